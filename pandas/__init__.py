@@ -31,10 +31,12 @@ from pandas.io.parsers import (read_csv, read_table, read_clipboard,
                                read_fwf, to_clipboard, ExcelFile,
                                ExcelWriter)
 from pandas.io.pytables import HDFStore
+from pandas.io.json import read_json
 from pandas.util.testing import debug
 
 from pandas.tools.describe import value_range
 from pandas.tools.merge import merge, concat, ordered_merge
+from pandas.tools.builder import DataFrameBuilder
 from pandas.tools.pivot import pivot_table, crosstab
 from pandas.tools.plotting import scatter_matrix
 from pandas.tools.tile import cut, qcut
@@ -6,6 +6,7 @@ intended for public consumption
 import numpy as np
 
 import pandas.core.common as com
+import pandas.core.parallel as parallel
 import pandas.lib as lib
 import pandas._algos as _algos
 
@@ -144,7 +145,7 @@ def value_counts(values, sort=True, ascending=False):
 
     Parameters
     ----------
-    values : ndarray (1-d)
+    values : ndarray (1-d) or Categorical
     sort : boolean, default True
         Sort by values
     ascending : boolean, default False
@@ -154,21 +155,29 @@ def value_counts(values, sort=True, ascending=False):
     -------
     value_counts : Series
     """
+    from pandas.core.categorical import Categorical
     from pandas.core.series import Series
     from collections import defaultdict
 
-    values = np.asarray(values)
-
-    if com.is_integer_dtype(values.dtype):
-        values = com._ensure_int64(values)
-        keys, counts = lib.value_count_int64(values)
-        result = Series(counts, index=keys)
+    if isinstance(values, Categorical):
+        # count the codes, keeping the levels that occur
+        codes = com._ensure_int64(values.labels)
+        counts = lib.group_count(codes[codes != -1], len(values.levels))
+        observed = counts > 0
+        result = Series(counts[observed], index=values.levels[observed])
     else:
-        counter = defaultdict(lambda: 0)
-        values = values[com.notnull(values)]
-        for value in values:
-            counter[value] += 1
-        result = Series(counter)
+        values = np.asarray(values)
+
+        if com.is_integer_dtype(values.dtype):
+            values = com._ensure_int64(values)
+            keys, counts = lib.value_count_int64(values)
+            result = Series(counts, index=keys)
+        else:
+            counter = defaultdict(lambda: 0)
+            values = values[com.notnull(values)]
+            for value in values:
+                counter[value] += 1
+            result = Series(counter)
 
     if sort:
         result.sort()
@@ -188,8 +197,33 @@ def rank(values, axis=0, method='average', na_option='keep',
         ranks = f(values, ties_method=method, ascending=ascending)
     elif values.ndim == 2:
         f, values = _get_data_algo(values, _rank2d_functions)
-        ranks = f(values, axis=axis, ties_method=method,
-                  ascending=ascending)
+        ranks = _rank_2d(f, values, axis, method, ascending)
+    return ranks
+
+def _rank_2d(f, values, axis, method, ascending):
+    """
+    Rank the columns (rows for axis=1) of values with the kernel f, in chunks
+    of columns (rows) on the threads of pandas.core.parallel when values is
+    large
+    """
+    split_axis = 1 - axis
+    nchunks = 1
+    if values.dtype != np.object_:
+        nchunks = parallel.get_nchunks(values.shape[split_axis], values.size)
+    if nchunks == 1:
+        return f(values, axis=axis, ties_method=method, ascending=ascending)
+
+    ranks = np.empty(values.shape, dtype=np.float64)
+
+    def _rank_chunk(start, end):
+        slicer = [slice(None), slice(None)]
+        slicer[split_axis] = slice(start, end)
+        slicer = tuple(slicer)
+        ranks[slicer] = f(values[slicer], axis=axis, ties_method=method,
+                          ascending=ascending)
+
+    parallel.run(_rank_chunk,
+                 parallel.chunk_bounds(values.shape[split_axis], nchunks))
     return ranks
 
 def quantile(x, q, interpolation_method='fraction'):
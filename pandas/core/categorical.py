@@ -18,7 +18,7 @@ def _cat_compare_op(op):
                 i = self.levels.get_loc(other)
                 return getattr(self.labels, op)(i)
             else:
-                return np.repeat(False, len(self))
+                return np.repeat(op == '__ne__', len(self))
 
     f.__name__ = op
 
@@ -110,6 +110,20 @@ class Categorical(object):
         else:
             return Categorical(self.labels[key], self.levels)
 
+    def _sort_labels(self):
+        """
+        Labels renumbered in the sort order of the levels, with missing values
+        (-1) sorting last
+        """
+        n = len(self.levels)
+        ranks = np.empty(n + 1, dtype=np.int64)
+        if self.levels.is_monotonic:
+            ranks[:n] = np.arange(n)
+        else:
+            ranks.put(self.levels.argsort(), np.arange(n))
+        ranks[n] = n
+        return ranks.take(com._ensure_platform_int(self.labels))
+
     def equals(self, other):
         """
         Returns True if categorical arrays are equal
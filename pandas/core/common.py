@@ -19,6 +19,7 @@ from numpy.lib.format import read_array, write_array
 import numpy as np
 
 import pandas._algos as _algos
+import pandas.core.parallel as parallel
 import pandas.lib as lib
 from pandas.util import py3compat
 import codecs
@@ -163,6 +164,7 @@ def _view_wrapper(f, wrap_dtype, na_override=None):
 
 _take1d_dict = {
     'float64' : _algos.take_1d_float64,
+    'float32' : _algos.take_1d_float32,
     'int32' : _algos.take_1d_int32,
     'int64' : _algos.take_1d_int64,
     'object' : _algos.take_1d_object,
@@ -173,6 +175,7 @@ _take1d_dict = {
 
 _take2d_axis0_dict = {
     'float64' : _algos.take_2d_axis0_float64,
+    'float32' : _algos.take_2d_axis0_float32,
     'int32' : _algos.take_2d_axis0_int32,
     'int64' : _algos.take_2d_axis0_int64,
     'object' : _algos.take_2d_axis0_object,
@@ -183,6 +186,7 @@ _take2d_axis0_dict = {
 
 _take2d_axis1_dict = {
     'float64' : _algos.take_2d_axis1_float64,
+    'float32' : _algos.take_2d_axis1_float32,
     'int32' : _algos.take_2d_axis1_int32,
     'int64' : _algos.take_2d_axis1_int64,
     'object' : _algos.take_2d_axis1_object,
@@ -193,6 +197,7 @@ _take2d_axis1_dict = {
 
 _take2d_multi_dict = {
     'float64' : _algos.take_2d_multi_float64,
+    'float32' : _algos.take_2d_multi_float32,
     'int32' : _algos.take_2d_multi_int32,
     'int64' : _algos.take_2d_multi_int64,
     'object' : _algos.take_2d_multi_object,
@@ -211,6 +216,72 @@ def _get_take2d_function(dtype_str, axis=0):
     else: # pragma: no cover
         raise ValueError('bad axis: %s' % axis)
 
+def _take_2d_kernel(take_f, arr, indexer, out, fill_value, axis=0):
+    """
+    Call a 2-d take kernel filling out, split into chunks of the rows (or
+    columns for axis=1) of out taken on the threads of pandas.core.parallel
+    when out is large. For axis='multi' indexer is a (row, column) pair
+    """
+    split_axis = 1 if axis == 1 else 0
+    if out.dtype == np.object_:
+        # the object kernels hold the GIL
+        nchunks = 1
+    else:
+        nchunks = parallel.get_nchunks(out.shape[split_axis], out.size)
+
+    def _take_chunk(start, end):
+        if axis == 'multi':
+            take_f(arr, indexer[0][start:end], indexer[1],
+                   out=out[start:end], fill_value=fill_value)
+        elif axis == 1:
+            take_f(arr, indexer[start:end], out=out[:, start:end],
+                   fill_value=fill_value)
+        else:
+            take_f(arr, indexer[start:end], out=out[start:end],
+                   fill_value=fill_value)
+
+    if nchunks == 1:
+        _take_chunk(0, out.shape[split_axis])
+    else:
+        parallel.run(_take_chunk,
+                     parallel.chunk_bounds(out.shape[split_axis], nchunks))
+
+def _take_upcast(arr, indexer, kind, out=None, fill_value=np.nan):
+    """
+    Take integer or boolean data with missing (-1) positions straight into
+    the NA-capable dtype it is upcast to (or the dtype of out), in one pass
+    and without first upcasting the whole of arr. kind is one of '1d',
+    '2d_axis0' or '2d_axis1'
+
+    Returns
+    -------
+    taken : ndarray, or None if there is no kernel for the dtypes
+    """
+    if out is None:
+        dest = _upcast_dtype(arr.dtype)
+    else:
+        dest = out.dtype
+    take_f = getattr(_algos, 'take_%s_%s_%s' % (kind, arr.dtype.name,
+                                                dest.name), None)
+    if take_f is None:
+        return None
+
+    if out is None:
+        if kind == '1d':
+            out_shape = (len(indexer),)
+        elif kind == '2d_axis0':
+            out_shape = (len(indexer), arr.shape[1])
+        else:
+            out_shape = (arr.shape[0], len(indexer))
+        out = np.empty(out_shape, dtype=dest)
+
+    if kind == '1d':
+        take_f(arr, _ensure_int64(indexer), out=out, fill_value=fill_value)
+    else:
+        _take_2d_kernel(take_f, arr, _ensure_int64(indexer), out, fill_value,
+                        axis=int(kind[-1]))
+    return out
+
 def take_1d(arr, indexer, out=None, fill_value=np.nan):
     """
     Specialized Cython take which sets NaN values in one pass
@@ -230,6 +301,13 @@ def take_1d(arr, indexer, out=None, fill_value=np.nan):
                 out = np.empty(n, dtype=arr.dtype)
             take_f(arr, _ensure_int64(indexer), out=out, fill_value=fill_value)
         except ValueError:
+            if not (out_passed and _need_upcast(out)):
+                result = _take_upcast(arr, indexer, '1d',
+                                      out=out if out_passed else None,
+                                      fill_value=fill_value)
+                if result is not None:
+                    return result
+
             mask = indexer == -1
             if len(arr) == 0:
                 if not out_passed:
@@ -242,13 +320,25 @@ def take_1d(arr, indexer, out=None, fill_value=np.nan):
                                     out.dtype)
                 out = _maybe_upcast(out)
                 np.putmask(out, mask, fill_value)
-    elif dtype_str in ('float64', 'object', 'datetime64[ns]'):
+    elif dtype_str in ('float64', 'float32', 'object', 'datetime64[ns]'):
+        if (out is not None and dtype_str == 'float32'
+                and out.dtype != arr.dtype):
+            # e.g. float32 values taken into a float64 block
+            return take_1d(arr.astype(out.dtype), indexer, out=out,
+                           fill_value=fill_value)
         if out is None:
             out = np.empty(n, dtype=arr.dtype)
         take_f(arr, _ensure_int64(indexer), out=out, fill_value=fill_value)
     else:
-        out = ndtake(arr, indexer, out=out)
         mask = indexer == -1
+        if mask.any() and not (out_passed and _need_upcast(out)):
+            # e.g. int8 / int16
+            result = _take_upcast(arr, indexer, '1d', out=out,
+                                  fill_value=fill_value)
+            if result is not None:
+                return result
+
+        out = ndtake(arr, indexer, out=out)
         if mask.any():
             if out_passed:
                 raise Exception('out with dtype %s does not support NA' %
@@ -270,22 +360,34 @@ def take_2d_multi(arr, row_idx, col_idx, fill_value=np.nan, out=None):
         needs_masking = row_mask.any() or col_mask.any()
 
         if needs_masking:
-            return take_2d_multi(_maybe_upcast(arr), row_idx, col_idx,
+            # upcast only the selected rows
+            rows = _take_upcast(arr, row_idx, '2d_axis0',
+                                fill_value=fill_value)
+            if rows is None:
+                rows = take_2d(_maybe_upcast(arr), row_idx, axis=0,
+                               fill_value=fill_value)
+            return take_2d_multi(rows, np.arange(len(rows)), col_idx,
                                  fill_value=fill_value, out=out)
         else:
             if out is None:
                 out = np.empty(out_shape, dtype=arr.dtype)
             take_f = _get_take2d_function(dtype_str, axis='multi')
-            take_f(arr, _ensure_int64(row_idx),
-                   _ensure_int64(col_idx), out=out,
-                   fill_value=fill_value)
+            _take_2d_kernel(take_f, arr,
+                            (_ensure_int64(row_idx), _ensure_int64(col_idx)),
+                            out, fill_value, axis='multi')
             return out
-    elif dtype_str in ('float64', 'object', 'datetime64[ns]'):
+    elif dtype_str in ('float64', 'float32', 'object', 'datetime64[ns]'):
+        if (out is not None and dtype_str == 'float32'
+                and out.dtype != arr.dtype):
+            # e.g. float32 values taken into a float64 block
+            return take_2d_multi(arr.astype(out.dtype), row_idx, col_idx,
+                                 out=out, fill_value=fill_value)
         if out is None:
             out = np.empty(out_shape, dtype=arr.dtype)
         take_f = _get_take2d_function(dtype_str, axis='multi')
-        take_f(arr, _ensure_int64(row_idx), _ensure_int64(col_idx), out=out,
-               fill_value=fill_value)
+        _take_2d_kernel(take_f, arr,
+                        (_ensure_int64(row_idx), _ensure_int64(col_idx)),
+                        out, fill_value, axis='multi')
         return out
     else:
         if out is not None:
@@ -315,6 +417,12 @@ def take_2d(arr, indexer, out=None, mask=None, needs_masking=None, axis=0,
             needs_masking = mask.any()
 
         if needs_masking:
+            if out is None or not _need_upcast(out):
+                result = _take_upcast(arr, indexer, '2d_axis%d' % axis,
+                                      out=out, fill_value=fill_value)
+                if result is not None:
+                    return result
+
             # upcasting may be required
             result = ndtake(arr, indexer, axis=axis, out=out)
             result = _maybe_mask(result, mask, needs_masking, axis=axis,
@@ -325,19 +433,33 @@ def take_2d(arr, indexer, out=None, mask=None, needs_masking=None, axis=0,
             if out is None:
                 out = np.empty(out_shape, dtype=arr.dtype)
             take_f = _get_take2d_function(dtype_str, axis=axis)
-            take_f(arr, _ensure_int64(indexer), out=out, fill_value=fill_value)
+            _take_2d_kernel(take_f, arr, _ensure_int64(indexer), out,
+                            fill_value, axis=axis)
             return out
-    elif dtype_str in ('float64', 'object', 'datetime64[ns]'):
+    elif dtype_str in ('float64', 'float32', 'object', 'datetime64[ns]'):
+        if (out is not None and dtype_str == 'float32'
+                and out.dtype != arr.dtype):
+            # e.g. float32 values taken into a float64 block
+            return take_2d(arr.astype(out.dtype), indexer, out=out, axis=axis,
+                           fill_value=fill_value)
         if out is None:
             out = np.empty(out_shape, dtype=arr.dtype)
         take_f = _get_take2d_function(dtype_str, axis=axis)
-        take_f(arr, _ensure_int64(indexer), out=out, fill_value=fill_value)
+        _take_2d_kernel(take_f, arr, _ensure_int64(indexer), out,
+                        fill_value, axis=axis)
         return out
     else:
         if mask is None:
             mask = indexer == -1
             needs_masking = mask.any()
 
+        if needs_masking and (out is None or not _need_upcast(out)):
+            # e.g. int8 / int16
+            result = _take_upcast(arr, indexer, '2d_axis%d' % axis,
+                                  out=out, fill_value=fill_value)
+            if result is not None:
+                return result
+
         # GH #486
         if out is not None and arr.dtype != out.dtype:
             arr = arr.astype(out.dtype)
@@ -380,14 +502,61 @@ def _maybe_mask(result, mask, needs_masking, axis=0, out_passed=False,
             mask_out_axis(result, mask, axis, fill_value)
     return result
 
-def _maybe_upcast(values):
-    if issubclass(values.dtype.type, np.integer):
-        values = values.astype(float)
-    elif issubclass(values.dtype.type, np.bool_):
-        values = values.astype(object)
+def _upcast_dtype(dtype):
+    """
+    The dtype integer and boolean data is upcast to to hold NAs
+    """
+    if issubclass(dtype.type, np.integer):
+        # small integers are represented exactly in float32
+        if dtype.itemsize <= 2:
+            return np.dtype(np.float32)
+        return np.dtype(np.float64)
+    elif issubclass(dtype.type, np.bool_):
+        return np.dtype(object)
+    return dtype
 
+def _maybe_upcast(values):
+    dtype = _upcast_dtype(values.dtype)
+    if dtype != values.dtype:
+        values = values.astype(dtype)
     return values
 
+def _inplace_op(func, ufunc, reverse=False):
+    """
+    Wrap the binary operation func(x, y), which ufunc computes, to write the
+    result into x when x is numeric and its dtype can hold the result. The
+    wrapped function returns x then, and func(x, y) otherwise
+    """
+    def f(x, y):
+        if not _holds_result(ufunc, x, y, reverse):
+            return func(x, y)
+        if reverse:
+            ufunc(y, x, x)
+        else:
+            ufunc(x, y, x)
+        return x
+    return f
+
+def _holds_result(ufunc, x, y, reverse=False):
+    if not issubclass(x.dtype.type, (np.number, np.bool_)):
+        return False
+
+    # numpy casts scalars depending on their value, so they take part as
+    # themselves and arrays as one-element samples of their dtype
+    left = np.ones(1, dtype=x.dtype)
+    if isinstance(y, np.ndarray):
+        right = np.ones(1, dtype=y.dtype)
+    else:
+        right = y
+    if reverse:
+        left, right = right, left
+
+    try:
+        result = ufunc(left, right)
+    except (TypeError, ValueError):
+        return False
+    return result.dtype == x.dtype
+
 def _need_upcast(values):
     if issubclass(values.dtype.type, (np.integer, np.bool_)):
         return True
@@ -405,7 +574,9 @@ _backfill_1d_datetime = _interp_wrapper(_algos.backfill_inplace_int64, np.int64)
 _backfill_2d_datetime = _interp_wrapper(_algos.backfill_2d_inplace_int64, np.int64)
 
 def pad_1d(values, limit=None, mask=None):
-    if is_float_dtype(values):
+    if values.dtype == np.float32:
+        _method = _algos.pad_inplace_float32
+    elif is_float_dtype(values):
         _method = _algos.pad_inplace_float64
     elif is_datetime64_dtype(values):
         _method = _pad_1d_datetime
@@ -420,7 +591,9 @@ def pad_1d(values, limit=None, mask=None):
     _method(values, mask, limit=limit)
 
 def backfill_1d(values, limit=None, mask=None):
-    if is_float_dtype(values):
+    if values.dtype == np.float32:
+        _method = _algos.backfill_inplace_float32
+    elif is_float_dtype(values):
         _method = _algos.backfill_inplace_float64
     elif is_datetime64_dtype(values):
         _method = _backfill_1d_datetime
@@ -436,7 +609,9 @@ def backfill_1d(values, limit=None, mask=None):
     _method(values, mask, limit=limit)
 
 def pad_2d(values, limit=None, mask=None):
-    if is_float_dtype(values):
+    if values.dtype == np.float32:
+        _method = _algos.pad_2d_inplace_float32
+    elif is_float_dtype(values):
         _method = _algos.pad_2d_inplace_float64
     elif is_datetime64_dtype(values):
         _method = _pad_2d_datetime
@@ -456,7 +631,9 @@ def pad_2d(values, limit=None, mask=None):
         pass
 
 def backfill_2d(values, limit=None, mask=None):
-    if is_float_dtype(values):
+    if values.dtype == np.float32:
+        _method = _algos.backfill_2d_inplace_float32
+    elif is_float_dtype(values):
         _method = _algos.backfill_2d_inplace_float64
     elif is_datetime64_dtype(values):
         _method = _backfill_2d_datetime
@@ -777,6 +954,7 @@ def is_float_dtype(arr_or_dtype):
 
 
 _ensure_float64 = _algos.ensure_float64
+_ensure_float32 = _algos.ensure_float32
 _ensure_int64 = _algos.ensure_int64
 _ensure_int32 = _algos.ensure_int32
 _ensure_platform_int = _algos.ensure_platform_int
@@ -834,20 +1012,28 @@ def save(obj, path):
         f.close()
 
 
-def load(path):
+def load(path, mmap_mode=None):
     """
     Load pickled pandas object (or any other pickled object) from the specified
-    file path
+    file path. Files written in the native block format (see
+    DataFrame.save) are detected and read directly into blocks
 
     Parameters
     ----------
     path : string
         File path
+    mmap_mode : {None, 'r'}, default None
+        Memory map the numeric blocks of a native format file read-only, see
+        pandas.io.native.read_native. Ignored for pickled files
 
     Returns
     -------
     unpickled : type of object stored in file
     """
+    from pandas.io.native import is_native_file, read_native
+    if is_native_file(path):
+        return read_native(path, mmap_mode=mmap_mode)
+
     f = open(path, 'rb')
     try:
         return pickle.load(f)
@@ -0,0 +1,388 @@
+"""
+Elementwise evaluation of binary operations, dispatched to numexpr when it is
+installed and the operands are large enough. numexpr evaluates the operation
+in cache-sized chunks on several threads instead of one full pass per numpy
+ufunc.
+
+Also evaluates string expressions of DataFrame columns (DataFrame.eval and
+query) in a single pass, with numexpr or chunk by chunk with numpy
+"""
+
+import operator
+
+try:
+    import ast
+except ImportError:  # Python 2.5 only has the node classes
+    import _ast as ast
+
+import numpy as np
+
+import pandas.core.common as com
+
+try:
+    import numexpr as ne
+    _NUMEXPR_INSTALLED = True
+except ImportError:  # pragma: no cover
+    _NUMEXPR_INSTALLED = False
+
+_USE_NUMEXPR = _NUMEXPR_INSTALLED
+
+# below this number of elements the numexpr overhead outweighs the gain
+_MIN_ELEMENTS = 10000
+
+_INT_FLOAT = set(['int32', 'int64', 'float32', 'float64'])
+_FLOAT = set(['float32', 'float64'])
+_BOOL = set(['bool'])
+
+# dtypes numexpr computes each operator for exactly like numpy: integer
+# division and powers are left out since their semantics differ
+_OP_DTYPES = {
+    '+': _INT_FLOAT, '-': _INT_FLOAT, '*': _INT_FLOAT,
+    '/': _FLOAT, '**': _FLOAT,
+    '>': _INT_FLOAT, '<': _INT_FLOAT, '>=': _INT_FLOAT, '<=': _INT_FLOAT,
+    '==': _INT_FLOAT, '!=': _INT_FLOAT,
+    '&': _BOOL, '|': _BOOL,
+}
+
+# dtypes of arrays combined with a number, numpy casts smaller types
+# depending on the value of the number
+_SCALAR_DTYPES = set(['int64', 'float64'])
+
+
+def set_use_numexpr(v=True):
+    """
+    Use numexpr, if it is installed, to evaluate large elementwise operations
+    of DataFrame and Series objects
+
+    Parameters
+    ----------
+    v : boolean, default True
+    """
+    global _USE_NUMEXPR
+    _USE_NUMEXPR = bool(v) and _NUMEXPR_INSTALLED
+
+
+def set_numexpr_threads(n=None):
+    """
+    Set the number of threads numexpr uses
+
+    Parameters
+    ----------
+    n : int, optional
+        Defaults to the number of cores
+    """
+    if _NUMEXPR_INSTALLED:
+        if n is None:
+            n = ne.detect_number_of_cores()
+        ne.set_num_threads(n)
+
+
+def evaluate(op, op_str, a, b, reverse=False):
+    """
+    Evaluate op(a, b), where op computes a op_str b (b op_str a if reverse),
+    with numexpr if possible and with op otherwise
+
+    Parameters
+    ----------
+    op : function
+    op_str : string or None
+        Operator in a numexpr expression, None if there is none
+    a : ndarray
+    b : ndarray or scalar
+    reverse : boolean, default False
+
+    Returns
+    -------
+    result : ndarray
+    """
+    if _can_use_numexpr(op_str, a, b):
+        if reverse:
+            expr = 'b_value %s a_value' % op_str
+        else:
+            expr = 'a_value %s b_value' % op_str
+        try:
+            return ne.evaluate(expr, local_dict={'a_value': a, 'b_value': b},
+                               casting='safe')
+        except (TypeError, ValueError, NotImplementedError):
+            pass
+    return op(a, b)
+
+
+def _can_use_numexpr(op_str, a, b):
+    if not _USE_NUMEXPR or op_str is None:
+        return False
+    if not isinstance(a, np.ndarray) or a.size < _MIN_ELEMENTS:
+        return False
+
+    dtypes = _OP_DTYPES.get(op_str)
+    if dtypes is None or a.dtype.name not in dtypes:
+        return False
+
+    if isinstance(b, np.ndarray) and b.ndim > 0:
+        # homogeneous operands only, numexpr casts mixed ones differently
+        return b.dtype == a.dtype
+    elif isinstance(b, (bool, np.bool_)):
+        return a.dtype.name == 'bool'
+    elif com.is_integer(b) or com.is_float(b):
+        return a.dtype.name in _SCALAR_DTYPES
+    return False
+
+
+#----------------------------------------------------------------------
+# String expressions
+
+# rows per chunk of the numpy evaluator, small enough for the temporaries of
+# an expression to stay in the cache
+_EVAL_CHUNKSIZE = 16384
+
+# operator in numexpr, None if numexpr computes it differently from numpy,
+# and function computing it. Division is true division
+_BINOPS = {
+    ast.Add: ('+', operator.add),
+    ast.Sub: ('-', operator.sub),
+    ast.Mult: ('*', operator.mul),
+    ast.Div: ('/', np.true_divide),
+    ast.Pow: ('**', operator.pow),
+    ast.Mod: (None, operator.mod),
+    ast.BitAnd: ('&', operator.and_),
+    ast.BitOr: ('|', operator.or_),
+}
+
+_BOOLOPS = {
+    ast.And: ('&', operator.and_),
+    ast.Or: ('|', operator.or_),
+}
+
+_UNARYOPS = {
+    ast.USub: ('-', operator.neg),
+    ast.UAdd: ('', operator.pos),
+    ast.Invert: ('~', np.invert),
+    ast.Not: ('~', np.invert),
+}
+
+_CMPOPS = {
+    ast.Gt: ('>', operator.gt),
+    ast.GtE: ('>=', operator.ge),
+    ast.Lt: ('<', operator.lt),
+    ast.LtE: ('<=', operator.le),
+    ast.Eq: ('==', operator.eq),
+    ast.NotEq: ('!=', operator.ne),
+}
+
+_CONSTANTS = {'True': True, 'False': False, 'None': None}
+
+# array dtypes passed to numexpr, which casts other dtypes and constants
+# differently from numpy
+_NUMEXPR_DTYPES = set(['int64', 'float64', 'bool'])
+
+
+class _NotNumExpr(Exception):
+    pass
+
+
+def eval_frame(expr, frame, local_dict=None):
+    """
+    Evaluate a string expression of the columns of a DataFrame elementwise,
+    see DataFrame.eval
+
+    Returns
+    -------
+    result : ndarray of length len(frame), or scalar
+    """
+    tree = _parse(expr)
+    resolve = _resolver(frame, local_dict)
+    nrows = len(frame)
+
+    if _USE_NUMEXPR and nrows >= _MIN_ELEMENTS:
+        try:
+            return _eval_numexpr(tree, resolve)
+        except _NotNumExpr:
+            pass
+
+    return _eval_chunked(tree, resolve, nrows)
+
+
+def _parse(expr):
+    try:
+        tree = compile(expr.strip(), '<expr>', 'eval', ast.PyCF_ONLY_AST)
+    except SyntaxError:
+        raise ValueError('Invalid expression: %s' % expr)
+
+    for node in _walk(tree.body):
+        if isinstance(node, ast.BinOp):
+            op = _BINOPS
+        elif isinstance(node, ast.BoolOp):
+            op = _BOOLOPS
+        elif isinstance(node, ast.UnaryOp):
+            op = _UNARYOPS
+        elif isinstance(node, ast.Compare):
+            for cmp_op in node.ops:
+                if type(cmp_op) not in _CMPOPS:
+                    raise ValueError('Unsupported operator %s in: %s'
+                                     % (type(cmp_op).__name__, expr))
+            continue
+        elif isinstance(node, (ast.Name, ast.Num, ast.Str, ast.Load,
+                               ast.operator, ast.boolop, ast.unaryop,
+                               ast.cmpop)):
+            continue
+        else:
+            raise ValueError('Unsupported syntax %s in: %s'
+                             % (type(node).__name__, expr))
+
+        if type(node.op) not in op:
+            raise ValueError('Unsupported operator %s in: %s'
+                             % (type(node.op).__name__, expr))
+    return tree.body
+
+
+def _walk(node):
+    """
+    All the nodes of the tree under node, like ast.walk (Python 2.6+)
+    """
+    nodes = [node]
+    while nodes:
+        node = nodes.pop()
+        for name in node._fields or ():
+            child = getattr(node, name, None)
+            if isinstance(child, list):
+                nodes.extend(c for c in child if isinstance(c, ast.AST))
+            elif isinstance(child, ast.AST):
+                nodes.append(child)
+        yield node
+
+
+def _resolver(frame, local_dict):
+    """
+    Function returning the values named in an expression for a slice of the
+    rows: a column, the index, a local variable or a constant
+    """
+    local_dict = local_dict or {}
+
+    def resolve(name, slicer=slice(None)):
+        if name in frame.columns:
+            column = frame[name]
+            if isinstance(column, type(frame)):
+                raise ValueError('Column %s is not unique' % name)
+            return column.values[slicer]
+        elif name in local_dict:
+            value = local_dict[name]
+            if isinstance(value, np.ndarray) and value.ndim == 1:
+                # Series and arrays aligned with the rows
+                return value[slicer]
+            return value
+        elif name == 'index':
+            return frame.index.values[slicer]
+        elif name in _CONSTANTS:
+            return _CONSTANTS[name]
+        raise NameError('name %s is not defined' % name)
+
+    return resolve
+
+
+def _eval_numexpr(tree, resolve):
+    values = {}
+
+    def _term(node):
+        if isinstance(node, ast.BinOp):
+            op_str = _BINOPS[type(node.op)][0]
+            if op_str is None:
+                raise _NotNumExpr
+            return '(%s %s %s)' % (_term(node.left), op_str,
+                                   _term(node.right))
+        elif isinstance(node, ast.BoolOp):
+            op_str = ' %s ' % _BOOLOPS[type(node.op)][0]
+            return '(%s)' % op_str.join(_term(v) for v in node.values)
+        elif isinstance(node, ast.UnaryOp):
+            op_str = _UNARYOPS[type(node.op)][0]
+            return '(%s%s)' % (op_str, _term(node.operand))
+        elif isinstance(node, ast.Compare):
+            operands = [node.left] + node.comparators
+            terms = ['(%s %s %s)' % (_term(left), _CMPOPS[type(op)][0],
+                                     _term(right))
+                     for left, op, right in zip(operands[:-1], node.ops,
+                                                operands[1:])]
+            return '(%s)' % ' & '.join(terms)
+        elif isinstance(node, ast.Num):
+            if not isinstance(node.n, (int, long, float)):
+                raise _NotNumExpr
+            return repr(node.n)
+        elif isinstance(node, ast.Name):
+            return _name(node.id)
+        raise _NotNumExpr
+
+    def _name(name):
+        value = resolve(name)
+        if isinstance(value, bool):
+            return repr(value)
+        if (not isinstance(value, np.ndarray) or value.ndim != 1 or
+            value.dtype.name not in _NUMEXPR_DTYPES):
+            raise _NotNumExpr
+
+        var = 'v%d' % len(values)
+        values[var] = value
+        return var
+
+    expr = _term(tree)
+    if not values:
+        raise _NotNumExpr
+
+    try:
+        return ne.evaluate(expr, local_dict=values, truediv=True)
+    except (TypeError, ValueError, NotImplementedError, KeyError):
+        raise _NotNumExpr
+
+
+def _eval_chunked(tree, resolve, nrows):
+    """
+    Evaluate the expression chunk by chunk of rows, the temporaries of one
+    chunk fit in the cache
+    """
+    def _eval(node, slicer):
+        if isinstance(node, ast.BinOp):
+            func = _BINOPS[type(node.op)][1]
+            return func(_eval(node.left, slicer), _eval(node.right, slicer))
+        elif isinstance(node, ast.BoolOp):
+            func = _BOOLOPS[type(node.op)][1]
+            result = _eval(node.values[0], slicer)
+            for value in node.values[1:]:
+                result = func(result, _eval(value, slicer))
+            return result
+        elif isinstance(node, ast.UnaryOp):
+            func = _UNARYOPS[type(node.op)][1]
+            return func(_eval(node.operand, slicer))
+        elif isinstance(node, ast.Compare):
+            result = None
+            left = _eval(node.left, slicer)
+            for op, comparator in zip(node.ops, node.comparators):
+                right = _eval(comparator, slicer)
+                cmp_result = _CMPOPS[type(op)][1](left, right)
+                if result is None:
+                    result = cmp_result
+                else:
+                    result = result & cmp_result
+                left = right
+            return result
+        elif isinstance(node, ast.Num):
+            return node.n
+        elif isinstance(node, ast.Str):
+            return node.s
+        elif isinstance(node, ast.Name):
+            return resolve(node.id, slicer)
+        raise ValueError('Unsupported syntax %s' % type(node).__name__)
+
+    result = None
+    for start in xrange(0, max(nrows, 1), _EVAL_CHUNKSIZE):
+        end = min(start + _EVAL_CHUNKSIZE, nrows)
+        chunk = _eval(tree, slice(start, end))
+
+        if result is None:
+            if np.ndim(chunk) == 0:
+                # the expression does not refer to the rows
+                return chunk
+            result = np.empty(nrows, dtype=np.asarray(chunk).dtype)
+        elif chunk.dtype != result.dtype:
+            result = result.astype(np.promote_types(result.dtype,
+                                                    chunk.dtype))
+        result[start:end] = chunk
+
+    return result
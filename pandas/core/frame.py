@@ -26,11 +26,12 @@ import numpy.ma as ma
 
 from pandas.core.common import (isnull, notnull, PandasError, _try_sort,
                                 _default_index, _stringify)
+from pandas.core.categorical import Categorical
 from pandas.core.generic import NDFrame
 from pandas.core.index import Index, MultiIndex, _ensure_index
 from pandas.core.indexing import _NDFrameIndexer, _maybe_droplevels
 from pandas.core.internals import BlockManager, make_block, form_blocks
-from pandas.core.series import Series, _radd_compat
+from pandas.core.series import Series, _radd_compat, _categorical_or_values
 from pandas.compat.scipy import scoreatpercentile as _quantile
 from pandas.util import py3compat
 from pandas.util.terminal import get_terminal_size
@@ -41,6 +42,7 @@ from pandas.tseries.period import PeriodIndex
 import pandas.core.algorithms as algos
 import pandas.core.datetools as datetools
 import pandas.core.common as com
+import pandas.core.expressions as expressions
 import pandas.core.format as fmt
 import pandas.core.generic as generic
 import pandas.core.nanops as nanops
@@ -64,6 +66,9 @@ fill_value : None or float value, default None
 level : int or name
     Broadcast across a level, matching Index values on the
     passed MultiIndex level
+inplace : boolean, default False
+    Store the result in this DataFrame. Blocks whose dtype can hold the
+    result are modified in place without allocating a new array
 
 Notes
 -----
@@ -71,7 +76,7 @@ Mismatched indices will be unioned together
 
 Returns
 -------
-result : DataFrame
+result : DataFrame (self if inplace)
 """
 
 
@@ -173,10 +178,14 @@ class DataConflictError(Exception): pass
 #----------------------------------------------------------------------
 # Factory helper methods
 
-def _arith_method(op, name, default_axis='columns'):
+# ufunc computing x / y in this module
+_div_ufunc = np.true_divide if py3compat.PY3 else np.divide
+
+def _arith_method(op, name, str_rep=None, default_axis='columns', ufunc=None,
+                  reverse=False):
     def na_op(x, y):
         try:
-            result = op(x, y)
+            result = expressions.evaluate(op, str_rep, x, y, reverse=reverse)
         except TypeError:
             xrav = x.ravel()
             result = np.empty(x.size, dtype=x.dtype)
@@ -193,44 +202,67 @@ def _arith_method(op, name, default_axis='columns'):
 
         return result
 
-    @Appender(_arith_doc % name)
-    def f(self, other, axis=default_axis, level=None, fill_value=None):
+    if ufunc is not None:
+        inplace_op = com._inplace_op(na_op, ufunc, reverse=reverse)
+    else:
+        inplace_op = None
+
+    def _combine(self, other, axis, level, fill_value):
         if isinstance(other, DataFrame):    # Another DataFrame
             return self._combine_frame(other, na_op, fill_value, level)
         elif isinstance(other, Series):
             return self._combine_series(other, na_op, fill_value, axis, level)
-        elif isinstance(other, (list, tuple)):
-            if axis is not None and self._get_axis_name(axis) == 'index':
-                casted = Series(other, index=self.index)
-            else:
-                casted = Series(other, index=self.columns)
-            return self._combine_series(casted, na_op, fill_value, axis, level)
-        elif isinstance(other, np.ndarray):
-            if other.ndim == 1:
-                if axis is not None and self._get_axis_name(axis) == 'index':
-                    casted = Series(other, index=self.index)
-                else:
-                    casted = Series(other, index=self.columns)
-                return self._combine_series(casted, na_op, fill_value,
-                                            axis, level)
-            elif other.ndim == 2:
-                casted = DataFrame(other, index=self.index,
-                                   columns=self.columns)
-                return self._combine_frame(casted, na_op, fill_value, level)
-            else:  # pragma: no cover
-                raise ValueError("Bad argument shape")
         else:
             return self._combine_const(other, na_op)
 
+    @Appender(_arith_doc % name)
+    def f(self, other, axis=default_axis, level=None, fill_value=None,
+          inplace=False):
+        other = _cast_other(self, other, axis)
+        if not inplace:
+            return _combine(self, other, axis, level, fill_value)
+
+        if (inplace_op is None or
+            not self._combine_inplace(other, inplace_op, axis, level,
+                                      fill_value)):
+            self._update_inplace(_combine(self, other, axis, level,
+                                          fill_value))
+        return self
+
     f.__name__ = name
 
     return f
 
-def _flex_comp_method(op, name, default_axis='columns'):
+def _inplace_method(method, name):
+    def f(self, other):
+        return method(self, other, inplace=True)
+
+    f.__name__ = name
+
+    return f
+
+def _cast_other(frame, other, axis):
+    # lists and arrays as Series or DataFrame labeled like the frame
+    if isinstance(other, (list, tuple)):
+        if axis is not None and frame._get_axis_name(axis) == 'index':
+            return Series(other, index=frame.index)
+        return Series(other, index=frame.columns)
+    elif isinstance(other, np.ndarray) and not isinstance(other, Series):
+        if other.ndim == 1:
+            if axis is not None and frame._get_axis_name(axis) == 'index':
+                return Series(other, index=frame.index)
+            return Series(other, index=frame.columns)
+        elif other.ndim == 2:
+            return DataFrame(other, index=frame.index, columns=frame.columns)
+        else:  # pragma: no cover
+            raise ValueError("Bad argument shape")
+    return other
+
+def _flex_comp_method(op, name, str_rep=None, default_axis='columns'):
 
     def na_op(x, y):
         try:
-            result = op(x, y)
+            result = expressions.evaluate(op, str_rep, x, y)
         except TypeError:
             xrav = x.ravel()
             result = np.empty(x.size, dtype=x.dtype)
@@ -293,15 +325,18 @@ def _flex_comp_method(op, name, default_axis='columns'):
     return f
 
 
-def _comp_method(func, name):
+def _comp_method(func, name, str_rep=None):
+    def na_op(x, y):
+        return expressions.evaluate(func, str_rep, x, y)
+
     @Appender('Wrapper for comparison method %s' % name)
     def f(self, other):
         if isinstance(other, DataFrame):    # Another DataFrame
             return self._compare_frame(other, func)
         elif isinstance(other, Series):
-            return self._combine_series_infer(other, func)
+            return self._combine_series_infer(other, na_op)
         else:
-            return self._combine_const(other, func)
+            return self._combine_const(other, na_op)
 
     f.__name__ = name
 
@@ -435,7 +470,7 @@ class DataFrame(NDFrame):
             mgr = mgr.copy()
         elif dtype is not None:
             # avoid copy if we can
-            if len(mgr.blocks) > 1 or mgr.blocks[0].values.dtype != dtype:
+            if len(mgr.blocks) > 1 or mgr.blocks[0].dtype != dtype:
                 mgr = mgr.astype(dtype)
         return mgr
 
@@ -649,64 +684,86 @@ class DataFrame(NDFrame):
     #----------------------------------------------------------------------
     # Arithmetic methods
 
-    add = _arith_method(operator.add, 'add')
-    mul = _arith_method(operator.mul, 'multiply')
-    sub = _arith_method(operator.sub, 'subtract')
-    div = divide = _arith_method(lambda x, y: x / y, 'divide')
-
-    radd = _arith_method(_radd_compat, 'radd')
-    rmul = _arith_method(operator.mul, 'rmultiply')
-    rsub = _arith_method(lambda x, y: y - x, 'rsubtract')
-    rdiv = _arith_method(lambda x, y: y / x, 'rdivide')
-
-    __add__ = _arith_method(operator.add, '__add__', default_axis=None)
-    __sub__ = _arith_method(operator.sub, '__sub__', default_axis=None)
-    __mul__ = _arith_method(operator.mul, '__mul__', default_axis=None)
-    __truediv__ = _arith_method(operator.truediv, '__truediv__',
-                               default_axis=None)
+    add = _arith_method(operator.add, 'add', '+', ufunc=np.add)
+    mul = _arith_method(operator.mul, 'multiply', '*', ufunc=np.multiply)
+    sub = _arith_method(operator.sub, 'subtract', '-', ufunc=np.subtract)
+    div = divide = _arith_method(lambda x, y: x / y, 'divide', '/',
+                                 ufunc=_div_ufunc)
+
+    radd = _arith_method(_radd_compat, 'radd', '+', ufunc=np.add,
+                         reverse=True)
+    rmul = _arith_method(operator.mul, 'rmultiply', '*', ufunc=np.multiply,
+                         reverse=True)
+    rsub = _arith_method(lambda x, y: y - x, 'rsubtract', '-',
+                         ufunc=np.subtract, reverse=True)
+    rdiv = _arith_method(lambda x, y: y / x, 'rdivide', '/', ufunc=_div_ufunc,
+                         reverse=True)
+
+    __add__ = _arith_method(operator.add, '__add__', '+', default_axis=None,
+                            ufunc=np.add)
+    __sub__ = _arith_method(operator.sub, '__sub__', '-', default_axis=None,
+                            ufunc=np.subtract)
+    __mul__ = _arith_method(operator.mul, '__mul__', '*', default_axis=None,
+                            ufunc=np.multiply)
+    __truediv__ = _arith_method(operator.truediv, '__truediv__', '/',
+                               default_axis=None, ufunc=np.true_divide)
     __floordiv__ = _arith_method(operator.floordiv, '__floordiv__',
-                               default_axis=None)
-    __pow__ = _arith_method(operator.pow, '__pow__', default_axis=None)
-
-    __radd__ = _arith_method(_radd_compat, '__radd__', default_axis=None)
-    __rmul__ = _arith_method(operator.mul, '__rmul__', default_axis=None)
-    __rsub__ = _arith_method(lambda x, y: y - x, '__rsub__', default_axis=None)
-    __rtruediv__ = _arith_method(lambda x, y: y / x, '__rtruediv__',
-                                default_axis=None)
+                               default_axis=None, ufunc=np.floor_divide)
+    __pow__ = _arith_method(operator.pow, '__pow__', '**', default_axis=None,
+                            ufunc=np.power)
+
+    # augmented assignment operates in place
+    __iadd__ = _inplace_method(__add__, '__iadd__')
+    __isub__ = _inplace_method(__sub__, '__isub__')
+    __imul__ = _inplace_method(__mul__, '__imul__')
+    __itruediv__ = _inplace_method(__truediv__, '__itruediv__')
+    __ifloordiv__ = _inplace_method(__floordiv__, '__ifloordiv__')
+    __ipow__ = _inplace_method(__pow__, '__ipow__')
+
+    __radd__ = _arith_method(_radd_compat, '__radd__', '+', default_axis=None,
+                             reverse=True)
+    __rmul__ = _arith_method(operator.mul, '__rmul__', '*', default_axis=None,
+                             reverse=True)
+    __rsub__ = _arith_method(lambda x, y: y - x, '__rsub__', '-',
+                             default_axis=None, reverse=True)
+    __rtruediv__ = _arith_method(lambda x, y: y / x, '__rtruediv__', '/',
+                                default_axis=None, reverse=True)
     __rfloordiv__ = _arith_method(lambda x, y: y // x, '__rfloordiv__',
                                default_axis=None)
-    __rpow__ = _arith_method(lambda x, y: y ** x, '__rpow__',
-                             default_axis=None)
+    __rpow__ = _arith_method(lambda x, y: y ** x, '__rpow__', '**',
+                             default_axis=None, reverse=True)
 
     # boolean operators
-    __and__ = _arith_method(operator.and_, '__and__')
-    __or__ = _arith_method(operator.or_, '__or__')
+    __and__ = _arith_method(operator.and_, '__and__', '&')
+    __or__ = _arith_method(operator.or_, '__or__', '|')
     __xor__ = _arith_method(operator.xor, '__xor__')
 
     # Python 2 division methods
     if not py3compat.PY3:
-        __div__ = _arith_method(operator.div, '__div__', default_axis=None)
-        __rdiv__ = _arith_method(lambda x, y: y / x, '__rdiv__',
-                                 default_axis=None)
+        __div__ = _arith_method(operator.div, '__div__', '/',
+                                default_axis=None, ufunc=np.divide)
+        __rdiv__ = _arith_method(lambda x, y: y / x, '__rdiv__', '/',
+                                 default_axis=None, reverse=True)
+        __idiv__ = _inplace_method(__div__, '__idiv__')
 
     def __neg__(self):
         arr = operator.neg(self.values)
         return self._wrap_array(arr, self.axes, copy=False)
 
     # Comparison methods
-    __eq__ = _comp_method(operator.eq, '__eq__')
-    __ne__ = _comp_method(operator.ne, '__ne__')
-    __lt__ = _comp_method(operator.lt, '__lt__')
-    __gt__ = _comp_method(operator.gt, '__gt__')
-    __le__ = _comp_method(operator.le, '__le__')
-    __ge__ = _comp_method(operator.ge, '__ge__')
-
-    eq = _flex_comp_method(operator.eq, 'eq')
-    ne = _flex_comp_method(operator.ne, 'ne')
-    gt = _flex_comp_method(operator.gt, 'gt')
-    lt = _flex_comp_method(operator.lt, 'lt')
-    ge = _flex_comp_method(operator.ge, 'ge')
-    le = _flex_comp_method(operator.le, 'le')
+    __eq__ = _comp_method(operator.eq, '__eq__', '==')
+    __ne__ = _comp_method(operator.ne, '__ne__', '!=')
+    __lt__ = _comp_method(operator.lt, '__lt__', '<')
+    __gt__ = _comp_method(operator.gt, '__gt__', '>')
+    __le__ = _comp_method(operator.le, '__le__', '<=')
+    __ge__ = _comp_method(operator.ge, '__ge__', '>=')
+
+    eq = _flex_comp_method(operator.eq, 'eq', '==')
+    ne = _flex_comp_method(operator.ne, 'ne', '!=')
+    gt = _flex_comp_method(operator.gt, 'gt', '>')
+    lt = _flex_comp_method(operator.lt, 'lt', '<')
+    ge = _flex_comp_method(operator.ge, 'ge', '>=')
+    le = _flex_comp_method(operator.le, 'le', '<=')
 
     def dot(self, other):
         """
@@ -1179,6 +1236,33 @@ class DataFrame(NDFrame):
             if close:
                 f.close()
 
+    def to_json(self, path_or_buf=None, orient='columns', date_unit='ms',
+                chunksize=10000):
+        """
+        Write DataFrame as JSON, encoding the blocks directly
+
+        Parameters
+        ----------
+        path_or_buf : string or file handle / StringIO, optional
+            File path or object to write to. If None, return the JSON string
+        orient : {'split', 'records', 'index', 'columns'}, default 'columns'
+            'split' : {"columns": [columns], "index": [index],
+            "data": [[row values], ...]}, 'records' : [{column: value}, ...],
+            'index' : {index: {column: value}},
+            'columns' : {column: {index: value}}
+        date_unit : {'s', 'ms', 'us', 'ns'}, default 'ms'
+            datetime64 values are written as integers since the epoch
+        chunksize : int, default 10000
+            Number of rows encoded and written at a time
+
+        Returns
+        -------
+        json : string, if path_or_buf is None
+        """
+        from pandas.io.json import to_json
+        return to_json(self, path_or_buf=path_or_buf, orient=orient,
+                       date_unit=date_unit, chunksize=chunksize)
+
     def to_excel(self, excel_writer, sheet_name='sheet1', na_rep='',
                  float_format=None, cols=None, header=True, index=True,
                  index_label=None):
@@ -1330,7 +1414,7 @@ class DataFrame(NDFrame):
         if buf is None:
             return formatter.buf.getvalue()
 
-    def info(self, verbose=True, buf=None):
+    def info(self, verbose=True, buf=None, memory_usage=True):
         """
         Concise summary of a DataFrame, used in __repr__ when very large.
 
@@ -1339,6 +1423,10 @@ class DataFrame(NDFrame):
         verbose : boolean, default True
             If False, don't print column count summary
         buf : writable buffer, defaults to sys.stdout
+        memory_usage : boolean or 'deep', default True
+            Print the total memory usage of the data and index. Object
+            columns only count their array of pointers (shown as e.g.
+            '1.2+ KB') unless 'deep', which also measures the objects
         """
         from pandas.core.format import _put_lines
 
@@ -1374,8 +1462,43 @@ class DataFrame(NDFrame):
         counts = self.get_dtype_counts()
         dtypes = ['%s(%d)' % k for k in sorted(counts.iteritems())]
         lines.append('dtypes: %s' % ', '.join(dtypes))
+
+        if memory_usage:
+            deep = memory_usage == 'deep'
+            size_qualifier = ''
+            if not deep and ('object' in counts.index or
+                             self.index.dtype == np.object_):
+                size_qualifier = '+'
+            nbytes = self.memory_usage(index=True, deep=deep).sum()
+            lines.append('memory usage: %s' % _sizeof_fmt(nbytes,
+                                                          size_qualifier))
         _put_lines(buf, lines)
 
+    def memory_usage(self, index=True, deep=False):
+        """
+        Memory usage of each column in bytes
+
+        Parameters
+        ----------
+        index : boolean, default True
+            Include the memory usage of the index (its values and, once built,
+            its hash table) as the first entry, labeled 'Index'
+        deep : boolean, default False
+            Also measure the Python objects held by object columns and an
+            object index rather than only the arrays of pointers to them
+
+        Returns
+        -------
+        usage : Series
+        """
+        result = Series(self._data.memory_usage(deep=deep),
+                        index=self.columns)
+        if index:
+            index_usage = Series([self.index.memory_usage(deep=deep)],
+                                 index=['Index'])
+            result = index_usage.append(result)
+        return result
+
     @property
     def dtypes(self):
         return self.apply(lambda x: x.dtype)
@@ -1399,6 +1522,26 @@ class DataFrame(NDFrame):
 
         return DataFrame(new_data, index=self.index, columns=self.columns)
 
+    def intern_strings(self, inplace=False):
+        """
+        Make repeated strings in the object columns share one object. This
+        frees the memory of the duplicates and makes later hashing and
+        equality comparisons of the strings cheaper
+
+        Parameters
+        ----------
+        inplace : boolean, default False
+            Intern the strings of this frame instead of a copy
+
+        Returns
+        -------
+        interned : DataFrame (self if inplace)
+        """
+        frame = self if inplace else self.copy()
+        frame._data.intern_strings()
+        frame._clear_item_cache()
+        return frame
+
     def get_dtype_counts(self):
         counts = {}
         for i in range(len(self.columns)):
@@ -1751,7 +1894,9 @@ class DataFrame(NDFrame):
         if values.ndim == 2:
             return DataFrame(values.T, columns=items, index=self.index)
         else:
-            return Series(values, index=self.index, name=items)
+            result = Series(values, index=self.index, name=items)
+            result._categorical = self._data.get_categorical(key)
+            return result
 
     def __getattr__(self, name):
         """After regular attribute access, try looking up the name of a column.
@@ -1802,6 +1947,7 @@ class DataFrame(NDFrame):
         if self._is_mixed_type:
             raise ValueError('Cannot do boolean setting on mixed-type frame')
 
+        self._ensure_writeable()
         if isinstance(value, DataFrame):
             assert(value._indexed_same(self))
             np.putmask(self.values, mask, value.values)
@@ -1811,8 +1957,9 @@ class DataFrame(NDFrame):
     def _set_item_multiple(self, keys, value):
         if isinstance(value, DataFrame):
             assert(len(value.columns) == len(keys))
-            for k1, k2 in zip(keys, value.columns):
-                self[k1] = value[k2]
+            self.add_columns(dict((k1, value[k2])
+                                  for k1, k2 in zip(keys, value.columns)),
+                             columns=keys)
         else:
             if isinstance(keys, np.ndarray) and keys.dtype == np.bool_:
                 # boolean slicing should happen on rows, consistent with
@@ -1849,10 +1996,54 @@ class DataFrame(NDFrame):
         value = self._sanitize_column(column, value)
         self._data.insert(loc, column, value)
 
+    def add_columns(self, data, columns=None):
+        """
+        Set several columns at once. New columns are appended together,
+        allocating one block per dtype rather than one block per column as
+        repeated df[col] = value does. Existing columns are overwritten
+
+        Parameters
+        ----------
+        data : dict or DataFrame
+            Column values, each an int, Series, or array-like as in
+            df[col] = value
+        columns : sequence, optional
+            Order in which to add the columns. Defaults to the DataFrame
+            columns or the sorted dict keys
+        """
+        if columns is None:
+            if isinstance(data, DataFrame):
+                columns = data.columns
+            else:
+                columns = _try_sort(data.keys())
+
+        new_columns = []
+        new_values = []
+        for col in columns:
+            if col in self.columns:
+                self[col] = data[col]
+            else:
+                value = self._sanitize_column(col, data[col])
+                if not isinstance(value, Categorical):
+                    value = value[0]
+                new_columns.append(col)
+                new_values.append(value)
+
+        if new_columns:
+            self._data.insert_many(new_columns, new_values)
+
     def _sanitize_column(self, key, value):
         # Need to make sure new columns (which go into the BlockManager as new
-        # blocks) are always copied
-        if _is_sequence(value):
+        # blocks) are always copied. Categorical values, and columns stored as
+        # categorical, are kept as codes
+        if (isinstance(value, Series) and value._categorical is not None
+            and value.index.equals(self.index)):
+            value = value._categorical
+
+        if isinstance(value, Categorical):
+            assert(len(value) == len(self.index))
+            return value
+        elif _is_sequence(value):
             if isinstance(value, Series):
                 if value.index.equals(self.index):
                     # copy the values
@@ -2589,6 +2780,66 @@ class DataFrame(NDFrame):
         else:
             raise ValueError('items was None!')
 
+    def eval(self, expr, local_dict=None):
+        """
+        Evaluate an expression of the columns elementwise, in one pass over
+        the rows without a temporary Series per operation. The expression is
+        computed with numexpr if it is installed and can compute it, else
+        chunk by chunk of rows with NumPy
+
+        Parameters
+        ----------
+        expr : string
+            Python expression of column names, numbers and strings using
+            arithmetic (+, -, *, /, **, %), comparison (chained comparisons
+            allowed) and boolean (&, |, ~, and, or, not) operators. / is true
+            division, and/or/not operate elementwise like &/|/~
+        local_dict : dict, optional
+            Values of the other names in the expression, scalars or arrays
+            with one value per row. Column names take precedence, the name
+            index refers to the index if no column has that name
+
+        Examples
+        --------
+        >>> df.eval('a + b * 2')
+        >>> df.eval('1 < a <= b and c != "foo"')
+
+        Returns
+        -------
+        result : Series, or scalar if the expression uses no columns
+        """
+        result = expressions.eval_frame(expr, self, local_dict=local_dict)
+        if np.ndim(result) == 0:
+            return result
+        return Series(result, index=self.index)
+
+    def query(self, expr, local_dict=None):
+        """
+        Rows for which a boolean expression of the columns is True. The mask
+        is computed with eval and the rows are selected from it block by
+        block, without intermediate frames
+
+        Parameters
+        ----------
+        expr : string
+            Boolean expression, see eval
+        local_dict : dict, optional
+            Values of the other names in the expression
+
+        Examples
+        --------
+        >>> df.query('a > 1 and b < c * 2')
+
+        Returns
+        -------
+        selected : DataFrame
+        """
+        mask = expressions.eval_frame(expr, self, local_dict=local_dict)
+        if np.ndim(mask) == 0 or mask.dtype != np.bool_:
+            raise ValueError('Expression does not give a boolean mask: %s'
+                             % expr)
+        return self.take(mask.nonzero()[0])
+
     def dropna(self, axis=0, how='any', thresh=None, subset=None):
         """
         Return object with labels on given axis omitted where alternately any
@@ -2778,10 +3029,14 @@ class DataFrame(NDFrame):
         if by is not None:
             assert(axis == 0)
             if isinstance(by, (tuple, list)):
-                keys = [self[x].values for x in by]
+                keys = [_categorical_or_values(self[x]) for x in by]
                 indexer = _lexsort_indexer(keys)
             else:
-                indexer = self[by].values.argsort()
+                key = _categorical_or_values(self[by])
+                if isinstance(key, Categorical):
+                    indexer = key._sort_labels().argsort(kind='mergesort')
+                else:
+                    indexer = key.argsort()
         else:
             indexer = labels.argsort()
 
@@ -2918,6 +3173,8 @@ class DataFrame(NDFrame):
         filled : DataFrame
         """
         self._consolidate_inplace()
+        if inplace:
+            self._ensure_writeable()
 
         if value is None:
             if self._is_mixed_type and axis == 1:
@@ -2945,6 +3202,7 @@ class DataFrame(NDFrame):
                                               'by column')
 
                 result = self if inplace else self.copy()
+                result._ensure_writeable(value.keys())
                 for k, v in value.iteritems():
                     if k not in result:
                         continue
@@ -2994,6 +3252,8 @@ class DataFrame(NDFrame):
         filled : DataFrame
         """
         self._consolidate_inplace()
+        if inplace:
+            self._ensure_writeable()
 
         if value is None:
             return self._interpolate(to_replace, method, axis, inplace, limit)
@@ -3057,6 +3317,7 @@ class DataFrame(NDFrame):
                                       limit=limit).T
 
             rs = self if inplace else self.copy()
+            rs._ensure_writeable(to_replace.keys())
             for k, v in to_replace.iteritems():
                 if k in rs:
                     rs[k].replace(v, method=method, limit=limit,
@@ -3080,6 +3341,7 @@ class DataFrame(NDFrame):
 
     def _replace_dest_dict(self, to_replace, value, inplace):
         rs = self if inplace else self.copy()
+        rs._ensure_writeable(value.keys())
         for k, v in value.iteritems():
             if k in rs:
                 rs[k].replace(to_replace, v, inplace=True)
@@ -3087,6 +3349,7 @@ class DataFrame(NDFrame):
 
     def _replace_src_dict(self, to_replace, value, inplace):
         rs = self if inplace else self.copy()
+        rs._ensure_writeable(to_replace.keys())
         for k, src in to_replace.iteritems():
             if k in rs:
                 rs[k].replace(src, value, inplace=True)
@@ -3094,6 +3357,7 @@ class DataFrame(NDFrame):
 
     def _replace_both_dict(self, to_replace, value, inplace):
         rs = self if inplace else self.copy()
+        rs._ensure_writeable(to_replace.keys())
         for c, src in to_replace.iteritems():
             if c in value and c in rs:
                 rs[c].replace(src, value[c], inplace=True)
@@ -3177,16 +3441,14 @@ class DataFrame(NDFrame):
 
             return func(left, right)
 
-        if this._is_mixed_type or other._is_mixed_type:
-            # XXX no good for duplicate columns
-            result = {}
-            for col in this:
-                result[col] = func(this[col].values, other[col].values)
-        else:
+        if not new_columns.is_unique:
             result = _arith_op(this.values, other.values)
+            return self._constructor(result, index=new_index,
+                                     columns=new_columns, copy=False)
 
-        return self._constructor(result, index=new_index,
-                                 columns=new_columns, copy=False)
+        # operate block by block, never interleaving mixed-type frames
+        new_data = this._data.combine(other._data, _arith_op)
+        return self._constructor(new_data)
 
     def _indexed_same(self, other):
         same_index = self.index.equals(other.index)
@@ -3239,15 +3501,75 @@ class DataFrame(NDFrame):
         if self.empty:
             return self
 
-        result_values = func(self.values, other)
+        def _block_op(values):
+            result = func(values, other)
+            if not isinstance(result, np.ndarray):
+                raise TypeError('Could not compare %s with DataFrame values'
+                                % repr(other))
+            return result
 
-        if not isinstance(result_values, np.ndarray):
-            raise TypeError('Could not compare %s with DataFrame values'
-                            % repr(other))
+        if lib.isscalar(other):
+            # scalars broadcast against each block separately. A block that
+            # can't be compared elementwise with other, e.g. floats with a
+            # string, gives a scalar: use the interleaved values then
+            try:
+                return self._constructor(self._data.apply(_block_op))
+            except TypeError:
+                pass
 
-        return self._constructor(result_values, index=self.index,
+        return self._constructor(_block_op(self.values), index=self.index,
                                  columns=self.columns, copy=False)
 
+    def _combine_inplace(self, other, func, axis=None, level=None,
+                         fill_value=None):
+        """
+        Operate with other block by block, func storing the result in the
+        values of each block when their dtype allows (see com._inplace_op).
+        Returns False, leaving the frame unchanged, if other is not aligned
+        with the frame
+        """
+        if (level is not None or fill_value is not None or
+            not self.columns.is_unique):
+            return False
+
+        if isinstance(other, DataFrame):
+            if not self._indexed_same(other):
+                return False
+            self._data.combine_inplace(other._data, func)
+        elif isinstance(other, Series):
+            if len(self) == 0 or len(other) == 0:
+                return False
+            if axis is None:
+                # as in _combine_series_infer
+                if self.index.is_all_dates and other.index.is_all_dates:
+                    axis = 'index'
+                else:
+                    axis = 'columns'
+
+            if self._get_axis_name(axis) == 'index':
+                if not other.index.equals(self.index):
+                    return False
+                values = other.values
+                self._data.apply_inplace(lambda v, items: func(v, values))
+            else:
+                if not other.index.equals(self.columns):
+                    return False
+                def _block_op(values, items):
+                    right = other.reindex(items).values[:, None]
+                    return func(values, right)
+                self._data.apply_inplace(_block_op)
+        elif lib.isscalar(other):
+            self._data.apply_inplace(lambda v, items: func(v, other))
+        else:
+            return False
+
+        self._clear_item_cache()
+        return True
+
+    def _update_inplace(self, result):
+        self._data = result._data
+        self._clear_item_cache()
+
     def _compare_frame(self, other, func):
         if not self._indexed_same(other):
             raise Exception('Can only compare identically-labeled '
@@ -4014,7 +4336,7 @@ class DataFrame(NDFrame):
         mat = numeric_df.values
 
         if method == 'pearson':
-            correl = lib.nancorr(com._ensure_float64(mat))
+            correl = nanops.nancorr_matrix(mat)
         else:
             mat = mat.T
             corrf = nanops.get_corr_func(method)
@@ -4050,7 +4372,7 @@ class DataFrame(NDFrame):
         if notnull(mat).all():
             baseCov = np.cov(mat.T)
         else:
-            baseCov = lib.nancorr(com._ensure_float64(mat), cov=True)
+            baseCov = nanops.nancorr_matrix(mat, cov=True)
 
         return self._constructor(baseCov, index=cols, columns=cols)
 
@@ -4822,7 +5144,7 @@ def extract_index(data):
             elif isinstance(v, dict):
                 have_dicts = True
                 indexes.append(v.keys())
-            elif isinstance(v, (list, tuple, np.ndarray)):
+            elif isinstance(v, (list, tuple, np.ndarray, Categorical)):
                 have_raw_arrays = True
                 raw_lengths.append(len(v))
 
@@ -5018,7 +5340,15 @@ def _homogenize(data, index, columns, dtype=None):
         else:
             v = data[k]
 
-        if isinstance(v, Series):
+        if (isinstance(v, Series) and v._categorical is not None and
+            dtype is None and v.index.equals(index)):
+            v = v._categorical
+
+        if isinstance(v, Categorical):
+            if dtype is not None:
+                v = _sanitize_array(np.asarray(v), index, dtype=dtype,
+                                    copy=False, raise_cast_failure=False)
+        elif isinstance(v, Series):
             if dtype is not None:
                 v = v.astype(dtype)
             if v.index is not index:
@@ -5046,6 +5376,13 @@ def _homogenize(data, index, columns, dtype=None):
 def _put_str(s, space):
     return ('%s' % s)[:space].ljust(space)
 
+def _sizeof_fmt(num, size_qualifier=''):
+    for unit in ['bytes', 'KB', 'MB', 'GB', 'TB']:
+        if num < 1024.0:
+            return '%3.1f%s %s' % (num, size_qualifier, unit)
+        num /= 1024.0
+    return '%3.1f%s %s' % (num, size_qualifier, 'PB')
+
 def _is_sequence(x):
     try:
         iter(x)
@@ -22,12 +22,31 @@ class PandasObject(object):
     _AXIS_ALIASES = {}
     _AXIS_NAMES = dict((v, k) for k, v in _AXIS_NUMBERS.iteritems())
 
-    def save(self, path):
-        com.save(self, path)
+    def save(self, path, format='pickle', compress=None):
+        """
+        Save object to file path
+
+        Parameters
+        ----------
+        path : string
+            File path
+        format : {'pickle', 'native'}, default 'pickle'
+            'native' (DataFrame and Panel only) writes the blocks and indexes
+            as raw binary buffers, which load much faster than a pickle
+        compress : {None, 'zlib'}, default None
+            Per-buffer compression, only used by the native format
+        """
+        if format == 'native':
+            from pandas.io.native import write_native
+            write_native(self, path, compress=compress)
+        elif format == 'pickle':
+            com.save(self, path)
+        else:
+            raise ValueError('Unrecognized format: %s' % format)
 
     @classmethod
-    def load(cls, path):
-        return com.load(path)
+    def load(cls, path, mmap_mode=None):
+        return com.load(path, mmap_mode=mmap_mode)
 
     #----------------------------------------------------------------------
     # Axis name business
@@ -482,6 +501,12 @@ class NDFrame(PandasObject):
     def _clear_item_cache(self):
         self._item_cache.clear()
 
+    def _ensure_writeable(self, items=None):
+        # copy read-only (memory mapped or shared) blocks about to be modified
+        # in place; cached items would still view the old values
+        if self._data.ensure_writeable(items):
+            self._clear_item_cache()
+
     def _set_item(self, key, value):
         if hasattr(self,'columns') and isinstance(self.columns, MultiIndex):
             # Pad the key with empty strings if lower levels of the key
@@ -490,6 +515,7 @@ class NDFrame(PandasObject):
                 key = (key,)
             if len(key) != self.columns.nlevels:
                 key += ('',)*(self.columns.nlevels - len(key))
+        self._ensure_writeable([key])
         self._data.set(key, value)
 
         try:
@@ -748,7 +774,9 @@ class NDFrame(PandasObject):
         Parameters
         ----------
         deep : boolean, default True
-            Make a deep copy, i.e. also copy data
+            Make a deep copy, i.e. also copy data. The data is shared
+            copy-on-write where possible and only copied once either object
+            is modified
 
         Returns
         -------
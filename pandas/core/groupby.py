@@ -12,7 +12,9 @@ from pandas.core.panel import Panel
 from pandas.util.decorators import cache_readonly, Appender
 import pandas.core.algorithms as algos
 import pandas.core.common as com
+import pandas.core.parallel as parallel
 import pandas.lib as lib
+import pandas._algos as _algos
 
 
 class GroupByError(Exception):
@@ -655,17 +657,19 @@ class Grouper(object):
     #------------------------------------------------------------
     # Aggregation functions
 
+    # kernel names, specialized by dtype in pandas._algos as
+    # <name>_float64 / <name>_float32, with any extra arguments
     _cython_functions = {
-        'add' : lib.group_add,
-        'prod' : lib.group_prod,
-        'min' : lib.group_min,
-        'max' : lib.group_max,
-        'mean' : lib.group_mean,
-        'median' : lib.group_median,
-        'var' : lib.group_var,
-        'std' : lib.group_var,
-        'first': lambda a, b, c, d: lib.group_nth(a, b, c, d, 1),
-        'last': lib.group_last
+        'add' : 'group_add',
+        'prod' : 'group_prod',
+        'min' : 'group_min',
+        'max' : 'group_max',
+        'mean' : 'group_mean',
+        'median' : 'group_median',
+        'var' : 'group_var',
+        'std' : 'group_var',
+        'first': ('group_nth', 1),
+        'last': 'group_last'
     }
 
     _cython_transforms = {
@@ -680,8 +684,38 @@ class Grouper(object):
 
     _filter_empty_groups = True
 
+    def _get_aggregate_function(self, how, values):
+        """
+        Look up the Cython kernel for `how` specialized to the dtype of
+        values. float32 data is aggregated by float32 kernels, everything else
+        (and anything without a float32 kernel, e.g. median) as float64
+
+        Returns
+        -------
+        (func, values) : values converted to the dtype func expects
+        """
+        fname = self._cython_functions[how]
+        extra = ()
+        if isinstance(fname, tuple):
+            fname, extra = fname[0], fname[1:]
+
+        func = None
+        if values.dtype == np.float32:
+            func = getattr(_algos, '%s_float32' % fname, None)
+        if func is None:
+            values = com._ensure_float64(values)
+            func = getattr(_algos, '%s_float64' % fname, None)
+            if func is None:
+                func = getattr(lib, fname)
+
+        if extra:
+            kernel = func
+            func = lambda *args: kernel(*(args + extra))
+
+        return func, values
+
     def aggregate(self, values, how, axis=0):
-        values = com._ensure_float64(values)
+        agg_func, values = self._get_aggregate_function(how, values)
         arity = self._cython_arity.get(how, 1)
 
         vdim = values.ndim
@@ -698,15 +732,16 @@ class Grouper(object):
             out_shape = (self.ngroups,) + values.shape[1:]
 
         # will be filled in Cython function
-        result = np.empty(out_shape, dtype=np.float64)
+        result = np.empty(out_shape, dtype=values.dtype)
         counts = np.zeros(self.ngroups, dtype=np.int64)
 
-        result = self._aggregate(result, counts, values, how)
+        result = self._aggregate(result, counts, values, agg_func, how)
 
         if self._filter_empty_groups:
             if result.ndim == 2:
-                result = lib.row_bool_subset(result,
-                                             (counts > 0).view(np.uint8))
+                subset = getattr(_algos,
+                                 'row_bool_subset_%s' % result.dtype.name)
+                result = subset(result, (counts > 0).view(np.uint8))
             else:
                 result = result[counts > 0]
 
@@ -724,8 +759,7 @@ class Grouper(object):
 
         return result, names
 
-    def _aggregate(self, result, counts, values, how):
-        agg_func = self._cython_functions[how]
+    def _aggregate(self, result, counts, values, agg_func, how):
         trans_func = self._cython_transforms.get(how, lambda x: x)
 
         comp_ids, _, ngroups = self.group_info
@@ -737,7 +771,7 @@ class Grouper(object):
                 agg_func(result[:, :, i], counts, chunk.squeeze(),
                          comp_ids)
         else:
-            agg_func(result, counts, values, comp_ids)
+            _aggregate_columns(agg_func, result, counts, values, comp_ids)
 
         return trans_func(result)
 
@@ -844,6 +878,28 @@ def generate_bins_generic(values, binner, closed):
     return bins
 
 
+def _aggregate_columns(agg_func, result, counts, values, labels):
+    """
+    Run an aggregation kernel on chunks of the columns of values on the
+    threads of pandas.core.parallel when values is large. Each chunk counts
+    the group sizes in an array of its own
+    """
+    nchunks = parallel.get_nchunks(values.shape[1], values.size)
+    if nchunks == 1:
+        agg_func(result, counts, values, labels)
+        return
+
+    bounds = parallel.chunk_bounds(values.shape[1], nchunks)
+    chunk_counts = dict((start, np.zeros_like(counts)) for start, _ in bounds)
+
+    def _aggregate_chunk(start, end):
+        agg_func(result[:, start:end], chunk_counts[start],
+                 values[:, start:end], labels)
+
+    parallel.run(_aggregate_chunk, bounds)
+    counts += chunk_counts[0]
+
+
 class CustomGrouper(object):
 
     def get_grouper(self, obj):
@@ -901,16 +957,16 @@ class BinGrouper(Grouper):
     # cython aggregation
 
     _cython_functions = {
-        'add' : lib.group_add_bin,
-        'prod' : lib.group_prod_bin,
-        'mean' : lib.group_mean_bin,
-        'min' : lib.group_min_bin,
-        'max' : lib.group_max_bin,
-        'var' : lib.group_var_bin,
-        'std' : lib.group_var_bin,
-        'ohlc' : lib.group_ohlc,
-        'first': lambda a, b, c, d: lib.group_nth_bin(a, b, c, d, 1),
-        'last': lib.group_last_bin
+        'add' : 'group_add_bin',
+        'prod' : 'group_prod_bin',
+        'mean' : 'group_mean_bin',
+        'min' : 'group_min_bin',
+        'max' : 'group_max_bin',
+        'var' : 'group_var_bin',
+        'std' : 'group_var_bin',
+        'ohlc' : 'group_ohlc',
+        'first': ('group_nth_bin', 1),
+        'last': 'group_last_bin'
     }
 
     _name_functions = {
@@ -919,8 +975,7 @@ class BinGrouper(Grouper):
 
     _filter_empty_groups = True
 
-    def _aggregate(self, result, counts, values, how):
-        agg_func = self._cython_functions[how]
+    def _aggregate(self, result, counts, values, agg_func, how):
         trans_func = self._cython_transforms.get(how, lambda x: x)
 
         if values.ndim > 3:
@@ -930,7 +985,7 @@ class BinGrouper(Grouper):
             for i, chunk in enumerate(values.transpose(2, 0, 1)):
                 agg_func(result[:, :, i], counts, chunk, self.bins)
         else:
-            agg_func(result, counts, values, self.bins)
+            _aggregate_columns(agg_func, result, counts, values, self.bins)
 
         return trans_func(result)
 
@@ -1009,6 +1064,15 @@ class Grouping(object):
         else:
             if isinstance(self.grouper, (list, tuple)):
                 self.grouper = com._asarray_tuplesafe(self.grouper)
+            elif (isinstance(grouper, Series) and
+                  grouper._categorical is not None and
+                  grouper.index.equals(index)):
+                # column stored as codes, group on the codes of the levels
+                # that occur
+                self._was_factor = True
+                self._labels, self._group_index, self._counts = \
+                    _categorical_groups(grouper._categorical, sort)
+                self._group_index.name = self.name
             elif isinstance(self.grouper, Categorical):
                 factor = self.grouper
                 self._was_factor = True
@@ -1156,6 +1220,39 @@ def _get_grouper(obj, key=None, axis=0, level=None, sort=True):
 
     return grouper, exclusions
 
+def _categorical_groups(factor, sort=True):
+    """
+    Group labels, group index and counts of the levels of a Categorical that
+    occur, computed from its codes
+
+    Returns
+    -------
+    (labels, group_index, counts)
+    """
+    levels = factor.levels
+    codes = com._ensure_int64(factor.labels)
+    observed = codes[codes != -1]
+    counts = lib.group_count(observed, len(levels))
+
+    if sort:
+        if levels.is_monotonic:
+            order = np.arange(len(levels))
+        else:
+            order = levels.argsort()
+        keep = order[counts.take(order) > 0]
+    else:
+        # groups in order of first appearance, like other keys
+        uniques, first = np.unique(observed, return_index=True)
+        keep = uniques.take(first.argsort())
+
+    # the extra last entry maps missing values (-1) to -1
+    mapping = np.empty(len(levels) + 1, dtype=np.int64)
+    mapping.fill(-1)
+    mapping[keep] = np.arange(len(keep))
+
+    labels = mapping.take(com._ensure_platform_int(codes))
+    return labels, levels.take(keep), counts.take(keep)
+
 def _is_label_like(val):
     return isinstance(val, basestring) or np.isscalar(val)
 
@@ -1414,11 +1511,10 @@ class NDFrameGroupBy(GroupBy):
         new_blocks = []
 
         for block in data.blocks:
-            values = block.values
-            if not issubclass(values.dtype.type, (np.number, np.bool_)):
+            if not issubclass(block.dtype.type, (np.number, np.bool_)):
                 continue
 
-            values = com._ensure_float64(values)
+            values = block.values
             result, names = self.grouper.aggregate(values, how, axis=agg_axis)
             newb = make_block(result, block.items, block.ref_items)
             new_blocks.append(newb)
@@ -2059,6 +2155,11 @@ def _lexsort_indexer(keys):
     labels = []
     shape = []
     for key in keys:
+        if isinstance(key, Categorical):
+            labels.append(key._sort_labels())
+            shape.append(len(key.levels) + 1)
+            continue
+
         rizer = lib.Factorizer(len(key))
 
         if not key.dtype == np.object_:
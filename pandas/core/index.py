@@ -220,6 +220,33 @@ class Index(np.ndarray):
     def values(self):
         return np.asarray(self)
 
+    def memory_usage(self, deep=False):
+        """
+        Memory used by the index values and, once it has been built, the hash
+        table of its engine
+
+        Parameters
+        ----------
+        deep : boolean, default False
+            Also measure the Python objects held by an object index rather
+            than only the array of pointers to them
+
+        Returns
+        -------
+        bytes : int
+        """
+        result = self.nbytes
+        if deep and self.dtype == np.object_:
+            result += lib.memory_usage_of_objects(self.values)
+        return result + self._engine_memory_usage()
+
+    def _engine_memory_usage(self):
+        # don't build the engine just to measure it
+        cache = getattr(self, '_cache', None) or {}
+        if '_engine' in cache:
+            return cache['_engine'].sizeof()
+        return 0
+
     @property
     def is_monotonic(self):
         return self._engine.is_monotonic
@@ -444,15 +471,7 @@ class Index(np.ndarray):
         mask : array of booleans where data is not NA
 
         """
-        locs = self.values[mask].searchsorted(where.values, side='right')
-
-        locs = np.where(locs > 0, locs - 1, 0)
-        result = np.arange(len(self))[mask].take(locs)
-
-        first = mask.argmax()
-        result[(locs == 0) & (where < self.values[first])] = -1
-
-        return result
+        return _asof_locs(self.values, where.values, mask)
 
     def order(self, return_indexer=False, ascending=True):
         """
@@ -744,6 +763,10 @@ class Index(np.ndarray):
             target = target.astype(object)
             return this.get_indexer(target, method=method, limit=limit)
 
+        # the monotonic check also tells whether a sorted index is unique,
+        # without building its hash table
+        can_merge = method is None and self._can_merge(target)
+
         if not self.is_unique:
             raise Exception('Reindexing only valid with uniquely valued Index '
                             'objects')
@@ -755,12 +778,33 @@ class Index(np.ndarray):
             assert(self.is_monotonic)
             indexer = self._engine.get_backfill_indexer(target.values, limit)
         elif method is None:
-            indexer = self._engine.get_indexer(target.values)
+            if can_merge:
+                indexer = self._left_indexer_unique(target.values,
+                                                    self.values)
+            else:
+                indexer = self._engine.get_indexer(target.values)
         else:
             raise ValueError('unrecognized method: %s' % method)
 
         return com._ensure_platform_int(indexer)
 
+    def _can_merge(self, other):
+        """
+        Whether indexers between self and other can be computed by merging
+        the sorted values of both, instead of looking them up in a hash table
+        """
+        if self.dtype != other.dtype:
+            return False
+        if not (self.is_monotonic and other.is_monotonic):
+            return False
+
+        # objects sorted on each side need not compare with each other, and
+        # NaN compares neither smaller nor larger than anything
+        if self.dtype == np.object_:
+            return (self.inferred_type in ('string', 'unicode') and
+                    other.inferred_type in ('string', 'unicode'))
+        return True
+
     def _possibly_promote(self, other):
         # A hack, but it works
         from pandas.tseries.index import DatetimeIndex
@@ -787,6 +831,11 @@ class Index(np.ndarray):
         -------
         is_contained : ndarray (boolean dtype)
         """
+        if (isinstance(values, Index) and self._can_merge(values) and
+                values.is_unique):
+            indexer = self._left_indexer_unique(self.values, values.values)
+            return indexer != -1
+
         value_set = set(values)
         return lib.ismember(self._array_values(), value_set)
 
@@ -1306,6 +1355,10 @@ class MultiIndex(Index):
         # hack for various methods
         return self.values
 
+    def _can_merge(self, other):
+        # merging would materialize the tuples
+        return False
+
     @property
     def dtype(self):
         return np.dtype('O')
@@ -1367,6 +1420,10 @@ class MultiIndex(Index):
 
     _tuples = None
 
+    @cache_readonly
+    def _engine(self):
+        return MultiIndexEngine(self.levels, self.labels)
+
     @property
     def values(self):
         if self._is_v2:
@@ -1386,6 +1443,29 @@ class MultiIndex(Index):
             self._tuples = lib.fast_zip(values)
             return self._tuples
 
+    def memory_usage(self, deep=False):
+        """
+        Memory used by the levels, labels, the tuples if they have been
+        materialized and the hash table of the engine if it has been built
+
+        Parameters
+        ----------
+        deep : boolean, default False
+            Also measure the Python objects held by object levels and tuples
+
+        Returns
+        -------
+        bytes : int
+        """
+        result = self.nbytes
+        result += sum(lev.memory_usage(deep=deep) for lev in self.levels)
+        result += sum(lab.nbytes for lab in self.labels)
+        if self._tuples is not None:
+            result += self._tuples.nbytes
+            if deep:
+                result += lib.memory_usage_of_objects(self._tuples)
+        return result + self._engine_memory_usage()
+
     # fml
     @property
     def _is_v1(self):
@@ -1433,7 +1513,9 @@ class MultiIndex(Index):
                 loc = self.get_loc(key)
                 new_values = series.values[loc]
                 new_index = self[loc]
-                new_index = _maybe_droplevels(new_index, key)
+                # a full key into a non-unique index keeps all the levels
+                if not (isinstance(key, tuple) and len(key) == self.nlevels):
+                    new_index = _maybe_droplevels(new_index, key)
                 return Series(new_values, index=new_index, name=series.name)
             except KeyError:
                 pass
@@ -1615,7 +1697,11 @@ class MultiIndex(Index):
     def __reduce__(self):
         """Necessary for making this object picklable"""
         object_state = list(np.ndarray.__reduce__(self))
-        subclass_state = (self.levels, self.labels, self.sortorder, self.names)
+
+        # labels are pickled in the smallest integer type that holds them
+        labels = [_compact_labels(lab, len(lev))
+                  for lab, lev in zip(self.labels, self.levels)]
+        subclass_state = (self.levels, labels, self.sortorder, self.names)
         object_state[2] = (object_state[2], subclass_state)
         return tuple(object_state)
 
@@ -1626,7 +1712,7 @@ class MultiIndex(Index):
         levels, labels, sortorder, names = own_state
 
         self.levels = [Index(x) for x in levels]
-        self.labels = labels
+        self.labels = [np.asarray(labs, dtype=np.int_) for labs in labels]
         self.names = names
         self.sortorder = sortorder
 
@@ -1886,6 +1972,21 @@ class MultiIndex(Index):
 
         target = _ensure_index(target)
 
+        if isinstance(target, MultiIndex) and target.nlevels == self.nlevels:
+            # look up the codes of the tuples rather than the tuples
+            codes = self._engine.get_target_codes(target)
+            if method is None:
+                return com._ensure_platform_int(
+                    self._engine.get_indexer(codes))
+            elif not (codes == -1).any():
+                assert(self.is_unique and self.is_monotonic)
+                if method == 'pad':
+                    indexer = self._engine.get_pad_indexer(codes, limit=limit)
+                else:
+                    indexer = self._engine.get_backfill_indexer(codes,
+                                                                limit=limit)
+                return com._ensure_platform_int(indexer)
+
         target_index = target
         if isinstance(target, MultiIndex):
             target_index = target._tuple_index
@@ -1941,6 +2042,78 @@ class MultiIndex(Index):
 
         return target, indexer
 
+    def join(self, other, how='left', level=None, return_indexers=False):
+        if (level is None and isinstance(other, MultiIndex) and
+                other.nlevels == self.nlevels and len(self) > 0 and
+                len(other) > 0):
+            _validate_join_method(how)
+            return self._join_codes(other, how=how,
+                                    return_indexers=return_indexers)
+        return Index.join(self, other, how=how, level=level,
+                          return_indexers=return_indexers)
+
+    def _join_codes(self, other, how='left', return_indexers=False):
+        """
+        Join two MultiIndex objects by joining the codes of their tuples
+        (see MultiIndexEngine) as an Int64Index, on the union of their levels
+        """
+        levels, left_labels, right_labels = [], [], []
+        for lev, lab, olev, olab in izip(self.levels, self.labels,
+                                         other.levels, other.labels):
+            if lev is not olev and not lev.equals(olev):
+                new_lev = lev.union(olev)
+                lab = _recode_labels(lab, new_lev.get_indexer(lev))
+                olab = _recode_labels(olab, new_lev.get_indexer(olev))
+                lev = new_lev
+            levels.append(lev)
+            left_labels.append(lab)
+            right_labels.append(olab)
+
+        # pack the tuples of both sides together, so that they get the same
+        # codes
+        n = len(self)
+        engine = MultiIndexEngine(levels, [np.concatenate([l, r]) for l, r
+                                           in izip(left_labels,
+                                                   right_labels)])
+        left_codes = Int64Index(engine.codes[:n])
+        right_codes = Int64Index(engine.codes[n:])
+
+        join_codes, lidx, ridx = left_codes.join(right_codes, how=how,
+                                                 return_indexers=True)
+
+        if how == 'inner' and not join_codes.is_monotonic:
+            # sorted like the intersection of the tuples
+            order = join_codes.argsort(kind='mergesort')
+            join_codes = join_codes.take(order)
+            lidx = order if lidx is None else lidx.take(order)
+            ridx = order if ridx is None else ridx.take(order)
+
+        if join_codes is left_codes:
+            join_index = self
+        elif join_codes is right_codes:
+            join_index = other
+        else:
+            if lidx is None:
+                labels = left_labels
+            elif ridx is None:
+                labels = right_labels
+            else:
+                missing = lidx == -1
+                labels = []
+                for lab, olab in izip(left_labels, right_labels):
+                    lab = lab.take(lidx)
+                    lab[missing] = olab.take(ridx[missing])
+                    labels.append(lab)
+
+            names = self.names if self.names == other.names else None
+            join_index = MultiIndex(levels=levels, labels=labels,
+                                    names=names)
+
+        if return_indexers:
+            return join_index, lidx, ridx
+        else:
+            return join_index
+
     @cache_readonly
     def _tuple_index(self):
         """
@@ -2379,6 +2552,187 @@ class MultiIndex(Index):
         return MultiIndex.from_tuples(joined, names=names)
 
 
+_INT64_MAX = np.iinfo(np.int64).max
+
+
+class MultiIndexEngine(object):
+    """
+    Maps the tuples of a MultiIndex to their locations without materializing
+    them: each tuple is identified by an int64 code combining the labels of
+    its levels, and the codes are looked up by an Int64Engine
+
+    The labels are the digits of the code in a mixed radix, one digit per
+    level (0 for NA), numbered in the sort order of the level so that codes
+    sort like the tuples. When the next level would overflow int64, the code
+    of the levels before it is replaced by its rank among the distinct codes
+
+    Parameters
+    ----------
+    levels : list of Index
+    labels : list of ndarray
+    """
+
+    def __init__(self, levels, labels):
+        self.levels = levels
+
+        # position of each level value in the sorted level, None if the
+        # level is sorted already
+        self._level_ranks = []
+        for lev in levels:
+            if lev.is_monotonic:
+                self._level_ranks.append(None)
+            else:
+                ranks = np.empty(len(lev), dtype=np.int64)
+                ranks.put(lev.values.argsort(kind='mergesort'),
+                          np.arange(len(lev)))
+                self._level_ranks.append(ranks)
+
+        # sorted distinct codes of the levels before level i, if ranked
+        self._code_ranks = [None] * len(levels)
+
+        self.codes = self._pack(labels, build=True)
+        self._engine = lib.Int64Engine(lambda: self.codes, len(self.codes))
+
+    def _pack(self, labels, build=False):
+        """
+        Codes of the tuples with the passed labels, -1 for those that are not
+        in the index (labels of -2 mark values missing from a level)
+        """
+        n = len(labels[0])
+        codes = np.zeros(n, dtype=np.int64)
+        found = np.ones(n, dtype=bool)
+        bound = 1
+
+        for i, (lev, lab) in enumerate(izip(self.levels, labels)):
+            radix = len(lev) + 1
+            if build and bound > _INT64_MAX // radix:
+                self._code_ranks[i] = np.unique(codes)
+
+            code_ranks = self._code_ranks[i]
+            if code_ranks is not None:
+                pos = code_ranks.searchsorted(codes)
+                if not build:
+                    in_range = pos < len(code_ranks)
+                    found &= in_range
+                    matched = code_ranks[pos[in_range]] == codes[in_range]
+                    found[in_range] &= matched
+                codes = pos
+                bound = len(code_ranks)
+
+            lab = com._ensure_int64(lab)
+            if not build:
+                found &= lab != -2
+
+            # NA labels (-1) take digit 0
+            if self._level_ranks[i] is not None:
+                digits = np.append(self._level_ranks[i], -1).take(lab) + 1
+            else:
+                digits = lab + 1
+
+            codes = codes * radix + digits
+            bound *= radix
+
+        if not build:
+            codes[~found] = -1
+        return codes
+
+    def get_target_codes(self, target):
+        """
+        Codes of the tuples of a MultiIndex with as many levels, -1 for those
+        that are not in the index
+        """
+        labels = []
+        for lev, tlev, tlab in izip(self.levels, target.levels, target.labels):
+            if lev is tlev or lev.equals(tlev):
+                labels.append(tlab)
+                continue
+            lev_indexer = com._ensure_int64(lev.get_indexer(tlev))
+            lev_indexer[lev_indexer == -1] = -2
+            # NA labels of the target take the last entry
+            lev_indexer = np.append(lev_indexer, -1)
+            labels.append(lev_indexer.take(tlab))
+        return self._pack(labels)
+
+    def _key_code(self, key):
+        if isinstance(key, (slice, np.ndarray, list)):
+            raise TypeError(key)
+        if not isinstance(key, tuple) or len(key) != len(self.levels):
+            raise KeyError(key)
+
+        labels = []
+        for lev, k in izip(self.levels, key):
+            loc = lev.get_loc(k)
+            if not com.is_integer(loc):
+                raise KeyError(key)
+            labels.append(np.array([loc], dtype=np.int64))
+
+        code = self._pack(labels)[0]
+        if code == -1:
+            raise KeyError(key)
+        return code
+
+    def get_loc(self, key):
+        if isinstance(key, tuple):
+            hash(key)
+        try:
+            code = self._key_code(key)
+            return self._engine.get_loc(code)
+        except KeyError:
+            raise KeyError(key)
+
+    def get_value(self, arr, key):
+        loc = self.get_loc(key)
+        if isinstance(loc, (slice, np.ndarray)):
+            return arr[loc]
+        # a non-unique index selects a Series, even for a single match
+        if not self.is_unique:
+            return arr[loc:loc + 1]
+        if arr.dtype == np.dtype('M8[ns]'):
+            return Timestamp(lib.get_value_at(arr, loc))
+        return lib.get_value_at(arr, loc)
+
+    def set_value(self, arr, key, value):
+        loc = self.get_loc(key)
+        if isinstance(loc, (slice, np.ndarray)):
+            arr[loc] = value
+        else:
+            lib.set_value_at(arr, loc, value)
+
+    def __contains__(self, key):
+        try:
+            self.get_loc(key)
+            return True
+        except (KeyError, TypeError):
+            return False
+
+    @property
+    def is_unique(self):
+        return self._engine.is_unique
+
+    @property
+    def is_monotonic(self):
+        return self._engine.is_monotonic
+
+    # the indexers take the codes of the target, see get_target_codes. Codes
+    # of -1 (tuples that are not in the index) cannot be padded / backfilled
+
+    def get_indexer(self, codes):
+        return self._engine.get_indexer(codes)
+
+    def get_pad_indexer(self, codes, limit=None):
+        return self._engine.get_pad_indexer(codes, limit=limit)
+
+    def get_backfill_indexer(self, codes, limit=None):
+        return self._engine.get_backfill_indexer(codes, limit=limit)
+
+    def sizeof(self):
+        """ size of the codes and, once built, their hash table in bytes """
+        return self.codes.nbytes + self._engine.sizeof()
+
+    def clear_mapping(self):
+        self._engine.clear_mapping()
+
+
 # For utility purposes
 
 
@@ -2410,6 +2764,40 @@ def _sparsify(label_list, start=0):
     return zip(*result)
 
 
+def _recode_labels(labels, level_indexer):
+    """
+    Labels into a new level, given the location of each value of the old
+    level in it. NA labels (-1) stay NA
+    """
+    level_indexer = np.append(com._ensure_int64(level_indexer), -1)
+    return level_indexer.take(labels)
+
+
+def _compact_labels(labels, nlevels):
+    for dtype in (np.int8, np.int16, np.int32):
+        if nlevels < np.iinfo(dtype).max:
+            return labels.astype(dtype)
+    return labels
+
+
+def _asof_locs(values, where, mask):
+    """
+    Location of the last value at or before each value of where among the
+    sorted values where mask is True, -1 if there is none
+    """
+    if mask.all():
+        positions = None
+    else:
+        positions = mask.nonzero()[0]
+        values = values.take(positions)
+
+    locs = values.searchsorted(where, side='right') - 1
+    if positions is not None:
+        found = locs >= 0
+        locs[found] = positions.take(locs[found])
+    return locs
+
+
 def _ensure_index(index_like):
     if isinstance(index_like, Index):
         return index_like
@@ -100,6 +100,7 @@ class _NDFrameIndexer(object):
 
             plane_indexer = indexer[:het_axis] + indexer[het_axis + 1:]
             item_labels = self.obj._get_axis(het_axis)
+            self.obj._ensure_writeable(item_labels[het_idx])
 
             if isinstance(value, (np.ndarray, DataFrame)) and value.ndim > 1:
                 raise ValueError('Setting mixed-type DataFrames with '
@@ -122,6 +123,7 @@ class _NDFrameIndexer(object):
                 if not isinstance(self.obj, DataFrame):
                     value = value.T
 
+            self.obj._ensure_writeable()
             self.obj.values[indexer] = value
 
     def _getitem_tuple(self, tup):
@@ -1,13 +1,25 @@
 import itertools
+import weakref
 from datetime import datetime
 
 from numpy import nan
 import numpy as np
 
-from pandas.core.index import Index, _ensure_index, _handle_legacy_indexes
+from pandas.core.categorical import Categorical
+from pandas.core.index import (Index, _ensure_index, _handle_legacy_indexes,
+                               _compact_labels)
 import pandas.core.common as com
 import pandas.lib as lib
 
+# Inserting items adds one block per item. Consolidation, which copies all the
+# blocks of a dtype together, is deferred until there are more than
+# _CONSOLIDATE_MIN_BLOCKS blocks, and in managers holding more than
+# _CONSOLIDATE_MIN_NBYTES until the number of blocks is a fraction of the
+# number of items, so the copying done by repeated inserts stays linear
+_CONSOLIDATE_MIN_BLOCKS = 100
+_CONSOLIDATE_MIN_NBYTES = 1 << 23
+_CONSOLIDATE_ITEMS_PER_BLOCK = 4
+
 class Block(object):
     """
     Canonical n-dimensional unit of homogeneous dtype contained in a pandas data
@@ -15,7 +27,20 @@ class Block(object):
 
     Index-ignorant; let the container take care of that
     """
-    __slots__ = ['items', 'ref_items', '_ref_locs', 'values', 'ndim']
+    __slots__ = ['items', '_ref_items', '_ref_locs', 'values', 'ndim']
+
+    # merged with the other blocks of its dtype by consolidation
+    _can_consolidate = True
+
+    # the values are stored, not built from another form on access
+    _is_dense = True
+
+    # nothing outside the block manager references the values, e.g. they
+    # were allocated by a copy or by consolidation, so copies may share them
+    _owns_values = False
+
+    # weak references to the blocks sharing the values copy-on-write
+    _shared = None
 
     def __init__(self, values, items, ref_items, ndim=2,
                  do_integrity_check=False):
@@ -39,6 +64,16 @@ class Block(object):
         # monotonicity
         return (self.ref_locs[1:] > self.ref_locs[:-1]).all()
 
+    def _get_ref_items(self):
+        return self._ref_items
+
+    def _set_ref_items(self, value):
+        # positions in the new ref_items may differ
+        self._ref_items = value
+        self._ref_locs = None
+
+    ref_items = property(fget=_get_ref_items, fset=_set_ref_items)
+
     _ref_locs = None
     @property
     def ref_locs(self):
@@ -89,11 +124,59 @@ class Block(object):
     def dtype(self):
         return self.values.dtype
 
+    def memory_usage(self, deep=False):
+        """
+        Bytes used by the values of each item
+
+        Parameters
+        ----------
+        deep : boolean, default False
+            Also measure the Python objects held by an object block
+
+        Returns
+        -------
+        usage : ndarray of int64, one entry per item
+        """
+        n = len(self.items)
+        result = np.empty(n, dtype=np.int64)
+        if n:
+            result.fill(self.values.nbytes // n)
+        return result
+
+    def _slice(self, slicer):
+        """
+        Block of the values selected by slicer, a tuple of slices with the null
+        slice along the item axis
+        """
+        return make_block(self._view_values()[slicer], self.items,
+                          self.ref_items)
+
+    def _xs_values(self, loc):
+        return self.values[:, loc]
+
+    def _get_scalar(self, loc):
+        return self.values[loc]
+
     def copy(self, deep=True):
+        if not deep:
+            return make_block(self._view_values(), self.items, self.ref_items)
+
         values = self.values
-        if deep:
-            values = values.copy()
-        return make_block(values, self.items, self.ref_items)
+        if not values.flags.writeable:
+            # memory mapped, copied on the first write (see _writeable_values)
+            return make_block(values.view(), self.items, self.ref_items)
+
+        if not self._owns_values:
+            result = make_block(values.copy(), self.items, self.ref_items)
+        else:
+            # the first of the blocks to be modified copies the values
+            result = make_block(values, self.items, self.ref_items)
+            if self._shared is None:
+                self._shared = [weakref.ref(self)]
+            self._shared.append(weakref.ref(result))
+            result._shared = self._shared
+        result._owns_values = True
+        return result
 
     def merge(self, other):
         assert(self.ref_items.equals(other.ref_items))
@@ -106,8 +189,14 @@ class Block(object):
     def reindex_axis(self, indexer, mask, needs_masking, axis=0,
                      fill_value=np.nan):
         """
-        Reindex using pre-computed indexer information
+        Reindex using pre-computed indexer information. Integer and boolean
+        values with missing values are kept in a MaskedBlock
         """
+        if (needs_masking and not self._can_hold_na and
+            com.isnull(fill_value) and self.values.size > 0):
+            data, mask = _take_masked(self.values, None, indexer, axis)
+            return MaskedBlock(data, mask, self.items, self.ref_items,
+                               ndim=self.ndim)
         if self.values.size > 0:
             new_values = com.take_fast(self.values, indexer, mask,
                                        needs_masking, axis=axis,
@@ -132,8 +221,13 @@ class Block(object):
         """
         new_ref_items, indexer = self.items.reindex(new_ref_items)
         if indexer is None:
+            if copy:
+                # keeps sharing the values with the copy tracked
+                block = self.copy()
+                block.items = block.ref_items = new_ref_items
+                return block
             new_items = new_ref_items
-            new_values = self.values.copy() if copy else self.values
+            new_values = self._view_values()
         else:
             mask = indexer != -1
             masked_idx = indexer[mask]
@@ -149,7 +243,49 @@ class Block(object):
 
     def get(self, item):
         loc = self.items.get_loc(item)
-        return self.values[loc]
+        return self._view_values()[loc]
+
+    def _writeable_values(self):
+        """
+        Values to modify in place. Read-only values, e.g. memory mapped by
+        read_native, and values still shared with copies of the block are
+        copied into the block first
+        """
+        if not self.values.flags.writeable or self._is_shared():
+            self._unshare()
+            self.values = self.values.copy()
+            self._owns_values = True
+        return self.values
+
+    def _view_values(self):
+        """
+        Values to hand out as a view that writes through to the block. Values
+        shared copy-on-write with copies of the block are unshared first, and
+        later copies of the block copy them
+        """
+        if self._is_shared():
+            self._writeable_values()
+        self._owns_values = False
+        return self.values
+
+    def _is_shared(self):
+        """
+        True if other blocks still share the values copy-on-write
+        """
+        if self._shared is None:
+            return False
+        live = [ref for ref in self._shared if ref() is not None]
+        self._shared[:] = live
+        if len(live) > 1:
+            return True
+        self._shared = None
+        return False
+
+    def _unshare(self):
+        if self._shared is not None:
+            self._shared[:] = [ref for ref in self._shared
+                               if ref() is not self and ref() is not None]
+            self._shared = None
 
     def set(self, item, value):
         """
@@ -160,7 +296,7 @@ class Block(object):
         None
         """
         loc = self.items.get_loc(item)
-        self.values[loc] = value
+        self._writeable_values()[loc] = value
 
     def delete(self, item):
         """
@@ -188,28 +324,32 @@ class Block(object):
             # no blocks left
             return None, None
 
+        # the new blocks view the values
+        values = self._view_values()
+
         if loc == 0:
             # at front
             left_block = None
-            right_block = make_block(self.values[1:], self.items[1:].copy(),
+            right_block = make_block(values[1:], self.items[1:].copy(),
                                       self.ref_items)
-        elif loc == len(self.values) - 1:
+        elif loc == len(values) - 1:
             # at back
-            left_block = make_block(self.values[:-1], self.items[:-1].copy(),
+            left_block = make_block(values[:-1], self.items[:-1].copy(),
                                     self.ref_items)
             right_block = None
         else:
             # in the middle
-            left_block = make_block(self.values[:loc],
+            left_block = make_block(values[:loc],
                                     self.items[:loc].copy(), self.ref_items)
-            right_block = make_block(self.values[loc + 1:],
+            right_block = make_block(values[loc + 1:],
                                      self.items[loc + 1:].copy(),
                                      self.ref_items)
 
         return left_block, right_block
 
     def fillna(self, value, inplace=False):
-        new_values = self.values if inplace else self.values.copy()
+        new_values = (self._writeable_values() if inplace
+                      else self.values.copy())
 
         mask = com.isnull(new_values)
         np.putmask(new_values, mask, value)
@@ -226,7 +366,8 @@ class Block(object):
         raise NotImplementedError()
 
     def replace(self, to_replace, value, inplace=False):
-        new_values = self.values if inplace else self.values.copy()
+        new_values = (self._writeable_values() if inplace
+                      else self.values.copy())
         if self._can_hold_element(value):
             value = self._try_cast(value)
 
@@ -254,7 +395,8 @@ class Block(object):
             return make_block(new_values, self.items, self.ref_items)
 
     def putmask(self, mask, new, inplace=False):
-        new_values = self.values if inplace else self.values.copy()
+        new_values = (self._writeable_values() if inplace
+                      else self.values.copy())
         if self._can_hold_element(new):
             new = self._try_cast(new)
             np.putmask(new_values, mask, new)
@@ -265,7 +407,8 @@ class Block(object):
 
     def interpolate(self, method='pad', axis=0, inplace=False,
                     limit=None, missing=None):
-        values = self.values if inplace else self.values.copy()
+        values = (self._writeable_values() if inplace
+                  else self.values.copy())
 
         if values.ndim != 2:
             raise NotImplementedError
@@ -286,6 +429,10 @@ class Block(object):
 
     def take(self, indexer, axis=1, fill_value=np.nan):
         assert(axis >= 1)
+        if not self._can_hold_na:
+            mask = com._ensure_int64(indexer) == -1
+            return self.reindex_axis(indexer, mask, mask.any(), axis=axis,
+                                     fill_value=fill_value)
         new_values = com.take_fast(self.values, indexer, None,
                                    None, axis=axis,
                                    fill_value=fill_value)
@@ -294,6 +441,13 @@ class Block(object):
     def get_values(self, dtype):
         return self.values
 
+    def to_dense(self):
+        """
+        Values of the block as a dense ndarray. Blocks storing their values in
+        another form, e.g. CategoricalBlock, build them on each call
+        """
+        return self.values
+
 def _mask_missing(array, missing_values):
     if not isinstance(missing_values, (list, np.ndarray)):
         missing_values = [missing_values]
@@ -385,6 +539,24 @@ class ObjectBlock(Block):
     def _try_cast(self, element):
         return element
 
+    def memory_usage(self, deep=False):
+        result = Block.memory_usage(self, deep=deep)
+        if deep:
+            for i, row in enumerate(self.values):
+                result[i] += lib.memory_usage_of_objects(row.ravel())
+        return result
+
+    def intern_strings(self, table):
+        """
+        Make equal strings in the block share one object, interning them in
+        table (a lib.StringHashTable)
+
+        Returns
+        -------
+        n_replaced : int
+        """
+        return sum(table.intern(row) for row in self._writeable_values())
+
     def should_store(self, value):
         return not issubclass(value.dtype.type,
                               (np.integer, np.floating, np.complexfloating,
@@ -428,7 +600,7 @@ class DatetimeBlock(Block):
         if value.dtype != _NS_DTYPE:
             value = lib.cast_to_nanoseconds(value)
 
-        self.values[loc] = value
+        self._writeable_values()[loc] = value
 
     def get_values(self, dtype):
         if dtype == object:
@@ -438,24 +610,479 @@ class DatetimeBlock(Block):
         return self.values
 
 
-def make_block(values, items, ref_items, do_integrity_check=False):
-    dtype = values.dtype
+class CategoricalBlock(Block):
+    """
+    Block holding a single item as integer codes into its levels, -1 marking
+    missing values. The codes use the smallest integer type that fits the
+    number of levels. Code that is not aware of the codes sees the dense
+    values, which are read-only: writing to them would not change the codes.
+    They are built from the codes on each access, see to_dense
+    """
+    _can_hold_na = True
+    _can_consolidate = False
+    _is_dense = False
+
+    def __init__(self, codes, levels, items, ref_items, ndim=2,
+                 do_integrity_check=False):
+        assert(codes.ndim == ndim)
+        assert(len(items) == len(codes) == 1)
+
+        self.codes = codes
+        self.levels = _ensure_index(levels)
+        self.ndim = ndim
+        self.items = _ensure_index(items)
+        self.ref_items = _ensure_index(ref_items)
+
+    def _get_codes(self):
+        return self._codes
+
+    def _set_codes(self, codes):
+        # whether any value is missing, which the dtype depends on, is found
+        # once when the codes are set
+        self._codes = codes
+        self._hasna = bool((codes == -1).any())
+
+    codes = property(fget=_get_codes, fset=_set_codes)
+
+    @property
+    def values(self):
+        values = self.to_dense()
+        values.flags.writeable = False
+        return values
+
+    def to_dense(self):
+        """
+        New ndarray of the values the codes stand for
+        """
+        return self._dense_at(slice(None))
+
+    def _dense_at(self, slicer):
+        # dense values of the codes selected by slicer, only those are taken
+        codes = self.codes[slicer]
+        if np.isscalar(codes) or getattr(codes, 'ndim', 1) == 0:
+            return self.levels[codes] if codes != -1 else np.nan
+        values = com.take_1d(self.levels.values, codes.ravel())
+        return values.reshape(codes.shape)
+
+    def get_values(self, dtype):
+        # cast the levels rather than the dense values
+        levels = self.levels.values
+        if dtype == object and levels.dtype == _NS_DTYPE:
+            levels = lib.ints_to_pydatetime(levels.view(np.int64))
+        elif levels.dtype != dtype:
+            levels = levels.astype(dtype)
+        values = com.take_1d(levels, self.codes.ravel())
+        return values.reshape(self.codes.shape)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getstate__(self):
+        return (self.items, self.ref_items, self.codes, self.levels)
+
+    def __setstate__(self, state):
+        items, ref_items, codes, levels = state
+        self.items = _ensure_index(items)
+        self.ref_items = _ensure_index(ref_items)
+        self.codes = codes
+        self.levels = _ensure_index(levels)
+        self.ndim = codes.ndim
+
+    @property
+    def shape(self):
+        return self.codes.shape
+
+    @property
+    def dtype(self):
+        dtype = self.levels.dtype
+        if self._hasna and issubclass(dtype.type, (np.integer, np.bool_)):
+            dtype = com._upcast_dtype(dtype)
+        return dtype
+
+    def memory_usage(self, deep=False):
+        nbytes = self.codes.nbytes + self.levels.memory_usage(deep=deep)
+        return np.array([nbytes], dtype=np.int64)
+
+    def to_categorical(self):
+        return Categorical(self.codes[0], self.levels, name=self.items[0])
+
+    def _with_codes(self, codes, levels=None):
+        if levels is None:
+            levels = self.levels
+        return CategoricalBlock(codes, levels, self.items, self.ref_items,
+                                ndim=self.ndim)
+
+    def _slice(self, slicer):
+        return self._with_codes(self.codes[slicer])
+
+    def _xs_values(self, loc):
+        return self._dense_at((slice(None), loc))
+
+    def _get_scalar(self, loc):
+        return self._dense_at(loc)
+
+    def _take_items(self, indexer, items, ref_items):
+        # one block per position the item is taken to
+        return [CategoricalBlock(self.codes.copy(), self.levels, [item],
+                                 ref_items)
+                for item in items]
+
+    def copy(self, deep=True):
+        codes = self.codes.copy() if deep else self.codes
+        return self._with_codes(codes)
+
+    def _view_values(self):
+        return self.values
+
+    def reindex_axis(self, indexer, mask, needs_masking, axis=0,
+                     fill_value=np.nan):
+        # the mask is not computed for blocks that never need upcasting
+        indexer = com._ensure_platform_int(indexer)
+        codes = self.codes.take(indexer, axis=axis)
+        mask = indexer == -1
+        if mask.any():
+            levels, code = _categorical_code(self.levels, fill_value)
+            codes = _fit_codes(codes, levels)
+            codes[:, mask] = code
+            return self._with_codes(codes, levels)
+        return self._with_codes(codes)
+
+    def reindex_items_from(self, new_ref_items, copy=True):
+        if self.items[0] in new_ref_items:
+            codes = self.codes.copy() if copy else self.codes
+            return CategoricalBlock(codes, self.levels, self.items,
+                                    new_ref_items)
+        return CategoricalBlock(self.codes[:0], self.levels, self.items[:0],
+                                new_ref_items)
+
+    def take(self, indexer, axis=1, fill_value=np.nan):
+        assert(axis >= 1)
+        return self.reindex_axis(indexer, None, None, axis=axis,
+                                 fill_value=fill_value)
+
+    def should_store(self, value):
+        return False
+
+    def putmask(self, mask, new, inplace=False):
+        levels, code = _categorical_code(self.levels, new)
+        codes = _fit_codes(self.codes if inplace else self.codes.copy(),
+                           levels)
+        np.putmask(codes, mask, code)
+        if inplace:
+            self.codes, self.levels = codes, levels
+            return self
+        return self._with_codes(codes, levels)
+
+    def fillna(self, value, inplace=False):
+        return self.putmask(self.codes == -1, value, inplace=inplace)
+
+    def replace(self, to_replace, value, inplace=False):
+        if not isinstance(to_replace, (list, np.ndarray)):
+            to_replace = [to_replace]
+
+        mask = np.zeros(self.shape, dtype=bool)
+        for item in to_replace:
+            if com.isnull(item):
+                mask |= self.codes == -1
+            elif item in self.levels:
+                mask |= self.codes == self.levels.get_loc(item)
+        return self.putmask(mask, value, inplace=inplace)
+
+    def interpolate(self, method='pad', axis=0, inplace=False,
+                    limit=None, missing=None):
+        if missing is not None:
+            # fill positions holding the missing values, not only NA
+            mask = np.zeros(self.shape, dtype=bool)
+            if not isinstance(missing, (list, np.ndarray)):
+                missing = [missing]
+            for item in missing:
+                if com.isnull(item):
+                    mask |= self.codes == -1
+                elif item in self.levels:
+                    mask |= self.codes == self.levels.get_loc(item)
+        else:
+            mask = self.codes == -1
+
+        # pad the codes as floats, NaN marking the positions to fill
+        codes = self.codes.astype(np.float64)
+        codes[mask] = np.nan
+        transf = (lambda x: x) if axis == 0 else (lambda x: x.T)
+        if method == 'pad':
+            com.pad_2d(transf(codes), limit=limit)
+        else:
+            com.backfill_2d(transf(codes), limit=limit)
+
+        filled = mask & com.notnull(codes)
+        new_codes = self.codes if inplace else self.codes.copy()
+        new_codes[filled] = codes[filled]
+        if inplace:
+            self.codes = new_codes
+            return self
+        return self._with_codes(new_codes)
+
+
+def _categorical_code(levels, value):
+    """
+    The code of value in levels, appending value as a new level if needed
+
+    Returns
+    -------
+    (levels, code) : (Index, int)
+    """
+    if com.isnull(value):
+        return levels, -1
+    if value in levels:
+        return levels, levels.get_loc(value)
+    return levels.insert(len(levels), value), len(levels)
+
+def _fit_codes(codes, levels):
+    # widen the codes if they can't index all of the levels
+    if len(levels) >= np.iinfo(codes.dtype).max:
+        return _compact_labels(com._ensure_int64(codes), len(levels))
+    return codes
+
+
+class MaskedBlock(Block):
+    """
+    Block holding integer or boolean data that has missing values, marked by
+    a boolean mask of the same shape, instead of upcasting the data. The data
+    at the masked positions is arbitrary. The dtype is the one the data would
+    be upcast to, and code that is not aware of the mask sees dense values of
+    that dtype, which are read-only and built on each access, see to_dense
+    """
+    _can_hold_na = True
+    _can_consolidate = False
+    _is_dense = False
+
+    def __init__(self, data, mask, items, ref_items, ndim=2,
+                 do_integrity_check=False):
+        assert(data.ndim == ndim)
+        assert(data.shape == mask.shape)
+        assert(len(items) == len(data))
+
+        self.data = data
+        self.mask = mask
+        self.ndim = ndim
+        self.items = _ensure_index(items)
+        self.ref_items = _ensure_index(ref_items)
+
+    @property
+    def values(self):
+        values = self.to_dense()
+        values.flags.writeable = False
+        return values
+
+    def to_dense(self):
+        """
+        New ndarray of the upcast data, NaN at the masked positions
+        """
+        return self.get_values(self.dtype)
+
+    def _dense_at(self, slicer):
+        # dense values of the data selected by slicer, only those are upcast
+        data = self.data[slicer]
+        if np.isscalar(data) or getattr(data, 'ndim', 1) == 0:
+            return np.nan if self.mask[slicer] else data
+        values = data.astype(self.dtype)
+        np.putmask(values, self.mask[slicer], np.nan)
+        return values
+
+    def get_values(self, dtype):
+        values = self.data.astype(dtype)
+        np.putmask(values, self.mask, np.nan)
+        return values
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getstate__(self):
+        return (self.items, self.ref_items, self.data, self.mask)
+
+    def __setstate__(self, state):
+        items, ref_items, data, mask = state
+        self.items = _ensure_index(items)
+        self.ref_items = _ensure_index(ref_items)
+        self.data = data
+        self.mask = mask
+        self.ndim = data.ndim
+
+    @property
+    def shape(self):
+        return self.data.shape
+
+    @property
+    def dtype(self):
+        return com._upcast_dtype(self.data.dtype)
+
+    def memory_usage(self, deep=False):
+        n = len(self.items)
+        result = np.empty(n, dtype=np.int64)
+        if n:
+            result.fill((self.data.nbytes + self.mask.nbytes) // n)
+        return result
+
+    def _with_data(self, data, mask, items=None):
+        if items is None:
+            items = self.items
+        return MaskedBlock(data, mask, items, self.ref_items, ndim=self.ndim)
+
+    def _densified(self):
+        return make_block(self.to_dense(), self.items, self.ref_items)
+
+    def _slice(self, slicer):
+        return self._with_data(self.data[slicer], self.mask[slicer])
+
+    def _xs_values(self, loc):
+        return self._dense_at((slice(None), loc))
+
+    def _get_scalar(self, loc):
+        return self._dense_at(loc)
+
+    def _take_items(self, indexer, items, ref_items):
+        indexer = com._ensure_platform_int(indexer)
+        return [MaskedBlock(self.data.take(indexer, axis=0),
+                            self.mask.take(indexer, axis=0), items,
+                            ref_items, ndim=self.ndim)]
+
+    def copy(self, deep=True):
+        if deep:
+            return self._with_data(self.data.copy(), self.mask.copy())
+        return self._with_data(self.data, self.mask)
+
+    def _view_values(self):
+        return self.values
+
+    def reindex_axis(self, indexer, mask, needs_masking, axis=0,
+                     fill_value=np.nan):
+        # the mask is not computed for blocks that never need upcasting
+        if not com.isnull(fill_value):
+            return self._densified().reindex_axis(indexer, mask, needs_masking,
+                                                  axis=axis,
+                                                  fill_value=fill_value)
+        data, mask = _take_masked(self.data, self.mask, indexer, axis)
+        return self._with_data(data, mask)
+
+    def reindex_items_from(self, new_ref_items, copy=True):
+        new_ref_items, indexer = self.items.reindex(new_ref_items)
+        if indexer is None:
+            new_items = new_ref_items
+            data, mask = self.data, self.mask
+            if copy:
+                data, mask = data.copy(), mask.copy()
+        else:
+            masked_idx = indexer[indexer != -1]
+            data = self.data.take(masked_idx, axis=0)
+            mask = self.mask.take(masked_idx, axis=0)
+            new_items = self.items.take(masked_idx)
+        return MaskedBlock(data, mask, new_items, new_ref_items,
+                           ndim=self.ndim)
+
+    def take(self, indexer, axis=1, fill_value=np.nan):
+        assert(axis >= 1)
+        return self.reindex_axis(indexer, None, None, axis=axis,
+                                 fill_value=fill_value)
+
+    def should_store(self, value):
+        return False
+
+    def split_block_at(self, item):
+        loc = self.items.get_loc(item)
+        left_block = right_block = None
+        if loc > 0:
+            left_block = self._with_data(self.data[:loc], self.mask[:loc],
+                                         self.items[:loc].copy())
+        if loc < len(self.items) - 1:
+            right_block = self._with_data(self.data[loc + 1:],
+                                          self.mask[loc + 1:],
+                                          self.items[loc + 1:].copy())
+        return left_block, right_block
+
+    def _can_hold_element(self, element):
+        if self.data.dtype == np.bool_:
+            return isinstance(element, (int, bool))
+        return com.is_integer(element)
+
+    def _try_cast(self, element):
+        return self.data.dtype.type(element)
+
+    def fillna(self, value, inplace=False):
+        # filling with a value the data can hold gives back a plain block
+        if not self._can_hold_element(value):
+            return self._densified().fillna(value, inplace=True)
+        data = self.data.copy()
+        np.putmask(data, self.mask, self._try_cast(value))
+        return make_block(data, self.items, self.ref_items)
+
+    def putmask(self, mask, new, inplace=False):
+        if not (com.isnull(new) or self._can_hold_element(new)):
+            # the value needs the upcast dtype
+            return self._densified().putmask(mask, new, inplace=True)
+        block = self if inplace else self.copy()
+        if com.isnull(new):
+            block.mask |= mask
+        else:
+            np.putmask(block.data, mask, self._try_cast(new))
+            block.mask &= ~mask
+        return block
+
+    def replace(self, to_replace, value, inplace=False):
+        return self._densified().replace(to_replace, value, inplace=True)
+
+    def interpolate(self, method='pad', axis=0, inplace=False,
+                    limit=None, missing=None):
+        return self._densified().interpolate(method, axis=axis, inplace=True,
+                                             limit=limit, missing=missing)
+
+
+def _take_masked(data, mask, indexer, axis):
+    """
+    Take integer or boolean data and its mask of missing values, or no mask,
+    along axis, the -1 positions of indexer being missing. The data is taken
+    with the integer take kernels, without upcasting
+
+    Returns
+    -------
+    (data, mask) : (ndarray, ndarray of bool)
+    """
+    indexer = com._ensure_int64(indexer)
+    missing = indexer == -1
+    fill_value = False if data.dtype == np.bool_ else 0
+    new_data = com.take_fast(data, indexer, missing, False, axis=axis,
+                             fill_value=fill_value)
+    if mask is None:
+        new_mask = np.zeros(new_data.shape, dtype=bool)
+    else:
+        new_mask = com.take_fast(mask, indexer, missing, False, axis=axis,
+                                 fill_value=True)
+    com.mask_out_axis(new_mask, missing, axis, True)
+    return new_data, new_mask
+
+
+def _get_block_type(dtype):
     vtype = dtype.type
 
     if issubclass(vtype, np.floating):
-        klass = FloatBlock
+        return FloatBlock
     elif issubclass(vtype, np.complexfloating):
-        klass = ComplexBlock
+        return ComplexBlock
     elif issubclass(vtype, np.datetime64):
-        klass = DatetimeBlock
+        return DatetimeBlock
     elif issubclass(vtype, np.integer):
-        if vtype != np.int64:
-            values = values.astype('i8')
-        klass = IntBlock
+        return IntBlock
     elif dtype == np.bool_:
-        klass = BoolBlock
+        return BoolBlock
     else:
-        klass = ObjectBlock
+        return ObjectBlock
+
+def make_block(values, items, ref_items, do_integrity_check=False):
+    if isinstance(values, Categorical):
+        codes = _compact_labels(values.labels, len(values.levels))
+        return CategoricalBlock(codes.reshape((1, len(codes))),
+                                values.levels, items, ref_items)
+
+    klass = _get_block_type(values.dtype)
+    if klass is IntBlock and values.dtype != np.int64:
+        values = values.astype('i8')
 
     return klass(values, items, ref_items, ndim=values.ndim,
                  do_integrity_check=do_integrity_check)
@@ -479,15 +1106,16 @@ class BlockManager(object):
     -----
     This is *not* a public API class
     """
-    __slots__ = ['axes', 'blocks', 'ndim']
+    __slots__ = ['axes', 'blocks', 'ndim', '_blknos', '_blklocs']
 
     def __init__(self, blocks, axes, do_integrity_check=True):
         self.axes = [_ensure_index(ax) for ax in axes]
         self.blocks = blocks
+        self._blknos = self._blklocs = None
 
         ndim = len(axes)
         for block in blocks:
-            assert(ndim == block.values.ndim)
+            assert(ndim == block.ndim)
 
         if do_integrity_check:
             self._verify_integrity()
@@ -528,25 +1156,77 @@ class BlockManager(object):
     items = property(fget=_get_items)
 
     def __getstate__(self):
-        block_values = [b.values for b in self.blocks]
-        block_items = [b.items for b in self.blocks]
         axes_array = [ax for ax in self.axes]
-        return axes_array, block_values, block_items
+        if not self.items.is_unique:
+            block_values = [b.values for b in self.blocks]
+            block_items = [b.items for b in self.blocks]
+            return axes_array, block_values, block_items
+
+        # compact format: block items are stored as integer positions in the
+        # items axis instead of a second copy of the labels, and datetime64
+        # values as their int64 view, so every block pickles as a raw buffer.
+        # Categorical blocks store their codes and levels, masked blocks their
+        # data and mask
+        block_values = []
+        block_dtypes = []
+        block_levels = []
+        block_masks = []
+        for b in self.blocks:
+            block_levels.append(None)
+            block_masks.append(None)
+            if isinstance(b, CategoricalBlock):
+                values = b.codes
+                block_levels[-1] = b.levels
+            elif isinstance(b, MaskedBlock):
+                values = b.data
+                block_masks[-1] = b.mask
+            else:
+                values = b.values
+            block_dtypes.append(values.dtype)
+            if values.dtype == _NS_DTYPE:
+                values = values.view(np.int64)
+            block_values.append(values)
+        block_locs = [com._ensure_int64(self.items.get_indexer(b.items))
+                      for b in self.blocks]
+        return {'axes': axes_array, 'block_values': block_values,
+                'block_locs': block_locs, 'block_dtypes': block_dtypes,
+                'block_levels': block_levels, 'block_masks': block_masks}
 
     def __setstate__(self, state):
-        # discard anything after 3rd, support beta pickling format for a little
-        # while longer
-        ax_arrays, bvalues, bitems = state[:3]
+        if isinstance(state, dict):
+            ax_arrays = state['axes']
+            bvalues = []
+            for values, dtype in zip(state['block_values'],
+                                     state['block_dtypes']):
+                if values.dtype != dtype:
+                    values = values.view(dtype)
+                bvalues.append(values)
+            bitems = [ax_arrays[0].take(locs) for locs in state['block_locs']]
+            blevels = state.get('block_levels', [None] * len(bvalues))
+            bmasks = state.get('block_masks', [None] * len(bvalues))
+        else:
+            # discard anything after 3rd, support beta pickling format for a
+            # little while longer
+            ax_arrays, bvalues, bitems = state[:3]
+            blevels = bmasks = [None] * len(bvalues)
 
         self.axes = [_ensure_index(ax) for ax in ax_arrays]
         self.axes = _handle_legacy_indexes(self.axes)
 
         blocks = []
-        for values, items in zip(bvalues, bitems):
-            blk = make_block(values, items, self.axes[0],
-                             do_integrity_check=True)
+        for values, items, levels, mask in zip(bvalues, bitems, blevels,
+                                               bmasks):
+            if levels is not None:
+                blk = CategoricalBlock(values, levels, items, self.axes[0])
+            elif mask is not None:
+                blk = MaskedBlock(values, mask, items, self.axes[0],
+                                  ndim=values.ndim)
+            else:
+                blk = make_block(values, items, self.axes[0],
+                                 do_integrity_check=True)
             blocks.append(blk)
         self.blocks = blocks
+        self._blknos = self._blklocs = None
 
     def __len__(self):
         return len(self.items)
@@ -572,7 +1252,7 @@ class BlockManager(object):
         mgr_shape = self.shape
         for block in self.blocks:
             assert(block.ref_items is self.items)
-            assert(block.values.shape[1:] == mgr_shape[1:])
+            assert(block.shape[1:] == mgr_shape[1:])
         tot_items = sum(len(x.items) for x in self.blocks)
         assert(len(self.items) == tot_items)
 
@@ -586,11 +1266,37 @@ class BlockManager(object):
         new_mgr = BlockManager(new_blocks, self.axes)
         return new_mgr.consolidate()
 
+    def ensure_writeable(self, items=None):
+        """
+        Copy the read-only (e.g. memory mapped or copy-on-write) blocks
+        holding any of the passed items, or all of them if items is None, so
+        that they can be modified in place. Categorical and masked blocks are
+        converted to dense blocks
+
+        Returns
+        -------
+        changed : boolean
+        """
+        changed = False
+        for i, block in enumerate(self.blocks):
+            if items is not None and not any(item in block for item in items):
+                continue
+            if not block._is_dense:
+                self.blocks[i] = make_block(block.to_dense(), block.items,
+                                            block.ref_items)
+                self._blknos = self._blklocs = None
+            elif block.values.flags.writeable and not block._is_shared():
+                continue
+            else:
+                block._writeable_values()
+            changed = True
+        return changed
+
     def is_consolidated(self):
         """
         Return True if more than one block with the same dtype
         """
-        dtypes = [blk.dtype.type for blk in self.blocks]
+        dtypes = [blk.dtype.type for blk in self.blocks if blk._can_consolidate]
         return len(dtypes) == len(set(dtypes))
 
     def get_numeric_data(self, copy=False, type_list=None):
@@ -600,15 +1306,17 @@ class BlockManager(object):
         copy : boolean, default False
             Whether to copy the blocks
         type_list : tuple of type, default None
-            Numeric types by default (Float/Complex/Int but not Datetime)
+            Numeric types by default (Float/Complex/Int but not Datetime).
+            Categorical and masked blocks are selected by their dtype
         """
         if type_list is None:
             def filter_blocks(block):
-                return (isinstance(block, (IntBlock, FloatBlock, ComplexBlock))
-                        and not isinstance(block, DatetimeBlock))
+                return issubclass(_block_kind(block),
+                                  (IntBlock, FloatBlock, ComplexBlock))
         else:
             type_list = self._get_clean_block_types(type_list)
-            filter_blocks = lambda block: isinstance(block, type_list)
+            filter_blocks = lambda block: issubclass(_block_kind(block),
+                                                     type_list)
 
         maybe_copy = lambda b: b.copy() if copy else b
         num_blocks = [maybe_copy(b) for b in self.blocks if filter_blocks(b)]
@@ -655,8 +1363,8 @@ class BlockManager(object):
         if axis == 0:
             new_items = new_axes[0]
             if len(self.blocks) == 1:
-                blk = self.blocks[0]
-                newb = make_block(blk.values[slobj], new_items,
+                blk = self._view_block(0)
+                newb = make_block(blk._view_values()[slobj], new_items,
                                   new_items)
                 new_blocks = [newb]
             else:
@@ -674,9 +1382,7 @@ class BlockManager(object):
         slicer = tuple(slicer)
 
         for block in self.blocks:
-            newb = make_block(block.values[slicer], block.items,
-                              block.ref_items)
-            new_blocks.append(newb)
+            new_blocks.append(block._slice(slicer))
         return new_blocks
 
     def get_series_dict(self):
@@ -712,10 +1418,10 @@ class BlockManager(object):
         if len(self.blocks) == 0:
             mat = np.empty(self.shape, dtype=float)
         elif len(self.blocks) == 1:
-            blk = self.blocks[0]
+            blk = self._view_block(0)
             if items is None or blk.items.equals(items):
                 # if not, then just call interleave per below
-                mat = blk.values
+                mat = blk._view_values()
             else:
                 mat = self.reindex_items(items).as_matrix()
         else:
@@ -769,12 +1475,20 @@ class BlockManager(object):
                 raise Exception('cannot get view of mixed-type or '
                                 'non-consolidated DataFrame')
             for blk in self.blocks:
-                newb = make_block(blk.values[slicer], blk.items, blk.ref_items)
+                if not blk._is_dense:
+                    vals = blk._dense_at(slicer)
+                else:
+                    vals = blk._view_values()[slicer]
+                newb = make_block(vals, blk.items, blk.ref_items)
                 new_blocks.append(newb)
         elif len(self.blocks) == 1:
-            vals = self.blocks[0].values[slicer]
-            if copy:
-                vals = vals.copy()
+            blk = self.blocks[0] if copy else self._view_block(0)
+            if not blk._is_dense:
+                vals = blk._dense_at(slicer)
+            elif copy:
+                vals = blk.values[slicer].copy()
+            else:
+                vals = blk._view_values()[slicer]
             new_blocks = [make_block(vals, self.items, self.items)]
 
         return BlockManager(new_blocks, new_axes)
@@ -784,10 +1498,12 @@ class BlockManager(object):
 
         """
         if len(self.blocks) == 1:
-            result = self.blocks[0].values[:, loc]
+            blk = self.blocks[0] if copy else self._view_block(0)
+            if not blk._is_dense:
+                return blk._xs_values(loc)
             if copy:
-                result = result.copy()
-            return result
+                return blk.values[:, loc].copy()
+            return blk._view_values()[:, loc]
 
         if not copy:
             raise Exception('cannot get view of mixed-type or '
@@ -799,10 +1515,10 @@ class BlockManager(object):
         n = len(items)
         result = np.empty(n, dtype=dtype)
         for blk in self.blocks:
-            values = blk.values
+            values = blk._xs_values(loc)
             for j, item in enumerate(blk.items):
                 i = items.get_loc(item)
-                result[i] = values[j, loc]
+                result[i] = values[j]
 
         return result
 
@@ -822,26 +1538,77 @@ class BlockManager(object):
 
     def _consolidate_inplace(self):
         self.blocks = _consolidate(self.blocks, self.items)
+        self._blknos = self._blklocs = None
+
+    def _item_map(self):
+        """
+        For each position in the items, the number of the block holding it and
+        its position in that block. Built lazily, only for unique items, and
+        kept up to date by insert, delete and set
+        """
+        if self._blknos is None:
+            n = len(self.items)
+            blknos = np.empty(n, dtype=np.int_)
+            blknos.fill(-1)
+            blklocs = np.empty(n, dtype=np.int_)
+            for blkno, block in enumerate(self.blocks):
+                # blocks can be shared with other managers, so don't trust
+                # block.ref_items to be our items
+                locs = self.items.get_indexer(block.items)
+                blknos[locs] = blkno
+                blklocs[locs] = np.arange(len(locs))
+            self._blknos, self._blklocs = blknos, blklocs
+        return self._blknos, self._blklocs
 
     def get(self, item):
+        if self.items.is_unique:
+            self._check_have(item)
+            loc = self.items.get_loc(item)
+            if com.is_integer(loc):
+                return self.iget(loc)
+        i, _ = self._find_block(item)
+        return self._view_block(i).get(item)
+
+    def _view_block(self, blkno):
+        """
+        The block at blkno, to hand out views writing through to it. A masked
+        block, whose values are built on access, is replaced by its dense
+        upcast block first
+        """
+        block = self.blocks[blkno]
+        if isinstance(block, MaskedBlock):
+            block = make_block(block.to_dense(), block.items,
+                               block.ref_items)
+            self.blocks[blkno] = block
+        return block
+
+    def get_categorical(self, item):
+        """
+        Categorical with the codes and levels of item, or None if the item is
+        not stored in a CategoricalBlock
+        """
         _, block = self._find_block(item)
-        return block.get(item)
+        if isinstance(block, CategoricalBlock):
+            return block.to_categorical()
+        return None
 
     def iget(self, i):
-        item = self.items[i]
         if self.items.is_unique:
-            return self.get(item)
+            blknos, blklocs = self._item_map()
+            return self._view_block(blknos[i])._view_values()[blklocs[i]]
         else:
+            item = self.items[i]
             # ugh
             inds, = (self.items == item).nonzero()
 
-            _, block = self._find_block(item)
+            blkno, _ = self._find_block(item)
+            block = self._view_block(blkno)
 
             binds, = (block.items == item).nonzero()
 
             for j, (k, b) in enumerate(zip(inds, binds)):
                 if i == k:
-                    return block.values[b]
+                    return block._view_values()[b]
 
             raise Exception('Cannot have duplicate column names '
                             'split across dtypes')
@@ -857,7 +1624,7 @@ class BlockManager(object):
         item_loc = blk.items.get_loc(item),
         full_loc = item_loc + tuple(ax.get_loc(x)
                                     for ax, x in zip(self.axes[1:], tup[1:]))
-        return blk.values[full_loc]
+        return blk._get_scalar(full_loc)
 
     def delete(self, item):
         i, _ = self._find_block(item)
@@ -866,22 +1633,35 @@ class BlockManager(object):
         new_items = self.items.delete(loc)
 
         self._delete_from_block(i, item)
+        blknos, blklocs = self._blknos, self._blklocs
         self.set_items_norename(new_items)
+        if blknos is not None:
+            self._blknos = np.delete(blknos, loc)
+            self._blklocs = np.delete(blklocs, loc)
 
     def set(self, item, value):
         """
         Set new item in-place. Does not consolidate. Adds new Block if not
-        contained in the current set of items
+        contained in the current set of items. A Categorical value is stored
+        in a CategoricalBlock
         """
-        if value.ndim == self.ndim - 1:
-            value = value.reshape((1,) + value.shape)
-        assert(value.shape[1:] == self.shape[1:])
+        if isinstance(value, Categorical):
+            assert(len(value) == self.shape[1])
+        else:
+            if value.ndim == self.ndim - 1:
+                value = value.reshape((1,) + value.shape)
+            assert(value.shape[1:] == self.shape[1:])
         if item in self.items:
             i, block = self._find_block(item)
-            if not block.should_store(value):
+            if isinstance(value, Categorical) or not block.should_store(value):
                 # delete from block, create and append new block
                 self._delete_from_block(i, item)
                 self._add_new_block(item, value, loc=None)
+                if self._blknos is not None:
+                    loc = self.items.get_loc(item)
+                    self._blknos[loc] = len(self.blocks) - 1
+                    self._blklocs[loc] = 0
+                self._maybe_consolidate()
             else:
                 block.set(item, value)
         else:
@@ -893,17 +1673,60 @@ class BlockManager(object):
             raise Exception('cannot insert %s, already exists' % item)
 
         new_items = self.items.insert(loc, item)
+        blknos, blklocs = self._blknos, self._blklocs
         self.set_items_norename(new_items)
 
         # new block
         self._add_new_block(item, value, loc=loc)
+        if blknos is not None and self.items.is_unique:
+            self._blknos = np.insert(blknos, loc, len(self.blocks) - 1)
+            self._blklocs = np.insert(blklocs, loc, 0)
+
+        self._maybe_consolidate()
 
-        if len(self.blocks) > 100:
+    def insert_many(self, items, values):
+        """
+        Append several new items at once. Their values are stacked into a
+        single new block per dtype instead of one block per item
+
+        Parameters
+        ----------
+        items : sequence
+            New item labels
+        values : sequence of ndarrays
+            One array per item, each shaped like the other axes
+        """
+        items = _ensure_index(items)
+        if not items.is_unique:
+            raise Exception('cannot insert duplicate items')
+        for item in items:
+            if item in self.items:
+                raise Exception('cannot insert %s, already exists' % item)
+
+        new_blocks = form_blocks(dict(zip(items, values)),
+                                 [items] + self.axes[1:])
+
+        self.set_items_norename(self.items.append(items))
+        for block in new_blocks:
+            block.set_ref_items(self.items, maybe_rename=False)
+        self.blocks.extend(new_blocks)
+
+        self._maybe_consolidate()
+
+    def _maybe_consolidate(self):
+        nblocks = len(self.blocks)
+        if nblocks <= _CONSOLIDATE_MIN_BLOCKS:
+            return
+
+        nbytes = sum(b.memory_usage().sum() for b in self.blocks)
+        if (nbytes <= _CONSOLIDATE_MIN_NBYTES or
+            nblocks * _CONSOLIDATE_ITEMS_PER_BLOCK > len(self.items)):
             self._consolidate_inplace()
 
     def set_items_norename(self, value):
         value = _ensure_index(value)
         self.axes[0] = value
+        self._blknos = self._blklocs = None
 
         for block in self.blocks:
             block.set_ref_items(value, maybe_rename=False)
@@ -915,6 +1738,21 @@ class BlockManager(object):
         block = self.blocks.pop(i)
         new_left, new_right = block.split_block_at(item)
 
+        if self._blknos is not None:
+            # the split blocks are appended, later blocks move down by one
+            blknos, blklocs = self._blknos, self._blklocs
+            locs = self.items.get_indexer(block.items)
+            loc = block.items.get_loc(item)
+            blknos[blknos > i] -= 1
+            blknos[locs[loc]] = -1
+            nblocks = len(self.blocks)
+            if new_left is not None:
+                blknos[locs[:loc]] = nblocks
+                nblocks += 1
+            if new_right is not None:
+                blknos[locs[loc + 1:]] = nblocks
+                blklocs[locs[loc + 1:]] -= loc + 1
+
         if new_left is not None:
             self.blocks.append(new_left)
 
@@ -933,6 +1771,12 @@ class BlockManager(object):
 
     def _find_block(self, item):
         self._check_have(item)
+        if self.items.is_unique:
+            loc = self.items.get_loc(item)
+            if com.is_integer(loc):
+                blknos, _ = self._item_map()
+                i = blknos[loc]
+                return i, self.blocks[i]
         for i, block in enumerate(self.blocks):
             if item in block:
                 return i, block
@@ -1007,6 +1851,10 @@ class BlockManager(object):
                 continue
 
             new_block_items = new_items.take(selector.nonzero()[0])
+            if not blk._is_dense:
+                new_blocks.extend(blk._take_items(blk_indexer[selector],
+                                                  new_block_items, new_items))
+                continue
             new_values = com.take_fast(blk.values, blk_indexer[selector],
                                        None, False, axis=0)
             new_blocks.append(make_block(new_values, new_block_items,
@@ -1087,9 +1935,12 @@ class BlockManager(object):
         new_axes[axis] = self.axes[axis].take(indexer)
         new_blocks = []
         for blk in self.blocks:
-            new_values = com.take_fast(blk.values, indexer,
-                                       None, False, axis=axis)
-            newb = make_block(new_values, blk.items, self.items)
+            if not blk._is_dense:
+                newb = blk.take(indexer, axis=axis)
+            else:
+                new_values = com.take_fast(blk.values, indexer,
+                                           None, False, axis=axis)
+                newb = make_block(new_values, blk.items, self.items)
             new_blocks.append(newb)
 
         return BlockManager(new_blocks, new_axes)
@@ -1174,6 +2025,7 @@ class BlockManager(object):
                       if b._can_hold_na else b
                       for b in self.blocks]
         if inplace:
+            self.blocks = new_blocks
             return self
         return BlockManager(new_blocks, self.axes)
 
@@ -1181,6 +2033,7 @@ class BlockManager(object):
         new_blocks = [b.replace(to_replace, value, inplace=inplace)
                       for b in self.blocks]
         if inplace:
+            self.blocks = new_blocks
             return self
         return BlockManager(new_blocks, self.axes)
 
@@ -1192,14 +2045,138 @@ class BlockManager(object):
                 masks[s] = [b.values == s for b in self.blocks]
 
             for s, d in zip(src_lst, dest_lst):
-                [b.putmask(masks[s][i], d, inplace=True) for i, b in
-                 enumerate(self.blocks)]
+                # blocks that can't hold d in place are replaced
+                self.blocks = [b.putmask(masks[s][i], d, inplace=True)
+                               for i, b in enumerate(self.blocks)]
         else:
             for s, d in zip(src_lst, dest_lst):
                 self.replace(s, d, inplace=True)
 
         return self
 
+    def apply(self, func):
+        """
+        Apply func to the values of each block, e.g. an operation with a
+        scalar, without interleaving the blocks
+
+        Returns
+        -------
+        y : BlockManager
+        """
+        new_blocks = [make_block(func(b.values), b.items, self.items)
+                      for b in self.blocks]
+        return BlockManager(new_blocks, list(self.axes))
+
+    def combine(self, other, func):
+        """
+        Apply func(left_values, right_values) to two managers with the same
+        unique items and axes. Items are grouped by the pair of blocks holding
+        them in either manager, so each group is computed directly from
+        (possibly a row subset of) the two blocks without interleaving
+
+        Returns
+        -------
+        y : BlockManager
+        """
+        assert(self.items.is_unique and self.items.equals(other.items))
+        assert(self._is_indexed_like(other))
+
+        lblknos, lblklocs = self._item_map()
+        rblknos, rblklocs = other._item_map()
+
+        pairs = lblknos * max(len(other.blocks), 1) + rblknos
+        order = pairs.argsort(kind='mergesort')
+        bounds = (pairs.take(order)[1:] != pairs.take(order)[:-1]).nonzero()[0]
+
+        new_blocks = []
+        for locs in np.split(order, bounds + 1):
+            if len(locs) == 0:
+                continue
+            left = _block_rows(self.blocks[lblknos[locs[0]]],
+                               lblklocs.take(locs))
+            right = _block_rows(other.blocks[rblknos[locs[0]]],
+                                rblklocs.take(locs))
+            new_blocks.append(make_block(func(left, right),
+                                         self.items.take(locs), self.items))
+
+        return BlockManager(new_blocks, list(self.axes))
+
+    def apply_inplace(self, func):
+        """
+        Apply func(values, items) to the writeable values of each block. func
+        modifies the values in place and returns them when their dtype can
+        hold the result, otherwise it returns new values replacing the block
+        """
+        for i, block in enumerate(self.blocks):
+            values = _inplace_values(block)
+            result = func(values, block.items)
+            if result is not values or not block._is_dense:
+                self.blocks[i] = make_block(result, block.items, self.items)
+
+    def combine_inplace(self, other, func):
+        """
+        Apply func(left_values, right_values) as in combine, storing the
+        results in this manager. func modifies the left values in place and
+        returns them when their dtype can hold the result, otherwise the items
+        move to new blocks holding the values it returns
+        """
+        assert(self.items.is_unique and self.items.equals(other.items))
+        assert(self._is_indexed_like(other))
+
+        lblknos, lblklocs = self._item_map()
+        rblknos, rblklocs = other._item_map()
+
+        pairs = lblknos * max(len(other.blocks), 1) + rblknos
+        order = pairs.argsort(kind='mergesort')
+        bounds = (pairs.take(order)[1:] != pairs.take(order)[:-1]).nonzero()[0]
+
+        # block number -> blocks taking some of its items
+        moved = {}
+        for locs in np.split(order, bounds + 1):
+            if len(locs) == 0:
+                continue
+            blkno = lblknos[locs[0]]
+            block = self.blocks[blkno]
+            rows = lblklocs.take(locs)
+            right = _block_rows(other.blocks[rblknos[locs[0]]],
+                                rblklocs.take(locs))
+
+            whole = (len(rows) == len(block) and
+                     (rows == np.arange(len(rows))).all())
+            if whole:
+                left = _inplace_values(block)
+            else:
+                left = block.values.take(rows, axis=0)
+
+            result = func(left, right)
+            if result is left and whole and block._is_dense:
+                continue
+            elif result.dtype == block.dtype and block._is_dense:
+                block._writeable_values()[rows] = result
+            else:
+                newb = make_block(result, self.items.take(locs), self.items)
+                moved.setdefault(blkno, []).append(newb)
+
+        if not moved:
+            return
+
+        new_blocks = []
+        for blkno, block in enumerate(self.blocks):
+            if blkno not in moved:
+                new_blocks.append(block)
+                continue
+            new_blocks.extend(moved[blkno])
+            gone = set(item for b in moved[blkno] for item in b.items)
+            keep = np.array([i for i, item in enumerate(block.items)
+                             if item not in gone], dtype=int)
+            if len(keep) > 0:
+                new_blocks.append(make_block(block.values.take(keep, axis=0),
+                                             block.items.take(keep),
+                                             self.items))
+
+        self.blocks = new_blocks
+        self._blknos = self._blklocs = None
+
     @property
     def block_id_vector(self):
         # TODO
@@ -1214,13 +2191,69 @@ class BlockManager(object):
         assert((result >= 0).all())
         return result
 
+    def memory_usage(self, deep=False, by_block=False):
+        """
+        Bytes used by the block data
+
+        Parameters
+        ----------
+        deep : boolean, default False
+            Also measure the Python objects held by object blocks
+        by_block : boolean, default False
+            Return one total per block, in the order of self.blocks, instead
+            of one entry per item
+
+        Returns
+        -------
+        usage : ndarray of int64
+        """
+        usages = [blk.memory_usage(deep=deep) for blk in self.blocks]
+        if by_block:
+            return np.array([u.sum() for u in usages], dtype=np.int64)
+
+        result = np.zeros(len(self.items), dtype=np.int64)
+        if len(usages) == 0:
+            return result
+
+        if self.items.is_unique:
+            blknos, blklocs = self._item_map()
+            offsets = np.cumsum([0] + [len(u) for u in usages[:-1]])
+            result[:] = np.concatenate(usages)[offsets[blknos] + blklocs]
+        else:
+            # match duplicate items to their positions in order, as in iget
+            for blk, usage in zip(self.blocks, usages):
+                for item in set(blk.items):
+                    inds, = (self.items == item).nonzero()
+                    binds, = (blk.items == item).nonzero()
+                    result[inds[:len(binds)]] = usage[binds]
+        return result
+
+    def intern_strings(self, table=None):
+        """
+        Make repeated strings in the object blocks share one object, in place
+
+        Parameters
+        ----------
+        table : lib.StringHashTable, optional
+            Table to intern the strings in, e.g. one shared with other data.
+            A new table is used by default
+
+        Returns
+        -------
+        n_replaced : int
+        """
+        if table is None:
+            table = lib.StringHashTable()
+        return sum(blk.intern_strings(table) for blk in self.blocks
+                   if isinstance(blk, ObjectBlock))
+
     @property
     def item_dtypes(self):
         result = np.empty(len(self.items), dtype='O')
         mask = np.zeros(len(self.items), dtype=bool)
         for i, blk in enumerate(self.blocks):
             indexer = self.items.get_indexer(blk.items)
-            result.put(indexer, blk.values.dtype.name)
+            result.put(indexer, blk.dtype.name)
             mask.put(indexer, 1)
         assert(mask.all())
         return result
@@ -1237,13 +2270,19 @@ def form_blocks(data, axes):
     # put "leftover" items in float bucket, where else?
     # generalize?
     float_dict = {}
+    float32_dict = {}
     complex_dict = {}
     int_dict = {}
     bool_dict = {}
     object_dict = {}
     datetime_dict = {}
+    categorical_blocks = []
     for k, v in data.iteritems():
-        if issubclass(v.dtype.type, np.floating):
+        if isinstance(v, Categorical):
+            categorical_blocks.append(make_block(v, [k], items))
+        elif v.dtype == np.float32:
+            float32_dict[k] = v
+        elif issubclass(v.dtype.type, np.floating):
             float_dict[k] = v
         elif issubclass(v.dtype.type, np.complexfloating):
             complex_dict[k] = v
@@ -1261,6 +2300,10 @@ def form_blocks(data, axes):
         float_block = _simple_blockify(float_dict, items, np.float64)
         blocks.append(float_block)
 
+    if len(float32_dict):
+        float32_block = _simple_blockify(float32_dict, items, np.float32)
+        blocks.append(float32_block)
+
     if len(complex_dict):
         complex_block = _simple_blockify(complex_dict, items, np.complex128)
         blocks.append(complex_block)
@@ -1288,6 +2331,8 @@ def form_blocks(data, axes):
         object_block = _simple_blockify(object_dict, items, np.object_)
         blocks.append(object_block)
 
+    blocks.extend(categorical_blocks)
+
     if len(extra_items):
         shape = (len(extra_items),) + tuple(len(x) for x in axes[1:])
 
@@ -1309,7 +2354,9 @@ def _simple_blockify(dct, ref_items, dtype):
     if values.dtype != dtype: # pragma: no cover
         values = values.astype(dtype)
 
-    return make_block(values, block_items, ref_items, do_integrity_check=True)
+    block = make_block(values, block_items, ref_items, do_integrity_check=True)
+    block._owns_values = True
+    return block
 
 def _stack_dict(dct, ref_items, dtype):
     from pandas.core.series import Series
@@ -1348,7 +2395,7 @@ def _blocks_to_series_dict(blocks, index=None):
     series_dict = {}
 
     for block in blocks:
-        for item, vec in zip(block.items, block.values):
+        for item, vec in zip(block.items, block._view_values()):
             series_dict[item] = Series(vec, index=index, name=item)
     return series_dict
 
@@ -1356,7 +2403,7 @@ def _interleaved_dtype(blocks):
     from collections import defaultdict
     counts = defaultdict(lambda: 0)
     for x in blocks:
-        counts[type(x)] += 1
+        counts[_block_kind(x)] += 1
 
     have_int = counts[IntBlock] > 0
     have_bool = counts[BoolBlock] > 0
@@ -1378,15 +2425,28 @@ def _interleaved_dtype(blocks):
         return np.dtype('M8[ns]')
     elif have_complex:
         return np.dtype('c16')
+    elif (have_float and not have_int and
+          all(b.dtype == np.float32 for b in blocks)):
+        return np.dtype('f4')
     else:
         return np.dtype('f8')
 
+def _block_kind(block):
+    # the type of the block the dense values would be stored in
+    if block._is_dense:
+        return type(block)
+    return _get_block_type(block.dtype)
+
 def _consolidate(blocks, items):
     """
-    Merge blocks having same dtype
+    Merge blocks having same dtype. Blocks that can't be consolidated, e.g.
+    categorical blocks, are kept as they are
     """
     get_dtype = lambda x: x.dtype.name
 
+    kept = [b for b in blocks if not b._can_consolidate]
+    blocks = [b for b in blocks if b._can_consolidate]
+
     # sort by dtype
     grouper = itertools.groupby(sorted(blocks, key=get_dtype),
                                 lambda x: x.dtype)
@@ -1396,7 +2456,7 @@ def _consolidate(blocks, items):
         new_block = _merge_blocks(list(group_blocks), items)
         new_blocks.append(new_block)
 
-    return new_blocks
+    return new_blocks + kept
 
 
 # TODO: this could be much optimized
@@ -1408,8 +2468,22 @@ def _merge_blocks(blocks, items):
     new_items = blocks[0].items.append([b.items for b in blocks[1:]])
     new_block = make_block(new_values, new_items, items,
                            do_integrity_check=True)
+    new_block._owns_values = True
     return new_block.reindex_items_from(items)
 
+def _inplace_values(block):
+    # values an operation may write its result into, categorical and masked
+    # blocks get new dense values since those do not write through
+    if not block._is_dense:
+        return block.to_dense()
+    return block._writeable_values()
+
+def _block_rows(block, locs):
+    # avoid a copy when all rows of the block are used in order
+    if len(locs) == len(block) and (locs == np.arange(len(locs))).all():
+        return block.values
+    return block.values.take(locs, axis=0)
+
 def _union_block_items(blocks):
     tot_len = 0
     all_items = []
@@ -4,6 +4,7 @@ import numpy as np
 
 from pandas.core.common import isnull, notnull
 import pandas.core.common as com
+import pandas.core.parallel as parallel
 import pandas.lib as lib
 
 try:
@@ -385,6 +386,35 @@ def nancov(a, b):
 
     return np.cov(a, b)[0, 1]
 
+def nancorr_matrix(mat, cov=False):
+    """
+    Pairwise Pearson correlation (covariance if cov) of the columns of mat,
+    excluding NA / inf values. Large inputs are split into chunks of the rows
+    of the result computed on the threads of pandas.core.parallel
+
+    Returns
+    -------
+    result : ndarray (K x K)
+    """
+    mat = com._ensure_float64(mat)
+    N, K = mat.shape
+
+    nchunks = parallel.get_nchunks(K, N * K * (K + 1) // 2)
+    if nchunks == 1:
+        return lib.nancorr(mat, cov=cov)
+
+    # row xi of the lower triangle costs xi + 1 column pairs, chunks of
+    # about the same number of pairs
+    edges = np.sqrt(np.linspace(0, 1, nchunks + 1)) * K
+    edges = np.unique(np.round(edges).astype(int))
+    bounds = zip(edges[:-1], edges[1:])
+
+    result = np.empty((K, K), dtype=np.float64)
+    parallel.run(lambda start, end: lib.nancorr(mat, cov=cov, start=start,
+                                                end=end, out=result),
+                 bounds)
+    return result
+
 def _ensure_numeric(x):
     if isinstance(x, np.ndarray):
         if x.dtype == np.object_:
@@ -0,0 +1,155 @@
+"""
+Global thread pool splitting the large Cython kernels (take, group
+aggregation, rank, nancorr) into chunks of rows or columns. The numeric
+kernels release the GIL in their loops, so that the chunks run on several
+cores at once
+"""
+from __future__ import with_statement  # for Python 2.5
+
+import threading
+
+import numpy as np
+
+_NUM_THREADS = 1
+
+# below this number of elements per thread the overhead of dispatching to the
+# pool outweighs the gain
+_MIN_ELEMENTS = 100000
+
+_pool = None
+_pool_lock = threading.Lock()
+
+# number of run calls mapping on each pool. A pool replaced by
+# set_num_threads is closed by its last user
+_pool_users = {}
+
+# set in the threads of the pool, kernels called from a chunk run serially
+_local = threading.local()
+
+
+def set_num_threads(n=None):
+    """
+    Set the number of threads large kernels are split across. With 1, the
+    default, kernels run on the calling thread only
+
+    Parameters
+    ----------
+    n : int, optional
+        Defaults to the number of cores
+    """
+    global _NUM_THREADS, _pool
+    if n is None:
+        try:
+            import multiprocessing
+            n = multiprocessing.cpu_count()
+        except (ImportError, NotImplementedError):
+            n = 1
+    n = int(n)
+    if n < 1:
+        raise ValueError('Number of threads must be at least 1, got %d' % n)
+
+    with _pool_lock:
+        if _pool is not None and n != _NUM_THREADS:
+            if _pool not in _pool_users:
+                _pool.close()
+            _pool = None
+        _NUM_THREADS = n
+
+
+def get_num_threads():
+    """
+    Number of threads large kernels are split across
+    """
+    return _NUM_THREADS
+
+
+def get_nchunks(n, size):
+    """
+    Number of chunks to split the n rows or columns of a kernel doing about
+    size units of work into, 1 if it is too small to be worth splitting
+
+    Parameters
+    ----------
+    n : int
+        Number of rows or columns that can be split
+    size : int
+        Number of elements the kernel processes
+
+    Returns
+    -------
+    nchunks : int
+    """
+    if _NUM_THREADS == 1 or getattr(_local, 'in_pool', False):
+        return 1
+    return max(min(_NUM_THREADS, n, int(size // _MIN_ELEMENTS)), 1)
+
+
+def chunk_bounds(n, nchunks):
+    """
+    Split range(n) into nchunks contiguous chunks of about equal length
+
+    Returns
+    -------
+    bounds : list of (start, end) tuples
+    """
+    edges = np.linspace(0, n, nchunks + 1).astype(int)
+    return zip(edges[:-1], edges[1:])
+
+
+def run(func, bounds):
+    """
+    Call func(start, end) for each chunk, on the threads of the pool if there
+    is more than one chunk. Exceptions raised in a chunk are raised again in
+    the calling thread
+
+    Parameters
+    ----------
+    func : function
+    bounds : list of (start, end) tuples
+
+    Returns
+    -------
+    results : list
+        Results of func, in the order of bounds
+    """
+    pool = None
+    if len(bounds) > 1:
+        pool = _acquire_pool()
+
+    # no thread pool without multiprocessing (Python 2.5)
+    if pool is None:
+        return [func(start, end) for start, end in bounds]
+
+    def _run_chunk(chunk):
+        _local.in_pool = True
+        try:
+            return func(*chunk)
+        finally:
+            _local.in_pool = False
+
+    try:
+        return pool.map(_run_chunk, bounds, chunksize=1)
+    finally:
+        _release_pool(pool)
+
+
+def _acquire_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            try:
+                from multiprocessing.pool import ThreadPool
+            except ImportError:
+                return None
+            _pool = ThreadPool(_NUM_THREADS)
+        _pool_users[_pool] = _pool_users.get(_pool, 0) + 1
+        return _pool
+
+
+def _release_pool(pool):
+    with _pool_lock:
+        _pool_users[pool] -= 1
+        if _pool_users[pool] == 0:
+            del _pool_users[pool]
+            if pool is not _pool:
+                pool.close()
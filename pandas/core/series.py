@@ -26,6 +26,7 @@ from pandas.util import py3compat
 from pandas.util.terminal import get_terminal_size
 import pandas.core.common as com
 import pandas.core.datetools as datetools
+import pandas.core.expressions as expressions
 import pandas.core.format as fmt
 import pandas.core.generic as generic
 import pandas.core.nanops as nanops
@@ -44,14 +45,14 @@ _SHOW_WARNINGS = True
 #----------------------------------------------------------------------
 # Wrapper function for Series arithmetic methods
 
-def _arith_method(op, name):
+def _arith_method(op, name, str_rep=None, reverse=False):
     """
     Wrapper function for Series arithmetic operations, to avoid
     code duplication.
     """
     def na_op(x, y):
         try:
-            result = op(x, y)
+            result = expressions.evaluate(op, str_rep, x, y, reverse=reverse)
         except TypeError:
             result = np.empty(len(x), dtype=x.dtype)
             if isinstance(y, np.ndarray):
@@ -98,7 +99,7 @@ def _arith_method(op, name):
     return wrapper
 
 
-def _comp_method(op, name):
+def _comp_method(op, name, str_rep=None):
     """
     Wrapper function for Series arithmetic operations, to avoid
     code duplication.
@@ -113,7 +114,7 @@ def _comp_method(op, name):
             else:
                 result = lib.scalar_compare(x, y, op)
         else:
-            result = op(x, y)
+            result = expressions.evaluate(op, str_rep, x, y)
 
         return result
 
@@ -121,14 +122,19 @@ def _comp_method(op, name):
         from pandas.core.frame import DataFrame
 
         if isinstance(other, Series):
-            name = _maybe_match_name(self, other)
+            res_name = _maybe_match_name(self, other)
             return Series(na_op(self.values, other.values),
-                          index=self.index, name=name)
+                          index=self.index, name=res_name)
         elif isinstance(other, DataFrame): # pragma: no cover
             return NotImplemented
         elif isinstance(other, np.ndarray):
             return Series(na_op(self.values, np.asarray(other)),
                           index=self.index, name=self.name)
+        elif (self._categorical is not None and
+              name in ('__eq__', '__ne__')):
+            # compare the codes with the code of other
+            return Series(op(self._categorical, other),
+                          index=self.index, name=self.name)
         else:
             values = self.values
             other = lib.convert_scalar(values, other)
@@ -146,14 +152,14 @@ def _comp_method(op, name):
     return wrapper
 
 
-def _bool_method(op, name):
+def _bool_method(op, name, str_rep=None):
     """
     Wrapper function for Series arithmetic operations, to avoid
     code duplication.
     """
     def na_op(x, y):
         try:
-            result = op(x, y)
+            result = expressions.evaluate(op, str_rep, x, y)
         except TypeError:
             if isinstance(y, list):
                 y = lib.list_to_object_array(y)
@@ -212,7 +218,23 @@ def _maybe_match_name(a, b):
     return name
 
 
-def _flex_method(op, name):
+def _inplace_method(method, ufunc, name):
+    """
+    Augmented assignment storing the result of method in the Series when it
+    fits, otherwise returning the result as a new Series
+    """
+    def f(self, other):
+        from pandas.core.frame import DataFrame
+
+        if isinstance(other, DataFrame):
+            return NotImplemented
+        return self._combine_inplace(other, ufunc, lambda: method(self, other))
+
+    f.__name__ = name
+    return f
+
+
+def _flex_method(op, name, str_rep=None, ufunc=None):
     doc = """
     Binary operator %s with support to substitute a fill_value for missing data
     in one of the inputs
@@ -226,15 +248,32 @@ def _flex_method(op, name):
     level : int or name
         Broadcast across a level, matching Index values on the
         passed MultiIndex level
+    inplace : boolean, default False
+        Store the result in this Series, which must have the index and dtype
+        of the result
 
     Returns
     -------
-    result : Series
+    result : Series (self if inplace)
     """ % name
 
+    def na_op(x, y):
+        return expressions.evaluate(op, str_rep, x, y)
+
     @Appender(doc)
-    def f(self, other, level=None, fill_value=None):
-        return self._binop(other, op, level=level, fill_value=fill_value)
+    def f(self, other, level=None, fill_value=None, inplace=False):
+        if not inplace:
+            return self._binop(other, na_op, level=level,
+                               fill_value=fill_value)
+
+        compute = lambda: self._binop(other, na_op, level=level,
+                                      fill_value=fill_value)
+        direct = level is None and fill_value is None
+        result = self._combine_inplace(other, ufunc, compute, direct=direct)
+        if result is not self:
+            raise ValueError('Result of %s does not fit in the Series, its '
+                             'index or dtype differs' % name)
+        return self
 
     f.__name__ = name
     return f
@@ -419,6 +458,10 @@ copy : boolean, default False
     _index = None
     index = lib.SeriesIndex()
 
+    # Categorical of a DataFrame column stored as codes, set on the read-only
+    # column and not passed on to arrays derived from it
+    _categorical = None
+
     def __array_finalize__(self, obj):
         """
         Gets called after any ufunc or other array operations, necessary
@@ -918,46 +961,52 @@ copy : boolean, default False
     #----------------------------------------------------------------------
     #   Arithmetic operators
 
-    __add__ = _arith_method(operator.add, '__add__')
-    __sub__ = _arith_method(operator.sub, '__sub__')
-    __mul__ = _arith_method(operator.mul, '__mul__')
-    __truediv__ = _arith_method(operator.truediv, '__truediv__')
+    __add__ = _arith_method(operator.add, '__add__', '+')
+    __sub__ = _arith_method(operator.sub, '__sub__', '-')
+    __mul__ = _arith_method(operator.mul, '__mul__', '*')
+    __truediv__ = _arith_method(operator.truediv, '__truediv__', '/')
     __floordiv__ = _arith_method(operator.floordiv, '__floordiv__')
-    __pow__ = _arith_method(operator.pow, '__pow__')
-
-    __radd__ = _arith_method(_radd_compat, '__add__')
-    __rmul__ = _arith_method(operator.mul, '__mul__')
-    __rsub__ = _arith_method(lambda x, y: y - x, '__sub__')
-    __rtruediv__ = _arith_method(lambda x, y: y / x, '__truediv__')
+    __pow__ = _arith_method(operator.pow, '__pow__', '**')
+
+    __radd__ = _arith_method(_radd_compat, '__add__', '+', reverse=True)
+    __rmul__ = _arith_method(operator.mul, '__mul__', '*', reverse=True)
+    __rsub__ = _arith_method(lambda x, y: y - x, '__sub__', '-',
+                             reverse=True)
+    __rtruediv__ = _arith_method(lambda x, y: y / x, '__truediv__', '/',
+                                 reverse=True)
     __rfloordiv__ = _arith_method(lambda x, y: y // x, '__floordiv__')
-    __rpow__ = _arith_method(lambda x, y: y ** x, '__pow__')
+    __rpow__ = _arith_method(lambda x, y: y ** x, '__pow__', '**',
+                             reverse=True)
 
     # comparisons
-    __gt__ = _comp_method(operator.gt, '__gt__')
-    __ge__ = _comp_method(operator.ge, '__ge__')
-    __lt__ = _comp_method(operator.lt, '__lt__')
-    __le__ = _comp_method(operator.le, '__le__')
-    __eq__ = _comp_method(operator.eq, '__eq__')
-    __ne__ = _comp_method(operator.ne, '__ne__')
+    __gt__ = _comp_method(operator.gt, '__gt__', '>')
+    __ge__ = _comp_method(operator.ge, '__ge__', '>=')
+    __lt__ = _comp_method(operator.lt, '__lt__', '<')
+    __le__ = _comp_method(operator.le, '__le__', '<=')
+    __eq__ = _comp_method(operator.eq, '__eq__', '==')
+    __ne__ = _comp_method(operator.ne, '__ne__', '!=')
 
     # binary logic
-    __or__ = _bool_method(operator.or_, '__or__')
-    __and__ = _bool_method(operator.and_, '__and__')
+    __or__ = _bool_method(operator.or_, '__or__', '|')
+    __and__ = _bool_method(operator.and_, '__and__', '&')
     __xor__ = _bool_method(operator.xor, '__xor__')
 
     # Inplace operators
-    __iadd__ = __add__
-    __isub__ = __sub__
-    __imul__ = __mul__
-    __itruediv__ = __truediv__
-    __ifloordiv__ = __floordiv__
-    __ipow__ = __pow__
+    __iadd__ = _inplace_method(__add__, np.add, '__iadd__')
+    __isub__ = _inplace_method(__sub__, np.subtract, '__isub__')
+    __imul__ = _inplace_method(__mul__, np.multiply, '__imul__')
+    __itruediv__ = _inplace_method(__truediv__, np.true_divide,
+                                   '__itruediv__')
+    __ifloordiv__ = _inplace_method(__floordiv__, np.floor_divide,
+                                    '__ifloordiv__')
+    __ipow__ = _inplace_method(__pow__, np.power, '__ipow__')
 
     # Python 2 division operators
     if not py3compat.PY3:
-        __div__ = _arith_method(operator.div, '__div__')
-        __rdiv__ = _arith_method(lambda x, y: y / x, '__div__')
-        __idiv__ = __div__
+        __div__ = _arith_method(operator.div, '__div__', '/')
+        __rdiv__ = _arith_method(lambda x, y: y / x, '__div__', '/',
+                                 reverse=True)
+        __idiv__ = _inplace_method(__div__, np.divide, '__idiv__')
 
     #----------------------------------------------------------------------
     # unbox reductions
@@ -986,6 +1035,30 @@ copy : boolean, default False
         """
         return self.view(ndarray)
 
+    def memory_usage(self, index=True, deep=False):
+        """
+        Memory usage of the Series in bytes
+
+        Parameters
+        ----------
+        index : boolean, default True
+            Include the memory usage of the index (its values and, once built,
+            its hash table)
+        deep : boolean, default False
+            Also measure the Python objects held by an object Series or index
+            rather than only the arrays of pointers to them
+
+        Returns
+        -------
+        bytes : int
+        """
+        result = self.nbytes
+        if deep and self.dtype == np.object_:
+            result += lib.memory_usage_of_objects(self.values)
+        if index:
+            result += self.index.memory_usage(deep=deep)
+        return result
+
     def copy(self, order='C'):
         """
         Return new Series with copy of underlying values
@@ -1007,6 +1080,31 @@ copy : boolean, default False
         """
         return dict(self.iteritems())
 
+    def to_json(self, path_or_buf=None, orient='index', date_unit='ms',
+                chunksize=10000):
+        """
+        Write Series as JSON
+
+        Parameters
+        ----------
+        path_or_buf : string or file handle / StringIO, optional
+            File path or object to write to. If None, return the JSON string
+        orient : {'split', 'records', 'index'}, default 'index'
+            'split' : {"name": name, "index": [index], "data": [values]},
+            'records' : [values], 'index' : {index: value}
+        date_unit : {'s', 'ms', 'us', 'ns'}, default 'ms'
+            datetime64 values are written as integers since the epoch
+        chunksize : int, default 10000
+            Number of values encoded and written at a time
+
+        Returns
+        -------
+        json : string, if path_or_buf is None
+        """
+        from pandas.io.json import to_json
+        return to_json(self, path_or_buf=path_or_buf, orient=orient,
+                       date_unit=date_unit, chunksize=chunksize)
+
     def to_sparse(self, kind='block', fill_value=None):
         """
         Convert Series to SparseSeries
@@ -1084,7 +1182,8 @@ copy : boolean, default False
         counts : Series
         """
         from pandas.core.algorithms import value_counts
-        return value_counts(self.values, sort=True, ascending=False)
+        return value_counts(_categorical_or_values(self), sort=True,
+                            ascending=False)
 
     def unique(self):
         """
@@ -1617,14 +1716,48 @@ copy : boolean, default False
         name = _maybe_match_name(self, other)
         return Series(result, index=new_index, name=name)
 
-    add = _flex_method(operator.add, 'add')
-    sub = _flex_method(operator.sub, 'subtract')
-    mul = _flex_method(operator.mul, 'multiply')
+    add = _flex_method(operator.add, 'add', '+', np.add)
+    sub = _flex_method(operator.sub, 'subtract', '-', np.subtract)
+    mul = _flex_method(operator.mul, 'multiply', '*', np.multiply)
     try:
-        div = _flex_method(operator.div, 'divide')
+        div = _flex_method(operator.div, 'divide', '/', np.divide)
     except AttributeError:  # pragma: no cover
         # Python 3
-        div = _flex_method(operator.truediv, 'divide')
+        div = _flex_method(operator.truediv, 'divide', '/', np.true_divide)
+
+    def _combine_inplace(self, other, ufunc, compute, direct=True):
+        """
+        Store the result of an operation with other in this Series. ufunc
+        writes it directly when other is aligned with the Series and the dtype
+        holds the result, otherwise compute returns it as a new Series that is
+        copied in if it has the index and dtype of this one
+
+        Returns
+        -------
+        result : Series (self, or the new Series if the result does not fit)
+        """
+        values = self.view(ndarray)
+
+        if isinstance(other, Series):
+            aligned = self.index.equals(other.index)
+            other_values = other.values
+        else:
+            if isinstance(other, (list, tuple)):
+                other = np.asarray(other)
+            aligned = np.ndim(other) == 0 or np.shape(other) == self.shape
+            other_values = other
+
+        if (direct and aligned and values.flags.writeable and
+            com._holds_result(ufunc, values, other_values)):
+            ufunc(values, other_values, values)
+            return self
+
+        result = compute()
+        if (values.flags.writeable and result.dtype == self.dtype and
+            result.index.equals(self.index)):
+            values[:] = result.values
+            return self
+        return result
 
     def combine(self, other, func, fill_value=nan):
         """
@@ -2728,6 +2861,15 @@ _INDEX_TYPES = ndarray, Index, list, tuple
 #-------------------------------------------------------------------------------
 # Supplementary functions
 
+def _categorical_or_values(series):
+    """
+    The Categorical of a column stored as codes, so that it can be factorized,
+    counted or sorted from the codes, otherwise the values
+    """
+    if series._categorical is not None:
+        return series._categorical
+    return series.values
+
 def remove_na(arr):
     """
     Return array containing only true/non-NaN values, possibly empty.
@@ -0,0 +1,566 @@
+"""
+Reading and writing DataFrame and Series objects as JSON
+"""
+from __future__ import absolute_import
+
+from StringIO import StringIO
+import os
+import re
+
+import numpy as np
+
+try:
+    import json
+except ImportError:  # Python 2.5
+    import simplejson as json
+
+from pandas.core.common import isnull
+from pandas.core.frame import DataFrame
+from pandas.core.index import Index
+from pandas.core.series import Series
+import pandas.lib as lib
+
+_DATE_DIVISORS = {'s': 1000000000, 'ms': 1000000, 'us': 1000, 'ns': 1}
+
+_FRAME_ORIENTS = ('split', 'records', 'index', 'columns')
+_SERIES_ORIENTS = ('split', 'records', 'index')
+
+_escape = json.encoder.encode_basestring_ascii
+
+
+def to_json(obj, path_or_buf=None, orient=None, date_unit='ms',
+            chunksize=10000):
+    """
+    Write DataFrame or Series as JSON
+
+    Parameters
+    ----------
+    obj : DataFrame or Series
+    path_or_buf : string or file handle / StringIO, optional
+        File path or object to write to. If None, return the JSON string
+    orient : string
+        DataFrame
+
+          * 'split' : {"columns": [columns], "index": [index],
+                       "data": [[row values], ...]}
+          * 'records' : [{column: value}, ...]
+          * 'index' : {index: {column: value}}
+          * 'columns' (default) : {column: {index: value}}
+
+        Series
+
+          * 'split' : {"name": name, "index": [index], "data": [values]}
+          * 'records' : [values]
+          * 'index' (default) : {index: value}
+
+    date_unit : {'s', 'ms', 'us', 'ns'}, default 'ms'
+        datetime64 values and datetimes are written as integers since the
+        epoch in this unit
+    chunksize : int, default 10000
+        Number of rows encoded and written at a time
+
+    Returns
+    -------
+    json : string, if path_or_buf is None
+    """
+    if date_unit not in _DATE_DIVISORS:
+        raise ValueError('date_unit must be one of %s'
+                         % str(sorted(_DATE_DIVISORS)))
+    divisor = _DATE_DIVISORS[date_unit]
+
+    if isinstance(obj, DataFrame):
+        orient = _check_orient(orient or 'columns', _FRAME_ORIENTS)
+        writer = _FRAME_WRITERS[orient]
+    elif isinstance(obj, Series):
+        orient = _check_orient(orient or 'index', _SERIES_ORIENTS)
+        writer = _SERIES_WRITERS[orient]
+    else:
+        raise TypeError('can only write DataFrame or Series as JSON, got %s'
+                        % type(obj).__name__)
+
+    if path_or_buf is None:
+        f = StringIO()
+    elif hasattr(path_or_buf, 'write'):
+        f = path_or_buf
+    else:
+        f = open(path_or_buf, 'w')
+
+    try:
+        writer(f, obj, divisor, max(int(chunksize), 1))
+    finally:
+        if isinstance(path_or_buf, basestring):
+            f.close()
+
+    if path_or_buf is None:
+        return f.getvalue()
+
+
+def read_json(path_or_buf, orient=None, typ='frame', date_unit='ms',
+              convert_dates=None, date_index=False, chunksize=None):
+    """
+    Read DataFrame or Series from JSON
+
+    Parameters
+    ----------
+    path_or_buf : string or file handle / StringIO
+        File path, JSON string, or object with a read method
+    orient : string
+        Layout of the JSON, see to_json. Default 'columns' for a DataFrame
+        and 'index' for a Series
+    typ : {'frame', 'series'}, default 'frame'
+    date_unit : {'s', 'ms', 'us', 'ns'}, default 'ms'
+        Unit of the epoch integers converted by convert_dates / date_index
+    convert_dates : list of column labels, optional
+        Columns holding epoch integers to convert to datetime64
+    date_index : boolean, default False
+        Convert the index from epoch integers to a DatetimeIndex
+    chunksize : int, optional
+        Only with orient='records': return an iterator of DataFrames with
+        chunksize rows each, decoding the input incrementally
+
+    Returns
+    -------
+    result : DataFrame, Series, or iterator of DataFrame
+    """
+    if date_unit not in _DATE_DIVISORS:
+        raise ValueError('date_unit must be one of %s'
+                         % str(sorted(_DATE_DIVISORS)))
+    divisor = _DATE_DIVISORS[date_unit]
+
+    if typ == 'frame':
+        orient = _check_orient(orient or 'columns', _FRAME_ORIENTS)
+    elif typ == 'series':
+        orient = _check_orient(orient or 'index', _SERIES_ORIENTS)
+    else:
+        raise ValueError("typ must be 'frame' or 'series', got %s" % typ)
+
+    def _finalize(result):
+        if date_index:
+            result.index = Index(_epoch_to_datetime(result.index.values,
+                                                    divisor))
+        if convert_dates:
+            for col in convert_dates:
+                result[col] = _epoch_to_datetime(result[col].values, divisor)
+        return result
+
+    if chunksize is not None:
+        if typ != 'frame' or orient != 'records':
+            raise ValueError("chunksize is only supported with typ='frame' "
+                             "and orient='records'")
+        return _iter_record_frames(path_or_buf, int(chunksize), _finalize)
+
+    if hasattr(path_or_buf, 'read'):
+        data = path_or_buf.read()
+    elif _is_path(path_or_buf):
+        f = open(path_or_buf)
+        try:
+            data = f.read()
+        finally:
+            f.close()
+    else:
+        data = path_or_buf
+
+    parsed = json.loads(data, **_DECODER_KWDS)
+
+    if typ == 'frame':
+        result = _FRAME_READERS[orient](parsed)
+    else:
+        result = _SERIES_READERS[orient](parsed)
+    return _finalize(result)
+
+
+def _check_orient(orient, valid):
+    if orient not in valid:
+        raise ValueError('orient must be one of %s, got %s'
+                         % (str(valid), orient))
+    return orient
+
+
+def _is_path(path_or_buf):
+    if not isinstance(path_or_buf, basestring):
+        return False
+    stripped = path_or_buf.lstrip()
+    if stripped[:1] in ('{', '['):
+        return False
+    return os.path.exists(path_or_buf)
+
+
+#----------------------------------------------------------------------
+# Writing
+
+def _encode(values, divisor):
+    return lib.json_encode_values(np.asarray(values), divisor)
+
+
+def _encode_array(values, divisor):
+    return '[' + ','.join(_encode(values, divisor)) + ']'
+
+
+def _encode_keys(index, divisor):
+    # JSON object keys are strings
+    return [t if t[0] == '"' else _escape(t)
+            for t in _encode(index.values, divisor)]
+
+
+def _iter_tokens(frame, divisor, chunksize):
+    """
+    Encode the frame block by block in chunks of rows, yielding the first row
+    and a (columns x rows) array of JSON tokens for each chunk
+    """
+    n = len(frame.index)
+    for start in xrange(0, n, chunksize):
+        end = min(start + chunksize, n)
+        tokens = np.empty((len(frame.columns), end - start), dtype=object)
+        for block in frame._data.blocks:
+            values = block._slice((slice(None), slice(start, end))).values
+            encoded = lib.json_encode_values(values.ravel(), divisor)
+            locs = frame.columns.get_indexer(block.items)
+            tokens[locs] = encoded.reshape(values.shape)
+        yield start, tokens
+
+
+def _write_chunks(f, pieces):
+    first = True
+    for piece in pieces:
+        if not piece:
+            continue
+        if not first:
+            f.write(',')
+        f.write(piece)
+        first = False
+
+
+def _write_frame_split(f, frame, divisor, chunksize):
+    f.write('{"columns":%s,"index":%s,"data":['
+            % (_encode_array(frame.columns.values, divisor),
+               _encode_array(frame.index.values, divisor)))
+    _write_chunks(f, (lib.json_join_arrays(tokens, 0, tokens.shape[1])
+                      for _, tokens in _iter_tokens(frame, divisor,
+                                                    chunksize)))
+    f.write(']}')
+
+
+def _write_frame_records(f, frame, divisor, chunksize):
+    keys = _encode_keys(frame.columns, divisor)
+    f.write('[')
+    _write_chunks(f, (lib.json_join_records(keys, tokens, 0, tokens.shape[1])
+                      for _, tokens in _iter_tokens(frame, divisor,
+                                                    chunksize)))
+    f.write(']')
+
+
+def _write_frame_index(f, frame, divisor, chunksize):
+    keys = _encode_keys(frame.columns, divisor)
+    row_keys = _encode_keys(frame.index, divisor)
+    f.write('{')
+    _write_chunks(f, (lib.json_join_records(
+                          keys, tokens, 0, tokens.shape[1],
+                          row_keys[start:start + tokens.shape[1]])
+                      for start, tokens in _iter_tokens(frame, divisor,
+                                                        chunksize)))
+    f.write('}')
+
+
+def _write_frame_columns(f, frame, divisor, chunksize):
+    keys = _encode_keys(frame.columns, divisor)
+    row_keys = _encode_keys(frame.index, divisor)
+    f.write('{')
+    for j, key in enumerate(keys):
+        if j > 0:
+            f.write(',')
+        f.write(key + ':{')
+        _write_series_pairs(f, frame.icol(j).values, row_keys, divisor,
+                            chunksize)
+        f.write('}')
+    f.write('}')
+
+
+def _write_series_pairs(f, values, row_keys, divisor, chunksize):
+    n = len(values)
+    _write_chunks(f, (lib.json_join_pairs(
+                          row_keys[start:start + chunksize],
+                          _encode(values[start:start + chunksize], divisor),
+                          0, min(chunksize, n - start))
+                      for start in xrange(0, n, chunksize)))
+
+
+def _write_series_values(f, values, divisor, chunksize):
+    _write_chunks(f, (','.join(_encode(values[start:start + chunksize],
+                                       divisor))
+                      for start in xrange(0, len(values), chunksize)))
+
+
+def _write_series_split(f, series, divisor, chunksize):
+    f.write('{"name":%s,"index":%s,"data":['
+            % (_encode([series.name], divisor)[0],
+               _encode_array(series.index.values, divisor)))
+    _write_series_values(f, series.values, divisor, chunksize)
+    f.write(']}')
+
+
+def _write_series_records(f, series, divisor, chunksize):
+    f.write('[')
+    _write_series_values(f, series.values, divisor, chunksize)
+    f.write(']')
+
+
+def _write_series_index(f, series, divisor, chunksize):
+    f.write('{')
+    _write_series_pairs(f, series.values, _encode_keys(series.index, divisor),
+                        divisor, chunksize)
+    f.write('}')
+
+
+_FRAME_WRITERS = {'split': _write_frame_split,
+                  'records': _write_frame_records,
+                  'index': _write_frame_index,
+                  'columns': _write_frame_columns}
+
+_SERIES_WRITERS = {'split': _write_series_split,
+                   'records': _write_series_records,
+                   'index': _write_series_index}
+
+
+#----------------------------------------------------------------------
+# Reading
+
+class _Pairs(list):
+    """
+    JSON object decoded as a list of (key, value) pairs, keeping key order
+    """
+    pass
+
+
+def _sorted_pairs(obj):
+    return _Pairs(sorted(obj.iteritems()))
+
+
+# object_pairs_hook needs the json module of Python 2.7 or simplejson 2.1;
+# older versions only hand out dicts, so the keys come back sorted
+try:
+    json.JSONDecoder(object_pairs_hook=_Pairs)
+    _DECODER_KWDS = {'object_pairs_hook': _Pairs}
+except TypeError:
+    _DECODER_KWDS = {'object_hook': _sorted_pairs}
+
+
+_KIND_FROM_PYTYPE = {float: 'f', int: 'if', long: 'if', bool: 'b'}
+
+
+def _convert_objects(values):
+    mask = isnull(values)
+    if mask.any():
+        values[mask] = np.nan
+    try:
+        return lib.maybe_convert_objects(values)
+    except OverflowError:
+        return values
+
+
+def _convert_axis(keys):
+    # object keys are always strings in JSON, recover numbers where possible
+    values = lib.list_to_object_array(list(keys))
+    try:
+        return Index(lib.maybe_convert_numeric(values, set()))
+    except Exception:
+        return Index(values)
+
+
+def _rows_to_arrays(rows, ncols):
+    """
+    Fill typed arrays from a list of row lists, sniffing the type from the
+    first row and falling back on object conversion
+    """
+    if len(rows) == 0:
+        return [np.empty(0, dtype=object) for _ in range(ncols)]
+
+    arrays = []
+    objects = None
+    for j in range(ncols):
+        values = None
+        for kind in _KIND_FROM_PYTYPE.get(type(rows[0][j]), ''):
+            values = lib.rows_to_typed_column(rows, j, kind)
+            if values is not None:
+                break
+        if values is None:
+            if objects is None:
+                objects = lib.to_object_array(rows)
+            values = _convert_objects(objects[:, j].copy())
+        arrays.append(values)
+    return arrays
+
+
+def _frame_from_pairs(records, index=None):
+    if len(records) == 0:
+        return DataFrame(index=index)
+
+    columns = [k for k, _ in records[0]]
+    dicts = [dict(rec) for rec in records]
+    if any(len(d) != len(columns) for d in dicts):
+        extra = set().union(*dicts) - set(columns)
+        columns.extend(sorted(extra))
+
+    objects = lib.dicts_to_array(dicts, columns)
+    data = dict((j, _convert_objects(objects[:, j].copy()))
+                for j in range(len(columns)))
+    result = DataFrame(data, index=index, columns=range(len(columns)))
+    result.columns = _convert_axis(columns)
+    return result
+
+
+def _read_frame_split(parsed):
+    parsed = dict(parsed)
+    columns, rows = parsed['columns'], parsed['data']
+    data = dict(enumerate(_rows_to_arrays(rows, len(columns))))
+    result = DataFrame(data, index=Index(parsed['index']),
+                       columns=range(len(columns)))
+    result.columns = Index(columns)
+    return result
+
+
+def _read_frame_records(parsed):
+    return _frame_from_pairs(parsed)
+
+
+def _read_frame_index(parsed):
+    if len(parsed) == 0:
+        return DataFrame()
+    keys, records = zip(*parsed)
+    return _frame_from_pairs(list(records), index=_convert_axis(keys))
+
+
+def _read_frame_columns(parsed):
+    if len(parsed) == 0:
+        return DataFrame()
+
+    columns = []
+    pieces = []
+    keys = None
+    for col, pairs in parsed:
+        col_keys, values = zip(*pairs) if pairs else ((), ())
+        if keys is None:
+            keys = list(col_keys)
+        elif list(col_keys) != keys:
+            # columns indexed differently, align on the union of the keys
+            values = dict(pairs)
+            known = set(keys)
+            keys.extend(k for k in col_keys if k not in known)
+        columns.append(col)
+        pieces.append(values)
+
+    data = {}
+    for j, values in enumerate(pieces):
+        if isinstance(values, dict):
+            values = [values.get(k) for k in keys]
+        elif len(values) < len(keys):
+            values = list(values) + [None] * (len(keys) - len(values))
+        data[j] = _convert_objects(lib.list_to_object_array(list(values)))
+
+    result = DataFrame(data, index=_convert_axis(keys),
+                       columns=range(len(columns)))
+    result.columns = _convert_axis(columns)
+    return result
+
+
+def _read_series_split(parsed):
+    parsed = dict(parsed)
+    values = _convert_objects(lib.list_to_object_array(parsed['data']))
+    return Series(values, index=Index(parsed['index']),
+                  name=parsed.get('name'))
+
+
+def _read_series_records(parsed):
+    return Series(_convert_objects(lib.list_to_object_array(parsed)))
+
+
+def _read_series_index(parsed):
+    if len(parsed) == 0:
+        return Series([])
+    keys, values = zip(*parsed)
+    values = _convert_objects(lib.list_to_object_array(list(values)))
+    return Series(values, index=_convert_axis(keys))
+
+
+_FRAME_READERS = {'split': _read_frame_split,
+                  'records': _read_frame_records,
+                  'index': _read_frame_index,
+                  'columns': _read_frame_columns}
+
+_SERIES_READERS = {'split': _read_series_split,
+                   'records': _read_series_records,
+                   'index': _read_series_index}
+
+
+_SEPARATORS = re.compile(r'[\s,]*')
+
+
+def _iter_records(f, blocksize=1 << 20):
+    """
+    Incrementally decode the objects of a top-level JSON array
+    """
+    decoder = json.JSONDecoder(**_DECODER_KWDS)
+
+    buf = f.read(blocksize).lstrip()
+    if not buf.startswith('['):
+        raise ValueError("orient='records' JSON must be an array")
+    pos = 1
+    while True:
+        pos = _SEPARATORS.match(buf, pos).end()
+        if pos == len(buf):
+            more = f.read(blocksize)
+            if not more:
+                raise ValueError('unterminated JSON array')
+            buf, pos = buf[pos:] + more, 0
+            continue
+        if buf[pos] == ']':
+            return
+        if buf[pos] != '{':
+            raise ValueError("orient='records' JSON must hold objects")
+        try:
+            record, end = decoder.raw_decode(buf, pos)
+        except ValueError:
+            # record continues past the end of the buffer
+            more = f.read(blocksize)
+            if not more:
+                raise
+            buf, pos = buf[pos:] + more, 0
+            continue
+        yield record
+        pos = end
+
+
+def _iter_record_frames(path_or_buf, chunksize, finalize):
+    if hasattr(path_or_buf, 'read'):
+        f, close = path_or_buf, False
+    elif _is_path(path_or_buf):
+        f, close = open(path_or_buf), True
+    else:
+        f, close = StringIO(path_or_buf), False
+
+    try:
+        start = 0
+        records = []
+        for record in _iter_records(f):
+            records.append(record)
+            if len(records) == chunksize:
+                yield finalize(_frame_chunk(records, start))
+                start += len(records)
+                records = []
+        if records:
+            yield finalize(_frame_chunk(records, start))
+    finally:
+        if close:
+            f.close()
+
+
+def _frame_chunk(records, start):
+    index = Index(np.arange(start, start + len(records)))
+    return _frame_from_pairs(records, index=index)
+
+
+def _epoch_to_datetime(values, divisor):
+    values = np.asarray(values)
+    mask = isnull(values)
+    stamps = np.where(mask, 0, values).astype(np.int64) * divisor
+    stamps[mask] = lib.iNaT
+    return stamps.view('M8[ns]')
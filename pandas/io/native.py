@@ -0,0 +1,291 @@
+"""
+Native binary format for DataFrame and Panel objects. The BlockManager is
+written as a small pickled metadata header followed by the raw, contiguous
+block and index buffers, so that loading is a handful of large reads directly
+into the block arrays instead of unpickling every element.
+
+File layout::
+
+    magic (8 bytes) | header length (uint64, little endian) | header
+    | padding | buffer 0 | padding | buffer 1 | ...
+
+Every buffer starts on a 64-byte boundary relative to the start of the file,
+so uncompressed numeric buffers can be memory mapped as aligned arrays.
+"""
+
+import cPickle as pickle
+import mmap
+import struct
+import zlib
+
+import numpy as np
+
+from pandas.core.index import Index, Int64Index, MultiIndex
+from pandas.core.internals import BlockManager, make_block
+from pandas.core.frame import DataFrame
+from pandas.core.panel import Panel
+from pandas.tseries.index import DatetimeIndex
+
+MAGIC = 'PDNATIVE'
+VERSION = 1
+
+_ALIGNMENT = 64
+_PREAMBLE_SIZE = len(MAGIC) + 8
+
+_CLASSES = {'DataFrame': DataFrame, 'Panel': Panel}
+_COMPRESSORS = (None, 'zlib')
+
+
+def is_native_file(path):
+    """
+    Return True if the file at path was written in the native block format
+    """
+    f = open(path, 'rb')
+    try:
+        return f.read(len(MAGIC)) == MAGIC
+    finally:
+        f.close()
+
+
+def write_native(obj, path, compress=None):
+    """
+    Write DataFrame or Panel to path in the native block format
+
+    Parameters
+    ----------
+    obj : DataFrame or Panel
+    path : string
+        File path
+    compress : {None, 'zlib'}, default None
+        Compress each block and index buffer separately. Compressed buffers
+        need to be decompressed in memory on load
+    """
+    klass = type(obj).__name__
+    if klass not in _CLASSES:
+        raise TypeError('native format only supports DataFrame and Panel, '
+                        'got %s' % klass)
+    if compress not in _COMPRESSORS:
+        raise ValueError('compress must be one of %s' % str(_COMPRESSORS))
+
+    mgr = obj._data
+    if not mgr.is_consolidated():
+        mgr = mgr.consolidate()
+
+    buffers = []
+    axes = [_index_meta(ax, buffers, compress) for ax in mgr.axes]
+    blocks = [{'items': _index_meta(blk.items, buffers, compress),
+               'values': _array_meta(blk.values, buffers, compress)}
+              for blk in mgr.blocks]
+
+    offsets = []
+    nbytes = []
+    position = 0
+    for buf in buffers:
+        position = _align(position)
+        offsets.append(position)
+        nbytes.append(_nbytes(buf))
+        position += nbytes[-1]
+
+    header = pickle.dumps({'version': VERSION, 'klass': klass, 'axes': axes,
+                           'blocks': blocks, 'offsets': offsets,
+                           'nbytes': nbytes},
+                          protocol=pickle.HIGHEST_PROTOCOL)
+
+    f = open(path, 'wb')
+    try:
+        f.write(MAGIC)
+        f.write(struct.pack('<Q', len(header)))
+        f.write(header)
+
+        data_start = _align(_PREAMBLE_SIZE + len(header))
+        for buf, offset in zip(buffers, offsets):
+            _pad_to(f, data_start + offset)
+            if isinstance(buf, np.ndarray):
+                buf.tofile(f)
+            else:
+                f.write(buf)
+    finally:
+        f.close()
+
+
+def read_native(path, mmap_mode=None):
+    """
+    Read DataFrame or Panel written by write_native
+
+    Parameters
+    ----------
+    path : string
+        File path
+    mmap_mode : {None, 'r'}, default None
+        If 'r', memory map the uncompressed numeric block and index buffers
+        read-only instead of reading them. Processes loading the same file
+        then share the OS page cache. A block is copied into private memory
+        the first time it is modified through the DataFrame or Panel
+
+    Returns
+    -------
+    obj : DataFrame or Panel
+    """
+    if mmap_mode not in (None, 'r'):
+        raise ValueError("mmap_mode must be None or 'r', got %s"
+                         % str(mmap_mode))
+
+    f = open(path, 'rb')
+    try:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError('%s is not a native pandas file' % path)
+        length, = struct.unpack('<Q', f.read(8))
+        header = pickle.loads(f.read(length))
+        if header['version'] > VERSION:
+            raise ValueError('native file version %d is newer than the '
+                             'supported version %d'
+                             % (header['version'], VERSION))
+
+        mapped = None
+        if mmap_mode is not None:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        reader = _BufferReader(f, _align(_PREAMBLE_SIZE + length), header,
+                               mapped)
+
+        axes = [_read_index(meta, reader) for meta in header['axes']]
+        blocks = [make_block(reader.read(meta['values']),
+                             _read_index(meta['items'], reader), axes[0])
+                  for meta in header['blocks']]
+    finally:
+        f.close()
+
+    mgr = BlockManager(blocks, axes)
+    return _CLASSES[header['klass']](mgr)
+
+
+class _BufferReader(object):
+
+    def __init__(self, f, data_start, header, mapped=None):
+        self.f = f
+        self.data_start = data_start
+        self.offsets = header['offsets']
+        self.nbytes = header['nbytes']
+        self.mapped = mapped
+
+    def read(self, meta):
+        i = meta['buffer']
+        offset = self.data_start + self.offsets[i]
+
+        dtype = np.dtype(meta['dtype'])
+        if meta['kind'] == 'raw' and meta['compress'] is None:
+            count = int(np.prod(meta['shape']))
+            if self.mapped is not None:
+                return self._map(offset, dtype, count, meta['shape'])
+
+            self.f.seek(offset)
+            values = np.fromfile(self.f, dtype=_storage_dtype(dtype),
+                                 count=count)
+            if len(values) != count:
+                raise ValueError('native file is truncated')
+            return values.view(dtype).reshape(meta['shape'])
+
+        self.f.seek(offset)
+        data = self.f.read(self.nbytes[i])
+        if meta['compress'] == 'zlib':
+            data = zlib.decompress(data)
+
+        if meta['kind'] == 'pickle':
+            return pickle.loads(data)
+
+        values = np.frombuffer(data, dtype=_storage_dtype(dtype)).copy()
+        return values.view(dtype).reshape(meta['shape'])
+
+    def _map(self, offset, dtype, count, shape):
+        if count == 0:
+            return np.empty(shape, dtype=dtype)
+        if offset + count * dtype.itemsize > len(self.mapped):
+            raise ValueError('native file is truncated')
+        # read-only view on the shared mapping, which it keeps alive
+        values = np.frombuffer(self.mapped, dtype=_storage_dtype(dtype),
+                               count=count, offset=offset)
+        return values.view(dtype).reshape(shape)
+
+
+def _index_meta(index, buffers, compress):
+    if isinstance(index, MultiIndex):
+        return {'kind': 'multi', 'names': list(index.names),
+                'sortorder': index.sortorder,
+                'levels': [_index_meta(lev, buffers, compress)
+                           for lev in index.levels],
+                'labels': [_array_meta(lab, buffers, compress)
+                           for lab in index.labels]}
+    elif isinstance(index, DatetimeIndex):
+        tz = index.tz
+        if tz is not None:
+            tz = tz.zone
+        return {'kind': 'datetime', 'name': index.name, 'freq': index.freq,
+                'tz': tz, 'values': _array_meta(index.asi8, buffers, compress)}
+    elif type(index) in (Index, Int64Index):
+        return {'kind': 'index', 'name': index.name,
+                'values': _array_meta(index.values, buffers, compress)}
+    else:
+        # less common index types (PeriodIndex, ...) keep their own pickling
+        return {'kind': 'pickle', 'index': index}
+
+
+def _read_index(meta, reader):
+    kind = meta['kind']
+    if kind == 'multi':
+        return MultiIndex(levels=[_read_index(m, reader)
+                                  for m in meta['levels']],
+                          labels=[reader.read(m) for m in meta['labels']],
+                          names=meta['names'], sortorder=meta['sortorder'])
+    elif kind == 'datetime':
+        return DatetimeIndex._simple_new(reader.read(meta['values']),
+                                         meta['name'], freq=meta['freq'],
+                                         tz=meta['tz'])
+    elif kind == 'index':
+        return Index(reader.read(meta['values']), name=meta['name'])
+    else:
+        return meta['index']
+
+
+def _array_meta(values, buffers, compress):
+    if values.dtype == np.object_:
+        kind = 'pickle'
+        data = pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL)
+    else:
+        kind = 'raw'
+        data = np.ascontiguousarray(values)
+
+    if compress == 'zlib':
+        data = zlib.compress(_as_bytes(data))
+
+    meta = {'buffer': len(buffers), 'kind': kind, 'dtype': values.dtype.str,
+            'shape': values.shape, 'compress': compress}
+    buffers.append(data)
+    return meta
+
+
+def _storage_dtype(dtype):
+    # datetime64 values are read as plain integers and viewed afterwards
+    if dtype.kind == 'M':
+        return np.dtype(dtype.byteorder + 'i8')
+    return dtype
+
+
+def _as_bytes(data):
+    if isinstance(data, np.ndarray):
+        return data.tostring()
+    return data
+
+
+def _nbytes(buf):
+    if isinstance(buf, np.ndarray):
+        return buf.nbytes
+    return len(buf)
+
+
+def _align(position):
+    return -(-position // _ALIGNMENT) * _ALIGNMENT
+
+
+def _pad_to(f, position):
+    current = f.tell()
+    if position > current:
+        f.write('\x00' * (position - current))
@@ -16,6 +16,7 @@ except NameError:  # pragma: no cover
 
 import numpy as np
 
+from pandas.core.categorical import Categorical
 from pandas.core.index import Index, MultiIndex
 from pandas.core.frame import DataFrame
 import datetime
@@ -88,6 +89,12 @@ chunksize : int, default None
 converters : dict. optional
     Dict of functions for converting values in certain columns. Keys can either
     be integers or column labels
+categorical : list of ints or names, default None
+    Columns to store as integer codes into their distinct values, which uses
+    much less memory for columns with few distinct values
+intern_strings : boolean, default False
+    Make repeated strings in object columns share one object, across all
+    columns and chunks
 verbose : boolean, default False
     Indicate number of NA values placed in non-numeric columns
 delimiter : string, default None
@@ -216,6 +223,8 @@ def read_csv(filepath_or_buffer,
              chunksize=None,
              skip_footer=0,
              converters=None,
+             categorical=None,
+             intern_strings=False,
              verbose=False,
              delimiter=None,
              encoding=None,
@@ -231,7 +240,8 @@ def read_csv(filepath_or_buffer,
                 dayfirst=dayfirst, date_parser=date_parser,
                 nrows=nrows, iterator=iterator,
                 chunksize=chunksize, skip_footer=skip_footer,
-                converters=converters, verbose=verbose,
+                converters=converters, categorical=categorical,
+                intern_strings=intern_strings, verbose=verbose,
                 delimiter=delimiter, encoding=encoding,
                 squeeze=squeeze)
 
@@ -263,6 +273,8 @@ def read_table(filepath_or_buffer,
                chunksize=None,
                skip_footer=0,
                converters=None,
+               categorical=None,
+               intern_strings=False,
                verbose=False,
                delimiter=None,
                encoding=None,
@@ -278,7 +290,8 @@ def read_table(filepath_or_buffer,
                 dayfirst=dayfirst, date_parser=date_parser,
                 nrows=nrows, iterator=iterator,
                 chunksize=chunksize, skip_footer=skip_footer,
-                converters=converters, verbose=verbose,
+                converters=converters, categorical=categorical,
+                intern_strings=intern_strings, verbose=verbose,
                 delimiter=delimiter, encoding=encoding,
                 squeeze=squeeze)
 
@@ -313,6 +326,8 @@ def read_fwf(filepath_or_buffer,
              chunksize=None,
              skip_footer=0,
              converters=None,
+             categorical=None,
+             intern_strings=False,
              delimiter=None,
              verbose=False,
              encoding=None,
@@ -328,7 +343,8 @@ def read_fwf(filepath_or_buffer,
                 dayfirst=dayfirst, date_parser=date_parser,
                 nrows=nrows, iterator=iterator,
                 chunksize=chunksize, skip_footer=skip_footer,
-                converters=converters, verbose=verbose,
+                converters=converters, categorical=categorical,
+                intern_strings=intern_strings, verbose=verbose,
                 delimiter=delimiter, encoding=encoding,
                 squeeze=squeeze)
 
@@ -430,6 +446,10 @@ class TextParser(object):
         Row numbers to skip
     skip_footer : int
         Number of line at bottom of file to skip
+    categorical : list of ints or names, default None
+        Columns to store as integer codes into their distinct values
+    intern_strings : boolean, default False
+        Make repeated strings in object columns share one object
     encoding : string, default None
         Encoding to use for UTF when reading/writing (ex. 'utf-8')
     squeeze : boolean, default False
@@ -442,7 +462,8 @@ class TextParser(object):
                  comment=None, parse_dates=False, keep_date_col=False,
                  date_parser=None, dayfirst=False,
                  chunksize=None, skiprows=None, skip_footer=0, converters=None,
-                 verbose=False, encoding=None, squeeze=False):
+                 categorical=None, intern_strings=False, verbose=False,
+                 encoding=None, squeeze=False):
         """
         Workhorse function for processing nested list into DataFrame
 
@@ -478,6 +499,14 @@ class TextParser(object):
         else:
             self.converters = {}
 
+        self.categorical = list(categorical) if categorical is not None else []
+
+        # shared by all chunks, so that their strings are interned together
+        if intern_strings:
+            self._string_table = lib.StringHashTable()
+        else:
+            self._string_table = None
+
         #assert(self.skip_footer >= 0)
 
         self.keep_default_na = keep_default_na
@@ -833,6 +862,16 @@ class TextParser(object):
 
         data = _convert_to_ndarrays(data, self.na_values, self.verbose)
 
+        if self._string_table is not None:
+            for values in data.itervalues():
+                if values.dtype == np.object_:
+                    self._string_table.intern(values)
+
+        for col in self.categorical:
+            if isinstance(col, int) and col not in self.orig_columns:
+                col = self.orig_columns[col]
+            data[col] = Categorical.from_array(data[col])
+
         if self.parse_dates is not None:
             data, columns = self._process_date_conversion(data)
 
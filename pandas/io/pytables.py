@@ -7,6 +7,8 @@ to disk
 
 from datetime import datetime, date
 import time
+import os
+import zlib
 
 import numpy as np
 from pandas import (
@@ -20,7 +22,7 @@ from pandas.core.algorithms import match, unique
 
 from pandas.core.categorical import Factor
 from pandas.core.common import _asarray_tuplesafe
-from pandas.core.internals import BlockManager, make_block
+from pandas.core.internals import BlockManager, CategoricalBlock, make_block
 from pandas.core.reshape import block2d_to_block3d
 import pandas.core.common as com
 
@@ -507,7 +509,12 @@ class HDFStore(object):
         for i in range(nblocks):
             blk = data.blocks[i]
             self._write_index(group, 'block%d_items' % i, blk.items)
-            self._write_array(group, 'block%d_values' % i, blk.values)
+            if isinstance(blk, CategoricalBlock):
+                # store the codes, the levels are written as an index
+                self._write_index(group, 'block%d_levels' % i, blk.levels)
+                self._write_array(group, 'block%d_values' % i, blk.codes)
+            else:
+                self._write_array(group, 'block%d_values' % i, blk.values)
 
     def _read_block_manager(self, group):
         ndim = group._v_attrs.ndim
@@ -522,7 +529,12 @@ class HDFStore(object):
         for i in range(group._v_attrs.nblocks):
             blk_items = self._read_index(group, 'block%d_items' % i)
             values = _read_array(group, 'block%d_values' % i)
-            blk = make_block(values, blk_items, items)
+            if hasattr(group._v_attrs, 'block%d_levels_variety' % i):
+                levels = self._read_index(group, 'block%d_levels' % i)
+                blk = CategoricalBlock(values, levels, blk_items, items,
+                                       ndim=values.ndim)
+            else:
+                blk = make_block(values, blk_items, items)
             blocks.append(blk)
 
         return BlockManager(blocks, axes)
@@ -930,6 +942,310 @@ class HDFStore(object):
         self.handle.flush()
         return len(s.values)
 
+
+class PartitionedStore(object):
+    """
+    Store a logical table as a set of smaller HDFStore Tables, one HDF5 file
+    per partition, so that appends and queries only touch the partitions they
+    need to
+
+    Rows are routed to a partition either by the time bucket their (datetime)
+    index falls in, or by a hash of the values of a column (or of the index).
+    A select with a range condition on the index only reads the partitions
+    that can contain matching rows.
+
+    Parameters
+    ----------
+    path : string
+        Directory holding the partition files. Created if it does not exist
+    partition_by : {'time', 'hash'}, default 'time'
+    freq : string, default 'M'
+        Period frequency of the time buckets when partition_by='time'
+    column : column name, default None
+        Column whose values are hashed when partition_by='hash'. If None, the
+        index is hashed
+    npartitions : int, default 16
+        Number of hash buckets when partition_by='hash'
+    mode : {'a', 'w', 'r', 'r+'}, default 'a'
+        'w' removes the partition files already in the directory, 'r' opens
+        it read-only. Partition files are opened with 'a' for writes and
+        'r' for reads
+    complevel, complib, fletcher32
+        Passed on to each HDFStore, see HDFStore docstring
+
+    Examples
+    --------
+    >>> store = PartitionedStore('ticks', partition_by='time', freq='D')
+    >>> store.append('df', df)   # routed to one file per day
+    >>> store.select('df', where=[{'field' : 'index', 'op' : '>=',
+    ...                            'value' : datetime(2012, 1, 5)}])
+    """
+
+    def __init__(self, path, partition_by='time', freq='M', column=None,
+                 npartitions=16, mode='a', complevel=None, complib=None,
+                 fletcher32=False):
+        if partition_by not in ('time', 'hash'):
+            raise ValueError('partition_by must be one of time or hash, got %s'
+                             % partition_by)
+        if partition_by == 'time' and column is not None:
+            raise ValueError('time partitioning is done on the index')
+
+        if not os.path.exists(path):
+            if mode == 'r':
+                raise IOError('partition directory %s does not exist' % path)
+            os.makedirs(path)
+
+        self.path = path
+        self.partition_by = partition_by
+        self.freq = freq
+        self.column = column
+        self.npartitions = npartitions
+        self.mode = mode
+        self.complevel = complevel
+        self.complib = complib
+        self.fletcher32 = fletcher32
+
+        if mode == 'w':
+            for name in os.listdir(path):
+                if _parse_partition_name(name) is not None:
+                    os.remove(os.path.join(path, name))
+
+    def __contains__(self, key):
+        return len(self.partitions(key)) > 0
+
+    def __repr__(self):
+        output = '%s\nDirectory path: %s\n' % (type(self), self.path)
+
+        keys = self.keys()
+        if len(keys) > 0:
+            nparts = [str(len(self.partitions(k))) for k in keys]
+            output += adjoin(5, keys, nparts)
+        else:
+            output += 'Empty'
+        return output
+
+    def keys(self):
+        """
+        Return a sorted list of the logical keys stored in the directory
+        """
+        keys = set()
+        for name in os.listdir(self.path):
+            parsed = _parse_partition_name(name)
+            if parsed is not None:
+                keys.add(parsed[0])
+        return sorted(keys)
+
+    def partitions(self, key):
+        """
+        Return the sorted partition numbers (period ordinals or hash buckets)
+        written for a key
+        """
+        key = _partition_key(key)
+        result = []
+        for name in os.listdir(self.path):
+            parsed = _parse_partition_name(name)
+            if parsed is not None and parsed[0] == key:
+                result.append(parsed[1])
+        return sorted(result)
+
+    def _partition_path(self, key, part):
+        return os.path.join(self.path, '%s.%d.h5' % (_partition_key(key), part))
+
+    def _open(self, key, part, write=False):
+        if write:
+            if self.mode == 'r':
+                raise IOError('partition directory %s is read-only'
+                              % self.path)
+            mode = 'a'
+        else:
+            mode = 'r'
+        return HDFStore(self._partition_path(key, part), mode=mode,
+                        complevel=self.complevel, complib=self.complib,
+                        fletcher32=self.fletcher32)
+
+    def _get_partition_keys(self, value):
+        if self.partition_by == 'time':
+            index = value.index
+            if not isinstance(index, DatetimeIndex):
+                raise TypeError('time partitioning requires a DatetimeIndex')
+            return index.to_period(self.freq).values
+
+        if self.column is None:
+            values = np.asarray(value.index)
+        else:
+            values = np.asarray(value[self.column])
+        return _hash_bucket(values, self.npartitions)
+
+    def append(self, key, value):
+        """
+        Append DataFrame to the Tables of the partitions its rows belong to.
+        Each partition file is only opened if it receives rows
+
+        Parameters
+        ----------
+        key : string
+        value : DataFrame
+        """
+        parts = self._get_partition_keys(value)
+        for part, chunk in value.groupby(parts):
+            store = self._open(key, part, write=True)
+            try:
+                store.append(key, chunk)
+            finally:
+                store.close()
+
+    def select(self, key, where=None):
+        """
+        Retrieve the pandas object stored under key from all the partitions
+        that may satisfy the where criteria. See HDFStore.select for the form
+        of the where conditions. Partitions are concatenated in partition
+        order, which is time order when partition_by='time'
+        """
+        from pandas.tools.merge import concat
+
+        all_parts = self.partitions(key)
+        if len(all_parts) == 0:
+            raise KeyError('No object named %s in the store' % key)
+
+        # no partition can match, let one of them produce the empty result
+        parts = self._prune(all_parts, where) or all_parts[:1]
+
+        pieces = []
+        for part in parts:
+            store = self._open(key, part)
+            try:
+                pieces.append(store.select(key, where=where))
+            finally:
+                store.close()
+
+        if len(pieces) == 1:
+            return pieces[0]
+        return concat(pieces)
+
+    def remove(self, key, where=None):
+        """
+        Remove rows matching where from the partitions of key. With no where
+        criteria the partition files are deleted entirely
+        """
+        parts = self._prune(self.partitions(key), where)
+        for part in parts:
+            if where is None:
+                os.remove(self._partition_path(key, part))
+                continue
+
+            store = self._open(key, part, write=True)
+            try:
+                store.remove(key, where=where)
+            finally:
+                store.close()
+
+    def _prune(self, parts, where):
+        """
+        Drop the partitions which cannot hold rows matching the index
+        conditions in where
+        """
+        if not where:
+            return parts
+
+        parts = np.asarray(parts, dtype=np.int64)
+        keep = np.ones(len(parts), dtype=bool)
+        for c in where:
+            if c.get('field') != 'index':
+                continue
+
+            op = c.get('op')
+            value = c['value']
+
+            if self.partition_by == 'time':
+                if isinstance(value, (list, np.ndarray)):
+                    targets = [self._time_bucket(v) for v in value]
+                    keep &= lib.ismember(parts, set(targets))
+                    continue
+
+                ordinal = self._time_bucket(value)
+                if op in ('>', '>='):
+                    keep &= parts >= ordinal
+                elif op in ('<', '<='):
+                    keep &= parts <= ordinal
+                elif op in (None, '=='):
+                    keep &= parts == ordinal
+            elif self.column is None and op in (None, '==', 'in'):
+                if not isinstance(value, (list, np.ndarray)):
+                    value = [value]
+                targets = _hash_bucket(np.asarray(value), self.npartitions)
+                keep &= lib.ismember(parts, set(targets))
+
+        return list(parts[keep])
+
+    def _time_bucket(self, value):
+        from pandas.tseries.period import Period
+        return Period(lib.Timestamp(value), freq=self.freq).ordinal
+
+
+def _hash_bucket(values, npartitions):
+    """
+    Hash bucket of each value. Dates hash by their nanosecond value and
+    strings with crc32, so that the buckets stay the same across value types
+    and platforms
+    """
+    if com.is_integer_dtype(values):
+        hashed = com._ensure_int64(values)
+    elif com.is_datetime64_dtype(values):
+        hashed = values.view('i8')
+    else:
+        hashed = np.array([_hash_value(x) for x in values], dtype=np.int64)
+
+    # mix the bits (splitmix64 finalizer) so that values with common
+    # factors, like the nanoseconds of whole days, spread over the buckets
+    hashed = hashed.view(np.uint64)
+    old_settings = np.seterr(over='ignore')
+    try:
+        hashed = hashed ^ (hashed >> np.uint64(30))
+        hashed = hashed * np.uint64(0xbf58476d1ce4e5b9)
+        hashed = hashed ^ (hashed >> np.uint64(27))
+        hashed = hashed * np.uint64(0x94d049bb133111eb)
+        hashed = hashed ^ (hashed >> np.uint64(31))
+    finally:
+        np.seterr(**old_settings)
+    return (hashed % np.uint64(npartitions)).astype(np.int64)
+
+
+def _hash_value(x):
+    if isinstance(x, (datetime, np.datetime64)):
+        return lib.Timestamp(x).value
+    elif com.is_integer(x):
+        return x
+    elif isinstance(x, unicode):
+        x = x.encode('utf-8')
+    if isinstance(x, str):
+        return zlib.crc32(x) & 0xffffffff
+    return hash(x)
+
+
+def _partition_key(key):
+    """
+    File name prefix of the partitions of key, '/df' and 'df' are the same key
+    """
+    key = key.lstrip('/')
+    if not key or '/' in key or os.sep in key:
+        raise ValueError('partition keys cannot contain path separators, '
+                         'got %s' % key)
+    return key
+
+
+def _parse_partition_name(name):
+    """
+    '<key>.<partition>.h5' -> (key, partition), None if name is not a partition
+    """
+    pieces = name.rsplit('.', 2)
+    if len(pieces) != 3 or pieces[2] != 'h5':
+        return None
+    try:
+        return pieces[0], int(pieces[1])
+    except ValueError:
+        return None
+
+
 def _convert_index(index):
     if isinstance(index, DatetimeIndex):
         converted = index.asi8
@@ -3,12 +3,17 @@ Collection of query wrappers / abstractions to both facilitate data
 retrieval and to reduce dependency on DB-specific API.
 """
 from datetime import datetime
+from decimal import Decimal
+import itertools
+import sys
 
 import numpy as np
 import traceback
+from contextlib import contextmanager
 
 from pandas.core.datetools import format as date_format
 from pandas.core.api import DataFrame, isnull
+import pandas.lib as lib
 
 #-------------------------------------------------------------------------------
 # Helper execution function
@@ -28,7 +33,10 @@ def execute(sql, con, retry=True, cur=None, params=None):
     """
     try:
         if cur is None:
-            cur = con.cursor()
+            if isinstance(con, PooledConnection):
+                cur = con.cached_cursor(sql)
+            else:
+                cur = con.cursor()
 
         if params is None:
             cur.execute(sql)
@@ -44,9 +52,12 @@ def execute(sql, con, retry=True, cur=None, params=None):
         print 'Error on sql %s' % sql
         raise
 
-def _safe_fetch(cur):
+def _safe_fetch(cur, size=None):
     try:
-        result = cur.fetchall()
+        if size is None:
+            result = cur.fetchall()
+        else:
+            result = cur.fetchmany(size)
         if not isinstance(result, list):
             result = list(result)
         return result
@@ -119,7 +130,8 @@ def uquery(sql, con=None, cur=None, retry=True, params=()):
             return uquery(sql, con, retry=False)
     return result
 
-def read_frame(sql, con, index_col=None, coerce_float=True):
+def read_frame(sql, con, index_col=None, coerce_float=True, chunksize=None,
+               intern_strings=False):
     """
     Returns a DataFrame corresponding to the result set of the query
     string.
@@ -134,28 +146,195 @@ def read_frame(sql, con, index_col=None, coerce_float=True):
     con: DB connection object, optional
     index_col: string, optional
         column name to use for the returned DataFrame object.
+    coerce_float : boolean, default True
+        Attempt to convert values to non-string, non-numeric objects (like
+        decimal.Decimal) to floating point
+    chunksize : int, default None
+        If specified, return an iterator yielding DataFrames of at most
+        chunksize rows each. Rows are fetched with cursor.fetchmany and
+        converted chunk by chunk, so the full result set is never held as
+        Python tuples at once
+    intern_strings : boolean, default False
+        Make repeated strings in object columns share one object, across all
+        columns and chunks
+
+    Returns
+    -------
+    DataFrame, or iterator of DataFrame if chunksize is given
     """
-    cur = execute(sql, con)
-    rows = _safe_fetch(cur)
+    if chunksize is not None and isinstance(con, PooledConnection):
+        # a cached cursor could be reused by another query while the chunks
+        # are still being fetched
+        cur = execute(sql, con, cur=con.cursor())
+    else:
+        cur = execute(sql, con)
     columns = [col_desc[0] for col_desc in cur.description]
+    kinds = _description_kinds(cur.description, con)
+    string_table = lib.StringHashTable() if intern_strings else None
+
+    if chunksize is not None:
+        return _iter_frames(cur, con, columns, kinds, chunksize,
+                            index_col=index_col, coerce_float=coerce_float,
+                            string_table=string_table)
+
+    rows = _safe_fetch(cur)
 
     cur.close()
     con.commit()
 
-    result = DataFrame.from_records(rows, columns=columns,
-                                    coerce_float=coerce_float)
+    return _frame_from_rows(rows, columns, kinds, index_col=index_col,
+                            coerce_float=coerce_float,
+                            string_table=string_table)
+
+def _iter_frames(cur, con, columns, kinds, chunksize, index_col=None,
+                 coerce_float=True, string_table=None):
+    start = 0
+    try:
+        while True:
+            rows = _safe_fetch(cur, chunksize)
+            if not rows:
+                break
+
+            yield _frame_from_rows(rows, columns, kinds, index_col=index_col,
+                                   coerce_float=coerce_float, start=start,
+                                   string_table=string_table)
+            start += len(rows)
+    finally:
+        cur.close()
+        con.commit()
+
+def _frame_from_rows(rows, columns, kinds, index_col=None, coerce_float=True,
+                     start=0, string_table=None):
+    """
+    Convert a list of row tuples to a DataFrame one column at a time, the
+    default index runs from start to start + len(rows) - 1. Strings in object
+    columns are interned in string_table if given
+
+    Columns of known type (see _description_kinds) are filled straight into
+    typed arrays, the rest go through an object array and type inference
+    """
+    if len(set(columns)) < len(columns):
+        raise ValueError('Non-unique columns not yet supported in read_frame')
+
+    if coerce_float:
+        convert = lib.convert_sql_column
+    else:
+        convert = lib.maybe_convert_objects
+
+    content = None
+    sdict = {}
+    for j, (col, kind) in enumerate(zip(columns, kinds)):
+        if kind is None and len(rows) > 0:
+            # no type code from the driver, guess from the first row
+            kind = _KIND_FROM_PYTYPE.get(type(rows[0][j]))
+
+        values = None
+        if kind is not None and len(rows) > 0:
+            for k in kind:
+                values = lib.rows_to_typed_column(rows, j, k,
+                                                  try_float=coerce_float)
+                if values is not None:
+                    break
+
+        if values is None:
+            if content is None:
+                if len(rows) > 0:
+                    content = lib.to_object_array_tuples(rows).T
+                else:
+                    content = np.empty((len(columns), 0), dtype=object)
+            values = convert(content[j])
+
+        if string_table is not None and values.dtype == np.object_:
+            string_table.intern(values)
+
+        sdict[col] = values
+
+    index = np.arange(start, start + len(rows))
+    result = DataFrame(sdict, index=index, columns=columns)
 
     if index_col is not None:
         result = result.set_index(index_col)
 
     return result
 
+# candidate typed conversions, tried in order: float64, int64, bool,
+# datetime64[ns]
+_KIND_FROM_PYTYPE = {
+    float : 'f',
+    np.float64 : 'f',
+    int : 'if',
+    long : 'if',
+    bool : 'b',
+    datetime : 'M',
+}
+
+def _description_kinds(description, con):
+    """
+    Map the DB-API type codes in cursor.description to the typed conversions
+    to try for each column. None means unknown: drivers such as sqlite3 do
+    not report type codes
+    """
+    if isinstance(con, PooledConnection):
+        con = con.con
+
+    # the type objects (NUMBER, DATETIME, ...) live in the driver module
+    module_name = type(con).__module__.split('.')[0]
+    module = sys.modules.get(module_name)
+
+    kinds = []
+    for col_desc in description:
+        type_code = col_desc[1]
+
+        kind = None
+        if type_code is None:
+            pass
+        elif isinstance(type_code, type):
+            # some drivers (e.g. pyodbc) report the Python type
+            if issubclass(type_code, Decimal):
+                kind = 'f'
+            else:
+                kind = _KIND_FROM_PYTYPE.get(type_code)
+        elif module is not None:
+            if type_code == getattr(module, 'NUMBER', None):
+                kind = 'if'
+            elif type_code == getattr(module, 'DATETIME', None):
+                kind = 'M'
+        kinds.append(kind)
+
+    return kinds
+
 frame_query = read_frame
 
-def write_frame(frame, name=None, con=None, flavor='sqlite', append=False):
+_FLAVORS = {
+    # wildcard: DB-API paramstyle placeholder
+    # max_params: bound parameters allowed in one statement, limits the
+    # number of rows per multi-row INSERT
+    'sqlite' : {'wildcard' : '?', 'max_params' : 999},
+}
+
+def write_frame(frame, name=None, con=None, flavor='sqlite', append=False,
+                chunksize=10000, multirow=False):
     """
     Write records stored in a DataFrame to SQLite. The index will currently be
     dropped
+
+    All rows are inserted in a single transaction which is committed at the
+    end, or rolled back if any insert fails. NaN values are written as NULL.
+
+    Parameters
+    ----------
+    frame : DataFrame
+    name : string
+        Name of the table
+    con : DB connection object
+    flavor : {'sqlite'}, default 'sqlite'
+    append : boolean, default False
+        If False, create the table if it does not exist yet
+    chunksize : int, default 10000
+        Number of rows converted and passed to each executemany call
+    multirow : boolean, default False
+        Insert several rows per statement (INSERT ... VALUES (...), (...)),
+        which cuts per-statement overhead. Requires SQLite >= 3.7.11
     """
     if flavor == 'sqlite':
         schema = get_sqlite_schema(frame, name)
@@ -165,10 +344,66 @@ def write_frame(frame, name=None, con=None, flavor='sqlite', append=False):
     if not append and not has_table(name, con):
         con.execute(schema)
 
-    wildcards = ','.join(['?'] * len(frame.columns))
-    insert_sql = 'INSERT INTO %s VALUES (%s)' % (name, wildcards)
-    data = [tuple(x) for x in frame.values]
-    con.executemany(insert_sql, data)
+    ncols = len(frame.columns)
+    wildcard = _FLAVORS[flavor]['wildcard']
+    row_wildcards = '(%s)' % ','.join([wildcard] * ncols)
+
+    if multirow and ncols > 0:
+        rows_per_stmt = max(1, _FLAVORS[flavor]['max_params'] // ncols)
+    else:
+        rows_per_stmt = 1
+
+    columns = [_sql_column_values(frame[c]) for c in frame.columns]
+
+    cur = con.cursor()
+    try:
+        for start in xrange(0, len(frame), chunksize):
+            end = min(start + chunksize, len(frame))
+            data = zip(*[col[start:end] for col in columns])
+
+            # full multi-row statements, then one for the remainder
+            nfull = len(data) // rows_per_stmt * rows_per_stmt
+            if nfull:
+                _insert_rows(cur, name, row_wildcards, data[:nfull],
+                             rows_per_stmt)
+            if nfull < len(data):
+                rest = data[nfull:]
+                _insert_rows(cur, name, row_wildcards, rest, len(rest))
+        cur.close()
+        con.commit()
+    except Exception:
+        try:
+            con.rollback()
+        except Exception:  # pragma: no cover
+            pass
+        raise
+
+def _insert_rows(cur, name, row_wildcards, data, rows_per_stmt):
+    insert_sql = 'INSERT INTO %s VALUES %s' % (
+        name, ','.join([row_wildcards] * rows_per_stmt))
+
+    if rows_per_stmt > 1:
+        data = [tuple(itertools.chain(*data[i:i + rows_per_stmt]))
+                for i in xrange(0, len(data), rows_per_stmt)]
+
+    cur.executemany(insert_sql, data)
+
+def _sql_column_values(series):
+    """
+    Column values as a list of Python scalars the DB-API can bind, with NA
+    values replaced by None
+    """
+    values = series.values
+    mask = isnull(values)
+
+    if issubclass(values.dtype.type, np.datetime64):
+        values = lib.ints_to_pydatetime(values.view('i8'))
+
+    if mask.any():
+        values = values.astype(object)
+        values[mask] = None
+
+    return values.tolist()
 
 def has_table(name, con):
     sqlstr = "SELECT name FROM sqlite_master WHERE type='table' AND name='%s'" % name
@@ -211,6 +446,217 @@ CREATE TABLE %(name)s (
 
 
 
+#-------------------------------------------------------------------------------
+# Connection and cursor reuse
+
+class ConnectionPool(object):
+    """
+    Keep a bounded number of idle DB-API connections for reuse, so that
+    services issuing many small queries do not pay for connecting each time
+
+    Connections handed out are PooledConnection objects, which can be passed
+    as con to execute, tquery, uquery and read_frame. These reuse one cursor
+    per SQL string, so repeated parameterized queries skip re-preparing the
+    statement in drivers that cache it on the cursor.
+
+    Parameters
+    ----------
+    factory : callable
+        Called with no arguments to open a new DB-API connection
+    max_idle : int, default 5
+        Maximum number of idle connections kept open
+    max_cursors : int, default 32
+        Maximum number of cached cursors per connection
+
+    Examples
+    --------
+    >>> pool = ConnectionPool(lambda: sqlite3.connect('prices.db'))
+    >>> with pool.connection() as con:
+    ...     df = read_frame('select * from prices where id = 1', con)
+    >>> with pool.transaction() as con:
+    ...     for row in rows:
+    ...         uquery(insert_sql, con, params=row)  # committed once at end
+    """
+
+    def __init__(self, factory, max_idle=5, max_cursors=32):
+        import threading
+
+        self.factory = factory
+        self.max_idle = max_idle
+        self.max_cursors = max_cursors
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._idle)
+
+    def get(self):
+        """
+        Return an idle connection, or a new one if there are none
+        """
+        self._lock.acquire()
+        try:
+            if self._idle:
+                return self._idle.pop()
+        finally:
+            self._lock.release()
+
+        return PooledConnection(self.factory(), max_cursors=self.max_cursors)
+
+    def put(self, con):
+        """
+        Return a connection to the pool. Closed if the pool is already full
+        """
+        self._lock.acquire()
+        try:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(con)
+                return
+        finally:
+            self._lock.release()
+
+        con.close()
+
+    def discard(self, con):
+        """
+        Close a connection (e.g. after a connection error) instead of
+        returning it to the pool
+        """
+        try:
+            con.close()
+        except Exception:  # pragma: no cover
+            pass
+
+    @contextmanager
+    def connection(self):
+        """
+        Context manager checking out a connection and returning it to the
+        pool on exit. Connections raising OperationalError are discarded
+        """
+        con = self.get()
+        try:
+            yield con
+        except Exception, e:
+            if e.__class__.__name__ == 'OperationalError':
+                self.discard(con)
+            else:
+                self.put(con)
+            raise
+        self.put(con)
+
+    @contextmanager
+    def transaction(self):
+        """
+        Like connection, but commits once on exit (or rolls back on error)
+        instead of after every tquery / uquery call
+        """
+        con = self.get()
+        con.in_transaction = True
+        try:
+            yield con
+            con.in_transaction = False
+            con.commit()
+        except Exception, e:
+            con.in_transaction = False
+            try:
+                con.rollback()
+            except Exception:  # pragma: no cover
+                pass
+
+            if e.__class__.__name__ == 'OperationalError':
+                self.discard(con)
+            else:
+                self.put(con)
+            raise
+        self.put(con)
+
+    def close(self):
+        """
+        Close all idle connections
+        """
+        self._lock.acquire()
+        try:
+            idle, self._idle = self._idle, []
+        finally:
+            self._lock.release()
+
+        for con in idle:
+            con.close()
+
+
+class PooledConnection(object):
+    """
+    DB-API connection wrapper with a bounded, least recently used cache of
+    cursors keyed by SQL string. Other attributes are passed through to the
+    wrapped connection
+    """
+
+    def __init__(self, con, max_cursors=32):
+        self.con = con
+        self.max_cursors = max_cursors
+        self.in_transaction = False
+        self._cursors = {}
+        self._cursor_order = []
+
+    def __getattr__(self, name):
+        return getattr(self.con, name)
+
+    def cursor(self):
+        return self.con.cursor()
+
+    def cached_cursor(self, sql):
+        """
+        Return the cursor last used for sql, creating one if needed
+        """
+        cur = self._cursors.get(sql)
+        if cur is not None:
+            self._cursor_order.remove(sql)
+        else:
+            if len(self._cursors) >= self.max_cursors:
+                oldest = self._cursor_order.pop(0)
+                self._cursors.pop(oldest).cursor.close()
+            cur = _ReusableCursor(self.con.cursor())
+            self._cursors[sql] = cur
+
+        self._cursor_order.append(sql)
+        return cur
+
+    def commit(self):
+        if not self.in_transaction:
+            self.con.commit()
+
+    def rollback(self):
+        self.con.rollback()
+
+    def close(self):
+        for cur in self._cursors.values():
+            try:
+                cur.cursor.close()
+            except Exception:  # pragma: no cover
+                pass
+        self._cursors = {}
+        self._cursor_order = []
+        self.con.close()
+
+
+class _ReusableCursor(object):
+    """
+    Cursor wrapper ignoring close, so tquery & co. leave it open for reuse
+    """
+
+    def __init__(self, cursor):
+        self.cursor = cursor
+
+    def __getattr__(self, name):
+        return getattr(self.cursor, name)
+
+    def __iter__(self):
+        return iter(self.cursor)
+
+    def close(self):
+        pass
+
+
 #-------------------------------------------------------------------------------
 # Query formatting
 
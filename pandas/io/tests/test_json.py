@@ -0,0 +1,194 @@
+from StringIO import StringIO
+import os
+import unittest
+
+import numpy as np
+
+from pandas import DataFrame, Series, Index, date_range, read_json
+from pandas.io.json import to_json
+from pandas.util.testing import (assert_frame_equal, assert_series_equal,
+                                 makeTimeDataFrame)
+import pandas.util.testing as tm
+
+try:
+    import json
+except ImportError:  # Python 2.5
+    import simplejson as json
+
+
+class TestJSON(unittest.TestCase):
+
+    def setUp(self):
+        self.frame = DataFrame({'a': [1.5, np.nan, 3., 4.5],
+                                'b': [1, 2, 3, 4],
+                                'c': ['x', None, 'z', u'\xe9'],
+                                'd': [True, False, True, True]},
+                               index=['r1', 'r2', 'r3', 'r4'],
+                               columns=['a', 'b', 'c', 'd'])
+
+    def test_frame_orients(self):
+        for orient in ['split', 'index', 'columns']:
+            for chunksize in [1, 3, 10000]:
+                js = self.frame.to_json(orient=orient, chunksize=chunksize)
+                result = read_json(js, orient=orient)
+                assert_frame_equal(result, self.frame)
+
+        js = self.frame.to_json(orient='records')
+        result = read_json(js, orient='records')
+        expected = self.frame.reset_index(drop=True)
+        assert_frame_equal(result, expected)
+
+    def test_frame_layout(self):
+        df = DataFrame({'a': [1, 2], 'b': [1.5, np.nan]}, index=[0, 1],
+                       columns=['a', 'b'])
+
+        self.assertEqual(json.loads(df.to_json(orient='split')),
+                         {'columns': ['a', 'b'], 'index': [0, 1],
+                          'data': [[1, 1.5], [2, None]]})
+        self.assertEqual(json.loads(df.to_json(orient='records')),
+                         [{'a': 1, 'b': 1.5}, {'a': 2, 'b': None}])
+        self.assertEqual(json.loads(df.to_json(orient='index')),
+                         {'0': {'a': 1, 'b': 1.5}, '1': {'a': 2, 'b': None}})
+        self.assertEqual(json.loads(df.to_json()),
+                         {'a': {'0': 1, '1': 2}, 'b': {'0': 1.5, '1': None}})
+
+    def test_dtypes(self):
+        result = read_json(self.frame.to_json(orient='split'),
+                           orient='split')
+        self.assertEqual(result['a'].dtype, np.float64)
+        self.assertEqual(result['b'].dtype, np.int64)
+        self.assertEqual(result['c'].dtype, np.object_)
+        self.assertEqual(result['d'].dtype, np.bool_)
+
+        # numeric index keys
+        df = makeTimeDataFrame().reset_index(drop=True)
+        result = read_json(df.to_json())
+        self.assert_(result.index.equals(df.index))
+        assert_frame_equal(result, df)
+
+    def test_dates(self):
+        df = DataFrame({'a': np.arange(5),
+                        'b': date_range('1/1/2000', periods=5)},
+                       index=date_range('1/1/2000', periods=5, freq='H'))
+        df['b'][2] = np.datetime64('NaT')
+
+        js = df.to_json(orient='split')
+        parsed = json.loads(js)
+        self.assertEqual(parsed['index'][0], 946684800000)
+        self.assertEqual(parsed['data'][2][1], None)
+
+        for orient in ['split', 'index', 'columns']:
+            js = df.to_json(orient=orient)
+            result = read_json(js, orient=orient, convert_dates=['b'],
+                               date_index=True)
+            self.assert_(result.index.equals(df.index))
+            self.assertEqual(result['b'].dtype, np.dtype('M8[ns]'))
+            assert_frame_equal(result, df)
+
+        js = df.to_json(orient='split', date_unit='s')
+        self.assertEqual(json.loads(js)['index'][0], 946684800)
+        result = read_json(js, orient='split', date_unit='s',
+                           convert_dates=['b'], date_index=True)
+        assert_frame_equal(result, df)
+
+        self.assertRaises(ValueError, df.to_json, date_unit='D')
+
+    def test_series(self):
+        s = Series([1.5, np.nan, 3.], index=['a', 'b', 'c'], name='foo')
+        for orient in ['split', 'index']:
+            result = read_json(s.to_json(orient=orient), orient=orient,
+                               typ='series')
+            assert_series_equal(result, s)
+        self.assertEqual(read_json(s.to_json(orient='split'),
+                                   orient='split', typ='series').name, 'foo')
+
+        result = read_json(s.to_json(orient='records'), orient='records',
+                           typ='series')
+        self.assert_(np.array_equal(result.values[[0, 2]], [1.5, 3.]))
+
+        self.assertRaises(ValueError, s.to_json, orient='columns')
+
+    def test_file_and_buffer(self):
+        path = '__test_json__.json'
+        try:
+            self.frame.to_json(path)
+            assert_frame_equal(read_json(path), self.frame)
+        finally:
+            if os.path.exists(path):
+                os.remove(path)
+
+        buf = StringIO()
+        self.frame.to_json(buf, orient='split')
+        buf.seek(0)
+        assert_frame_equal(read_json(buf, orient='split'), self.frame)
+
+    def test_read_chunksize(self):
+        df = DataFrame({'a': np.arange(25, dtype=float),
+                        'b': ['x%d' % i for i in range(25)]},
+                       columns=['a', 'b'])
+        js = df.to_json(orient='records')
+
+        chunks = list(read_json(StringIO(js), orient='records',
+                                chunksize=10))
+        self.assertEqual([len(c) for c in chunks], [10, 10, 5])
+        self.assert_(np.array_equal(chunks[2].index, np.arange(20, 25)))
+        assert_frame_equal(chunks[0].append(chunks[1:]), df)
+
+        # records spanning read boundaries
+        from pandas.io.json import _iter_records
+        records = list(_iter_records(StringIO(js), blocksize=7))
+        self.assertEqual(len(records), 25)
+
+        self.assertRaises(ValueError, read_json, js, orient='split',
+                          chunksize=10)
+
+    def test_missing_keys(self):
+        js = '[{"a": 1, "b": 2}, {"a": 3}, {"a": 4, "b": 5, "c": "x"}]'
+        result = read_json(js, orient='records')
+        self.assertEqual(list(result.columns), ['a', 'b', 'c'])
+        self.assert_(np.isnan(result['b'][1]))
+
+        js = '{"a": {"0": 1, "1": 2}, "b": {"1": 3, "2": 4}}'
+        result = read_json(js)
+        self.assert_(np.array_equal(result.index, [0, 1, 2]))
+        self.assert_(np.isnan(result['b'][0]))
+        self.assert_(np.isnan(result['a'][2]))
+
+    def test_read_without_pairs_hook(self):
+        # json of Python 2.6 has no object_pairs_hook, keys come back sorted
+        import pandas.io.json as pjson
+        kwds = pjson._DECODER_KWDS
+        pjson._DECODER_KWDS = {'object_hook': pjson._sorted_pairs}
+        try:
+            for orient in ['split', 'index', 'columns']:
+                js = self.frame.to_json(orient=orient)
+                assert_frame_equal(read_json(js, orient=orient), self.frame)
+
+            js = self.frame.to_json(orient='records')
+            result = list(read_json(StringIO(js), orient='records',
+                                    chunksize=3))
+            expected = self.frame.reset_index(drop=True)
+            assert_frame_equal(result[0].append(result[1:]), expected)
+
+            js = '{"b": {"1": 3, "0": 4}, "a": {"0": 1, "1": 2}}'
+            result = read_json(js)
+            self.assertEqual(list(result.columns), ['a', 'b'])
+            self.assertEqual(list(result['b']), [4, 3])
+        finally:
+            pjson._DECODER_KWDS = kwds
+
+    def test_empty(self):
+        df = DataFrame(columns=['a', 'b'])
+        self.assertEqual(json.loads(df.to_json(orient='split'))['data'], [])
+        self.assertEqual(df.to_json(orient='records'), '[]')
+
+    def test_bad_input(self):
+        self.assertRaises(ValueError, self.frame.to_json, orient='foo')
+        self.assertRaises(TypeError, to_json, np.arange(5))
+        self.assertRaises(ValueError, read_json, '{}', typ='panel')
+
+
+if __name__ == '__main__':
+    import nose
+    nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
+                   exit=False)
@@ -0,0 +1,176 @@
+import os
+import unittest
+
+import numpy as np
+
+from pandas import DataFrame, Panel, MultiIndex, Index, date_range
+import pandas as pd
+from pandas.io.native import write_native, read_native, is_native_file
+from pandas.util.testing import (assert_frame_equal, assert_panel_equal,
+                                 makeTimeDataFrame, makePanel)
+import pandas.util.testing as tm
+
+
+class TestNative(unittest.TestCase):
+
+    path = '__test_native__.pdn'
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def _roundtrip(self, obj, compress=None):
+        write_native(obj, self.path, compress=compress)
+        return read_native(self.path)
+
+    def test_mixed_frame(self):
+        df = DataFrame({'a': np.random.randn(10),
+                        'b': np.arange(10),
+                        'c': ['foo'] * 10,
+                        'd': [True, False] * 5,
+                        'e': date_range('1/1/2000', periods=10)},
+                       index=['r%d' % i for i in range(10)])
+        df.index.name = 'rows'
+        for compress in [None, 'zlib']:
+            result = self._roundtrip(df, compress=compress)
+            assert_frame_equal(result, df)
+            self.assertEqual(result.index.name, 'rows')
+            self.assert_(result._data.is_consolidated())
+
+    def test_time_frame(self):
+        df = makeTimeDataFrame()
+        result = self._roundtrip(df)
+        assert_frame_equal(result, df)
+        self.assertEqual(result.index.freq, df.index.freq)
+
+        df.index = df.index.tz_localize('US/Eastern')
+        result = self._roundtrip(df)
+        self.assertEqual(result.index.tz.zone, 'US/Eastern')
+        assert_frame_equal(result, df)
+
+    def test_multiindex(self):
+        index = MultiIndex(levels=[['foo', 'bar'], [1, 2, 3]],
+                           labels=[[0, 0, 0, 1, 1, 1], [0, 1, 2, 0, 1, 2]],
+                           names=['first', 'second'])
+        df = DataFrame(np.random.randn(6, 2), index=index, columns=['A', 'B'])
+        result = self._roundtrip(df, compress='zlib')
+        assert_frame_equal(result, df)
+        self.assertEqual(result.index.names, ['first', 'second'])
+
+    def test_unconsolidated(self):
+        df = DataFrame(np.random.randn(5, 2), columns=['a', 'b'])
+        df['c'] = 1.
+        df['d'] = 'foo'
+        self.assert_(not df._data.is_consolidated())
+        assert_frame_equal(self._roundtrip(df), df)
+
+    def test_empty(self):
+        df = DataFrame(columns=['a', 'b'])
+        result = self._roundtrip(df)
+        self.assert_(result.columns.equals(df.columns))
+        self.assertEqual(len(result), 0)
+
+    def test_panel(self):
+        panel = makePanel()
+        assert_panel_equal(self._roundtrip(panel), panel)
+
+    def test_save_load(self):
+        df = makeTimeDataFrame()
+        df.save(self.path, format='native')
+        self.assert_(is_native_file(self.path))
+        assert_frame_equal(DataFrame.load(self.path), df)
+        assert_frame_equal(pd.load(self.path), df)
+
+        df.save(self.path)
+        self.assert_(not is_native_file(self.path))
+        assert_frame_equal(pd.load(self.path), df)
+
+        self.assertRaises(ValueError, df.save, self.path, format='foo')
+
+    def test_unsupported(self):
+        s = tm.makeFloatSeries()
+        self.assertRaises(TypeError, write_native, s, self.path)
+        df = makeTimeDataFrame()
+        self.assertRaises(ValueError, write_native, df, self.path,
+                          compress='lzma')
+
+    def test_bad_file(self):
+        f = open(self.path, 'wb')
+        f.write('not a native file')
+        f.close()
+        self.assertRaises(ValueError, read_native, self.path)
+
+        write_native(makeTimeDataFrame(), self.path)
+        data = open(self.path, 'rb').read()
+        f = open(self.path, 'wb')
+        f.write(data[:-100])
+        f.close()
+        self.assertRaises(ValueError, read_native, self.path)
+
+    def test_mmap(self):
+        df = DataFrame({'a': np.random.randn(10),
+                        'b': np.random.randn(10),
+                        'c': np.arange(10),
+                        'd': ['foo'] * 10})
+        write_native(df, self.path)
+        result = read_native(self.path, mmap_mode='r')
+        assert_frame_equal(result, df)
+
+        blocks = dict((b.dtype.kind, b) for b in result._data.blocks)
+        self.assert_(not blocks['f'].values.flags.writeable)
+        self.assert_(not blocks['i'].values.flags.writeable)
+        self.assert_(isinstance(result.index, Index))
+
+        assert_frame_equal(pd.load(self.path, mmap_mode='r'), df)
+        assert_frame_equal(DataFrame.load(self.path, mmap_mode='r'), df)
+
+        self.assertRaises(ValueError, read_native, self.path, mmap_mode='w+')
+
+        # compressed buffers can't be mapped
+        write_native(df, self.path, compress='zlib')
+        result = read_native(self.path, mmap_mode='r')
+        assert_frame_equal(result, df)
+        self.assert_(result._data.blocks[0].values.flags.writeable)
+
+    def test_mmap_copy_on_write(self):
+        df = DataFrame({'a': np.random.randn(10),
+                        'b': np.random.randn(10),
+                        'c': np.arange(10)})
+        write_native(df, self.path)
+
+        result = read_native(self.path, mmap_mode='r')
+        cached = result['b']
+        result['a'] = 5.
+        self.assert_((result['a'] == 5).all())
+        self.assert_(result['b'] is not cached)
+
+        blocks = dict((b.dtype.kind, b) for b in result._data.blocks)
+        self.assert_(blocks['f'].values.flags.writeable)
+        self.assert_(not blocks['i'].values.flags.writeable)
+
+        result.ix[0, 'c'] = 100
+        self.assertEqual(result['c'][0], 100)
+
+        result = read_native(self.path, mmap_mode='r')
+        result.ix[:3] = 0
+        self.assert_((result.values[:3] == 0).all())
+
+        result = read_native(self.path, mmap_mode='r')
+        result.fillna(0, inplace=True)
+        result.replace(0, 1, inplace=True)
+
+        # the file itself is never modified
+        assert_frame_equal(read_native(self.path), df)
+
+        floats = df[['a', 'b']]
+        write_native(floats, self.path)
+        result = read_native(self.path, mmap_mode='r')
+        result[result > 0] = 0.
+        self.assert_((result.values <= 0).all())
+        assert_frame_equal(read_native(self.path), floats)
+
+
+if __name__ == '__main__':
+    import nose
+    nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
+                   exit=False)
@@ -1155,6 +1155,47 @@ c,4,5,01/03/2009
         expected['D'] = expected['D'].map(converter)
         assert_frame_equal(result, expected)
 
+    def test_categorical(self):
+        data = """A,B,C
+foo,1,x
+bar,2,y
+foo,3,
+baz,4,x
+"""
+        expected = read_csv(StringIO(data))
+        result = read_csv(StringIO(data), categorical=['A', 2])
+        assert_frame_equal(result, expected)
+        self.assert_(result._data.get_categorical('A') is not None)
+        self.assert_(result._data.get_categorical('B') is None)
+
+        cat = result._data.get_categorical('C')
+        self.assert_(np.array_equal(cat.levels, ['x', 'y']))
+        self.assert_(np.array_equal(cat.labels, [0, 1, -1, 0]))
+
+        chunks = list(read_csv(StringIO(data), categorical=['A'],
+                               chunksize=2))
+        self.assert_(chunks[1]._data.get_categorical('A') is not None)
+        self.assert_(np.array_equal(chunks[1]['A'], ['foo', 'baz']))
+
+    def test_intern_strings(self):
+        data = """A,B,C
+foo,1,bar
+bar,2,foo
+foo,3,
+"""
+        # strings are only shared within a column by default
+        expected = read_csv(StringIO(data))
+        self.assert_(expected['A'][0] is not expected['C'][1])
+
+        result = read_csv(StringIO(data), intern_strings=True)
+        assert_frame_equal(result, expected)
+        self.assert_(result['A'][0] is result['A'][2])
+        self.assert_(result['A'][0] is result['C'][1])
+
+        chunks = list(read_csv(StringIO(data), intern_strings=True,
+                               chunksize=2))
+        self.assert_(chunks[0]['A'][0] is chunks[1]['A'][0])
+
     def test_converters_euro_decimal_format(self):
         data = """Id;Number1;Number2;Text1;Text2;Number3
 1;1521,1541;187101,9543;ABC;poi;4,738797819
@@ -9,8 +9,9 @@ from datetime import datetime
 import numpy as np
 
 from pandas import (Series, DataFrame, Panel, MultiIndex, bdate_range,
-                    date_range, Index)
-from pandas.io.pytables import HDFStore, get_store
+                    date_range, Index, Categorical)
+from pandas.io.pytables import (HDFStore, PartitionedStore, get_store,
+                                 _hash_bucket)
 import pandas.util.testing as tm
 from pandas.tests.test_series import assert_series_equal
 from pandas.tests.test_frame import assert_frame_equal
@@ -349,6 +350,16 @@ class TestHDFStore(unittest.TestCase):
         # empty
         self._check_roundtrip(df[:0], tm.assert_frame_equal)
 
+    def test_frame_categorical(self):
+        df = tm.makeDataFrame()
+        keys = np.array(['foo', 'bar', np.nan] * 10, dtype=object)
+        df['key'] = Categorical.from_array(keys)[:len(df)]
+        self._check_roundtrip(df, tm.assert_frame_equal)
+
+        self.store['df'] = df
+        recons = self.store['df']
+        self.assert_(recons._data.get_categorical('key') is not None)
+
     def test_empty_series_frame(self):
         s0 = Series()
         s1 = Series(name='myseries')
@@ -694,6 +705,132 @@ class TestHDFStore(unittest.TestCase):
 
         self.assertRaises(Exception, self.store.put, 'foo', df, table=True)
 
+
+class TestPartitionedStore(unittest.TestCase):
+    path = '__test_partitions__'
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def test_append_select_time(self):
+        store = PartitionedStore(self.path, partition_by='time', freq='M')
+
+        df = DataFrame(np.random.randn(100, 3), columns=['A', 'B', 'C'],
+                       index=date_range('1/1/2000', periods=100))
+        store.append('df', df[:50])
+        store.append('df', df[50:])
+
+        self.assertEquals(len(store.partitions('df')), 4)
+        self.assertEquals(store.keys(), ['df'])
+        self.assert_('df' in store)
+        repr(store)
+
+        result = store.select('df')
+        assert_frame_equal(result, df)
+
+        # only February is read
+        where = [{'field' : 'index', 'op' : '>=',
+                  'value' : datetime(2000, 2, 3)},
+                 {'field' : 'index', 'op' : '<',
+                  'value' : datetime(2000, 2, 10)}]
+        parts = store._prune(store.partitions('df'), where)
+        self.assertEquals(len(parts), 1)
+
+        result = store.select('df', where=where)
+        expected = df.ix[datetime(2000, 2, 3):datetime(2000, 2, 9)]
+        assert_frame_equal(result, expected)
+
+        store.remove('df')
+        self.assert_('df' not in store)
+        self.assertRaises(KeyError, store.select, 'df')
+
+    def test_append_select_hash(self):
+        store = PartitionedStore(self.path, partition_by='hash',
+                                 npartitions=4)
+
+        df = DataFrame(np.random.randn(20, 2), columns=['A', 'B'],
+                       index=range(20))
+        store.append('df', df)
+        self.assertEquals(store.partitions('df'), [0, 1, 2, 3])
+
+        result = store.select('df')
+        assert_frame_equal(result.sort_index(), df)
+
+        parts = store._prune(store.partitions('df'),
+                             [{'field' : 'index', 'value' : [5, 6]}])
+        expected = sorted(set(_hash_bucket(np.array([5, 6]), 4)))
+        self.assertEquals(parts, expected)
+
+    def test_hash_dates(self):
+        store = PartitionedStore(self.path, partition_by='hash',
+                                 npartitions=16)
+
+        df = DataFrame(np.random.randn(20, 2), columns=['A', 'B'],
+                       index=date_range('1/1/2000', periods=20))
+        store.append('df', df)
+        self.assert_(len(store.partitions('df')) > 1)
+
+        # the bucket of a Timestamp is the bucket of the datetime64 value
+        result = store.select('df', where=[{'field' : 'index', 'op' : '==',
+                                            'value' : df.index[3]}])
+        assert_frame_equal(result, df[3:4])
+
+        buckets = _hash_bucket(np.asarray(df.index), 16)
+        expected = _hash_bucket(np.array(list(df.index), dtype=object), 16)
+        self.assert_(np.array_equal(buckets, expected))
+
+    def test_mode_w(self):
+        df = DataFrame(np.random.randn(40, 2), columns=['A', 'B'],
+                       index=date_range('1/1/2000', periods=40))
+
+        store = PartitionedStore(self.path, partition_by='time', freq='M')
+        store.append('df', df)
+
+        # only the partitions already there are removed
+        store = PartitionedStore(self.path, partition_by='time', freq='M',
+                                 mode='w')
+        self.assertEquals(store.keys(), [])
+        store.append('df', df[:10])
+        store.append('df', df[10:])
+        assert_frame_equal(store.select('df'), df)
+
+        store = PartitionedStore(self.path, mode='r')
+        self.assertRaises(IOError, store.append, 'df', df)
+
+    def test_keys_with_slash(self):
+        store = PartitionedStore(self.path, partition_by='time', freq='M')
+        df = DataFrame(np.random.randn(10, 2), columns=['A', 'B'],
+                       index=date_range('1/1/2000', periods=10))
+        store.append('/df', df)
+
+        self.assertEquals(store.keys(), ['df'])
+        self.assert_('/df' in store)
+        assert_frame_equal(store.select('df'), df)
+        self.assertRaises(ValueError, store.append, 'a/b', df)
+
+    def test_select_pruned(self):
+        store = PartitionedStore(self.path, partition_by='time', freq='M')
+        df = DataFrame(np.random.randn(10, 2), columns=['A', 'B'],
+                       index=date_range('1/1/2000', periods=10))
+        store.append('df', df)
+
+        where = [{'field' : 'index', 'op' : '>',
+                  'value' : datetime(2001, 1, 1)}]
+        result = store.select('df', where=where)
+        self.assertEquals(len(result), 0)
+        self.assert_(result.columns.equals(df.columns))
+
+        self.assertRaises(KeyError, store.select, 'foo', where=where)
+
+    def test_bad_partitioning(self):
+        self.assertRaises(ValueError, PartitionedStore, self.path,
+                          partition_by='foo')
+
+        store = PartitionedStore(self.path, partition_by='time')
+        df = DataFrame(np.random.randn(5, 2), columns=['A', 'B'])
+        self.assertRaises(TypeError, store.append, 'df', df)
+
 def curpath():
     pth, _ = os.path.split(os.path.abspath(__file__))
     return pth
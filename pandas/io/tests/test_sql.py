@@ -1,13 +1,17 @@
+from __future__ import with_statement
+
 from pandas.util.py3compat import StringIO
 import unittest
+import os
 import sqlite3
 import sys
+from datetime import datetime
 
 import numpy as np
 
 import pandas.io.sql as sql
 import pandas.util.testing as tm
-from pandas import Series, Index
+from pandas import Series, Index, DataFrame, isnull
 
 class TestSQLite(unittest.TestCase):
 
@@ -111,7 +115,117 @@ class TestSQLite(unittest.TestCase):
             sys.stdout = sys.__stdout__
 
     def test_na_roundtrip(self):
-        pass
+        frame = tm.makeTimeDataFrame()
+        frame.ix[:5, 'A'] = np.nan
+        frame['txt'] = ['a', None] * (len(frame) // 2)
+        sql.write_frame(frame, name='test_table', con=self.db)
+
+        nulls = sql.tquery("select count(*) from test_table where A is null",
+                           self.db)
+        self.assertEqual(nulls[0], 5)
+
+        result = sql.read_frame("select * from test_table", self.db)
+        result.index = frame.index
+        tm.assert_frame_equal(result, frame)
+
+    def test_write_frame_batches(self):
+        frame = DataFrame({'a' : np.arange(1000),
+                           'b' : np.random.randn(1000),
+                           'c' : ['foo'] * 1000})
+
+        for multirow in [False, True]:
+            name = 'test_table_%d' % multirow
+            sql.write_frame(frame, name=name, con=self.db, chunksize=300,
+                            multirow=multirow)
+            result = sql.read_frame("select * from %s" % name, self.db)
+            tm.assert_frame_equal(result, frame)
+
+    def test_write_frame_rollback(self):
+        frame = DataFrame({'a' : np.arange(10)})
+        create_sql = sql.get_sqlite_schema(frame, 'test', keys='a')
+        self.db.execute(create_sql)
+
+        # duplicate primary key in the second batch
+        frame2 = DataFrame({'a' : np.arange(10) % 6})
+        self.assertRaises(sqlite3.IntegrityError, sql.write_frame, frame2,
+                          name='test', con=self.db, append=True, chunksize=4)
+
+        count = sql.tquery("select count(*) from test", self.db)
+        self.assertEqual(count[0], 0)
+
+    def test_read_frame_typed_columns(self):
+        db = sqlite3.connect(':memory:',
+                             detect_types=sqlite3.PARSE_DECLTYPES)
+        db.execute('CREATE TABLE test (a INTEGER, b REAL, c TEXT, '
+                   'd TIMESTAMP, e REAL)')
+        rows = [(1, 1.5, 'foo', datetime(2012, 1, 1, 9, 30), None),
+                (2, None, 'bar', datetime(2012, 1, 2), 2.5),
+                (3, 3.5, None, None, 3)]
+        db.executemany('INSERT INTO test VALUES (?, ?, ?, ?, ?)', rows)
+
+        result = sql.read_frame('select * from test', db)
+        self.assert_(result['a'].dtype == np.int64)
+        self.assert_(result['b'].dtype == np.float64)
+        self.assert_(result['c'].dtype == np.object_)
+        self.assert_(result['d'].dtype == 'M8[ns]')
+        self.assert_(result['e'].dtype == np.float64)
+
+        self.assert_(np.isnan(result['b'][1]))
+        self.assertEqual(result['d'][0], datetime(2012, 1, 1, 9, 30))
+        self.assert_(isnull(result['d'][2]))
+        self.assert_(result['c'][2] is None)
+
+    def test_read_frame_intern_strings(self):
+        self.db.execute('CREATE TABLE test (a TEXT, b TEXT, c REAL)')
+        rows = [('foo', 'bar', 1.), ('bar', None, 2.), ('foo', 'foo', 3.)]
+        self.db.executemany('INSERT INTO test VALUES (?, ?, ?)', rows)
+
+        expected = sql.read_frame('select * from test', self.db)
+        result = sql.read_frame('select * from test', self.db,
+                                intern_strings=True)
+        tm.assert_frame_equal(result, expected)
+        self.assert_(result['a'][0] is result['a'][2])
+        self.assert_(result['a'][0] is result['b'][2])
+
+        chunks = list(sql.read_frame('select * from test', self.db,
+                                     chunksize=2, intern_strings=True))
+        self.assert_(chunks[0]['a'][0] is chunks[1]['a'][2])
+
+    def test_description_kinds(self):
+        from decimal import Decimal
+
+        # type codes as reported by drivers returning Python types
+        desc = [('a', int), ('b', Decimal), ('c', datetime), ('d', str),
+                ('e', None)]
+        result = sql._description_kinds(desc, self.db)
+        self.assertEqual(result, ['if', 'f', 'M', None, None])
+
+    def test_read_frame_chunksize(self):
+        frame = tm.makeTimeDataFrame()
+        frame['txt'] = ['a'] * len(frame)
+        sql.write_frame(frame, name='test_table', con=self.db)
+
+        expected = sql.read_frame("select * from test_table", self.db)
+
+        chunks = list(sql.read_frame("select * from test_table", self.db,
+                                     chunksize=7))
+        self.assertEqual(len(chunks), 5)
+        self.assert_(all(len(c) <= 7 for c in chunks))
+        self.assert_(chunks[0]['txt'].dtype == np.object_)
+
+        from pandas import concat
+        tm.assert_frame_equal(concat(chunks), expected)
+
+        # index_col is applied per chunk
+        chunks = sql.read_frame("select * from test_table", self.db,
+                                index_col='txt', chunksize=10)
+        result = concat(list(chunks))
+        tm.assert_frame_equal(result, expected.set_index('txt'))
+
+        # no rows
+        chunks = list(sql.read_frame("select * from test_table where A > 100",
+                                     self.db, chunksize=10))
+        self.assertEqual(len(chunks), 0)
 
     def _check_roundtrip(self, frame):
         sql.write_frame(frame, name='test_table', con=self.db)
@@ -172,6 +286,101 @@ class TestSQLite(unittest.TestCase):
             sys.stdout = sys.__stdout__
 
 
+class TestConnectionPool(unittest.TestCase):
+    path = '__test_pool__.db'
+
+    def setUp(self):
+        self.nconnects = 0
+
+        def factory():
+            self.nconnects += 1
+            return sqlite3.connect(self.path)
+
+        self.pool = sql.ConnectionPool(factory, max_idle=2, max_cursors=2)
+
+        with self.pool.connection() as con:
+            con.execute('CREATE TABLE test (a INTEGER, b REAL)')
+
+    def tearDown(self):
+        self.pool.close()
+        os.remove(self.path)
+
+    def test_reuse_connection(self):
+        for i in range(5):
+            with self.pool.connection() as con:
+                sql.uquery('INSERT INTO test VALUES (?, ?)', con,
+                           params=(i, i * 0.5))
+        self.assertEqual(self.nconnects, 1)
+
+        with self.pool.connection() as con:
+            result = sql.read_frame('select * from test', con)
+            self.assertEqual(len(result), 5)
+            self.assert_(result['a'].dtype == np.int64)
+
+            chunks = list(sql.read_frame('select * from test', con,
+                                         chunksize=2))
+            self.assertEqual(len(chunks), 3)
+
+        # bounded number of idle connections
+        cons = [self.pool.get() for _ in range(4)]
+        for con in cons:
+            self.pool.put(con)
+        self.assertEqual(len(self.pool), 2)
+
+    def test_cached_cursor(self):
+        ins = 'INSERT INTO test VALUES (?, ?)'
+        with self.pool.connection() as con:
+            cur = con.cached_cursor(ins)
+            self.assert_(sql.execute(ins, con, params=(1, 1.)) is cur)
+            self.assert_(sql.execute(ins, con, params=(2, 2.)) is cur)
+
+            # least recently used cursor is evicted
+            con.cached_cursor('select 1')
+            con.cached_cursor('select 2')
+            self.assert_(con.cached_cursor(ins) is not cur)
+
+            self.assertEqual(sql.tquery('select a from test', con), [1, 2])
+            self.assertEqual(sql.tquery('select a from test', con), [1, 2])
+
+    def test_transaction(self):
+        ins = 'INSERT INTO test VALUES (?, ?)'
+        with self.pool.transaction() as con:
+            for i in range(3):
+                sql.uquery(ins, con, params=(i, 0.))
+
+            # not committed yet
+            other = sqlite3.connect(self.path)
+            self.assertEqual(sql.tquery('select count(*) from test', other),
+                             [0])
+            other.close()
+
+        with self.pool.connection() as con:
+            self.assertEqual(sql.tquery('select count(*) from test', con),
+                             [3])
+
+        def _failing():
+            with self.pool.transaction() as con:
+                sql.uquery(ins, con, params=(10, 0.))
+                raise ValueError('abort')
+
+        self.assertRaises(ValueError, _failing)
+        with self.pool.connection() as con:
+            self.assertEqual(sql.tquery('select count(*) from test', con),
+                             [3])
+
+    def test_discard_on_operational_error(self):
+        def _bad_query():
+            with self.pool.connection() as con:
+                sql.tquery('select * from blah', con)
+
+        try:
+            sys.stdout = StringIO()
+            self.assertRaises(sqlite3.OperationalError, _bad_query)
+        finally:
+            sys.stdout = sys.__stdout__
+        self.assertEqual(len(self.pool), 0)
+
+
 if __name__ == '__main__':
     # unittest.main()
     import nose
@@ -502,6 +502,16 @@ class SparseDataFrame(DataFrame):
         return self._constructor(data=new_data, index=self.index,
                                  columns=self.columns)
 
+    def _combine_inplace(self, other, func, axis=None, level=None,
+                         fill_value=None):
+        # the sparse columns are replaced, see _update_inplace
+        return False
+
+    def _update_inplace(self, result):
+        self._series = result._series
+        self.index = result.index
+        self.columns = result.columns
+
     def _reindex_index(self, index, method, copy, level, fill_value=np.nan,
                        limit=None):
         if level is not None:
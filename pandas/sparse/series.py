@@ -241,6 +241,9 @@ to sparse
         __div__ = _sparse_op_wrap(operator.div, 'div')
         __rdiv__ = _sparse_op_wrap(lambda x, y: y / x, '__rdiv__')
 
+    def _combine_inplace(self, other, ufunc, compute, direct=True):
+        raise NotImplementedError('inplace binary ops not supported')
+
     def __getitem__(self, key):
         """
 
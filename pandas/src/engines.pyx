@@ -243,6 +243,12 @@ cdef class IndexEngine:
         self.mapping = None
         self.initialized = 0
 
+    def sizeof(self):
+        """ return the size of the hash table in bytes, 0 if not built """
+        if self.mapping is None:
+            return 0
+        return self.mapping.sizeof()
+
     def get_indexer(self, values):
         self._ensure_mapping_populated()
         return self.mapping.lookup(values)
@@ -36,8 +36,8 @@ cimport util
 from util cimport is_array, _checknull, _checknan
 
 cdef extern from "math.h":
-    double sqrt(double x)
-    double fabs(double)
+    double sqrt(double x) nogil
+    double fabs(double) nogil
 
 # import datetime C API
 PyDateTime_IMPORT
@@ -77,20 +77,23 @@ def take_1d_%(name)s(ndarray[%(c_type)s] values,
         outbuf = out
 
     if %(raise_on_na)s and _checknan(fill_value):
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                raise ValueError('No NA values allowed')
-            else:
-                outbuf[i] = values[idx]
+        %(nogil)s
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    %(gil)s
+                        raise ValueError('No NA values allowed')
+                else:
+                    outbuf[i] = values[idx]
     else:
         fv = fill_value
-        for i in range(n):
-            idx = indexer[i]
-            if idx == -1:
-                outbuf[i] = fv
-            else:
-                outbuf[i] = values[idx]
+        %(nogil)s
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    outbuf[i] = fv
+                else:
+                    outbuf[i] = values[idx]
 
 """
 
@@ -113,16 +116,81 @@ def take_2d_axis0_%(name)s(ndarray[%(c_type)s, ndim=2] values,
         outbuf = out
 
     if %(raise_on_na)s and _checknan(fill_value):
+        %(nogil)s
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    for j from 0 <= j < k:
+                        %(gil)s
+                            raise ValueError('No NA values allowed')
+                else:
+                    for j from 0 <= j < k:
+                        outbuf[i, j] = values[idx, j]
+    else:
+        fv = fill_value
+        %(nogil)s
+            for i in range(n):
+                idx = indexer[i]
+                if idx == -1:
+                    for j in range(k):
+                        outbuf[i, j] = fv
+                else:
+                    for j in range(k):
+                        outbuf[i, j] = values[idx, j]
+
+"""
+
+# Takes from integer / boolean data into an array of the type the data is
+# upcast to when missing values are introduced (float / object), filling the
+# positions where the indexer is -1 in the same pass
+
+take_1d_upcast_template = """@cython.wraparound(False)
+def take_1d_%(name)s_%(dest)s(ndarray[%(c_type)s] values,
+                              ndarray[int64_t] indexer,
+                              out=None, fill_value=np.nan):
+    cdef:
+        Py_ssize_t i, n, idx
+        ndarray[%(dest_type)s] outbuf
+        %(dest_type)s fv
+
+    n = len(indexer)
+
+    if out is None:
+        outbuf = np.empty(n, dtype=%(dest_dtype)s)
+    else:
+        outbuf = out
+
+    fv = fill_value
+    %(nogil)s
         for i in range(n):
             idx = indexer[i]
             if idx == -1:
-                for j from 0 <= j < k:
-                    raise ValueError('No NA values allowed')
+                outbuf[i] = fv
             else:
-                for j from 0 <= j < k:
-                    outbuf[i, j] = values[idx, j]
+                outbuf[i] = %(cast)svalues[idx]
+
+"""
+
+take_2d_axis0_upcast_template = """@cython.wraparound(False)
+@cython.boundscheck(False)
+def take_2d_axis0_%(name)s_%(dest)s(ndarray[%(c_type)s, ndim=2] values,
+                                    ndarray[int64_t] indexer,
+                                    out=None, fill_value=np.nan):
+    cdef:
+        Py_ssize_t i, j, k, n, idx
+        ndarray[%(dest_type)s, ndim=2] outbuf
+        %(dest_type)s fv
+
+    n = len(indexer)
+    k = values.shape[1]
+
+    if out is None:
+        outbuf = np.empty((n, k), dtype=%(dest_dtype)s)
     else:
-        fv = fill_value
+        outbuf = out
+
+    fv = fill_value
+    %(nogil)s
         for i in range(n):
             idx = indexer[i]
             if idx == -1:
@@ -130,7 +198,39 @@ def take_2d_axis0_%(name)s(ndarray[%(c_type)s, ndim=2] values,
                     outbuf[i, j] = fv
             else:
                 for j in range(k):
-                    outbuf[i, j] = values[idx, j]
+                    outbuf[i, j] = %(cast)svalues[idx, j]
+
+"""
+
+take_2d_axis1_upcast_template = """@cython.wraparound(False)
+@cython.boundscheck(False)
+def take_2d_axis1_%(name)s_%(dest)s(ndarray[%(c_type)s, ndim=2] values,
+                                    ndarray[int64_t] indexer,
+                                    out=None, fill_value=np.nan):
+    cdef:
+        Py_ssize_t i, j, k, n, idx
+        ndarray[%(dest_type)s, ndim=2] outbuf
+        %(dest_type)s fv
+
+    n = len(values)
+    k = len(indexer)
+
+    if out is None:
+        outbuf = np.empty((n, k), dtype=%(dest_dtype)s)
+    else:
+        outbuf = out
+
+    fv = fill_value
+    %(nogil)s
+        for j in range(k):
+            idx = indexer[j]
+
+            if idx == -1:
+                for i in range(n):
+                    outbuf[i, j] = fv
+            else:
+                for i in range(n):
+                    outbuf[i, j] = %(cast)svalues[i, idx]
 
 """
 
@@ -153,26 +253,29 @@ def take_2d_axis1_%(name)s(ndarray[%(c_type)s, ndim=2] values,
         outbuf = out
 
     if %(raise_on_na)s and _checknan(fill_value):
-        for j in range(k):
-            idx = indexer[j]
-
-            if idx == -1:
-                for i in range(n):
-                    raise ValueError('No NA values allowed')
-            else:
-                for i in range(n):
-                    outbuf[i, j] = values[i, idx]
+        %(nogil)s
+            for j in range(k):
+                idx = indexer[j]
+
+                if idx == -1:
+                    for i in range(n):
+                        %(gil)s
+                            raise ValueError('No NA values allowed')
+                else:
+                    for i in range(n):
+                        outbuf[i, j] = values[i, idx]
     else:
         fv = fill_value
-        for j in range(k):
-            idx = indexer[j]
+        %(nogil)s
+            for j in range(k):
+                idx = indexer[j]
 
-            if idx == -1:
-                for i in range(n):
-                    outbuf[i, j] = fv
-            else:
-                for i in range(n):
-                    outbuf[i, j] = values[i, idx]
+                if idx == -1:
+                    for i in range(n):
+                        outbuf[i, j] = fv
+                else:
+                    for i in range(n):
+                        outbuf[i, j] = values[i, idx]
 
 """
 
@@ -197,30 +300,34 @@ def take_2d_multi_%(name)s(ndarray[%(c_type)s, ndim=2] values,
 
 
     if %(raise_on_na)s and _checknan(fill_value):
-        for i in range(n):
-            idx = idx0[i]
-            if idx == -1:
-                for j in range(k):
-                    raise ValueError('No NA values allowed')
-            else:
-                for j in range(k):
-                    if idx1[j] == -1:
-                        raise ValueError('No NA values allowed')
-                    else:
-                        outbuf[i, j] = values[idx, idx1[j]]
+        %(nogil)s
+            for i in range(n):
+                idx = idx0[i]
+                if idx == -1:
+                    for j in range(k):
+                        %(gil)s
+                            raise ValueError('No NA values allowed')
+                else:
+                    for j in range(k):
+                        if idx1[j] == -1:
+                            %(gil)s
+                                raise ValueError('No NA values allowed')
+                        else:
+                            outbuf[i, j] = values[idx, idx1[j]]
     else:
         fv = fill_value
-        for i in range(n):
-            idx = idx0[i]
-            if idx == -1:
-                for j in range(k):
-                    outbuf[i, j] = fv
-            else:
-                for j in range(k):
-                    if idx1[j] == -1:
+        %(nogil)s
+            for i in range(n):
+                idx = idx0[i]
+                if idx == -1:
+                    for j in range(k):
                         outbuf[i, j] = fv
-                    else:
-                        outbuf[i, j] = values[idx, idx1[j]]
+                else:
+                    for j in range(k):
+                        if idx1[j] == -1:
+                            outbuf[i, j] = fv
+                        else:
+                            outbuf[i, j] = values[idx, idx1[j]]
 
 """
 
@@ -282,41 +389,42 @@ def backfill_%(name)s(ndarray[%(c_type)s] old, ndarray[%(c_type)s] new,
     if nleft == 0 or nright == 0 or new[0] > old[nleft - 1]:
         return indexer
 
-    i = nleft - 1
-    j = nright - 1
+    %(nogil)s
+        i = nleft - 1
+        j = nright - 1
 
-    cur = old[nleft - 1]
+        cur = old[nleft - 1]
 
-    while j >= 0 and new[j] > cur:
-        j -= 1
+        while j >= 0 and new[j] > cur:
+            j -= 1
 
-    while True:
-        if j < 0:
-            break
+        while True:
+            if j < 0:
+                break
+
+            if i == 0:
+                while j >= 0:
+                    if new[j] == cur:
+                        indexer[j] = i
+                    elif new[j] < cur and fill_count < lim:
+                        indexer[j] = i
+                        fill_count += 1
+                    j -= 1
+                break
 
-        if i == 0:
-            while j >= 0:
+            prev = old[i - 1]
+
+            while j >= 0 and prev < new[j] <= cur:
                 if new[j] == cur:
                     indexer[j] = i
                 elif new[j] < cur and fill_count < lim:
                     indexer[j] = i
                     fill_count += 1
                 j -= 1
-            break
-
-        prev = old[i - 1]
 
-        while j >= 0 and prev < new[j] <= cur:
-            if new[j] == cur:
-                indexer[j] = i
-            elif new[j] < cur and fill_count < lim:
-                indexer[j] = i
-                fill_count += 1
-            j -= 1
-
-        fill_count = 0
-        i -= 1
-        cur = prev
+            fill_count = 0
+            i -= 1
+            cur = prev
 
     return indexer
 
@@ -347,40 +455,41 @@ def pad_%(name)s(ndarray[%(c_type)s] old, ndarray[%(c_type)s] new,
     if nleft == 0 or nright == 0 or new[nright - 1] < old[0]:
         return indexer
 
-    i = j = 0
+    %(nogil)s
+        i = j = 0
 
-    cur = old[0]
+        cur = old[0]
 
-    while j <= nright - 1 and new[j] < cur:
-        j += 1
+        while j <= nright - 1 and new[j] < cur:
+            j += 1
 
-    while True:
-        if j == nright:
-            break
+        while True:
+            if j == nright:
+                break
+
+            if i == nleft - 1:
+                while j < nright:
+                    if new[j] == cur:
+                        indexer[j] = i
+                    elif new[j] > cur and fill_count < lim:
+                        indexer[j] = i
+                        fill_count += 1
+                    j += 1
+                break
 
-        if i == nleft - 1:
-            while j < nright:
+            next = old[i + 1]
+
+            while j < nright and cur <= new[j] < next:
                 if new[j] == cur:
                     indexer[j] = i
-                elif new[j] > cur and fill_count < lim:
+                elif fill_count < lim:
                     indexer[j] = i
                     fill_count += 1
                 j += 1
-            break
 
-        next = old[i + 1]
-
-        while j < nright and cur <= new[j] < next:
-            if new[j] == cur:
-                indexer[j] = i
-            elif fill_count < lim:
-                indexer[j] = i
-                fill_count += 1
-            j += 1
-
-        fill_count = 0
-        i += 1
-        cur = next
+            fill_count = 0
+            i += 1
+            cur = next
 
     return indexer
 
@@ -404,16 +513,17 @@ def pad_inplace_%(name)s(ndarray[%(c_type)s] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    val = values[0]
-    for i in range(N):
-        if mask[i]:
-            if fill_count >= lim:
-                continue
-            fill_count += 1
-            values[i] = val
-        else:
-            fill_count = 0
-            val = values[i]
+    %(nogil)s
+        val = values[0]
+        for i in range(N):
+            if mask[i]:
+                if fill_count >= lim:
+                    continue
+                fill_count += 1
+                values[i] = val
+            else:
+                fill_count = 0
+                val = values[i]
 
 """
 
@@ -435,18 +545,19 @@ def pad_2d_inplace_%(name)s(ndarray[%(c_type)s, ndim=2] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    for j in range(K):
-        fill_count = 0
-        val = values[j, 0]
-        for i in range(N):
-            if mask[j, i]:
-                if fill_count >= lim:
-                    continue
-                fill_count += 1
-                values[j, i] = val
-            else:
-                fill_count = 0
-                val = values[j, i]
+    %(nogil)s
+        for j in range(K):
+            fill_count = 0
+            val = values[j, 0]
+            for i in range(N):
+                if mask[j, i]:
+                    if fill_count >= lim:
+                        continue
+                    fill_count += 1
+                    values[j, i] = val
+                else:
+                    fill_count = 0
+                    val = values[j, i]
 """
 
 backfill_2d_template = """@cython.boundscheck(False)
@@ -467,18 +578,19 @@ def backfill_2d_inplace_%(name)s(ndarray[%(c_type)s, ndim=2] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    for j in range(K):
-        fill_count = 0
-        val = values[j, N - 1]
-        for i in range(N - 1, -1 , -1):
-            if mask[j, i]:
-                if fill_count >= lim:
-                    continue
-                fill_count += 1
-                values[j, i] = val
-            else:
-                fill_count = 0
-                val = values[j, i]
+    %(nogil)s
+        for j in range(K):
+            fill_count = 0
+            val = values[j, N - 1]
+            for i in range(N - 1, -1 , -1):
+                if mask[j, i]:
+                    if fill_count >= lim:
+                        continue
+                    fill_count += 1
+                    values[j, i] = val
+                else:
+                    fill_count = 0
+                    val = values[j, i]
 """
 
 backfill_1d_template = """@cython.boundscheck(False)
@@ -499,16 +611,17 @@ def backfill_inplace_%(name)s(ndarray[%(c_type)s] values,
             raise ValueError('Limit must be non-negative')
         lim = limit
 
-    val = values[N - 1]
-    for i in range(N - 1, -1 , -1):
-        if mask[i]:
-            if fill_count >= lim:
-                continue
-            fill_count += 1
-            values[i] = val
-        else:
-            fill_count = 0
-            val = values[i]
+    %(nogil)s
+        val = values[N - 1]
+        for i in range(N - 1, -1 , -1):
+            if mask[i]:
+                if fill_count >= lim:
+                    continue
+                fill_count += 1
+                values[i] = val
+            else:
+                fill_count = 0
+                val = values[i]
 """
 
 is_monotonic_template = """@cython.boundscheck(False)
@@ -1109,6 +1222,7 @@ cpdef ensure_%(name)s(object arr):
 
 ensure_functions = [
     ('float64', 'FLOAT64', 'float64'),
+    ('float32', 'FLOAT32', 'float32'),
     ('int32', 'INT32', 'int32'),
     ('int64', 'INT64', 'int64'),
     # ('platform_int', 'INT', 'int_'),
@@ -1139,6 +1253,1026 @@ def put2d_%(name)s_%(dest_type)s(ndarray[%(c_type)s, ndim=2, cast=True] values,
 """
 
 
+#-------------------------------------------------------------------------
+# Group aggregations. Sums, products, means and variances are accumulated in
+# float64 whatever the type of the values and result
+
+group_add_template = """
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_add_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[%(c_type)s, ndim=2] values,
+                       ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        float64_t val, count
+        ndarray[float64_t, ndim=2] sumx, nobs
+
+    nobs = np.zeros_like(out, dtype=np.float64)
+    sumx = np.zeros_like(out, dtype=np.float64)
+
+    N, K = (<object> values).shape
+    ncounts = len(counts)
+
+    with nogil:
+        if K > 1:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
+
+                counts[lab] += 1
+                for j in range(K):
+                    val = values[i, j]
+
+                    # not nan
+                    if val == val:
+                        nobs[lab, j] += 1
+                        sumx[lab, j] += val
+        else:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
+
+                counts[lab] += 1
+                val = values[i, 0]
+
+                # not nan
+                if val == val:
+                    nobs[lab, 0] += 1
+                    sumx[lab, 0] += val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = sumx[i, j]
+"""
+
+group_prod_template = """
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_prod_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                        ndarray[int64_t] counts,
+                        ndarray[%(c_type)s, ndim=2] values,
+                        ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        float64_t val, count
+        ndarray[float64_t, ndim=2] prodx, nobs
+
+    nobs = np.zeros_like(out, dtype=np.float64)
+    prodx = np.ones_like(out, dtype=np.float64)
+
+    N, K = (<object> values).shape
+    ncounts = len(counts)
+
+    with nogil:
+        if K > 1:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
+
+                counts[lab] += 1
+                for j in range(K):
+                    val = values[i, j]
+
+                    # not nan
+                    if val == val:
+                        nobs[lab, j] += 1
+                        prodx[lab, j] *= val
+        else:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
+
+                counts[lab] += 1
+                val = values[i, 0]
+
+                # not nan
+                if val == val:
+                    nobs[lab, 0] += 1
+                    prodx[lab, 0] *= val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = prodx[i, j]
+"""
+
+group_nth_template = """
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nth_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[%(c_type)s, ndim=2] values,
+                       ndarray[int64_t] labels, int64_t rank):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        float64_t val, count
+        ndarray[%(c_type)s, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    nobs[lab, j] += 1
+                    if nobs[lab, j] == rank:
+                        resx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = resx[i, j]
+"""
+
+group_nth_bin_template = """
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_nth_bin_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[%(c_type)s, ndim=2] values,
+                           ndarray[int64_t] bins, int64_t rank):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        float64_t val, count
+        ndarray[%(c_type)s, ndim=2] resx, nobs
+
+    nobs = np.zeros_like(out)
+    resx = np.empty_like(out)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    nobs[b, j] += 1
+                    if nobs[b, j] == rank:
+                        resx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = resx[i, j]
+"""
+
+group_last_template = """
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_last_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                        ndarray[int64_t] counts,
+                        ndarray[%(c_type)s, ndim=2] values,
+                        ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        float64_t val, count
+        ndarray[%(c_type)s, ndim=2] resx
+        ndarray[int64_t, ndim=2] nobs
+
+    nobs = np.zeros((<object> out).shape, dtype=np.int64)
+    resx = np.empty_like(out)
+
+    N, K = (<object> values).shape
+    ncounts = len(counts)
+
+    with nogil:
+        for i in range(N):
+            lab = labels[i]
+            if lab < 0:
+                continue
+
+            counts[lab] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    nobs[lab, j] += 1
+                    resx[lab, j] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = resx[i, j]
+"""
+
+group_last_bin_template = """
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_last_bin_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                            ndarray[int64_t] counts,
+                            ndarray[%(c_type)s, ndim=2] values,
+                            ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        float64_t val, count
+        ndarray[%(c_type)s, ndim=2] resx, nobs
+
+    nobs = np.zeros_like(out)
+    resx = np.empty_like(out)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                b += 1
+
+            counts[b] += 1
+            for j in range(K):
+                val = values[i, j]
+
+                # not nan
+                if val == val:
+                    nobs[b, j] += 1
+                    resx[b, j] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = resx[i, j]
+"""
+
+group_min_template = """
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_min_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[%(c_type)s, ndim=2] values,
+                       ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        float64_t val, count
+        ndarray[%(c_type)s, ndim=2] minx, nobs
+
+    nobs = np.zeros_like(out)
+
+    minx = np.empty_like(out)
+    minx.fill(np.inf)
+
+    N, K = (<object> values).shape
+    ncounts = len(counts)
+
+    with nogil:
+        if K > 1:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
+
+                counts[lab] += 1
+                for j in range(K):
+                    val = values[i, j]
+
+                    # not nan
+                    if val == val:
+                        nobs[lab, j] += 1
+                        if val < minx[lab, j]:
+                            minx[lab, j] = val
+        else:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
+
+                counts[lab] += 1
+                val = values[i, 0]
+
+                # not nan
+                if val == val:
+                    nobs[lab, 0] += 1
+                    if val < minx[lab, 0]:
+                        minx[lab, 0] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = minx[i, j]
+"""
+
+group_max_template = """
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_max_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[%(c_type)s, ndim=2] values,
+                       ndarray[int64_t] labels):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        float64_t val, count
+        ndarray[%(c_type)s, ndim=2] maxx, nobs
+
+    nobs = np.zeros_like(out)
+
+    maxx = np.empty_like(out)
+    maxx.fill(-np.inf)
+
+    N, K = (<object> values).shape
+    ncounts = len(counts)
+
+    with nogil:
+        if K > 1:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
+
+                counts[lab] += 1
+                for j in range(K):
+                    val = values[i, j]
+
+                    # not nan
+                    if val == val:
+                        nobs[lab, j] += 1
+                        if val > maxx[lab, j]:
+                            maxx[lab, j] = val
+        else:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
+
+                counts[lab] += 1
+                val = values[i, 0]
+
+                # not nan
+                if val == val:
+                    nobs[lab, 0] += 1
+                    if val > maxx[lab, 0]:
+                        maxx[lab, 0] = val
+
+        for i in range(ncounts):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = maxx[i, j]
+"""
+
+group_mean_template = """
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_mean_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                        ndarray[int64_t] counts,
+                        ndarray[%(c_type)s, ndim=2] values,
+                        ndarray[int64_t] labels):
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        float64_t val, count
+        ndarray[float64_t, ndim=2] sumx, nobs
+
+    nobs = np.zeros_like(out, dtype=np.float64)
+    sumx = np.zeros_like(out, dtype=np.float64)
+
+    N, K = (<object> values).shape
+    ncounts = len(counts)
+
+    with nogil:
+        if K > 1:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
+
+                counts[lab] += 1
+                for j in range(K):
+                    val = values[i, j]
+                    # not nan
+                    if val == val:
+                        nobs[lab, j] += 1
+                        sumx[lab, j] += val
+        else:
+            for i in range(N):
+                lab = labels[i]
+                if lab < 0:
+                    continue
+
+                counts[lab] += 1
+                val = values[i, 0]
+                # not nan
+                if val == val:
+                    nobs[lab, 0] += 1
+                    sumx[lab, 0] += val
+
+        for i in range(ncounts):
+            for j in range(K):
+                count = nobs[i, j]
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = sumx[i, j] / count
+"""
+
+group_var_template = """
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_var_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                       ndarray[int64_t] counts,
+                       ndarray[%(c_type)s, ndim=2] values,
+                       ndarray[int64_t] labels):
+    cdef:
+        Py_ssize_t i, j, N, K, lab, ncounts
+        float64_t val, ct
+        ndarray[float64_t, ndim=2] nobs, sumx, sumxx
+
+    nobs = np.zeros_like(out, dtype=np.float64)
+    sumx = np.zeros_like(out, dtype=np.float64)
+    sumxx = np.zeros_like(out, dtype=np.float64)
+
+    N, K = (<object> values).shape
+    ncounts = len(counts)
+
+    with nogil:
+        if K > 1:
+            for i in range(N):
+
+                lab = labels[i]
+                if lab < 0:
+                    continue
+
+                counts[lab] += 1
+
+                for j in range(K):
+                    val = values[i, j]
+
+                    # not nan
+                    if val == val:
+                        nobs[lab, j] += 1
+                        sumx[lab, j] += val
+                        sumxx[lab, j] += val * val
+        else:
+            for i in range(N):
+
+                lab = labels[i]
+                if lab < 0:
+                    continue
+
+                counts[lab] += 1
+                val = values[i, 0]
+                # not nan
+                if val == val:
+                    nobs[lab, 0] += 1
+                    sumx[lab, 0] += val
+                    sumxx[lab, 0] += val * val
+
+
+        for i in range(ncounts):
+            for j in range(K):
+                ct = nobs[i, j]
+                if ct < 2:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = ((ct * sumxx[i, j] - sumx[i, j] * sumx[i, j]) /
+                                 (ct * ct - ct))
+"""
+
+group_add_bin_template = """
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_add_bin_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[%(c_type)s, ndim=2] values,
+                           ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b, nbins
+        float64_t val, count
+        ndarray[float64_t, ndim=2] sumx, nobs
+
+    nobs = np.zeros_like(out, dtype=np.float64)
+    sumx = np.zeros_like(out, dtype=np.float64)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        if K > 1:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
+
+                counts[b] += 1
+                for j in range(K):
+                    val = values[i, j]
+
+                    # not nan
+                    if val == val:
+                        nobs[b, j] += 1
+                        sumx[b, j] += val
+        else:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
+
+                counts[b] += 1
+                val = values[i, 0]
+
+                # not nan
+                if val == val:
+                    nobs[b, 0] += 1
+                    sumx[b, 0] += val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = sumx[i, j]
+"""
+
+group_prod_bin_template = """
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_prod_bin_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[%(c_type)s, ndim=2] values,
+                           ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        float64_t val, count
+        ndarray[float64_t, ndim=2] prodx, nobs
+
+    nobs = np.zeros_like(out, dtype=np.float64)
+    prodx = np.ones_like(out, dtype=np.float64)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        if K > 1:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
+
+                counts[b] += 1
+                for j in range(K):
+                    val = values[i, j]
+
+                    # not nan
+                    if val == val:
+                        nobs[b, j] += 1
+                        prodx[b, j] *= val
+        else:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
+
+                counts[b] += 1
+                val = values[i, 0]
+
+                # not nan
+                if val == val:
+                    nobs[b, 0] += 1
+                    prodx[b, 0] *= val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = prodx[i, j]
+"""
+
+group_min_bin_template = """
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_min_bin_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                            ndarray[int64_t] counts,
+                            ndarray[%(c_type)s, ndim=2] values,
+                            ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        float64_t val, count
+        ndarray[%(c_type)s, ndim=2] minx, nobs
+
+    nobs = np.zeros_like(out)
+
+    minx = np.empty_like(out)
+    minx.fill(np.inf)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        if K > 1:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
+
+                counts[b] += 1
+                for j in range(K):
+                    val = values[i, j]
+
+                    # not nan
+                    if val == val:
+                        nobs[b, j] += 1
+                        if val < minx[b, j]:
+                            minx[b, j] = val
+        else:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
+
+                counts[b] += 1
+                val = values[i, 0]
+
+                # not nan
+                if val == val:
+                    nobs[b, 0] += 1
+                    if val < minx[b, 0]:
+                        minx[b, 0] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = minx[i, j]
+"""
+
+group_max_bin_template = """
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_max_bin_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[%(c_type)s, ndim=2] values,
+                           ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        float64_t val, count
+        ndarray[%(c_type)s, ndim=2] maxx, nobs
+
+    nobs = np.zeros_like(out)
+    maxx = np.empty_like(out)
+    maxx.fill(-np.inf)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        if K > 1:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
+
+                counts[b] += 1
+                for j in range(K):
+                    val = values[i, j]
+
+                    # not nan
+                    if val == val:
+                        nobs[b, j] += 1
+                        if val > maxx[b, j]:
+                            maxx[b, j] = val
+        else:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
+
+                counts[b] += 1
+                val = values[i, 0]
+
+                # not nan
+                if val == val:
+                    nobs[b, 0] += 1
+                    if val > maxx[b, 0]:
+                        maxx[b, 0] = val
+
+        for i in range(ngroups):
+            for j in range(K):
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = maxx[i, j]
+"""
+
+group_ohlc_template = """
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_ohlc_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[%(c_type)s, ndim=2] values,
+                           ndarray[int64_t] bins):
+    '''
+    Only aggregates on axis=0
+    '''
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        float64_t val, count
+        float64_t vopen, vhigh, vlow, vclose, NA
+        bint got_first = 0
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    if out.shape[1] != 4:
+        raise ValueError('Output array must have 4 columns')
+
+    NA = np.nan
+
+    b = 0
+    if K > 1:
+        raise NotImplementedError
+    else:
+        for i in range(N):
+            while b < ngroups - 1 and i >= bins[b]:
+                if not got_first:
+                    out[b, 0] = NA
+                    out[b, 1] = NA
+                    out[b, 2] = NA
+                    out[b, 3] = NA
+                else:
+                    out[b, 0] = vopen
+                    out[b, 1] = vhigh
+                    out[b, 2] = vlow
+                    out[b, 3] = vclose
+                b += 1
+                got_first = 0
+
+            counts[b] += 1
+            val = values[i, 0]
+
+            # not nan
+            if val == val:
+                if not got_first:
+                    got_first = 1
+                    vopen = val
+                    vlow = val
+                    vhigh = val
+                else:
+                    if val < vlow:
+                        vlow = val
+                    if val > vhigh:
+                        vhigh = val
+                vclose = val
+
+        if not got_first:
+            out[b, 0] = NA
+            out[b, 1] = NA
+            out[b, 2] = NA
+            out[b, 3] = NA
+        else:
+            out[b, 0] = vopen
+            out[b, 1] = vhigh
+            out[b, 2] = vlow
+            out[b, 3] = vclose
+"""
+
+group_mean_bin_template = """
+# @cython.boundscheck(False)
+# @cython.wraparound(False)
+def group_mean_bin_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                            ndarray[int64_t] counts,
+                            ndarray[%(c_type)s, ndim=2] values,
+                            ndarray[int64_t] bins):
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        float64_t val, count
+        ndarray[float64_t, ndim=2] sumx, nobs
+
+    nobs = np.zeros_like(out, dtype=np.float64)
+    sumx = np.zeros_like(out, dtype=np.float64)
+
+    N, K = (<object> values).shape
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    with nogil:
+        b = 0
+        if K > 1:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
+
+                counts[b] += 1
+                for j in range(K):
+                    val = values[i, j]
+
+                    # not nan
+                    if val == val:
+                        nobs[b, j] += 1
+                        sumx[b, j] += val
+        else:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
+
+                counts[b] += 1
+                val = values[i, 0]
+
+                # not nan
+                if val == val:
+                    nobs[b, 0] += 1
+                    sumx[b, 0] += val
+
+        for i in range(ngroups):
+            for j in range(K):
+                count = nobs[i, j]
+                if nobs[i, j] == 0:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = sumx[i, j] / count
+"""
+
+group_var_bin_template = """
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_var_bin_%(name)s(ndarray[%(c_type)s, ndim=2] out,
+                           ndarray[int64_t] counts,
+                           ndarray[%(c_type)s, ndim=2] values,
+                           ndarray[int64_t] bins):
+
+    cdef:
+        Py_ssize_t i, j, N, K, ngroups, b
+        float64_t val, ct
+        ndarray[float64_t, ndim=2] nobs, sumx, sumxx
+
+    nobs = np.zeros_like(out, dtype=np.float64)
+    sumx = np.zeros_like(out, dtype=np.float64)
+    sumxx = np.zeros_like(out, dtype=np.float64)
+
+    if bins[len(bins) - 1] == len(values):
+        ngroups = len(bins)
+    else:
+        ngroups = len(bins) + 1
+
+    N, K = (<object> values).shape
+
+    with nogil:
+        b = 0
+        if K > 1:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
+
+                counts[b] += 1
+
+                for j in range(K):
+                    val = values[i, j]
+
+                    # not nan
+                    if val == val:
+                        nobs[b, j] += 1
+                        sumx[b, j] += val
+                        sumxx[b, j] += val * val
+        else:
+            for i in range(N):
+                while b < ngroups - 1 and i >= bins[b]:
+                    b += 1
+
+                counts[b] += 1
+                val = values[i, 0]
+
+                # not nan
+                if val == val:
+                    nobs[b, 0] += 1
+                    sumx[b, 0] += val
+                    sumxx[b, 0] += val * val
+
+        for i in range(ngroups):
+            for j in range(K):
+                ct = nobs[i, j]
+                if ct < 2:
+                    out[i, j] = nan
+                else:
+                    out[i, j] = ((ct * sumxx[i, j] - sumx[i, j] * sumx[i, j]) /
+                                 (ct * ct - ct))
+"""
+
+row_bool_subset_template = """
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def row_bool_subset_%(name)s(ndarray[%(c_type)s, ndim=2] values,
+                             ndarray[uint8_t, cast=True] mask):
+    cdef:
+        Py_ssize_t i, j, n, k, pos = 0
+        ndarray[%(c_type)s, ndim=2] out
+
+    n, k = (<object> values).shape
+    assert(n == len(mask))
+
+    out = np.empty((mask.sum(), k), dtype=%(dtype)s)
+
+    for i in range(n):
+        if mask[i]:
+            for j in range(k):
+                out[pos, j] = values[i, j]
+            pos += 1
+
+    return out
+"""
+
 #-------------------------------------------------------------------------
 # Generators
 
@@ -1166,9 +2300,20 @@ def generate_put_functions():
     return output.getvalue()
 
 
+# The loops of the kernels run without the GIL, so that the threads of
+# pandas.core.parallel run them concurrently, except for object arrays, whose
+# elements are Python objects
+
+def _nogil(c_type):
+    return 'if True:' if c_type == 'object' else 'with nogil:'
+
+def _gil(c_type):
+    return 'if True:' if c_type == 'object' else 'with gil:'
+
 # name, ctype, capable of holding NA
 function_list = [
     ('float64', 'float64_t', 'np.float64', True),
+    ('float32', 'float32_t', 'np.float32', True),
     ('object', 'object', 'object', True),
     ('int32', 'int32_t', 'np.int32', False),
     ('int64', 'int64_t', 'np.int64', False),
@@ -1183,7 +2328,41 @@ def generate_from_template(template, ndim=1, exclude=None):
 
         func = template % {'name': name, 'c_type': c_type,
                            'dtype': dtype,
-                           'raise_on_na': 'False' if can_hold_na else 'True'}
+                           'raise_on_na': 'False' if can_hold_na else 'True',
+                           'nogil': _nogil(c_type), 'gil': _gil(c_type)}
+        output.write(func)
+    return output.getvalue()
+
+# name, ctype, dtype
+groupby_function_list = [
+    ('float64', 'float64_t', 'np.float64'),
+    ('float32', 'float32_t', 'np.float32'),
+]
+
+# name, ctype, dest name, dest ctype, dest dtype, cast
+upcast_function_list = [
+    ('int8', 'int8_t', 'float32', 'float32_t', 'np.float32', ''),
+    ('int8', 'int8_t', 'float64', 'float64_t', 'np.float64', ''),
+    ('int16', 'int16_t', 'float32', 'float32_t', 'np.float32', ''),
+    ('int16', 'int16_t', 'float64', 'float64_t', 'np.float64', ''),
+    ('int32', 'int32_t', 'float64', 'float64_t', 'np.float64', ''),
+    ('int64', 'int64_t', 'float64', 'float64_t', 'np.float64', ''),
+    ('bool', 'uint8_t, cast=True', 'object', 'object', 'object', '<bint> '),
+]
+
+def generate_from_template_upcast(template):
+    output = StringIO()
+    for name, c_type, dest, dest_type, dest_dtype, cast in upcast_function_list:
+        func = template % {'name': name, 'c_type': c_type, 'dest': dest,
+                           'dest_type': dest_type, 'dest_dtype': dest_dtype,
+                           'cast': cast, 'nogil': _nogil(dest_type)}
+        output.write(func)
+    return output.getvalue()
+
+def generate_from_template_groupby(template):
+    output = StringIO()
+    for name, c_type, dtype in groupby_function_list:
+        func = template % {'name': name, 'c_type': c_type, 'dtype': dtype}
         output.write(func)
     return output.getvalue()
 
@@ -1208,6 +2387,29 @@ templates_2d = [take_2d_axis0_template,
                 take_2d_axis1_template,
                 take_2d_multi_template]
 
+upcast_templates = [take_1d_upcast_template,
+                    take_2d_axis0_upcast_template,
+                    take_2d_axis1_upcast_template]
+
+groupby_templates = [group_add_template,
+                     group_prod_template,
+                     group_nth_template,
+                     group_nth_bin_template,
+                     group_last_template,
+                     group_last_bin_template,
+                     group_min_template,
+                     group_max_template,
+                     group_mean_template,
+                     group_var_template,
+                     group_add_bin_template,
+                     group_prod_bin_template,
+                     group_min_bin_template,
+                     group_max_bin_template,
+                     group_ohlc_template,
+                     group_mean_bin_template,
+                     group_var_bin_template,
+                     row_bool_subset_template]
+
 def generate_take_cython_file(path='generated.pyx'):
     with open(path, 'w') as f:
         print >> f, header
@@ -1229,5 +2431,11 @@ def generate_take_cython_file(path='generated.pyx'):
         for template in nobool_1d_templates:
             print >> f, generate_from_template(template, exclude=['bool'])
 
+        for template in upcast_templates:
+            print >> f, generate_from_template_upcast(template)
+
+        for template in groupby_templates:
+            print >> f, generate_from_template_groupby(template)
+
 if __name__ == '__main__':
     generate_take_cython_file()
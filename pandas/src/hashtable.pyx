@@ -123,8 +123,17 @@ cdef class HashTable:
     pass
 
 
+cdef inline Py_ssize_t _khash_sizeof(khint_t n_buckets, size_t key_size):
+    # table struct, keys, values and the flags (2 bits per bucket)
+    cdef Py_ssize_t flags_size = 1 if n_buckets < 16 else n_buckets >> 4
+    return (sizeof(kh_int64_t) + n_buckets * (key_size + sizeof(Py_ssize_t))
+            + flags_size * sizeof(uint32_t))
+
+
 cdef class StringHashTable(HashTable):
     cdef kh_str_t *table
+    cdef list interned
+    cdef dict interned_other
 
     # def __init__(self, size_hint=1):
     #     if size_hint is not None:
@@ -138,6 +147,10 @@ cdef class StringHashTable(HashTable):
     def __dealloc__(self):
         kh_destroy_str(self.table)
 
+    def sizeof(self):
+        """ return the size of the hash table in bytes """
+        return _khash_sizeof(self.table.n_buckets, sizeof(kh_cstr_t))
+
     cdef inline int check_type(self, object val):
         return util.is_string_object(val)
 
@@ -249,6 +262,53 @@ cdef class StringHashTable(HashTable):
         # return None
         return reverse, labels, counts[:count].copy()
 
+    def intern(self, ndarray[object] values):
+        '''
+        Replace in place each string in values by the first equal string
+        interned by this table, so that repeated strings share one object.
+        Values that are not strings are left alone. A table used for
+        interning should not be used for anything else
+
+        Returns
+        -------
+        n_replaced : int
+        '''
+        cdef:
+            Py_ssize_t i, n = len(values), count = 0
+            int ret = 0
+            object val, seen
+            char *buf
+            khiter_t k
+
+        if self.interned is None:
+            self.interned = []
+            self.interned_other = {}
+
+        for i in range(n):
+            val = values[i]
+            if type(val) is str:
+                buf = util.get_c_string(val)
+                k = kh_get_str(self.table, buf)
+                if k != self.table.n_buckets:
+                    seen = self.interned[self.table.vals[k]]
+                else:
+                    # the key points into val, which the table keeps alive
+                    k = kh_put_str(self.table, buf, &ret)
+                    self.table.vals[k] = len(self.interned)
+                    self.interned.append(val)
+                    continue
+            elif util.is_string_object(val):
+                seen = self.interned_other.setdefault(val, val)
+            else:
+                continue
+
+            # strings with embedded NULs can share a key
+            if seen is not val and seen == val:
+                values[i] = seen
+                count += 1
+
+        return count
+
 cdef class Int32HashTable(HashTable):
     cdef kh_int32_t *table
 
@@ -262,6 +322,10 @@ cdef class Int32HashTable(HashTable):
     def __dealloc__(self):
         kh_destroy_int32(self.table)
 
+    def sizeof(self):
+        """ return the size of the hash table in bytes """
+        return _khash_sizeof(self.table.n_buckets, sizeof(int32_t))
+
     cdef inline int check_type(self, object val):
         return util.is_string_object(val)
 
@@ -366,6 +430,10 @@ cdef class Int64HashTable(HashTable):
     def __dealloc__(self):
         kh_destroy_int64(self.table)
 
+    def sizeof(self):
+        """ return the size of the hash table in bytes """
+        return _khash_sizeof(self.table.n_buckets, sizeof(int64_t))
+
     def __contains__(self, object key):
         cdef khiter_t k
         k = kh_get_int64(self.table, key)
@@ -611,6 +679,10 @@ cdef class Float64HashTable(HashTable):
     def __dealloc__(self):
         kh_destroy_float64(self.table)
 
+    def sizeof(self):
+        """ return the size of the hash table in bytes """
+        return _khash_sizeof(self.table.n_buckets, sizeof(float64_t))
+
     def factorize(self, ndarray[float64_t] values):
         uniques = []
         labels, counts = self.get_labels(values, uniques, 0, -1)
@@ -718,6 +790,12 @@ cdef class PyObjectHashTable(HashTable):
         if self.table is not NULL:
             self.destroy()
 
+    def sizeof(self):
+        """ return the size of the hash table in bytes """
+        if self.table is NULL:
+            return 0
+        return _khash_sizeof(self.table.n_buckets, sizeof(PyObject*))
+
     def __len__(self):
         return self.table.size
 
@@ -516,6 +516,91 @@ def maybe_convert_objects(ndarray[object] objects, bint try_float=0,
 def convert_sql_column(x):
     return maybe_convert_objects(x, try_float=1)
 
+def rows_to_typed_column(list rows, Py_ssize_t col, object kind,
+                         bint try_float=0):
+    '''
+    Fill column col of a list of row tuples directly into a typed array,
+    without going through an intermediate object array
+
+    Parameters
+    ----------
+    rows : list of tuples
+    col : int
+    kind : {'f', 'i', 'b', 'M'}
+        float64, int64, bool or datetime64[ns]. None becomes NaN / NaT in float
+        and datetime columns
+    try_float : boolean, default False
+        Attempt to convert non-numeric objects (like decimal.Decimal) in a float
+        column to float
+
+    Returns
+    -------
+    ndarray, or None if some value does not fit the requested kind
+    '''
+    cdef:
+        Py_ssize_t i, n = len(rows)
+        object val
+        ndarray[float64_t] floats
+        ndarray[int64_t] ints
+        ndarray[uint8_t] bools
+        pandas_datetimestruct dts
+
+    if kind == 'f':
+        floats = np.empty(n, dtype='f8')
+        for i in range(n):
+            val = rows[i][col]
+            if val is None:
+                floats[i] = NaN
+            elif util.is_float_object(val) or util.is_integer_object(val):
+                floats[i] = val
+            elif try_float and not util.is_string_object(val):
+                try:
+                    floats[i] = float(val)
+                except Exception:
+                    return None
+            else:
+                return None
+        return floats
+    elif kind == 'i':
+        ints = np.empty(n, dtype='i8')
+        for i in range(n):
+            val = rows[i][col]
+            if not util.is_integer_object(val):
+                return None
+            try:
+                ints[i] = val
+            except OverflowError:
+                return None
+        return ints
+    elif kind == 'b':
+        bools = np.empty(n, dtype=np.uint8)
+        for i in range(n):
+            val = rows[i][col]
+            if not util.is_bool_object(val):
+                return None
+            bools[i] = val
+        return bools.view(np.bool_)
+    elif kind == 'M':
+        result = np.empty(n, dtype='M8[ns]')
+        ints = result.view(np.int64)
+        for i in range(n):
+            val = rows[i][col]
+            if val is None:
+                ints[i] = iNaT
+            elif PyDateTime_Check(val):
+                if val.tzinfo is not None:
+                    return None
+                ints[i] = _pydatetime_to_dts(val, &dts)
+                _check_dts_bounds(ints[i], &dts)
+            elif PyDate_Check(val):
+                ints[i] = _date_to_datetime64(val, &dts)
+                _check_dts_bounds(ints[i], &dts)
+            else:
+                return None
+        return result
+
+    raise ValueError('unrecognized kind: %s' % kind)
+
 def try_parse_dates(ndarray[object] values, parser=None,
                     dayfirst=False):
     cdef:
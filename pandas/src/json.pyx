@@ -0,0 +1,163 @@
+cdef double JSON_INF = <double> np.inf
+cdef double JSON_NEGINF = -JSON_INF
+
+# imported on first use so that importing pandas does not require the json
+# module, which is missing on Python 2.5
+cdef object _json_dumps = None
+cdef object _json_escape = None
+
+
+cdef _load_json():
+    global _json_dumps, _json_escape
+
+    try:
+        import json
+    except ImportError:
+        import simplejson as json
+
+    _json_dumps = json.dumps
+    _json_escape = json.encoder.encode_basestring_ascii
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def json_encode_values(ndarray values, int64_t date_divisor=1000000):
+    '''
+    Encode each element of a 1-d array as a JSON token. Missing values become
+    null, datetime64 values and datetimes integers since the epoch in units
+    of date_divisor nanoseconds
+
+    Returns
+    -------
+    tokens : ndarray of object
+    '''
+    cdef:
+        Py_ssize_t i, n = len(values)
+        ndarray[object] result = np.empty(n, dtype=object)
+        ndarray[float64_t] floats
+        ndarray[int64_t] ints
+        ndarray[uint8_t] bools
+        ndarray[object] objects
+        float64_t fval
+        int64_t ival
+
+    kind = values.dtype.kind
+    if kind == 'f':
+        floats = values.astype(np.float64)
+        for i in range(n):
+            fval = floats[i]
+            if fval != fval or fval == JSON_INF or fval == JSON_NEGINF:
+                result[i] = 'null'
+            else:
+                result[i] = repr(fval)
+    elif kind == 'i' or kind == 'u':
+        ints = values.astype(np.int64)
+        for i in range(n):
+            result[i] = str(ints[i])
+    elif kind == 'b':
+        bools = values.view(np.uint8)
+        for i in range(n):
+            result[i] = 'true' if bools[i] else 'false'
+    elif kind == 'M':
+        ints = values.view(np.int64)
+        for i in range(n):
+            ival = ints[i]
+            if ival == NPY_NAT:
+                result[i] = 'null'
+            else:
+                result[i] = str(ival // date_divisor)
+    else:
+        if _json_dumps is None:
+            _load_json()
+        objects = values.astype(object)
+        for i in range(n):
+            result[i] = _json_encode_object(objects[i], date_divisor)
+
+    return result
+
+
+cdef object _json_encode_object(object val, int64_t date_divisor):
+    cdef float64_t fval
+
+    if val is None or val is NaT:
+        return 'null'
+    elif util.is_string_object(val):
+        return _json_escape(val)
+    elif util.is_bool_object(val):
+        return 'true' if val else 'false'
+    elif util.is_integer_object(val):
+        return str(val)
+    elif util.is_float_object(val):
+        fval = val
+        if fval != fval or fval == JSON_INF or fval == JSON_NEGINF:
+            return 'null'
+        return repr(fval)
+    elif PyDateTime_Check(val) or PyDate_Check(val):
+        return str(Timestamp(val).value // date_divisor)
+    else:
+        return _json_dumps(val)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def json_join_records(list keys, ndarray[object, ndim=2] tokens,
+                      Py_ssize_t start, Py_ssize_t end, list row_keys=None):
+    '''
+    Join rows [start, end) of a (columns x rows) array of JSON tokens into
+    comma separated JSON objects keyed by the encoded keys. With row_keys each
+    object is prefixed by its encoded row key, as in {"row":{"col":1}}
+    '''
+    cdef:
+        Py_ssize_t i, j, k = len(keys)
+        list pieces = [], fields
+        object record
+
+    for i in range(start, end):
+        fields = []
+        for j in range(k):
+            fields.append(keys[j] + ':' + tokens[j, i])
+        record = '{' + ','.join(fields) + '}'
+        if row_keys is not None:
+            record = row_keys[i] + ':' + record
+        pieces.append(record)
+
+    return ','.join(pieces)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def json_join_arrays(ndarray[object, ndim=2] tokens, Py_ssize_t start,
+                     Py_ssize_t end):
+    '''
+    Join rows [start, end) of a (columns x rows) array of JSON tokens into
+    comma separated JSON arrays
+    '''
+    cdef:
+        Py_ssize_t i, j, k = len(tokens)
+        list pieces = [], fields
+
+    for i in range(start, end):
+        fields = []
+        for j in range(k):
+            fields.append(tokens[j, i])
+        pieces.append('[' + ','.join(fields) + ']')
+
+    return ','.join(pieces)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def json_join_pairs(list keys, ndarray[object] tokens, Py_ssize_t start,
+                    Py_ssize_t end):
+    '''
+    Join elements [start, end) of encoded keys and JSON tokens as comma
+    separated "key":value pairs
+    '''
+    cdef:
+        Py_ssize_t i
+        list pieces = []
+
+    for i in range(start, end):
+        pieces.append(keys[i] + ':' + tokens[i])
+
+    return ','.join(pieces)
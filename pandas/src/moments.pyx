@@ -162,33 +162,34 @@ def roll_sum(ndarray[double_t] input, int win, int minp):
 
     minp = _check_minp(win, minp, N)
 
-    for i from 0 <= i < minp - 1:
-        val = input[i]
+    with nogil:
+        for i from 0 <= i < minp - 1:
+            val = input[i]
 
-        # Not NaN
-        if val == val:
-            nobs += 1
-            sum_x += val
+            # Not NaN
+            if val == val:
+                nobs += 1
+                sum_x += val
 
-        output[i] = NaN
+            output[i] = NaN
 
-    for i from minp - 1 <= i < N:
-        val = input[i]
+        for i from minp - 1 <= i < N:
+            val = input[i]
 
-        if i > win - 1:
-            prev = input[i - win]
-            if prev == prev:
-                sum_x -= prev
-                nobs -= 1
+            if i > win - 1:
+                prev = input[i - win]
+                if prev == prev:
+                    sum_x -= prev
+                    nobs -= 1
 
-        if val == val:
-            nobs += 1
-            sum_x += val
+            if val == val:
+                nobs += 1
+                sum_x += val
 
-        if nobs >= minp:
-            output[i] = sum_x
-        else:
-            output[i] = NaN
+            if nobs >= minp:
+                output[i] = sum_x
+            else:
+                output[i] = NaN
 
     return output
 
@@ -205,33 +206,34 @@ def roll_mean(ndarray[double_t] input,
 
     minp = _check_minp(win, minp, N)
 
-    for i from 0 <= i < minp - 1:
-        val = input[i]
+    with nogil:
+        for i from 0 <= i < minp - 1:
+            val = input[i]
 
-        # Not NaN
-        if val == val:
-            nobs += 1
-            sum_x += val
+            # Not NaN
+            if val == val:
+                nobs += 1
+                sum_x += val
 
-        output[i] = NaN
+            output[i] = NaN
 
-    for i from minp - 1 <= i < N:
-        val = input[i]
+        for i from minp - 1 <= i < N:
+            val = input[i]
 
-        if i > win - 1:
-            prev = input[i - win]
-            if prev == prev:
-                sum_x -= prev
-                nobs -= 1
+            if i > win - 1:
+                prev = input[i - win]
+                if prev == prev:
+                    sum_x -= prev
+                    nobs -= 1
 
-        if val == val:
-            nobs += 1
-            sum_x += val
+            if val == val:
+                nobs += 1
+                sum_x += val
 
-        if nobs >= minp:
-            output[i] = sum_x / nobs
-        else:
-            output[i] = NaN
+            if nobs >= minp:
+                output[i] = sum_x / nobs
+            else:
+                output[i] = NaN
 
     return output
 
@@ -294,54 +296,69 @@ def ewma(ndarray[double_t] input, double_t com, int adjust):
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def nancorr(ndarray[float64_t, ndim=2] mat, cov=False):
+def nancorr(ndarray[float64_t, ndim=2] mat, cov=False, start=0, end=None,
+            out=None):
+    '''
+    Pairwise correlation (covariance if cov) of the columns of mat, excluding
+    NA / inf values. Only rows start to end of the lower triangle of the
+    result, and their mirror image, are computed and written in out if these
+    are passed
+    '''
     cdef:
-        Py_ssize_t i, j, xi, yi, N, K
+        Py_ssize_t i, j, xi, yi, N, K, xstart, xend
         ndarray[float64_t, ndim=2] result
         ndarray[uint8_t, ndim=2] mask
         int64_t nobs = 0
         float64_t vx, vy, sumx, sumy, sumxx, sumyy, meanx, meany, divisor
+        bint cov_flag = cov
 
     N, K = (<object> mat).shape
 
-    result = np.empty((K, K), dtype=np.float64)
-    mask = np.isfinite(mat).view(np.uint8)
+    xstart = start
+    xend = K if end is None else end
 
-    for xi in range(K):
-        for yi in range(xi + 1):
-            nobs = sumxx = sumyy = sumx = sumy = 0
-            for i in range(N):
-                if mask[i, xi] and mask[i, yi]:
-                    vx = mat[i, xi]
-                    vy = mat[i, yi]
-                    nobs += 1
-                    sumx += vx
-                    sumy += vy
-
-            if nobs == 0:
-                result[xi, yi] = result[yi, xi] = np.NaN
-            else:
-                meanx = sumx / nobs
-                meany = sumy / nobs
-
-                # now the cov numerator
-                sumx = 0
+    if out is None:
+        result = np.empty((K, K), dtype=np.float64)
+    else:
+        result = out
+    mask = np.isfinite(mat).view(np.uint8)
 
+    with nogil:
+        for xi in range(xstart, xend):
+            for yi in range(xi + 1):
+                nobs = sumxx = sumyy = sumx = sumy = 0
                 for i in range(N):
                     if mask[i, xi] and mask[i, yi]:
-                        vx = mat[i, xi] - meanx
-                        vy = mat[i, yi] - meany
+                        vx = mat[i, xi]
+                        vy = mat[i, yi]
+                        nobs += 1
+                        sumx += vx
+                        sumy += vy
+
+                if nobs == 0:
+                    result[xi, yi] = result[yi, xi] = NaN
+                else:
+                    meanx = sumx / nobs
+                    meany = sumy / nobs
 
-                        sumx += vx * vy
-                        sumxx += vx * vx
-                        sumyy += vy * vy
+                    # now the cov numerator
+                    sumx = 0
 
-                divisor = (nobs - 1.0) if cov else sqrt(sumxx * sumyy)
+                    for i in range(N):
+                        if mask[i, xi] and mask[i, yi]:
+                            vx = mat[i, xi] - meanx
+                            vy = mat[i, yi] - meany
 
-                if divisor != 0:
-                    result[xi, yi] = result[yi, xi] = sumx / divisor
-                else:
-                    result[xi, yi] = result[yi, xi] = np.NaN
+                            sumx += vx * vy
+                            sumxx += vx * vx
+                            sumyy += vy * vy
+
+                    divisor = (nobs - 1.0) if cov_flag else sqrt(sumxx * sumyy)
+
+                    if divisor != 0:
+                        result[xi, yi] = result[yi, xi] = sumx / divisor
+                    else:
+                        result[xi, yi] = result[yi, xi] = NaN
 
     return result
 
@@ -357,41 +374,42 @@ def roll_var(ndarray[double_t] input, int win, int minp, int ddof=1):
 
     minp = _check_minp(win, minp, N)
 
-    for i from 0 <= i < minp - 1:
-        val = input[i]
+    with nogil:
+        for i from 0 <= i < minp - 1:
+            val = input[i]
 
-        # Not NaN
-        if val == val:
-            nobs += 1
-            sum_x += val
-            sum_xx += val * val
+            # Not NaN
+            if val == val:
+                nobs += 1
+                sum_x += val
+                sum_xx += val * val
 
-        output[i] = NaN
+            output[i] = NaN
 
-    for i from minp - 1 <= i < N:
-        val = input[i]
+        for i from minp - 1 <= i < N:
+            val = input[i]
 
-        if i > win - 1:
-            prev = input[i - win]
-            if prev == prev:
-                sum_x -= prev
-                sum_xx -= prev * prev
-                nobs -= 1
+            if i > win - 1:
+                prev = input[i - win]
+                if prev == prev:
+                    sum_x -= prev
+                    sum_xx -= prev * prev
+                    nobs -= 1
 
-        if val == val:
-            nobs += 1
-            sum_x += val
-            sum_xx += val * val
+            if val == val:
+                nobs += 1
+                sum_x += val
+                sum_xx += val * val
 
-        if nobs >= minp:
-            # pathological case
-            if nobs == 1:
-                output[i] = 0
-                continue
+            if nobs >= minp:
+                # pathological case
+                if nobs == 1:
+                    output[i] = 0
+                    continue
 
-            output[i] = (nobs * sum_xx - sum_x * sum_x) / (nobs * (nobs - ddof))
-        else:
-            output[i] = NaN
+                output[i] = (nobs * sum_xx - sum_x * sum_x) / (nobs * (nobs - ddof))
+            else:
+                output[i] = NaN
 
     return output
 
@@ -411,47 +429,48 @@ def roll_skew(ndarray[double_t] input, int win, int minp):
 
     minp = _check_minp(win, minp, N)
 
-    for i from 0 <= i < minp - 1:
-        val = input[i]
+    with nogil:
+        for i from 0 <= i < minp - 1:
+            val = input[i]
 
-        # Not NaN
-        if val == val:
-            nobs += 1
-            x += val
-            xx += val * val
-            xxx += val * val * val
+            # Not NaN
+            if val == val:
+                nobs += 1
+                x += val
+                xx += val * val
+                xxx += val * val * val
 
-        output[i] = NaN
+            output[i] = NaN
 
-    for i from minp - 1 <= i < N:
-        val = input[i]
+        for i from minp - 1 <= i < N:
+            val = input[i]
 
-        if i > win - 1:
-            prev = input[i - win]
-            if prev == prev:
-                x -= prev
-                xx -= prev * prev
-                xxx -= prev * prev * prev
+            if i > win - 1:
+                prev = input[i - win]
+                if prev == prev:
+                    x -= prev
+                    xx -= prev * prev
+                    xxx -= prev * prev * prev
 
-                nobs -= 1
+                    nobs -= 1
 
-        if val == val:
-            nobs += 1
-            x += val
-            xx += val * val
-            xxx += val * val * val
+            if val == val:
+                nobs += 1
+                x += val
+                xx += val * val
+                xxx += val * val * val
 
-        if nobs >= minp:
-            A = x / nobs
-            B = xx / nobs - A * A
-            C = xxx / nobs - A * A * A - 3 * A * B
+            if nobs >= minp:
+                A = x / nobs
+                B = xx / nobs - A * A
+                C = xxx / nobs - A * A * A - 3 * A * B
 
-            R = sqrt(B)
+                R = sqrt(B)
 
-            output[i] = ((sqrt(nobs * (nobs - 1.)) * C) /
-                         ((nobs-2) * R * R * R))
-        else:
-            output[i] = NaN
+                output[i] = ((sqrt(nobs * (nobs - 1.)) * C) /
+                             ((nobs-2) * R * R * R))
+            else:
+                output[i] = NaN
 
     return output
 
@@ -473,57 +492,58 @@ def roll_kurt(ndarray[double_t] input,
 
     minp = _check_minp(win, minp, N)
 
-    for i from 0 <= i < minp - 1:
-        val = input[i]
-
-        # Not NaN
-        if val == val:
-            nobs += 1
+    with nogil:
+        for i from 0 <= i < minp - 1:
+            val = input[i]
 
-            # seriously don't ask me why this is faster
-            x += val
-            xx += val * val
-            xxx += val * val * val
-            xxxx += val * val * val * val
+            # Not NaN
+            if val == val:
+                nobs += 1
 
-        output[i] = NaN
-
-    for i from minp - 1 <= i < N:
-        val = input[i]
+                # seriously don't ask me why this is faster
+                x += val
+                xx += val * val
+                xxx += val * val * val
+                xxxx += val * val * val * val
 
-        if i > win - 1:
-            prev = input[i - win]
-            if prev == prev:
-                x -= prev
-                xx -= prev * prev
-                xxx -= prev * prev * prev
-                xxxx -= prev * prev * prev * prev
-
-                nobs -= 1
-
-        if val == val:
-            nobs += 1
-            x += val
-            xx += val * val
-            xxx += val * val * val
-            xxxx += val * val * val * val
-
-        if nobs >= minp:
-            A = x / nobs
-            R = A * A
-            B = xx / nobs - R
-            R = R * A
-            C = xxx / nobs - R - 3 * A * B
-            R = R * A
-            D = xxxx / nobs - R - 6*B*A*A - 4*C*A
-
-            K = (nobs * nobs - 1.)*D/(B*B) - 3*((nobs-1.)**2)
-            K = K / ((nobs - 2.)*(nobs-3.))
-
-            output[i] = K
-        else:
             output[i] = NaN
 
+        for i from minp - 1 <= i < N:
+            val = input[i]
+
+            if i > win - 1:
+                prev = input[i - win]
+                if prev == prev:
+                    x -= prev
+                    xx -= prev * prev
+                    xxx -= prev * prev * prev
+                    xxxx -= prev * prev * prev * prev
+
+                    nobs -= 1
+
+            if val == val:
+                nobs += 1
+                x += val
+                xx += val * val
+                xxx += val * val * val
+                xxxx += val * val * val * val
+
+            if nobs >= minp:
+                A = x / nobs
+                R = A * A
+                B = xx / nobs - R
+                R = R * A
+                C = xxx / nobs - R - 3 * A * B
+                R = R * A
+                D = xxxx / nobs - R - 6*B*A*A - 4*C*A
+
+                K = (nobs * nobs - 1.)*D/(B*B) - 3*((nobs-1.)**2)
+                K = K / ((nobs - 2.)*(nobs-3.))
+
+                output[i] = K
+            else:
+                output[i] = NaN
+
     return output
 
 #-------------------------------------------------------------------------------
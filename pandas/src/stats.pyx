@@ -243,32 +243,33 @@ def rank_2d_float64(object in_arr, axis=0, ties_method='average',
     values = _take_2d_float64(values, _as)
     argsorted = _as.astype('i8')
 
-    for i in range(n):
-        dups = sum_ranks = 0
-        for j in range(k):
-            sum_ranks += j + 1
-            dups += 1
-            val = values[i, j]
-            if val == nan_value:
-                ranks[i, argsorted[i, j]] = nan
-                continue
-            if j == k - 1 or fabs(values[i, j + 1] - val) > FP_ERR:
-                if tiebreak == TIEBREAK_AVERAGE:
-                    for z in range(j - dups + 1, j + 1):
-                        ranks[i, argsorted[i, z]] = sum_ranks / dups
-                elif tiebreak == TIEBREAK_MIN:
-                    for z in range(j - dups + 1, j + 1):
-                        ranks[i, argsorted[i, z]] = j - dups + 2
-                elif tiebreak == TIEBREAK_MAX:
-                    for z in range(j - dups + 1, j + 1):
-                        ranks[i, argsorted[i, z]] = j + 1
-                elif tiebreak == TIEBREAK_FIRST:
-                    for z in range(j - dups + 1, j + 1):
-                        ranks[i, argsorted[i, z]] = z + 1
-                elif tiebreak == TIEBREAK_FIRST_DESCENDING:
-                    for z in range(j - dups + 1, j + 1):
-                        ranks[i, argsorted[i, z]] = 2 * j - z - dups + 2
-                sum_ranks = dups = 0
+    with nogil:
+        for i in range(n):
+            dups = sum_ranks = 0
+            for j in range(k):
+                sum_ranks += j + 1
+                dups += 1
+                val = values[i, j]
+                if val == nan_value:
+                    ranks[i, argsorted[i, j]] = nan
+                    continue
+                if j == k - 1 or fabs(values[i, j + 1] - val) > FP_ERR:
+                    if tiebreak == TIEBREAK_AVERAGE:
+                        for z in range(j - dups + 1, j + 1):
+                            ranks[i, argsorted[i, z]] = sum_ranks / dups
+                    elif tiebreak == TIEBREAK_MIN:
+                        for z in range(j - dups + 1, j + 1):
+                            ranks[i, argsorted[i, z]] = j - dups + 2
+                    elif tiebreak == TIEBREAK_MAX:
+                        for z in range(j - dups + 1, j + 1):
+                            ranks[i, argsorted[i, z]] = j + 1
+                    elif tiebreak == TIEBREAK_FIRST:
+                        for z in range(j - dups + 1, j + 1):
+                            ranks[i, argsorted[i, z]] = z + 1
+                    elif tiebreak == TIEBREAK_FIRST_DESCENDING:
+                        for z in range(j - dups + 1, j + 1):
+                            ranks[i, argsorted[i, z]] = 2 * j - z - dups + 2
+                    sum_ranks = dups = 0
 
     if axis == 0:
         return ranks.T
@@ -314,29 +315,30 @@ def rank_2d_int64(object in_arr, axis=0, ties_method='average',
     values = _take_2d_int64(values, _as)
     argsorted = _as.astype('i8')
 
-    for i in range(n):
-        dups = sum_ranks = 0
-        for j in range(k):
-            sum_ranks += j + 1
-            dups += 1
-            val = values[i, j]
-            if j == k - 1 or fabs(values[i, j + 1] - val) > FP_ERR:
-                if tiebreak == TIEBREAK_AVERAGE:
-                    for z in range(j - dups + 1, j + 1):
-                        ranks[i, argsorted[i, z]] = sum_ranks / dups
-                elif tiebreak == TIEBREAK_MIN:
-                    for z in range(j - dups + 1, j + 1):
-                        ranks[i, argsorted[i, z]] = j - dups + 2
-                elif tiebreak == TIEBREAK_MAX:
-                    for z in range(j - dups + 1, j + 1):
-                        ranks[i, argsorted[i, z]] = j + 1
-                elif tiebreak == TIEBREAK_FIRST:
-                    for z in range(j - dups + 1, j + 1):
-                        ranks[i, argsorted[i, z]] = z + 1
-                elif tiebreak == TIEBREAK_FIRST_DESCENDING:
-                    for z in range(j - dups + 1, j + 1):
-                        ranks[i, argsorted[i, z]] = 2 * j - z - dups + 2
-                sum_ranks = dups = 0
+    with nogil:
+        for i in range(n):
+            dups = sum_ranks = 0
+            for j in range(k):
+                sum_ranks += j + 1
+                dups += 1
+                val = values[i, j]
+                if j == k - 1 or fabs(values[i, j + 1] - val) > FP_ERR:
+                    if tiebreak == TIEBREAK_AVERAGE:
+                        for z in range(j - dups + 1, j + 1):
+                            ranks[i, argsorted[i, z]] = sum_ranks / dups
+                    elif tiebreak == TIEBREAK_MIN:
+                        for z in range(j - dups + 1, j + 1):
+                            ranks[i, argsorted[i, z]] = j - dups + 2
+                    elif tiebreak == TIEBREAK_MAX:
+                        for z in range(j - dups + 1, j + 1):
+                            ranks[i, argsorted[i, z]] = j + 1
+                    elif tiebreak == TIEBREAK_FIRST:
+                        for z in range(j - dups + 1, j + 1):
+                            ranks[i, argsorted[i, z]] = z + 1
+                    elif tiebreak == TIEBREAK_FIRST_DESCENDING:
+                        for z in range(j - dups + 1, j + 1):
+                            ranks[i, argsorted[i, z]] = 2 * j - z - dups + 2
+                    sum_ranks = dups = 0
 
     if axis == 0:
         return ranks.T
@@ -59,8 +59,8 @@ cimport util
 from util cimport is_array, _checknull, _checknan
 
 cdef extern from "math.h":
-    double sqrt(double x)
-    double fabs(double)
+    double sqrt(double x) nogil
+    double fabs(double) nogil
 
 # import datetime C API
 PyDateTime_IMPORT
@@ -223,6 +223,21 @@ def isnullobj2d(ndarray[object, ndim=2] arr):
                 result[i, j] = 1
     return result.view(np.bool_)
 
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def memory_usage_of_objects(ndarray[object, ndim=1] arr):
+    """
+    Total size in bytes of the Python objects referenced by arr, not
+    including the array of pointers itself
+    """
+    cdef Py_ssize_t i, n
+    cdef int64_t size = 0
+
+    n = len(arr)
+    for i from 0 <= i < n:
+        size += arr[i].__sizeof__()
+    return size
+
 def list_to_object_array(list obj):
     '''
     Convert list to object ndarray. Seriously can't believe I had to write this
@@ -704,3 +719,4 @@ include "properties.pyx"
 include "inference.pyx"
 include "join.pyx"
 include "engines.pyx"
+include "json.pyx"
@@ -50,6 +50,9 @@ cdef inline set_value_at(ndarray arr, object loc, object value):
     elif i >= sz:
         raise IndexError('index out of bounds')
 
+    if not cnp.PyArray_ISWRITEABLE(arr):
+        raise ValueError('assignment destination is read-only')
+
     assign_value_1d(arr, i, value)
 
 cdef inline int is_contiguous(ndarray arr):
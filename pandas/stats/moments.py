@@ -248,7 +248,7 @@ def _rolling_moment(arg, window, func, minp, axis=0, freq=None,
     y : type of input
     """
     arg = _conv_timerule(arg, freq, time_rule)
-    calc = lambda x: func(x, window, minp=minp, **kwargs)
+    calc = _as_float64_kernel(lambda x: func(x, window, minp=minp, **kwargs))
     return_hook, values = _process_data_structure(arg)
     # actually calculate the moment. Faster way to do this?
     result = np.apply_along_axis(calc, axis, values)
@@ -267,7 +267,8 @@ def _process_data_structure(arg, kill_inf=True):
         return_hook = lambda v: v
         values = arg
 
-    if not issubclass(values.dtype.type, float):
+    # float32 input is kept as is, see _as_float64_kernel
+    if values.dtype not in (np.float32, np.float64):
         values = values.astype(float)
 
     if kill_inf:
@@ -276,6 +277,19 @@ def _process_data_structure(arg, kill_inf=True):
 
     return return_hook, values
 
+def _as_float64_kernel(func):
+    """
+    Wrap a Cython moment function taking and returning 1-d float64 arrays so
+    that it can be applied to float32 data: each slice is converted on the way
+    in (the kernels accumulate in double precision) and the result converted
+    back to the input dtype, so only one slice at a time is widened
+    """
+    def wrapper(x):
+        if x.dtype == np.float64:
+            return func(x)
+        return func(x.astype(np.float64)).astype(x.dtype)
+    return wrapper
+
 #-------------------------------------------------------------------------------
 # Exponential moving moments
 
@@ -306,7 +320,7 @@ def ewma(arg, com=None, span=None, min_periods=0, freq=None, time_rule=None,
         return result
 
     return_hook, values = _process_data_structure(arg)
-    output = np.apply_along_axis(_ewma, 0, values)
+    output = np.apply_along_axis(_as_float64_kernel(_ewma), 0, values)
     return return_hook(output)
 
 def _first_valid_index(arr):
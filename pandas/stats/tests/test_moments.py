@@ -279,6 +279,21 @@ class TestMoments(unittest.TestCase):
         result = mom.ewma(arr, span=100, adjust=False).sum()
         self.assert_(np.abs(result - 1) < 1e-2)
 
+    def test_float32(self):
+        arr = self.arr.astype(np.float32)
+        frame = DataFrame({'A': arr, 'B': arr * 2})
+
+        for f in [lambda x: mom.rolling_mean(x, 20),
+                  lambda x: mom.rolling_std(x, 20),
+                  lambda x: mom.ewma(x, com=10)]:
+            result = f(arr)
+            self.assertEqual(result.dtype, np.float32)
+            assert_almost_equal(result.astype(np.float64),
+                                f(arr.astype(np.float64)))
+
+            result = f(frame)
+            self.assert_((result.dtypes == np.float32).all())
+
     def test_ewmvar(self):
         self._check_ew(mom.ewmvar)
 
@@ -236,6 +236,60 @@ class TestTake(unittest.TestCase):
         expected = arr.take(indexer)
         expected[-1] = np.nan
         tm.assert_almost_equal(result, expected)
+        self.assertEqual(result.dtype, np.float32)
+
+        # small integers upcast to float32
+        result = com.take_1d(np.arange(10, dtype=np.int16), indexer)
+        self.assertEqual(result.dtype, np.float32)
+        tm.assert_almost_equal(result, [1, 2, 3, np.nan])
+
+    def test_take_upcast(self):
+        indexer = [2, -1, 0]
+
+        arr = np.arange(5)
+        result = com.take_1d(arr, indexer)
+        self.assertEqual(result.dtype, np.float64)
+        tm.assert_almost_equal(result, [2, np.nan, 0])
+
+        arr = np.array([True, False, True])
+        result = com.take_1d(arr, indexer)
+        self.assertEqual(result.dtype, np.object_)
+        tm.assert_almost_equal(result, [True, np.nan, True])
+        self.assert_(result[0] is True)
+
+        arr = np.arange(12, dtype=np.int8).reshape(3, 4)
+        result = com.take_2d(arr, indexer, axis=0)
+        self.assertEqual(result.dtype, np.float32)
+        expected = arr.take([2, 0, 0], axis=0).astype(np.float32)
+        expected[1] = np.nan
+        tm.assert_almost_equal(result, expected)
+
+        result = com.take_2d(arr, indexer, axis=1)
+        expected = arr.take([2, 0, 0], axis=1).astype(np.float32)
+        expected[:, 1] = np.nan
+        tm.assert_almost_equal(result, expected)
+
+        # into a float64 buffer
+        out = np.empty((3, 4))
+        com.take_2d(arr.astype(np.int64), indexer, axis=0, out=out)
+        expected = arr.take([2, 0, 0], axis=0).astype(np.float64)
+        expected[1] = np.nan
+        tm.assert_almost_equal(out, expected)
+
+        result = com.take_2d_multi(arr.astype(np.int64), np.array(indexer),
+                                   np.array([3, -1]))
+        tm.assert_almost_equal(result, [[11, np.nan], [np.nan, np.nan],
+                                        [3, np.nan]])
+
+    def test_pad_float32(self):
+        arr = np.array([1, np.nan, 3, np.nan], dtype=np.float32)
+        com.pad_1d(arr)
+        self.assertEqual(arr.dtype, np.float32)
+        tm.assert_almost_equal(arr, [1, 1, 3, 3])
+
+        arr = np.array([[np.nan, 1, np.nan, 3]], dtype=np.float32)
+        com.backfill_2d(arr)
+        tm.assert_almost_equal(arr, [[1, 1, 3, 3]])
 
     def test_2d_other_dtypes(self):
         arr = np.random.randn(10, 5).astype(np.float32)
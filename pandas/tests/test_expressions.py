@@ -0,0 +1,130 @@
+import nose
+import operator
+import unittest
+
+import numpy as np
+
+from pandas import DataFrame, Series
+import pandas.core.expressions as expr
+from pandas.util.testing import assert_frame_equal, assert_series_equal
+
+_frame = DataFrame(np.random.randn(10000, 4), columns=list('ABCD'))
+_mixed = DataFrame({'A': _frame['A'].copy(),
+                    'B': _frame['B'].astype('int64'),
+                    'C': _frame['C'].astype('float32'),
+                    'D': _frame['D'] > 0})
+
+
+class TestExpressions(unittest.TestCase):
+
+    def setUp(self):
+        self.frame = _frame.copy()
+        self.mixed = _mixed.copy()
+        self._use_numexpr = expr._USE_NUMEXPR
+        self._chunksize = expr._EVAL_CHUNKSIZE
+
+    def tearDown(self):
+        expr._USE_NUMEXPR = self._use_numexpr
+        expr._EVAL_CHUNKSIZE = self._chunksize
+
+    def test_can_use_numexpr(self):
+        expr._USE_NUMEXPR = True
+        values = self.frame.values
+        ints = values.astype('int64')
+        small = values[:10]
+
+        self.assert_(expr._can_use_numexpr('+', values, values))
+        self.assert_(expr._can_use_numexpr('+', values, 2))
+        self.assert_(expr._can_use_numexpr('/', values, 1.5))
+        self.assert_(expr._can_use_numexpr('>', ints, 1.5))
+        self.assert_(expr._can_use_numexpr('&', values > 0, values < 1))
+
+        self.assert_(not expr._can_use_numexpr(None, values, values))
+        self.assert_(not expr._can_use_numexpr('+', small, small))
+        self.assert_(not expr._can_use_numexpr('+', values, ints))
+        self.assert_(not expr._can_use_numexpr('/', ints, ints))
+        self.assert_(not expr._can_use_numexpr('+', values > 0, True))
+        self.assert_(not expr._can_use_numexpr('+', values, 'foo'))
+        self.assert_(not expr._can_use_numexpr('+', values.astype('float32'),
+                                                2))
+        self.assert_(not expr._can_use_numexpr('+', values.astype(object),
+                                                values.astype(object)))
+
+        expr._USE_NUMEXPR = False
+        self.assert_(not expr._can_use_numexpr('+', values, values))
+
+    def test_evaluate_fallback(self):
+        expr._USE_NUMEXPR = False
+        values = self.frame.values
+        result = expr.evaluate(operator.add, '+', values, values)
+        self.assert_(np.array_equal(result, values + values))
+
+        result = expr.evaluate(lambda x, y: y - x, '-', values, 1,
+                               reverse=True)
+        self.assert_(np.array_equal(result, 1 - values))
+
+    def _check_ops(self, frame):
+        ops = [lambda x, y: x + y, lambda x, y: x - y, lambda x, y: x * y,
+               lambda x, y: x / y, lambda x, y: x > y, lambda x, y: x == y,
+               lambda x, y: y - x]
+
+        for op in ops:
+            for other in [frame, 2, 1.5]:
+                expr.set_use_numexpr(False)
+                expected = op(frame, other)
+                expr.set_use_numexpr(True)
+                result = op(frame, other)
+                assert_frame_equal(result, expected)
+
+            for col in frame.columns:
+                expr.set_use_numexpr(False)
+                expected = op(frame[col], frame[col])
+                expr.set_use_numexpr(True)
+                result = op(frame[col], frame[col])
+                assert_series_equal(result, expected)
+
+    def test_frame_ops(self):
+        if not expr._NUMEXPR_INSTALLED:
+            raise nose.SkipTest('numexpr not installed')
+        self._check_ops(self.frame)
+        self._check_ops(self.mixed[['A', 'B', 'C']])
+
+        expr.set_use_numexpr(False)
+        expected = self.mixed['D'] & (self.frame['A'] > 0)
+        expr.set_use_numexpr(True)
+        result = self.mixed['D'] & (self.frame['A'] > 0)
+        assert_series_equal(result, expected)
+
+    def test_eval_frame(self):
+        df = self.mixed
+        A, B, C, D = [df[c].values for c in 'ABCD']
+        expected = {
+            'A + B * 2': A + B * 2,
+            'A / B': A / B,
+            'B / 2': B / 2.,
+            '(A > 0) & (B < C * 2)': (A > 0) & (B < C * 2),
+            '0 < A <= 1 or not D': (0 < A) & (A <= 1) | ~D,
+            'B % 3': B % 3,
+            '-A ** 2': -A ** 2,
+            'D | (A > B)': D | (A > B),
+        }
+
+        expr._USE_NUMEXPR = False
+        expr._EVAL_CHUNKSIZE = 1000
+        for e, values in expected.iteritems():
+            result = expr.eval_frame(e, df)
+            self.assert_(np.array_equal(result, values))
+            self.assertEqual(result.dtype, values.dtype)
+
+        if not expr._NUMEXPR_INSTALLED:
+            raise nose.SkipTest('numexpr not installed')
+
+        expr._USE_NUMEXPR = True
+        for e, values in expected.iteritems():
+            result = expr.eval_frame(e, df)
+            self.assert_(np.allclose(result, values))
+            self.assertEqual(result.dtype, values.dtype)
+
+if __name__ == '__main__':
+    nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
+                   exit=False)
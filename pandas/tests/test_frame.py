@@ -21,7 +21,7 @@ import pandas.core.common as com
 import pandas.core.format as fmt
 import pandas.core.datetools as datetools
 from pandas.core.api import (DataFrame, Index, Series, notnull, isnull,
-                             MultiIndex, DatetimeIndex)
+                             MultiIndex, DatetimeIndex, Categorical)
 from pandas.io.parsers import (ExcelFile, ExcelWriter, read_csv)
 
 from pandas.util.testing import (assert_almost_equal,
@@ -1556,6 +1556,25 @@ class TestDataFrame(unittest.TestCase, CheckIndexing,
         should_be_view[0][0] = 97
         self.assertEqual(df.values[0, 0], 97)
 
+    def test_float32_preserved(self):
+        arr = np.random.randn(10).astype(np.float32)
+        df = DataFrame({'A': arr, 'B': arr * 2})
+        self.assert_((df.dtypes == np.float32).all())
+        self.assertEqual(df.values.dtype, np.float32)
+
+        df['C'] = np.arange(10.)
+        self.assertEqual(df['C'].dtype, np.float64)
+        self.assertEqual(df['A'].dtype, np.float32)
+        self.assertEqual(df.values.dtype, np.float64)
+
+        result = df.reindex(range(12))
+        self.assertEqual(result['A'].dtype, np.float32)
+        self.assert_(isnull(result['A'][10:]).all())
+
+        result = result.fillna(method='pad')
+        self.assertEqual(result['A'].dtype, np.float32)
+        self.assertEqual(result['A'][11], arr[9])
+
     def test_constructor_rec(self):
         rec = self.frame.to_records(index=False)
 
@@ -2698,6 +2717,34 @@ class TestDataFrame(unittest.TestCase, CheckIndexing,
         df.insert(0, 'baz', df['c'])
         self.assertEqual(df.columns.name, 'some_name')
 
+    def test_add_columns(self):
+        df = DataFrame(np.random.randn(5, 2), columns=['a', 'b'])
+        nblocks = len(df._data.blocks)
+
+        data = dict(('f%d' % i, np.random.randn(5)) for i in range(10))
+        data['i'] = np.arange(5)
+        data['s'] = Series(['x'] * 5, index=df.index[::-1])
+        data['k'] = 1.
+        data['b'] = df['a']
+        df.add_columns(data)
+
+        self.assert_(np.array_equal(df.columns,
+                                    ['a', 'b'] + sorted(set(data) - set('b'))))
+        # one new block per dtype
+        self.assertEqual(len(df._data.blocks), nblocks + 3)
+        for col in ['f3', 'i', 'b']:
+            assert_almost_equal(df[col], data[col])
+        self.assertEqual(df['i'].dtype, np.int64)
+        self.assert_((df['k'] == 1.).all())
+
+        df.add_columns({'y': [1, 2, 3, 4, 5], 'x': np.zeros(5)},
+                       columns=['y', 'x'])
+        self.assert_(np.array_equal(df.columns[-2:], ['y', 'x']))
+
+        other = DataFrame({'c1': np.arange(5), 'c2': np.arange(5) * 2.})
+        df[['n1', 'n2']] = other
+        assert_almost_equal(df['n2'], other['c2'])
+
     def test_delitem(self):
         del self.frame['A']
         self.assert_('A' not in self.frame)
@@ -3074,6 +3121,68 @@ class TestDataFrame(unittest.TestCase, CheckIndexing,
         added = DataFrame(df.values + val3, index=df.index, columns=df.columns)
         assert_frame_equal(df.add(val3), added)
 
+    def test_arith_inplace(self):
+        df = self.mixed_frame.copy()
+        df['int'] = np.arange(len(df))
+        numeric = df.ix[:, ['A', 'B', 'C', 'D', 'int']]
+
+        for op in ['add', 'sub', 'mul', 'div', 'radd', 'rsub', 'rmul']:
+            for other in [2, 1.5, numeric, numeric['A'] + 1,
+                          numeric.xs(numeric.index[0])]:
+                frame = numeric.copy()
+                kwds = {}
+                if isinstance(other, Series) and len(other) == len(frame):
+                    kwds['axis'] = 'index'
+                expected = getattr(frame, op)(other, **kwds)
+                result = getattr(frame, op)(other, inplace=True, **kwds)
+                self.assert_(result is frame)
+                assert_frame_equal(frame, expected)
+
+        # float blocks are modified without reallocating, columns taken
+        # before see the result
+        frame = numeric.copy()
+        col = frame['A']
+        fvalues = [b.values for b in frame._data.blocks
+                   if b.dtype == np.float64][0]
+        frame *= 2
+        frame += 1
+        self.assert_(any(b.values is fvalues for b in frame._data.blocks))
+        assert_almost_equal(col, numeric['A'] * 2 + 1)
+        assert_frame_equal(frame, numeric * 2 + 1)
+
+        # the int column is replaced when it cannot hold the result
+        frame = numeric.copy()
+        frame += 0.5
+        self.assertEqual(frame['int'].dtype, np.float64)
+        assert_frame_equal(frame, numeric + 0.5)
+
+        frame = DataFrame({'a': np.arange(3), 'b': np.arange(3)})
+        other = DataFrame({'a': [0.5] * 3, 'b': [1] * 3})
+        expected = frame + other
+        frame += other
+        assert_frame_equal(frame, expected)
+        self.assertEqual(frame['b'].dtype, np.int64)
+
+        # copies are not affected
+        frame = numeric.copy()
+        copy = frame.copy()
+        frame -= frame
+        self.assert_((frame.values == 0).all())
+        assert_frame_equal(copy, numeric)
+
+        # object columns and unaligned objects
+        frame = df.copy()
+        frame['foo'] += '_x'
+        self.assertEqual(frame['foo'][0], df['foo'][0] + '_x')
+
+        frame = numeric.copy()
+        frame += numeric[:5]
+        assert_frame_equal(frame, numeric + numeric[:5])
+
+        frame = numeric.copy()
+        frame.add(numeric[:5], fill_value=0, inplace=True)
+        assert_frame_equal(frame, numeric.add(numeric[:5], fill_value=0))
+
     def test_combineFrame(self):
         frame_copy = self.frame.reindex(self.frame.index[::2])
 
@@ -3114,6 +3223,40 @@ class TestDataFrame(unittest.TestCase, CheckIndexing,
 
         assert_frame_equal(reverse + self.frame, self.frame * 2)
 
+    def test_combine_blockwise(self):
+        df = DataFrame({'a': np.random.randn(5),
+                        'b': np.arange(5),
+                        'c': np.random.randn(5),
+                        'd': np.arange(5) * 2,
+                        'e': [True, False] * 2 + [True]},
+                       columns=['a', 'b', 'c', 'd', 'e'])
+        other = df.reindex(columns=['e', 'c', 'b', 'a', 'd'])
+        other['c'] = np.arange(5)   # c is an int column on this side
+
+        def _check(result, op):
+            self.assert_(result.columns.equals(df.columns))
+            for col in df.columns:
+                assert_series_equal(result[col], op(df[col], other[col]))
+
+        _check(df + other, operator.add)
+        _check(df * other, operator.mul)
+        self.assertEqual(df.add(other)['b'].dtype, np.int64)
+        self.assertEqual(df.add(other)['c'].dtype, np.float64)
+
+        # fill_value applies to mixed-type frames too
+        df.ix[0, 'a'] = nan
+        result = df.add(other.reindex(columns=['a', 'b']), fill_value=0)
+        self.assertEqual(result['a'][0], other['a'][0])
+        self.assertEqual(result['b'][1], df['b'][1] * 2)
+        assert_series_equal(result['c'], df['c'])
+
+        # scalars preserve the block dtypes
+        result = df[['a', 'b', 'd']] * 2
+        self.assertEqual(result['b'].dtype, np.int64)
+        assert_series_equal(result['a'], df['a'] * 2)
+        self.assert_(np.array_equal((df[['a', 'b']] > 0).values,
+                                    df[['a', 'b']].values > 0))
+
     def test_combineSeries(self):
 
         # Series
@@ -3208,6 +3351,14 @@ class TestDataFrame(unittest.TestCase, CheckIndexing,
         assert_frame_equal(df[mask_b], df.ix[0:0,:])
         assert_frame_equal(df[-mask_b], df.ix[1:1,:])
 
+    def test_mixed_string_comparison(self):
+        df = DataFrame({'a': [1., 2], 'b': ['x', 'y'], 'c': [1, 2]},
+                       columns=['a', 'b', 'c'])
+        expected = DataFrame({'a': [False, False], 'b': [True, False],
+                              'c': [False, False]}, columns=['a', 'b', 'c'])
+        assert_frame_equal(df == 'x', expected)
+        assert_frame_equal(df != 'x', -expected)
+
     def test_float_none_comparison(self):
         df = DataFrame(np.random.randn(8, 3), index=range(8),
                        columns=['A', 'B', 'C'])
@@ -3661,6 +3812,81 @@ class TestDataFrame(unittest.TestCase, CheckIndexing,
         frame.info(verbose=False)
         sys.stdout = sys.__stdout__
 
+    def test_info_memory_usage(self):
+        frame = DataFrame({'a': np.arange(10), 'b': np.random.randn(10)})
+        io = StringIO()
+        frame.info(buf=io)
+        self.assert_('memory usage: 240.0 bytes' in io.getvalue())
+
+        frame['c'] = 'foo'
+        io = StringIO()
+        frame.info(buf=io)
+        self.assert_('memory usage: 320.0+ bytes' in io.getvalue())
+
+        io = StringIO()
+        frame.info(buf=io, memory_usage='deep')
+        self.assert_('+ bytes' not in io.getvalue())
+
+        io = StringIO()
+        frame.info(buf=io, memory_usage=False)
+        self.assert_('memory usage' not in io.getvalue())
+
+    def test_memory_usage(self):
+        frame = DataFrame({'a': np.arange(10), 'b': np.random.randn(10),
+                           'c': ['foo'] * 10}, columns=['a', 'b', 'c'])
+        result = frame.memory_usage()
+        self.assert_(np.array_equal(result.index, ['Index', 'a', 'b', 'c']))
+        self.assert_(np.array_equal(result.values, [80, 80, 80, 80]))
+
+        result = frame.memory_usage(index=False)
+        self.assert_(result.index.equals(frame.columns))
+
+        deep = frame.memory_usage(index=False, deep=True)
+        self.assertEqual(deep['a'], 80)
+        self.assert_(deep['c'] > 80)
+
+    def test_categorical_column(self):
+        keys = np.array(['b', 'a', np.nan, 'c', 'a'] * 20, dtype=object)
+        dense = DataFrame({'key': keys, 'value': np.arange(100)},
+                          columns=['key', 'value'])
+        df = DataFrame({'key': Categorical.from_array(keys),
+                        'value': np.arange(100)}, columns=['key', 'value'])
+        self.assert_(df._data.get_categorical('key') is not None)
+        self.assertEqual(df['key'].dtype, np.object_)
+        assert_frame_equal(df, dense)
+        self.assert_(df.memory_usage()['key'] < dense.memory_usage()['key'])
+
+        assert_frame_equal(df[df['key'] == 'a'], dense[dense['key'] == 'a'])
+        assert_frame_equal(df[df['key'] != 'a'], dense[dense['key'] != 'a'])
+        self.assert_(not (df['key'] == 'z').any())
+        assert_series_equal(df['key'].value_counts(),
+                            dense['key'].value_counts())
+
+        # missing values sort last
+        result = df.sort_index(by='key')
+        expected = dense[dense['key'].notnull()].sort_index(by='key')
+        assert_frame_equal(result[:80], expected)
+        self.assert_(result['key'][80:].isnull().all())
+        mask = dense['key'].notnull()
+        result = df[mask].sort_index(by=['key', 'value'], ascending=False)
+        expected = dense[mask].sort_index(by=['key', 'value'],
+                                          ascending=False)
+        assert_frame_equal(result, expected)
+
+        # row selections and copies keep the codes
+        for result in [df[:10], df.take([0, 3, 4]), df.copy(),
+                       pickle.loads(pickle.dumps(df)),
+                       df.reindex(range(105)), df.fillna('z')]:
+            self.assert_(result._data.get_categorical('key') is not None)
+        assert_frame_equal(df.reindex(range(105)), dense.reindex(range(105)))
+        assert_frame_equal(df.fillna('z'), dense.fillna('z'))
+
+        # the column values are read-only, writing densifies the column
+        self.assertRaises(ValueError, df['key'].__setitem__, 0, 'z')
+        df.ix[0, 'key'] = 'z'
+        self.assert_(df._data.get_categorical('key') is None)
+        self.assertEqual(df['key'][0], 'z')
+
     def test_info_duplicate_columns(self):
         io = StringIO()
 
@@ -3683,6 +3909,24 @@ class TestDataFrame(unittest.TestCase, CheckIndexing,
         assert_frame_equal(converted, self.mixed_frame)
         self.assert_(converted['A'].dtype == np.float64)
 
+    def test_intern_strings(self):
+        make = lambda s: ''.join(list(s))
+        frame = DataFrame({'a': [make('foo'), make('bar'), make('foo')],
+                           'b': [make('bar'), np.nan, make('foo')],
+                           'c': [1., 2., 3.]})
+        self.assert_(frame['a'][0] is not frame['a'][2])
+
+        result = frame.intern_strings()
+        assert_frame_equal(result, frame)
+        self.assert_(result['a'][0] is result['a'][2])
+        self.assert_(result['a'][0] is result['b'][2])
+        self.assert_(result['a'][1] is result['b'][0])
+        self.assert_(frame['a'][0] is not frame['a'][2])
+
+        result = frame.intern_strings(inplace=True)
+        self.assert_(result is frame)
+        self.assert_(frame['a'][0] is frame['a'][2])
+
     def test_convert_objects_no_conversion(self):
         mixed1 = DataFrame({'a': [1,2,3], 'b': [4.0, 5, 6], 'c': ['x','y','z']})
         mixed2 = mixed1.convert_objects()
@@ -3809,6 +4053,47 @@ class TestDataFrame(unittest.TestCase, CheckIndexing,
         copy = self.mixed_frame.copy()
         self.assert_(copy._data is not self.mixed_frame._data)
 
+    def test_copy_on_write(self):
+        df = DataFrame({'a': np.random.randn(10), 'b': np.random.randn(10),
+                        'c': np.arange(10)})
+        expected = df.copy()
+        cop = df.copy()
+        reindexed = df.reindex(index=df.index, columns=df.columns)
+
+        def _shares(left, right):
+            return all(np.may_share_memory(lb.values, rb.values)
+                       for lb, rb in zip(left._data.blocks,
+                                         right._data.blocks))
+
+        self.assert_(_shares(cop, df))
+        self.assert_(_shares(reindexed, df))
+
+        cop['a'][:5] = 0
+        cop.ix[0, 'c'] = 100
+        reindexed['b'][:] = 1
+        df['b'] = 5.
+        assert_series_equal(df['a'], expected['a'])
+        assert_series_equal(df['c'], expected['c'])
+
+        self.assert_((cop['a'][:5] == 0).all())
+        self.assertEqual(cop['c'][0], 100)
+        self.assert_((reindexed['b'] == 1).all())
+        assert_series_equal(reindexed['a'], expected['a'])
+
+        # slices remain views of the frame they came from
+        cop = df.copy()
+        sliced = cop[:5]
+        sliced['a'] = 7.
+        self.assert_((cop['a'][:5] == 7).all())
+        self.assert_(not (df['a'] == 7).any())
+
+        # the values of the blocks stay writeable
+        df = DataFrame({'a': np.random.randn(10), 'b': np.random.randn(10)})
+        cop = df.copy()
+        self.assert_(_shares(cop, df))
+        cop._data.blocks[0].values[0, 0] = 7.
+        self.assertEqual(cop['a'][0], 7)
+
     # def test_copy_index_name_checking(self):
     #     # don't want to be able to modify the index stored elsewhere after
     #     # making a copy
@@ -4362,6 +4647,17 @@ class TestDataFrame(unittest.TestCase, CheckIndexing,
         result = df.replace(False, True)
         self.assert_(result.values.all())
 
+        # ints with missing values, the value needing the upcast dtype
+        df = DataFrame({'a': np.arange(3), 'b': np.arange(3) * 2})
+        result = df.reindex([0, 1, 5]).replace([1, 2], [2, 1.5])
+        expected = DataFrame({'a': [0, 2, np.nan], 'b': [0, 1.5, np.nan]},
+                             index=[0, 1, 5])
+        assert_frame_equal(result, expected)
+        result = df.reindex([0, 1, 5]).replace(2, 2.5)
+        expected = DataFrame({'a': [0, 1, np.nan], 'b': [0, 2.5, np.nan]},
+                             index=[0, 1, 5])
+        assert_frame_equal(result, expected)
+
         #complex blocks
         df = DataFrame({'complex': [1j, 2j, 3j]})
         result = df.replace(1j, 0j)
@@ -4702,6 +4998,19 @@ class TestDataFrame(unittest.TestCase, CheckIndexing,
         smaller = self.intframe.reindex(columns=['A', 'B'])
         self.assert_(smaller['A'].dtype == np.int64)
 
+    def test_reindex_int_with_na_writeable(self):
+        # the columns of int data taken with missing labels write through
+        df = DataFrame({'a': np.arange(3), 'b': np.arange(3) * 2})
+        df = df.reindex([0, 1, 5])
+        df['a'][0] = 7
+        df.set_value(1, 'a', 8)
+        s = df['b']
+        s[0] = 9
+        df.values[1, 1] = 10
+        expected = DataFrame({'a': [7., 8, np.nan], 'b': [9., 10, np.nan]},
+                             index=[0, 1, 5])
+        assert_frame_equal(df, expected)
+
     def test_reindex_like(self):
         other = self.frame.reindex(index=self.frame.index[:10],
                                    columns=['C', 'B'])
@@ -5412,6 +5721,43 @@ class TestDataFrame(unittest.TestCase, CheckIndexing,
         result = empty.filter(like='foo')
         assert_frame_equal(result, empty)
 
+    def test_eval(self):
+        df = self.mixed_frame.copy()
+        df['int'] = np.arange(len(df))
+
+        assert_series_equal(df.eval('A + B * 2'), df['A'] + df['B'] * 2)
+        assert_series_equal(df.eval('-(A - 1) ** 2'), -(df['A'] - 1) ** 2)
+        assert_series_equal(df.eval('int / 2'), df['int'] / 2.)
+        assert_series_equal(df.eval('int % 3'), df['int'] % 3)
+        assert_series_equal(df.eval('0 < A <= B'),
+                            (df['A'] > 0) & (df['A'] <= df['B']))
+        assert_series_equal(df.eval('A > 0 and not foo == "bar"'),
+                            (df['A'] > 0) & (df['foo'] != 'bar'))
+        assert_series_equal(df.eval('A * x', local_dict={'x': 2}),
+                            df['A'] * 2)
+        self.assertEqual(df.eval('1 + 2'), 3)
+
+        self.assertRaises(NameError, df.eval, 'A + missing')
+        self.assertRaises(ValueError, df.eval, 'A(1)')
+        self.assertRaises(ValueError, df.eval, 'A in B')
+        self.assertRaises(ValueError, df.eval, 'A +')
+
+    def test_query(self):
+        df = self.mixed_frame.copy()
+
+        result = df.query('(A > 0) & (B < C * 2)')
+        assert_frame_equal(result, df[(df['A'] > 0) & (df['B'] < df['C'] * 2)])
+
+        result = df.query('foo == "bar" or D < 0')
+        assert_frame_equal(result, df[(df['foo'] == 'bar') | (df['D'] < 0)])
+
+        cutoff = df.index[5]
+        result = df.query('index > cutoff', local_dict={'cutoff': cutoff})
+        assert_frame_equal(result, df[df.index > cutoff])
+
+        self.assertRaises(ValueError, df.query, 'A + 1')
+        self.assertEqual(len(df[:0].query('A > 0')), 0)
+
     def test_select(self):
         f = lambda x: x.weekday() == 2
         result = self.tsframe.select(f, axis=0)
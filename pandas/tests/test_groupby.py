@@ -1066,6 +1066,20 @@ class TestGroupBy(unittest.TestCase):
         _testit(lambda x: x.min())
         _testit(lambda x: x.max())
 
+    def test_cython_agg_float32(self):
+        df = DataFrame({'A': np.random.randint(0, 5, 50),
+                        'B': np.random.randn(50).astype(np.float32)})
+        df['B'][::7] = nan
+        grouped = df.groupby('A')['B']
+
+        for f in ['sum', 'prod', 'mean', 'min', 'max', 'var', 'std',
+                  'first', 'last']:
+            result = getattr(grouped, f)()
+            self.assertEqual(result.dtype, np.float32)
+            expected = getattr(df.astype(np.float64).groupby('A')['B'], f)()
+            assert_almost_equal(result.values.astype(np.float64),
+                                expected.values)
+
     def test_cython_agg_boolean(self):
         frame = DataFrame({'a': np.random.randint(0, 5, 50),
                            'b': np.random.randint(0, 2, 50).astype('bool')})
@@ -2061,6 +2075,26 @@ class TestGroupBy(unittest.TestCase):
         exp = data.groupby(labels).mean().reindex(cats.levels)
         assert_series_equal(result, exp)
 
+    def test_groupby_categorical_column(self):
+        keys = np.array(['c', 'a', np.nan, 'c', 'b', 'a', 'c'], dtype=object)
+        dense = DataFrame({'key': keys, 'value': np.arange(7.)},
+                          columns=['key', 'value'])
+        df = dense.copy()
+        df['key'] = Categorical.from_array(keys)
+        self.assert_(df['key']._categorical is not None)
+
+        # levels not observed in the column are not groups
+        df2 = df[df['key'] != 'b']
+        for frame, expected in [(df, dense), (df2, dense[dense['key'] != 'b'])]:
+            for sort in [True, False]:
+                result = frame.groupby('key', sort=sort).sum()
+                exp = expected.groupby('key', sort=sort).sum()
+                assert_frame_equal(result, exp)
+
+        result = df.groupby(['key', df['value'] > 2]).sum()
+        expected = dense.groupby(['key', dense['value'] > 2]).sum()
+        assert_frame_equal(result, expected)
+
 def _check_groupby(df, result, keys, field, f=lambda x: x.sum()):
     tups = map(tuple, df[keys].values)
     tups = com._asarray_tuplesafe(tups)
@@ -91,6 +91,19 @@ class TestIndex(unittest.TestCase):
         i_copy = i.copy()
         self.assert_(i_copy.name == 'Foo')
 
+    def test_memory_usage(self):
+        index = Index(['a', 'bb', 'ccc'])
+        shallow = index.memory_usage()
+        self.assertEqual(shallow, index.nbytes)
+        self.assert_(index.memory_usage(deep=True) > shallow)
+
+        # the engine's hash table counts once it has been built
+        index.get_loc('bb')
+        self.assert_(index.memory_usage() > shallow)
+
+        index = Int64Index(np.arange(100))
+        self.assertEqual(index.memory_usage(deep=True), index.nbytes)
+
     def test_view(self):
         i = Index([], name='Foo')
         i_view = i.view()
@@ -574,6 +587,34 @@ class TestInt64Index(unittest.TestCase):
         expected = np.array([0, -1, 1, -1, 2, -1, 3, -1, 4, -1])
         self.assert_(np.array_equal(indexer, expected))
 
+    def test_get_indexer_monotonic(self):
+        # merged without building the hash tables
+        target = Int64Index([-2, 0, 0, 5, 6, 18, 30])
+        indexer = self.index.get_indexer(target)
+        expected = np.array([-1, 0, 0, -1, 3, 9, -1])
+        self.assert_(np.array_equal(indexer, expected))
+        self.assertEqual(self.index._engine.sizeof(), 0)
+        self.assertEqual(target._engine.sizeof(), 0)
+
+        result = target.isin(self.index)
+        expected = np.array([False, True, True, False, True, True, False])
+        self.assert_(np.array_equal(result, expected))
+        self.assertEqual(self.index._engine.sizeof(), 0)
+
+        index = Index(['a', 'c', 'd', 'f'])
+        target = Index(['b', 'c', 'f', 'g'])
+        self.assert_(np.array_equal(index.get_indexer(target),
+                                    [-1, 1, 3, -1]))
+        self.assertEqual(index._engine.sizeof(), 0)
+
+        # values that do not compare with each other
+        target = Index([datetime(2000, 1, 1), datetime(2000, 1, 2)])
+        self.assert_(np.array_equal(index.get_indexer(target), [-1, -1]))
+
+        index = Index([1.5, np.nan, 2.5])
+        target = Index([1.5, 2.5])
+        self.assert_(np.array_equal(index.get_indexer(target), [0, 2]))
+
     def test_get_indexer_pad(self):
         target = Int64Index(np.arange(10))
         indexer = self.index.get_indexer(target, method='pad')
@@ -874,6 +915,13 @@ class TestMultiIndex(unittest.TestCase):
     def test_constructor_no_levels(self):
         self.assertRaises(Exception, MultiIndex, levels=[], labels=[])
 
+    def test_memory_usage(self):
+        shallow = self.index.memory_usage()
+        expected = (sum(lev.nbytes for lev in self.index.levels) +
+                    sum(lab.nbytes for lab in self.index.labels))
+        self.assert_(shallow >= expected)
+        self.assert_(self.index.memory_usage(deep=True) > shallow)
+
     def test_copy(self):
         i_copy = self.index.copy()
 
@@ -977,6 +1025,16 @@ class TestMultiIndex(unittest.TestCase):
         pickled = pickle.dumps(self.index)
         unpickled = pickle.loads(pickled)
         self.assert_(self.index.equals(unpickled))
+        self.assertEqual(unpickled.names, self.index.names)
+        for labels in unpickled.labels:
+            self.assert_(labels.dtype == np.int_)
+
+        # labels of a large level don't fit the compact type
+        index = MultiIndex(levels=[np.arange(1000), ['a', 'b']],
+                           labels=[np.arange(1000).repeat(2),
+                                   np.tile([0, 1], 1000)])
+        unpickled = pickle.loads(pickle.dumps(index, protocol=2))
+        self.assert_(index.equals(unpickled))
 
     def test_legacy_pickle(self):
         if py3compat.PY3:
@@ -1273,6 +1331,74 @@ class TestMultiIndex(unittest.TestCase):
         # self.assertRaises(Exception, idx1.get_indexer,
         #                   list(list(zip(*idx2._tuple_index))[0]))
 
+    def test_engine_no_tuples(self):
+        from pandas import Series
+        index = MultiIndex(levels=[['foo', 'bar', 'baz', 'qux'],
+                                   ['two', 'one']],
+                           labels=[[0, 0, 1, 2, 3, 3], [1, 0, 1, 0, 1, 0]])
+        other = MultiIndex(levels=[['qux', 'foo', 'abc'], ['one', 'two']],
+                           labels=[[1, 0, 2, 1], [1, 0, 0, -1]])
+
+        self.assertEqual(index.get_loc(('bar', 'one')), 2)
+        self.assert_(('qux', 'two') in index)
+        self.assert_(('qux', 'three') not in index)
+        self.assertRaises(KeyError, index._engine.get_loc, ('abc', 'one'))
+        self.assertRaises(KeyError, index._engine.get_loc, 'foo')
+
+        result = index.get_indexer(other)
+        assert_almost_equal(result, [1, 4, -1, -1])
+
+        self.assert_(index._tuples is None)
+        self.assert_(other._tuples is None)
+
+        expected = Index(index.values).get_indexer(other[:3].values)
+        assert_almost_equal(result[:3], expected)
+
+        s = Series(np.arange(6.), index=index)
+        self.assertEqual(s[('baz', 'two')], 3)
+        s[('baz', 'two')] = 10
+        self.assertEqual(s.get_value(('baz', 'two')), 10)
+
+    def test_engine_get_value_non_unique(self):
+        from pandas import Series
+        index = MultiIndex.from_tuples([('a', 1), ('b', 0), ('b', 0),
+                                        ('c', 2)])
+        s = Series(np.arange(4.), index=index)
+        self.assertRaises(KeyError, index._engine.get_loc, ('c', 0))
+
+        result = s[('a', 1)]
+        self.assert_(isinstance(result, Series))
+        self.assert_(result.index.equals(index[:1]))
+        assert_almost_equal(result, [0.])
+
+        result = s[('b', 0)]
+        self.assert_(result.index.equals(index[1:3]))
+        assert_almost_equal(result, [1., 2.])
+
+        result = s[('c', 0)]
+        self.assert_(isinstance(result, Series))
+        self.assertEqual(len(result), 0)
+
+    def test_engine_overflow(self):
+        # the packed codes of the tuples do not fit in int64
+        n = 1000
+        levels = [np.arange(n) * 3 for _ in range(8)]
+        labels = [np.random.permutation(n) for _ in range(8)]
+        index = MultiIndex(levels=levels, labels=labels)
+        self.assert_(index.is_unique)
+
+        for i in [0, 10, 999]:
+            self.assertEqual(index.get_loc(index[i]), i)
+
+        target = index[::-2]
+        result = index.get_indexer(target)
+        assert_almost_equal(result, np.arange(n)[::-2])
+
+        target = MultiIndex(levels=[lev + 1 for lev in levels],
+                            labels=labels)
+        result = index.get_indexer(target)
+        self.assert_((result == -1).all())
+
     def test_format(self):
         self.index.format()
         self.index[:0].format()
@@ -1625,6 +1751,25 @@ class TestMultiIndex(unittest.TestCase):
 
         self.assertRaises(Exception, self.index.join, self.index, level=1)
 
+    def test_join_multi(self):
+        other = MultiIndex(levels=[['bar', 'qux', 'zzz'], ['two', 'one']],
+                           labels=[[1, 0, 2, 1], [0, 1, 0, 1]])
+
+        for how in ['left', 'right', 'inner', 'outer']:
+            result, lidx, ridx = self.index.join(other, how=how,
+                                                 return_indexers=True)
+            expected, elidx, eridx = Index.join(self.index, other, how=how,
+                                                return_indexers=True)
+            self.assert_(isinstance(result, MultiIndex))
+            self.assert_(np.array_equal(result.values, expected.values))
+            assert_almost_equal(lidx, elidx)
+            assert_almost_equal(ridx, eridx)
+
+        result = self.index.join(self.index[::-1], how='left')
+        self.assert_(result is self.index)
+        result = self.index.join(self.index[:3], how='right')
+        self.assert_(np.array_equal(result.values, self.index[:3].values))
+
     def test_reindex(self):
         result, indexer = self.index.reindex(list(self.index[:4]))
         self.assert_(isinstance(result, MultiIndex))
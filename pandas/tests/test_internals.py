@@ -1,10 +1,11 @@
 # pylint: disable=W0102
 
+import cPickle
 import unittest
 
 import numpy as np
 
-from pandas import Index, MultiIndex, DataFrame, Series
+from pandas import Categorical, Index, MultiIndex, DataFrame, Series
 from pandas.core.internals import *
 import pandas.core.internals as internals
 import pandas.util.testing as tm
@@ -109,6 +110,43 @@ class TestBlock(unittest.TestCase):
         self.assert_(cop is not self.fblock)
         assert_block_equal(self.fblock, cop)
 
+    def test_copy_on_write(self):
+        # the values may be referenced elsewhere, so they are copied
+        block = get_float_ex().copy()
+        expected = block.values.copy()
+        cop = block.copy()
+        self.assert_(cop.values is block.values)
+        self.assert_(block.values.flags.writeable)
+
+        # the first one modified copies
+        cop.set('a', np.ones(N))
+        self.assert_(not np.may_share_memory(cop.values, block.values))
+        self.assert_((cop.get('a') == 1).all())
+        assert_almost_equal(block.values, expected)
+
+        # the other one is then the only user of the values
+        values = block.values
+        block.set('a', np.zeros(N))
+        self.assert_(block.values is values)
+
+        # shared blocks are unshared once the other ones are gone
+        cop = block.copy()
+        del cop
+        block.set('a', np.ones(N))
+        self.assert_(block.values is values)
+
+        # views of the values can't be shared
+        view = block.get('c')
+        cop = block.copy()
+        self.assert_(not np.may_share_memory(cop.values, block.values))
+
+        # neither can values the block was made with
+        values = get_float_mat(N, 3).T
+        block = make_block(values, ['a', 'c', 'e'], TEST_COLS)
+        cop = block.copy()
+        values[0, 0] = 100
+        self.assertNotEqual(cop.values[0, 0], 100)
+
     def test_items(self):
         cols = self.fblock.items
         self.assert_(np.array_equal(cols, ['a', 'c', 'e']))
@@ -184,6 +222,92 @@ class TestBlock(unittest.TestCase):
     def test_repr(self):
         pass
 
+    def test_categorical_block(self):
+        values = np.array(['b', 'a', np.nan, 'b'], dtype=object)
+        cat = Categorical.from_array(values)
+        block = make_block(cat, ['c'], ['c'])
+        self.assert_(isinstance(block, CategoricalBlock))
+        self.assertEqual(block.codes.dtype, np.int8)
+        self.assertEqual(block.shape, (1, 4))
+        assert_almost_equal(block.values[0], values)
+        self.assert_(not block.values.flags.writeable)
+        self.assert_(block.to_categorical().levels.equals(cat.levels))
+
+        result = block.reindex_axis(np.array([3, -1, 0]), None, False,
+                                    axis=1, fill_value='z')
+        assert_almost_equal(result.values[0], ['b', 'z', 'b'])
+        self.assert_(np.array_equal(result.levels, ['a', 'b', 'z']))
+
+        result = block.fillna('a')
+        assert_almost_equal(result.values[0], ['b', 'a', 'a', 'b'])
+        self.assert_(block.codes[0, 2] == -1)
+
+        result = block.replace('b', 'c')
+        assert_almost_equal(result.values[0], ['c', 'a', np.nan, 'c'])
+
+    def test_masked_block(self):
+        values = np.arange(20).reshape((2, 10))
+        values[0, 5] = 2 ** 60 + 1
+        block = make_block(values, ['b', 'd'], TEST_COLS)
+        indexer = np.array([5, -1, 2, -1])
+        result = block.reindex_axis(indexer, indexer == -1, True, axis=1)
+        self.assert_(isinstance(result, MaskedBlock))
+        self.assertEqual(result.data.dtype, np.int64)
+        self.assertEqual(result.dtype, np.float64)
+        self.assert_(np.array_equal(result.mask[0], [False, True, False, True]))
+        assert_almost_equal(result.values[1], [15, np.nan, 12, np.nan])
+        self.assert_(not result.values.flags.writeable)
+        self.assert_(np.isnan(result._get_scalar((0, 1))))
+        self.assertEqual(result._get_scalar((0, 0)), 2 ** 60 + 1)
+
+        # the mask is taken along
+        taken = result.take(np.array([1, 0, -1]), axis=1)
+        self.assert_(isinstance(taken, MaskedBlock))
+        self.assert_(np.array_equal(taken.mask[1], [True, False, True]))
+
+        # filling gives back the data without precision loss
+        filled = result.fillna(-1)
+        self.assert_(isinstance(filled, IntBlock))
+        self.assertEqual(filled.values[0, 0], 2 ** 60 + 1)
+        self.assert_(np.array_equal(filled.values[1], [15, -1, 12, -1]))
+        self.assert_(isinstance(result.fillna(0.5), FloatBlock))
+
+        # values the data can't hold are put in the upcast values
+        mask = np.array([[True, False, False, False]] * 2)
+        putmasked = result.putmask(mask, 2.5, inplace=True)
+        self.assert_(isinstance(putmasked, FloatBlock))
+        assert_almost_equal(putmasked.values[1], [2.5, np.nan, 12, np.nan])
+
+        result = get_bool_ex(['f']).take(np.array([0, -1]), axis=1)
+        self.assert_(isinstance(result, MaskedBlock))
+        self.assertEqual(result.dtype, np.object_)
+        assert_almost_equal(result.values[0], [True, np.nan])
+
+    def test_categorical_block_dense(self):
+        cat = Categorical(np.array([1, 0, -1, 1]), Index([1, 2]))
+        block = make_block(cat, ['c'], ['c'])
+        self.assertEqual(block.dtype, np.float64)
+
+        # new writeable values each time
+        dense = block.to_dense()
+        self.assert_(dense.flags.writeable)
+        self.assert_(dense is not block.to_dense())
+        assert_almost_equal(dense[0], [2, 1, np.nan, 2])
+        assert_almost_equal(block.get_values(np.dtype(object))[0],
+                            [2, 1, np.nan, 2])
+
+        # the missing flag follows the codes
+        block.fillna(1, inplace=True)
+        self.assertEqual(block.dtype, np.int64)
+        self.assert_(np.array_equal(block.get_values(np.dtype(np.int64)),
+                                    [[2, 1, 1, 2]]))
+        self.assertEqual(block.take(np.array([0, -1]), axis=1).dtype,
+                         np.float64)
+
+        pickled = cPickle.loads(cPickle.dumps(block, 2))
+        self.assert_(np.array_equal(pickled.codes, block.codes))
+        self.assert_(pickled.levels.equals(block.levels))
+
 
 class TestBlockManager(unittest.TestCase):
 
@@ -271,9 +395,68 @@ class TestBlockManager(unittest.TestCase):
         # share ref_items
         self.assert_(mgr2.blocks[0].ref_items is mgr2.blocks[1].ref_items)
 
+    def test_pickle_compact(self):
+        import pickle
+
+        items = Index(['a', 'b', 'c', 'd', 'e'])
+        blocks = [get_float_ex(['a', 'c']), get_obj_ex(['b', 'd']),
+                  get_dt_ex(['e'])]
+        blocks = [make_block(b.values, b.items, items) for b in blocks]
+        mgr = BlockManager(blocks, [items, np.arange(N)])
+
+        # block items are stored as positions, datetimes as int64
+        state = mgr.__getstate__()
+        self.assert_(isinstance(state, dict))
+        self.assert_(np.array_equal(state['block_locs'][1], [1, 3]))
+        self.assert_(state['block_values'][2].dtype == np.int64)
+
+        mgr2 = pickle.loads(pickle.dumps(mgr, protocol=2))
+        assert_frame_equal(DataFrame(mgr), DataFrame(mgr2))
+        self.assert_(mgr2.blocks[2].dtype == np.dtype('M8[ns]'))
+        for b1, b2 in zip(mgr.blocks, mgr2.blocks):
+            assert_block_equal(b1, b2)
+
+        # previous format
+        mgr3 = BlockManager.__new__(BlockManager)
+        mgr3.__setstate__((mgr.axes, [b.values for b in mgr.blocks],
+                           [b.items for b in mgr.blocks]))
+        assert_frame_equal(DataFrame(mgr), DataFrame(mgr3))
+
     def test_get(self):
         pass
 
+    def test_item_map(self):
+        def check(mgr):
+            for i, item in enumerate(mgr.items):
+                expected = [b.get(item) for b in mgr.blocks if item in b][0]
+                assert_almost_equal(mgr.get(item), expected)
+                assert_almost_equal(mgr.iget(i), expected)
+
+        mgr = self.mgr.copy()
+        check(mgr)
+
+        mgr.insert(0, 'baz', np.arange(N).reshape(1, N))
+        mgr.insert(3, 'qux', np.ones((1, N), dtype=bool))
+        check(mgr)
+
+        mgr.delete('c')
+        mgr.delete('baz')
+        check(mgr)
+
+        # moves the item to a new block
+        mgr.set('a', np.array(['foo'] * N, dtype=object))
+        check(mgr)
+        self.assert_(mgr.get('a')[0] == 'foo')
+
+        mgr._consolidate_inplace()
+        check(mgr)
+
+        # blocks shared with another manager
+        mgr2 = BlockManager(mgr.blocks, mgr.axes)
+        for b in mgr2.blocks:
+            b.ref_items = Index(['x'] * len(mgr.items))
+        check(mgr2)
+
     def test_get_scalar(self):
         for item in self.mgr.items:
             for i, index in enumerate(self.mgr.axes[1]):
@@ -309,6 +492,50 @@ class TestBlockManager(unittest.TestCase):
     def test_as_matrix(self):
         pass
 
+    def test_memory_usage(self):
+        result = self.mgr.memory_usage()
+        self.assertEqual(len(result), len(self.mgr.items))
+        for item, nbytes in zip(self.mgr.items, result):
+            self.assertEqual(nbytes, self.mgr.get(item).nbytes)
+
+        by_block = self.mgr.memory_usage(by_block=True)
+        self.assert_(np.array_equal(by_block,
+                                    [b.values.nbytes for b in self.mgr.blocks]))
+        self.assertEqual(by_block.sum(), result.sum())
+
+        deep = self.mgr.memory_usage(deep=True)
+        self.assert_(deep.sum() > result.sum())
+
+    def test_categorical(self):
+        n = 100
+        cat = Categorical.from_array(np.array(['a', 'b'] * (n // 2),
+                                              dtype=object))
+        items = Index(['a', 'b'])
+        blocks = [make_block(np.random.randn(1, n), ['a'], items),
+                  make_block(cat, ['b'], items)]
+        mgr = BlockManager(blocks, [items, np.arange(n)])
+        self.assert_(mgr.is_consolidated())
+        self.assert_(mgr.get_categorical('a') is None)
+        self.assert_(mgr.get_categorical('b').levels.equals(cat.levels))
+
+        self.assert_(mgr.memory_usage()[1] < mgr.get('b').nbytes)
+
+        dense = cat.levels.values.take(cat.labels)
+        assert_almost_equal(mgr.as_matrix()[1], dense)
+        assert_almost_equal(mgr.fast_2d_xs(3, copy=True), mgr.as_matrix()[:, 3])
+        assert_almost_equal(mgr.xs(3).as_matrix()[1], dense[3])
+
+        result = mgr.reindex_indexer(Index(['b', 'c', 'a', 'd']),
+                                     np.array([1, -1, 0, 1]), axis=0)
+        self.assert_(result.get_categorical('b') is not None)
+        self.assert_(result.get_categorical('d') is not None)
+        assert_almost_equal(result.get('d'), dense)
+
+        self.assert_(mgr.ensure_writeable(['b']))
+        self.assert_(mgr.get_categorical('b') is None)
+        self.assert_(mgr.get('b').flags.writeable)
+        assert_almost_equal(mgr.get('b'), cat.levels.values.take(cat.labels))
+
     def test_as_matrix_int_bool(self):
         items = Index(['a', 'b'])
 
@@ -345,6 +572,38 @@ class TestBlockManager(unittest.TestCase):
     def test_consolidate(self):
         pass
 
+    def test_deferred_consolidation(self):
+        import pandas.core.internals as internals
+
+        items = Index(['a'])
+        mgr = BlockManager([make_block(randn(1, 10), items, items)],
+                           [items, np.arange(10)])
+        for i in range(internals._CONSOLIDATE_MIN_BLOCKS - 1):
+            mgr.insert(len(mgr.items), 'i%d' % i, randn(1, 10))
+        self.assertEqual(mgr.nblocks, internals._CONSOLIDATE_MIN_BLOCKS)
+
+        # small managers consolidate past the block threshold
+        mgr.insert(len(mgr.items), 'x', randn(1, 10))
+        self.assertEqual(mgr.nblocks, 1)
+
+        # large ones wait until the new blocks are a fraction of the items
+        old_nbytes = internals._CONSOLIDATE_MIN_NBYTES
+        internals._CONSOLIDATE_MIN_NBYTES = 0
+        try:
+            values = randn(1000, 10)
+            mgr.insert_many(['b%d' % i for i in range(1000)], values)
+            self.assertEqual(mgr.nblocks, 2)
+            for i in range(200):
+                mgr.insert(len(mgr.items), 'j%d' % i, randn(1, 10))
+            self.assertEqual(mgr.nblocks, 202)
+        finally:
+            internals._CONSOLIDATE_MIN_NBYTES = old_nbytes
+
+        assert_almost_equal(mgr.get('b500'), values[500])
+        self.assertRaises(Exception, mgr.insert_many, ['b1'], [randn(10)])
+        self.assertRaises(Exception, mgr.insert_many, ['z', 'z'],
+                          [randn(10), randn(10)])
+
     def test_consolidate_ordering_issues(self):
         self.mgr.set('f', randn(N))
         self.mgr.set('d', randn(N))
@@ -0,0 +1,148 @@
+import nose
+import unittest
+
+import numpy as np
+
+from pandas import DataFrame
+import pandas.core.algorithms as algos
+import pandas.core.common as com
+import pandas.core.nanops as nanops
+import pandas.core.parallel as parallel
+from pandas.util.testing import assert_frame_equal, assert_almost_equal
+
+
+class TestParallel(unittest.TestCase):
+
+    def setUp(self):
+        self._num_threads = parallel.get_num_threads()
+        self._min_elements = parallel._MIN_ELEMENTS
+
+        values = np.random.randn(1000, 12)
+        values[::7, 3] = np.nan
+        self.values = values
+
+    def tearDown(self):
+        parallel.set_num_threads(self._num_threads)
+        parallel._MIN_ELEMENTS = self._min_elements
+
+    def _check(self, func, check=assert_almost_equal):
+        parallel.set_num_threads(1)
+        expected = func()
+
+        parallel.set_num_threads(4)
+        parallel._MIN_ELEMENTS = 100
+        result = func()
+        check(result, expected)
+
+    def test_set_num_threads(self):
+        parallel.set_num_threads(3)
+        self.assertEqual(parallel.get_num_threads(), 3)
+        parallel.set_num_threads()
+        self.assert_(parallel.get_num_threads() >= 1)
+        self.assertRaises(ValueError, parallel.set_num_threads, 0)
+
+    def test_get_nchunks(self):
+        parallel.set_num_threads(1)
+        self.assertEqual(parallel.get_nchunks(100, 10 ** 9), 1)
+
+        parallel.set_num_threads(4)
+        parallel._MIN_ELEMENTS = 1000
+        self.assertEqual(parallel.get_nchunks(100, 10 ** 9), 4)
+        self.assertEqual(parallel.get_nchunks(2, 10 ** 9), 2)
+        self.assertEqual(parallel.get_nchunks(100, 2500), 2)
+        self.assertEqual(parallel.get_nchunks(100, 10), 1)
+
+        # kernels called from a chunk run serially
+        result = parallel.run(lambda start, end:
+                              parallel.get_nchunks(100, 10 ** 9),
+                              parallel.chunk_bounds(10, 2))
+        self.assertEqual(result, [1, 1])
+
+    def test_chunk_bounds(self):
+        self.assertEqual(parallel.chunk_bounds(10, 3),
+                         [(0, 3), (3, 6), (6, 10)])
+        self.assertEqual(parallel.chunk_bounds(2, 1), [(0, 2)])
+
+    def test_run(self):
+        parallel.set_num_threads(4)
+        bounds = parallel.chunk_bounds(100, 4)
+        self.assertEqual(parallel.run(lambda start, end: end - start, bounds),
+                         [25] * 4)
+
+        def f(start, end):
+            raise KeyError(start)
+        self.assertRaises(KeyError, parallel.run, f, bounds)
+
+    def test_set_num_threads_while_running(self):
+        parallel.set_num_threads(4)
+        bounds = parallel.chunk_bounds(100, 4)
+
+        # the pool a caller maps on is only closed once it is done
+        pool = parallel._acquire_pool()
+        parallel.set_num_threads(2)
+        self.assertEqual(pool.map(abs, [-1, -2]), [1, 2])
+        parallel._release_pool(pool)
+        self.assertRaises(Exception, pool.map, abs, [-1])
+        self.assertEqual(parallel._pool_users, {})
+
+        self.assertEqual(parallel.run(lambda start, end: end - start, bounds),
+                         [25] * 4)
+
+    def test_take_2d(self):
+        indexer = np.random.permutation(1000)
+        indexer[::5] = -1
+        col_indexer = np.array([3, -1, 0, 11, 5])
+        ints = (self.values * 100).astype(np.int64)
+        for values in [self.values, ints, self.values > 0,
+                       self.values.astype(np.float32)]:
+            self._check(lambda: com.take_2d(values, indexer, axis=0))
+            self._check(lambda: com.take_2d(values.T, indexer, axis=1))
+            self._check(lambda: com.take_2d(values[:, [0, 1]], indexer,
+                                            axis=0))
+            self._check(lambda: com.take_2d_multi(values, indexer,
+                                                  col_indexer))
+
+        indexer = np.random.permutation(1000)
+        self._check(lambda: com.take_2d(ints, indexer, axis=0))
+        self._check(lambda: com.take_2d(ints.T, indexer, axis=1))
+
+    def test_groupby(self):
+        df = DataFrame(self.values)
+        df['key'] = np.random.randint(0, 20, len(df))
+        grouped = df.groupby('key')
+        for how in ['sum', 'prod', 'mean', 'var', 'min', 'max', 'median',
+                    'first', 'last']:
+            self._check(lambda: getattr(grouped, how)(), assert_frame_equal)
+        self._check(lambda: grouped.size())
+
+        df['key'] = df['key'].astype(np.float32)
+        self._check(lambda: df.astype(np.float32).groupby('key').mean(),
+                    assert_frame_equal)
+
+    def test_rank(self):
+        ints = (self.values * 10).astype(np.int64)
+        for values in [self.values, ints]:
+            for axis in [0, 1]:
+                for method in ['average', 'min', 'max', 'first']:
+                    self._check(lambda: algos.rank(values, axis=axis,
+                                                   method=method))
+            self._check(lambda: algos.rank(values, ascending=False))
+
+    def test_nancorr_matrix(self):
+        values = self.values
+        self._check(lambda: nanops.nancorr_matrix(values))
+        self._check(lambda: nanops.nancorr_matrix(values, cov=True))
+        self._check(lambda: nanops.nancorr_matrix(values[:, :2]))
+
+        df = DataFrame(values)
+        self._check(lambda: df.corr(), assert_frame_equal)
+        self._check(lambda: df.cov(), assert_frame_equal)
+
+        result = nanops.nancorr_matrix(values)
+        expected = np.corrcoef(values[:, [0, 1]].T)
+        assert_almost_equal(result[:2, :2], expected)
+
+
+if __name__ == '__main__':
+    nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
+                   exit=False)
@@ -1078,6 +1078,15 @@ class TestSeries(unittest.TestCase, CheckNameIntegration):
     def test_values(self):
         self.assert_(np.array_equal(self.ts, self.ts.values))
 
+    def test_memory_usage(self):
+        s = Series(np.arange(10.))
+        self.assertEqual(s.memory_usage(index=False), 80)
+        self.assertEqual(s.memory_usage(), 80 + s.index.memory_usage())
+
+        s = Series(['a', 'bb', 'ccc'])
+        self.assert_(s.memory_usage(index=False, deep=True) >
+                     s.memory_usage(index=False))
+
     def test_iteritems(self):
         for idx, val in self.series.iteritems():
             self.assertEqual(val, self.series[idx])
@@ -1431,6 +1440,42 @@ class TestSeries(unittest.TestCase, CheckNameIntegration):
         expected = Series(['foo_suffix', 'bar_suffix', 'baz_suffix', np.nan])
         assert_series_equal(result, expected)
 
+    def test_arith_inplace(self):
+        s = self.ts.copy()
+        values = s.values
+        s *= 2
+        s += 1
+        assert_series_equal(s, self.ts * 2 + 1)
+        self.assert_(np.may_share_memory(s, values))
+
+        s = self.ts.copy()
+        result = s.add(self.ts, inplace=True)
+        self.assert_(result is s)
+        assert_series_equal(s, self.ts * 2)
+
+        s = self.ts.copy()
+        s.sub(self.ts[:5], fill_value=0, inplace=True)
+        assert_series_equal(s, self.ts.sub(self.ts[:5], fill_value=0))
+
+        # a column of a frame is modified in place
+        df = DataFrame({'a': np.arange(5.)})
+        col = df['a']
+        col /= 2
+        self.assert_(np.array_equal(df['a'], np.arange(5.) / 2))
+
+        # results that do not fit make a new Series
+        s = Series(np.arange(5))
+        alias = s
+        s += 1.5
+        self.assert_(s is not alias)
+        self.assert_(np.array_equal(alias, np.arange(5)))
+        self.assertRaises(ValueError, alias.add, Series([1.5] * 5),
+                          inplace=True)
+
+        s = self.ts.copy()
+        s += self.ts[5:]
+        assert_series_equal(s, self.ts + self.ts[5:])
+
     def test_object_comparisons(self):
         s = Series(['a', 'b', np.nan, 'c', 'a'])
 
@@ -2337,6 +2382,10 @@ class TestSeries(unittest.TestCase, CheckNameIntegration):
         result = s.asof(s.index[0])
         self.assertEqual(result, s[0])
 
+        s = Series(np.nan, index=date_range('1/1/2000', periods=9))
+        result = s.asof(dates)
+        self.assert_(isnull(result).all())
+
     def test_astype_cast_nan_int(self):
         df = Series([1.0, 2.0, 3.0, np.nan])
         self.assertRaises(ValueError, df.astype, np.int64)
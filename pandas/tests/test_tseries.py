@@ -328,6 +328,28 @@ def test_get_reverse_indexer():
     expected = np.array([4, 2, 3, 6, 7], dtype=np.int64)
     assert(np.array_equal(result, expected))
 
+def test_intern_strings():
+    # equal strings built at run time are distinct objects
+    make = lambda s: ''.join(list(s))
+    values = np.array([make('foo'), make('bar'), make('foo'), None, 1.5,
+                       make(u'baz'), make(u'baz'), make('a\x00b'),
+                       make('a\x00c')], dtype=object)
+    expected = values.copy()
+    assert(values[0] is not values[2])
+
+    table = lib.StringHashTable()
+    result = table.intern(values)
+    assert(result == 2)
+    assert(values[0] is values[2])
+    assert(values[5] is values[6])
+    assert(list(values) == list(expected))
+
+    # strings are interned with those seen before
+    other = np.array([make('bar'), make('a\x00c')], dtype=object)
+    assert(table.intern(other) == 1)
+    assert(other[0] is values[1])
+    assert(other[1] == 'a\x00c')
+
 def test_pad_backfill_object_segfault():
     from datetime import datetime
     old = np.array([], dtype='O')
@@ -435,8 +457,8 @@ class TestBinGroupers(unittest.TestCase):
         }
 
         for fname in funcs:
-            args = [getattr(lib, 'group_%s' % fname),
-                    getattr(lib, 'group_%s_bin' % fname),
+            args = [getattr(algos, 'group_%s_float64' % fname),
+                    getattr(algos, 'group_%s_bin_float64' % fname),
                     np_funcs[fname]]
             self._check_versions(*args)
 
@@ -482,7 +504,7 @@ def test_group_ohlc():
     out  = np.zeros((3, 4), np.float64)
     counts = np.zeros(len(out), dtype=np.int64)
 
-    lib.group_ohlc(out, counts, obj[:, None], bins)
+    algos.group_ohlc_float64(out, counts, obj[:, None], bins)
 
     def _ohlc(group):
         if isnull(group).all():
@@ -496,7 +518,7 @@ def test_group_ohlc():
     assert_almost_equal(counts, [6, 6, 8])
 
     obj[:6] = nan
-    lib.group_ohlc(out, counts, obj[:, None], bins)
+    algos.group_ohlc_float64(out, counts, obj[:, None], bins)
     expected[0] = nan
     assert_almost_equal(out, expected)
 
@@ -0,0 +1,330 @@
+"""
+Incremental construction of DataFrame objects from batches of rows
+"""
+
+import numpy as np
+
+from pandas.core.frame import DataFrame
+from pandas.core.index import Index, MultiIndex
+from pandas.core.internals import BlockManager, make_block
+from pandas.core.series import Series
+import pandas.core.common as com
+import pandas.lib as lib
+
+_NS_DTYPE = np.dtype('M8[ns]')
+
+
+class DataFrameBuilder(object):
+    """
+    Accumulates rows or DataFrames into column buffers whose capacity doubles
+    when full, so that appending a batch of rows costs time proportional to
+    the size of the batch (amortized). DataFrame.append and concat copy the
+    whole frame on every call instead
+
+    Columns of the same dtype share one 2-D buffer, which get_frame hands to
+    the DataFrame as a block without copying. A column is widened
+    when a batch brings values of another type (int to float, anything to
+    object, ...) or leaves the column out (int to float, bool to object)
+
+    Parameters
+    ----------
+    columns : sequence, optional
+        Initial column order, columns first seen in later batches are added
+        after these
+    capacity : int, default 1024
+        Number of rows to allocate initially
+    ignore_index : boolean, default False
+        Number the rows 0 to n - 1 instead of keeping the index of the
+        appended frames
+
+    Examples
+    --------
+    >>> builder = DataFrameBuilder()
+    >>> for batch in batches:
+    ...     builder.append(batch)
+    >>> df = builder.get_frame()
+    """
+
+    def __init__(self, columns=None, capacity=1024, ignore_index=False):
+        self.columns = []
+        self.ignore_index = ignore_index
+
+        self._capacity = max(int(capacity), 1)
+        self._nrows = 0
+
+        # dtype -> _ColumnGroup, column -> group holding it
+        self._groups = {}
+        self._group_of = {}
+
+        self._index = None
+        self._index_names = None
+
+        # columns given up front hold NA until a batch fills them
+        for col in (columns if columns is not None else []):
+            self._add_column(col, np.dtype(np.float64))
+
+    def __len__(self):
+        return self._nrows
+
+    def append(self, other):
+        """
+        Append rows to the builder
+
+        Parameters
+        ----------
+        other : DataFrame, Series, dict or list
+            A DataFrame, a single row as a Series (indexed by column, labeled
+            by its name) or a dict, or a list of rows as accepted by the
+            DataFrame constructor. Rows that are not from a DataFrame are
+            labeled by their position, unless a Series row has a name
+        """
+        batch = self._to_frame(other)
+        if not batch.columns.is_unique:
+            raise ValueError('Non-unique columns not supported')
+
+        n, k = self._nrows, len(batch)
+        if k == 0:
+            for col in batch.columns:
+                if col not in self._group_of:
+                    dtype = batch[col].dtype
+                    if n > 0:
+                        dtype = com._upcast_dtype(dtype)
+                    self._add_column(col, dtype)
+            return
+
+        self._reserve(n + k)
+
+        for col in batch.columns:
+            values = batch._data.get(col)
+            if col not in self._group_of:
+                dtype = values.dtype
+                if n > 0:
+                    dtype = com._upcast_dtype(dtype)
+                self._add_column(col, dtype)
+            else:
+                self._widen(col, values.dtype)
+            self._group_of[col].put(col, slice(n, n + k), values)
+
+        # fill the columns the batch does not have
+        for col in self.columns:
+            if col not in batch:
+                self._widen(col, com._upcast_dtype(self._group_of[col].dtype))
+                self._group_of[col].fill_na(col, slice(n, n + k))
+
+        if not self.ignore_index:
+            self._append_index(batch.index)
+
+        self._nrows = n + k
+
+    def get_frame(self, copy=False):
+        """
+        DataFrame of the rows appended so far. Rows appended later do not
+        show in it
+
+        Parameters
+        ----------
+        copy : boolean, default False
+            Copy the data. By default the blocks of the frame are views on the
+            buffers of the builder, so modifying the frame in place also
+            modifies the rows of frames returned later
+
+        Returns
+        -------
+        frame : DataFrame
+        """
+        n = self._nrows
+        columns = Index(self.columns)
+
+        if self.ignore_index:
+            index = Index(np.arange(n))
+        elif self._index_names is not None and len(self._index_names) > 1:
+            index = MultiIndex.from_tuples(self._index[:n],
+                                           names=self._index_names)
+        elif self._index is not None:
+            index = Index(self._index[:n], name=self._index_names[0])
+        else:
+            index = Index(np.arange(n))
+
+        blocks = []
+        for group in self._groups.itervalues():
+            if len(group.items) == 0:
+                continue
+            values = group.values[:n].T
+            if copy:
+                values = values.copy()
+            blocks.append(make_block(values, group.items, columns))
+
+        mgr = BlockManager(blocks, [columns, index])
+        return DataFrame(mgr)
+
+    def _to_frame(self, other):
+        if isinstance(other, DataFrame):
+            return other
+
+        if isinstance(other, Series):
+            index = [other.name if other.name is not None else self._nrows]
+            return DataFrame(dict((k, [v]) for k, v in other.iteritems()),
+                             index=index, columns=other.index)
+        elif isinstance(other, dict):
+            other = DataFrame(dict((k, [v]) for k, v in other.iteritems()))
+        else:
+            other = list(other)
+            if (len(other) > 0 and not isinstance(other[0], (dict, Series))
+                    and len(self.columns) > 0):
+                other = DataFrame(other, columns=self.columns)
+            else:
+                other = DataFrame(other)
+
+        other.index = Index(np.arange(self._nrows, self._nrows + len(other)))
+        return other
+
+    def _reserve(self, nrows):
+        if nrows <= self._capacity:
+            return
+
+        capacity = max(2 * self._capacity, nrows)
+        for group in self._groups.itervalues():
+            group.resize(capacity, self._nrows)
+
+        if self._index is not None:
+            self._index = _resize(self._index, capacity, self._nrows)
+
+        self._capacity = capacity
+
+    def _add_column(self, col, dtype):
+        group = self._get_group(dtype)
+        group.add(col, self._nrows)
+        self._group_of[col] = group
+        self.columns.append(col)
+
+    def _get_group(self, dtype):
+        dtype = _buffer_dtype(dtype)
+        group = self._groups.get(dtype)
+        if group is None:
+            group = _ColumnGroup(dtype, self._capacity)
+            self._groups[dtype] = group
+        return group
+
+    def _widen(self, col, dtype):
+        """
+        Move the column to the buffer of the dtype that holds both its values
+        and values of the passed dtype, if that is not its dtype already
+        """
+        group = self._group_of[col]
+        if self._nrows == 0:
+            # nothing to keep, e.g. a column given up front
+            new_dtype = _buffer_dtype(dtype)
+        else:
+            new_dtype = _common_dtype(group.dtype, dtype)
+        if new_dtype == group.dtype:
+            return
+
+        values = group.remove(col, self._nrows)
+        new_group = self._get_group(new_dtype)
+        new_group.add(col, self._nrows)
+        new_group.put(col, slice(0, self._nrows), values)
+        self._group_of[col] = new_group
+
+    def _append_index(self, index):
+        names = list(index.names)
+        if self._index_names is None:
+            self._index_names = names
+
+        values = index.values
+        if self._index is None:
+            dtype = _buffer_dtype(values.dtype)
+            self._index = np.empty(self._capacity, dtype=dtype)
+        else:
+            dtype = _common_dtype(self._index.dtype, values.dtype)
+            if dtype != self._index.dtype:
+                self._index = _astype(self._index, dtype)
+
+        n = self._nrows
+        self._index[n:n + len(values)] = _astype(values, self._index.dtype)
+
+
+class _ColumnGroup(object):
+    """
+    Buffer holding the columns of one dtype, one column of the buffer per
+    column of the frame. Its transpose is laid out like the block of a
+    DataFrame constructed from a 2-D ndarray
+    """
+
+    def __init__(self, dtype, capacity):
+        self.dtype = dtype
+        self.items = []
+        self.values = np.empty((capacity, 0), dtype=dtype)
+
+    def add(self, col, nrows):
+        # adding a column copies the other columns of the group, new columns
+        # are rare compared with appended rows
+        column = np.empty((len(self.values), 1), dtype=self.dtype)
+        self.values = np.hstack([self.values, column])
+        self.items.append(col)
+        self.fill_na(col, slice(0, nrows))
+
+    def remove(self, col, nrows):
+        loc = self.items.index(col)
+        values = self.values[:nrows, loc].copy()
+        self.values = np.delete(self.values, loc, axis=1)
+        del self.items[loc]
+        return values
+
+    def put(self, col, slicer, values):
+        loc = self.items.index(col)
+        self.values[slicer, loc] = _astype(values, self.dtype)
+
+    def fill_na(self, col, slicer):
+        loc = self.items.index(col)
+        if self.dtype == _NS_DTYPE:
+            self.values[slicer, loc].view(np.int64).fill(lib.iNaT)
+        elif issubclass(self.dtype.type, (np.integer, np.bool_)):
+            # the column is upcast before any NA is put in it
+            assert(slicer.stop == slicer.start)
+        else:
+            self.values[slicer, loc] = np.nan
+
+    def resize(self, capacity, nrows):
+        self.values = _resize(self.values, capacity, nrows)
+
+
+def _resize(values, capacity, nrows):
+    # new buffer with the first nrows rows of values
+    result = np.empty((capacity,) + values.shape[1:], dtype=values.dtype)
+    result[:nrows] = values[:nrows]
+    return result
+
+
+def _buffer_dtype(dtype):
+    dtype = np.dtype(dtype)
+    if issubclass(dtype.type, np.datetime64):
+        return _NS_DTYPE
+    elif dtype.kind in ('S', 'U', 'V'):
+        return np.dtype(object)
+    return dtype
+
+
+def _common_dtype(left, right):
+    """
+    dtype holding values of both dtypes, following the block types: numbers
+    are promoted, anything else mixed becomes object
+    """
+    left, right = _buffer_dtype(left), _buffer_dtype(right)
+    if left == right:
+        return left
+
+    numeric = (np.integer, np.floating, np.complexfloating)
+    if (issubclass(left.type, numeric) and issubclass(right.type, numeric)):
+        return np.promote_types(left, right)
+    return np.dtype(object)
+
+
+def _astype(values, dtype):
+    values = np.asarray(values)
+    if values.dtype == dtype:
+        return values
+    if dtype == np.object_ and values.dtype == _NS_DTYPE:
+        return lib.ints_to_pydatetime(values.view(np.int64))
+    if dtype == _NS_DTYPE and values.dtype != _NS_DTYPE:
+        return lib.cast_to_nanoseconds(values)
+    return values.astype(dtype)
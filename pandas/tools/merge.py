@@ -8,12 +8,12 @@ from pandas.core.categorical import Factor
 from pandas.core.frame import DataFrame, _merge_doc
 from pandas.core.generic import NDFrame
 from pandas.core.groupby import get_group_index
-from pandas.core.series import Series
+from pandas.core.series import Series, _categorical_or_values
 from pandas.core.index import (Index, MultiIndex, _get_combined_index,
                                _ensure_index, _get_consensus_names,
-                               _all_indexes_same)
-from pandas.core.internals import (IntBlock, BoolBlock, BlockManager,
-                                   make_block, _consolidate)
+                               _all_indexes_same, _compact_labels)
+from pandas.core.internals import (IntBlock, BoolBlock, CategoricalBlock,
+                                   MaskedBlock, BlockManager, make_block)
 from pandas.util.decorators import cache_readonly, Appender, Substitution
 
 from pandas.sparse.frame import SparseDataFrame
@@ -203,34 +203,41 @@ class _MergeOperation(object):
             if not _should_fill(lname, rname):
                 continue
 
-            if name in result:
-                key_col = result[name]
+            # Categorical keys (see _get_merge_keys) are filled in from their
+            # dense values
+            left_key = self.left_join_keys[i]
+            right_key = self.right_join_keys[i]
 
+            if name in result:
                 if name in self.left and left_indexer is not None:
                     na_indexer = (left_indexer == -1).nonzero()[0]
                     if len(na_indexer) == 0:
                         continue
 
                     right_na_indexer = right_indexer.take(na_indexer)
-                    key_col.put(na_indexer, com.take_1d(self.right_join_keys[i],
-                                                        right_na_indexer))
+                    fill = com.take_1d(np.asarray(right_key), right_na_indexer)
                 elif name in self.right and right_indexer is not None:
                     na_indexer = (right_indexer == -1).nonzero()[0]
                     if len(na_indexer) == 0:
                         continue
 
                     left_na_indexer = left_indexer.take(na_indexer)
-                    key_col.put(na_indexer, com.take_1d(self.left_join_keys[i],
-                                                        left_na_indexer))
+                    fill = com.take_1d(np.asarray(left_key), left_na_indexer)
+                else:
+                    continue
+
+                # a key column stored as codes can't be filled in place
+                result._ensure_writeable([name])
+                result[name].put(na_indexer, fill)
             elif left_indexer is not None:
                 if name is None:
                     name = 'key_%d' % i
 
                 # a faster way?
-                key_col = com.take_1d(self.left_join_keys[i], left_indexer)
+                key_col = com.take_1d(np.asarray(left_key), left_indexer)
                 na_indexer = (left_indexer == -1).nonzero()[0]
                 right_na_indexer = right_indexer.take(na_indexer)
-                key_col.put(na_indexer, com.take_1d(self.right_join_keys[i],
+                key_col.put(na_indexer, com.take_1d(np.asarray(right_key),
                                                     right_na_indexer))
                 result.insert(i, name, key_col)
 
@@ -309,11 +316,11 @@ class _MergeOperation(object):
                         right_keys.append(rk)
                         join_names.append(None)  # what to do?
                     else:
-                        right_keys.append(right[rk].values)
+                        right_keys.append(_categorical_or_values(right[rk]))
                         join_names.append(rk)
                 else:
                     if not is_rkey(rk):
-                        right_keys.append(right[rk].values)
+                        right_keys.append(_categorical_or_values(right[rk]))
                         if lk == rk:
                             # avoid key upcast in corner case (length-0)
                             if len(left) > 0:
@@ -322,7 +329,7 @@ class _MergeOperation(object):
                                 left_drop.append(lk)
                     else:
                         right_keys.append(rk)
-                    left_keys.append(left[lk].values)
+                    left_keys.append(_categorical_or_values(left[lk]))
                     join_names.append(lk)
         elif _any(self.left_on):
             for k in self.left_on:
@@ -330,7 +337,7 @@ class _MergeOperation(object):
                     left_keys.append(k)
                     join_names.append(None)
                 else:
-                    left_keys.append(left[k].values)
+                    left_keys.append(_categorical_or_values(left[k]))
                     join_names.append(k)
             if isinstance(self.right.index, MultiIndex):
                 right_keys = [lev.values.take(lab)
@@ -344,7 +351,7 @@ class _MergeOperation(object):
                     right_keys.append(k)
                     join_names.append(None)
                 else:
-                    right_keys.append(right[k].values)
+                    right_keys.append(_categorical_or_values(right[k]))
                     join_names.append(k)
             if isinstance(self.left.index, MultiIndex):
                 left_keys = [lev.values.take(lab)
@@ -553,6 +560,11 @@ _join_functions = {
 
 
 def _factorize_keys(lk, rk, sort=True):
+    if isinstance(lk, Factor) and isinstance(rk, Factor):
+        return _factorize_categorical_keys(lk, rk, sort=sort)
+
+    lk = np.asarray(lk)
+    rk = np.asarray(rk)
     if com.is_integer_dtype(lk) and com.is_integer_dtype(rk):
         klass = lib.Int64Factorizer
         lk = com._ensure_int64(lk)
@@ -576,6 +588,26 @@ def _factorize_keys(lk, rk, sort=True):
 
     return llab, rlab, count
 
+def _factorize_categorical_keys(lk, rk, sort=True):
+    # the left codes are the labels, the right levels are mapped onto the
+    # left ones, appending those the left doesn't have
+    rindexer = lk.levels.get_indexer(rk.levels)
+    new = rindexer == -1
+    count = len(lk.levels) + new.sum()
+    rindexer[new] = np.arange(len(lk.levels), count)
+
+    llab = com._ensure_int64(lk.labels)
+    # the extra last entry maps missing values (-1) to -1
+    rlab = np.append(rindexer, -1).take(com._ensure_platform_int(rk.labels))
+    rlab = com._ensure_int64(rlab)
+
+    if sort:
+        uniques = np.concatenate([lk.levels.values.astype('O'),
+                                  rk.levels.values[new].astype('O')])
+        llab, rlab = _sort_labels(uniques, llab, rlab)
+
+    return llab, rlab, count
+
 def _sort_labels(uniques, left, right):
     if not isinstance(uniques, np.ndarray):
         # tuplesafe
@@ -627,10 +659,11 @@ class _BlockJoinOperation(object):
         blockmaps = []
 
         for unit in self.units:
-            join_blocks = unit.get_upcasted_blocks()
+            # int / bool blocks needing masking are reindexed into masked
+            # blocks, keeping their dtype
             type_map = {}
-            for blk in join_blocks:
-                type_map.setdefault(type(blk), []).append(blk)
+            for blk in unit.blocks:
+                type_map.setdefault(unit.get_result_kind(blk), []).append(blk)
             blockmaps.append((unit, type_map))
 
         return blockmaps
@@ -652,9 +685,25 @@ class _BlockJoinOperation(object):
             for unit, mapping in blockmaps:
                 if klass in mapping:
                     klass_blocks.extend((unit, b) for b in mapping[klass])
+
+            if klass in (CategoricalBlock, MaskedBlock):
+                # never merged, take each block's codes or data and mask
+                for unit, b in klass_blocks:
+                    result_blocks.append(
+                        unit.reindex_block(b, self.axis, self.result_items,
+                                           copy=self.copy))
+                continue
+
             res_blk = self._get_merged_block(klass_blocks)
             result_blocks.append(res_blk)
 
+        if (len(result_blocks) == 1 and
+                not result_blocks[0].items.equals(self.result_items)):
+            # a unit's int / bool rows were merged with its other blocks, put
+            # them back in order as expected of a single block
+            result_blocks = [result_blocks[0].reindex_items_from(
+                self.result_items)]
+
         return BlockManager(result_blocks, self.result_axes)
 
     def _get_merged_block(self, to_merge):
@@ -680,7 +729,8 @@ class _BlockJoinOperation(object):
         out_shape[self.axis] = n
 
         # Should use Fortran order??
-        block_dtype = _get_block_dtype([x[1] for x in merge_chunks])
+        block_dtype = _get_block_dtype([blk.dtype
+                                        for unit, blk in merge_chunks])
         out = np.empty(out_shape, dtype=block_dtype)
 
         sofar = 0
@@ -693,9 +743,11 @@ class _BlockJoinOperation(object):
                               None, False,
                               axis=self.axis, out=out_chunk)
             else:
-                # write out the values to the result array
+                # write out the values to the result array, filling the
+                # masked positions
+                mask, need_masking = unit.mask_info
                 com.take_fast(blk.values, unit.indexer,
-                              None, False,
+                              mask, need_masking,
                               axis=self.axis, out=out_chunk)
 
             sofar += len(blk)
@@ -730,11 +782,11 @@ class _JoinUnit(object):
     def need_masking(self):
         return self.mask_info[1]
 
-    def get_upcasted_blocks(self):
-        # will short-circuit and not compute lneed_masking if indexer is None
-        if self.need_masking:
-            return _upcast_blocks(self.blocks)
-        return self.blocks
+    def get_result_kind(self, block):
+        # will short-circuit and not compute need_masking if indexer is None
+        if isinstance(block, (IntBlock, BoolBlock)) and self.need_masking:
+            return MaskedBlock
+        return type(block)
 
     def reindex_block(self, block, axis, ref_items, copy=True):
         # still some inefficiency here for bool/int64 because in the case where
@@ -754,6 +806,36 @@ class _JoinUnit(object):
         result.ref_items = ref_items
         return result
 
+def _concat_categorical_codes(blocks, axis):
+    """
+    Concatenate the codes of categorical blocks along axis, mapping them onto
+    the levels of the first block with the levels it doesn't have appended
+
+    Returns
+    -------
+    (codes, levels) : (ndarray, Index)
+    """
+    levels = blocks[0].levels
+    to_concat = [com._ensure_int64(blocks[0].codes)]
+    for blk in blocks[1:]:
+        indexer = levels.get_indexer(blk.levels)
+        new = indexer == -1
+        if new.any():
+            indexer[new] = np.arange(len(levels), len(levels) + new.sum())
+            levels = levels.append(blk.levels[new])
+        # the extra last entry maps missing values (-1) to -1
+        indexer = com._ensure_int64(np.append(indexer, -1))
+        codes = indexer.take(com._ensure_platform_int(blk.codes))
+        to_concat.append(codes)
+
+    codes = np.concatenate(to_concat, axis=axis)
+    return _compact_labels(codes, len(levels)), levels
+
+def _first_block(blocks):
+    for blk in blocks:
+        if blk is not None:
+            return blk
+
 def _may_need_upcasting(blocks):
     for block in blocks:
         if isinstance(block, (IntBlock, BoolBlock)):
@@ -761,25 +843,6 @@ def _may_need_upcasting(blocks):
     return False
 
 
-def _upcast_blocks(blocks):
-    """
-    Upcast and consolidate if necessary
-    """
-    new_blocks = []
-    for block in blocks:
-        if isinstance(block, IntBlock):
-            newb = make_block(block.values.astype(float), block.items,
-                              block.ref_items)
-        elif isinstance(block, BoolBlock):
-            newb = make_block(block.values.astype(object), block.items,
-                              block.ref_items)
-        else:
-            newb = block
-        new_blocks.append(newb)
-
-    # use any ref_items
-    return _consolidate(new_blocks, newb.ref_items)
-
 def _get_all_block_kinds(blockmaps):
     kinds = set()
     for mapping in blockmaps:
@@ -792,16 +855,15 @@ def _get_merge_block_kinds(blockmaps):
         kinds |= set(mapping)
     return kinds
 
-def _get_block_dtype(blocks):
-    if len(blocks) == 0:
+def _get_block_dtype(dtypes):
+    if len(dtypes) == 0:
         return object
-    blk1 = blocks[0]
-    dtype = blk1.dtype
+    dtype = dtypes[0]
 
     if issubclass(dtype.type, np.floating):
-        for blk in blocks:
-            if blk.dtype.type == np.float64:
-                return blk.dtype
+        for dt in dtypes:
+            if dt.type == np.float64:
+                return dt
 
     return dtype
 
@@ -950,9 +1012,18 @@ class _Concatenator(object):
         reindexed_data = self._get_reindexed_data()
 
         blockmaps = []
-        for data in reindexed_data:
+        for i, data in enumerate(reindexed_data):
             data = data.consolidate()
-            type_map = dict((type(blk), blk) for blk in data.blocks)
+            type_map = {}
+            for j, blk in enumerate(data.blocks):
+                if blk._is_dense:
+                    type_map[type(blk)] = blk
+                elif self.axis == 0:
+                    # the items of each object are kept apart
+                    type_map[type(blk), i, j] = blk
+                else:
+                    # the codes or data of the same items are concatenated
+                    type_map[type(blk), blk.dtype, tuple(blk.items)] = blk
             blockmaps.append(type_map)
         return blockmaps
 
@@ -1006,8 +1077,14 @@ class _Concatenator(object):
         return reindexed_data
 
     def _concat_blocks(self, blocks):
+        first = _first_block(blocks)
+        if isinstance(first, CategoricalBlock):
+            return self._concat_categorical_blocks(blocks)
+        elif isinstance(first, MaskedBlock):
+            return self._concat_masked_blocks(blocks)
+
         values_list = [b.values for b in blocks if b is not None]
-        concat_values = com._concat_compat(values_list)
+        concat_values = com._concat_compat(values_list, axis=self.axis)
 
         if self.axis > 0:
             # Not safe to remove this check, need to profile
@@ -1016,21 +1093,50 @@ class _Concatenator(object):
                                 'DataFrames')
             return make_block(concat_values, blocks[0].items, self.new_axes[0])
         else:
-            offsets = np.r_[0, np.cumsum([len(x._data.axes[0]) for
-                                            x in self.objs])]
-            indexer = np.concatenate([offsets[i] + b.ref_locs
-                                      for i, b in enumerate(blocks)
-                                      if b is not None])
-            if self.ignore_index:
-                concat_items = indexer
-            else:
-                concat_items = self.new_axes[0].take(indexer)
+            concat_items, ref_items = self._get_concat_items(blocks)
+            return make_block(concat_values, concat_items, ref_items)
+
+    def _get_concat_items(self, blocks):
+        # items of the blocks concatenated along the items axis
+        offsets = np.r_[0, np.cumsum([len(x._data.axes[0]) for
+                                        x in self.objs])]
+        indexer = np.concatenate([offsets[i] + b.ref_locs
+                                  for i, b in enumerate(blocks)
+                                  if b is not None])
+        if self.ignore_index:
+            return indexer, self._get_fresh_axis()
+        return self.new_axes[0].take(indexer), self.new_axes[0]
+
+    def _concat_categorical_blocks(self, blocks):
+        # concatenate the codes, the blocks are never densified
+        if self.axis > 0:
+            if any(b is None for b in blocks):
+                raise Exception('dtypes are not consistent throughout '
+                                'DataFrames')
+            codes, levels = _concat_categorical_codes(blocks, self.axis)
+            return CategoricalBlock(codes, levels, blocks[0].items,
+                                    self.new_axes[0])
 
-            if self.ignore_index:
-                ref_items = self._get_fresh_axis()
-                return make_block(concat_values, concat_items, ref_items)
+        blk = _first_block(blocks)
+        items, ref_items = self._get_concat_items(blocks)
+        return CategoricalBlock(blk.codes.copy(), blk.levels, items,
+                                ref_items)
 
-            return make_block(concat_values, concat_items, self.new_axes[0])
+    def _concat_masked_blocks(self, blocks):
+        # concatenate the data and masks, the data is never upcast
+        if self.axis > 0:
+            if any(b is None for b in blocks):
+                raise Exception('dtypes are not consistent throughout '
+                                'DataFrames')
+            data = np.concatenate([b.data for b in blocks], axis=self.axis)
+            mask = np.concatenate([b.mask for b in blocks], axis=self.axis)
+            return MaskedBlock(data, mask, blocks[0].items, self.new_axes[0],
+                               ndim=data.ndim)
+
+        blk = _first_block(blocks)
+        items, ref_items = self._get_concat_items(blocks)
+        return MaskedBlock(blk.data.copy(), blk.mask.copy(), items, ref_items,
+                           ndim=blk.ndim)
 
     def _concat_single_item(self, item):
         all_values = []
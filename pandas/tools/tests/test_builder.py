@@ -0,0 +1,169 @@
+import nose
+import unittest
+
+import numpy as np
+
+from pandas import (DataFrame, Series, Index, MultiIndex, concat, isnull,
+                    date_range)
+from pandas.tools.builder import DataFrameBuilder
+import pandas.util.testing as tm
+
+
+class TestDataFrameBuilder(unittest.TestCase):
+
+    def setUp(self):
+        self.frame = DataFrame({'a': np.arange(10),
+                                'b': np.random.randn(10),
+                                'c': ['foo', 'bar'] * 5,
+                                'd': [True, False] * 5},
+                               columns=['a', 'b', 'c', 'd'],
+                               index=np.arange(10) * 2)
+
+    def test_append_frames(self):
+        builder = DataFrameBuilder(capacity=3)
+        pieces = [self.frame[:4], self.frame[4:5], self.frame[5:]]
+        for piece in pieces:
+            builder.append(piece)
+        self.assertEqual(len(builder), 10)
+
+        result = builder.get_frame()
+        tm.assert_frame_equal(result, self.frame)
+        self.assert_((result.dtypes == self.frame.dtypes).all())
+        self.assert_(result._data.is_consolidated())
+
+        # the frame does not see rows appended later
+        builder.append(self.frame)
+        self.assertEqual(len(result), 10)
+        tm.assert_frame_equal(builder.get_frame(),
+                              concat([self.frame, self.frame]))
+
+    def test_ignore_index(self):
+        builder = DataFrameBuilder(ignore_index=True)
+        builder.append(self.frame)
+        builder.append(self.frame)
+        result = builder.get_frame()
+        self.assert_(np.array_equal(result.index, np.arange(20)))
+        tm.assert_frame_equal(result[10:].set_index(self.frame.index),
+                              self.frame)
+
+    def test_widen_dtypes(self):
+        builder = DataFrameBuilder()
+        builder.append(DataFrame({'a': [1, 2], 'b': [True, False]}))
+        builder.append(DataFrame({'a': [1.5], 'b': [1]}))
+        result = builder.get_frame()
+        self.assertEqual(result['a'].dtype, np.float64)
+        self.assertEqual(result['b'].dtype, np.object_)
+        self.assert_(np.array_equal(result['a'], [1, 2, 1.5]))
+        self.assertEqual(list(result['b']), [True, False, 1])
+
+        builder.append(DataFrame({'a': ['x']}))
+        result = builder.get_frame()
+        self.assertEqual(list(result['a']), [1, 2, 1.5, 'x'])
+        self.assert_(isnull(result['b'].values[3]))
+
+    def test_missing_and_new_columns(self):
+        builder = DataFrameBuilder()
+        builder.append(DataFrame({'a': [1, 2]}))
+        builder.append(DataFrame({'b': [1, 2], 'c': [True, False],
+                                  'd': date_range('1/1/2012', periods=2)}))
+        builder.append(DataFrame({'a': [3]}))
+
+        result = builder.get_frame()
+        self.assertEqual(list(result.columns), ['a', 'b', 'c', 'd'])
+        self.assertEqual(result['a'].dtype, np.float64)
+        self.assertEqual(result['b'].dtype, np.float64)
+        self.assertEqual(result['c'].dtype, np.object_)
+        self.assertEqual(result['d'].dtype, np.dtype('M8[ns]'))
+        self.assert_(np.array_equal(isnull(result['a']),
+                                    [False, False, True, True, False]))
+        self.assert_(np.array_equal(isnull(result['d']),
+                                    [True, True, False, False, True]))
+
+        # columns given up front take the dtype of the first batch
+        builder = DataFrameBuilder(columns=['b', 'a'])
+        builder.append(DataFrame({'a': [1, 2], 'b': [3, 4]}))
+        result = builder.get_frame()
+        self.assertEqual(list(result.columns), ['b', 'a'])
+        self.assertEqual(result['a'].dtype, np.int64)
+
+    def test_append_rows(self):
+        builder = DataFrameBuilder(columns=['a', 'b'])
+        builder.append({'a': 1, 'b': 'x'})
+        builder.append(Series([2, 'y'], index=['a', 'b'], name='r'))
+        builder.append([(3, 'z'), (4, 'w')])
+        builder.append([{'a': 5}])
+
+        result = builder.get_frame()
+        self.assertEqual(list(result.index), [0, 'r', 2, 3, 4])
+        self.assertEqual(list(result['a']), [1, 2, 3, 4, 5])
+        self.assertEqual(list(result['b'][:4]), ['x', 'y', 'z', 'w'])
+        self.assert_(isnull(result['b'][4]))
+
+    def test_index(self):
+        frame = self.frame.copy()
+        frame.index = MultiIndex.from_arrays([np.arange(10) % 2,
+                                              np.arange(10)],
+                                             names=['first', 'second'])
+        builder = DataFrameBuilder()
+        builder.append(frame[:5])
+        builder.append(frame[5:])
+        result = builder.get_frame()
+        self.assert_(isinstance(result.index, MultiIndex))
+        self.assert_(result.index.equals(frame.index))
+        self.assertEqual(result.index.names, ['first', 'second'])
+
+        frame = self.frame.copy()
+        frame.index = Index(np.arange(10), name='foo')
+        builder = DataFrameBuilder()
+        builder.append(frame)
+        self.assertEqual(builder.get_frame().index.name, 'foo')
+
+    def test_get_frame_copy(self):
+        builder = DataFrameBuilder()
+        builder.append(self.frame)
+
+        result = builder.get_frame(copy=True)
+        result['b'][:] = 0
+        tm.assert_frame_equal(builder.get_frame(), self.frame)
+
+        # shared with the buffers by default
+        result = builder.get_frame()
+        result['b'][:] = 0
+        self.assert_((builder.get_frame()['b'] == 0).all())
+
+    def test_empty(self):
+        builder = DataFrameBuilder()
+        result = builder.get_frame()
+        self.assertEqual(len(result), 0)
+        self.assertEqual(len(result.columns), 0)
+
+        builder.append(self.frame[:0])
+        result = builder.get_frame()
+        self.assertEqual(len(result), 0)
+        self.assert_(result.columns.equals(self.frame.columns))
+
+        # new int and bool columns from an empty batch after rows exist
+        builder = DataFrameBuilder()
+        builder.append(DataFrame({'a': [1., 2.]}))
+        builder.append(DataFrame({'b': np.array([], dtype=np.int64),
+                                  'c': np.array([], dtype=bool)}))
+        result = builder.get_frame()
+        self.assertEqual(result['b'].dtype, np.float64)
+        self.assertEqual(result['c'].dtype, np.object_)
+        self.assert_(isnull(result['b']).all())
+        self.assert_(isnull(result['c']).all())
+
+        builder.append(DataFrame({'a': [3.], 'b': [4]}))
+        result = builder.get_frame()
+        self.assert_(np.array_equal(isnull(result['b']),
+                                    [True, True, False]))
+
+    def test_duplicate_columns(self):
+        builder = DataFrameBuilder()
+        df = DataFrame(np.random.randn(2, 2), columns=['a', 'a'])
+        self.assertRaises(ValueError, builder.append, df)
+
+
+if __name__ == '__main__':
+    nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
+                   exit=False)
@@ -1,5 +1,6 @@
 # pylint: disable=E1103
 
+import cPickle as pickle
 import nose
 import unittest
 
@@ -11,6 +12,7 @@ import random
 
 from pandas import *
 from pandas.tseries.index import DatetimeIndex
+from pandas.core.internals import MaskedBlock
 from pandas.tools.merge import merge, concat, ordered_merge, MergeError
 from pandas.util.testing import (assert_frame_equal, assert_series_equal,
                                  assert_almost_equal, rands)
@@ -427,6 +429,49 @@ class TestMerge(unittest.TestCase):
         xp = xpdf.merge(s.astype('f8'), left_on='a', right_index=True)
         assert_frame_equal(rs, xp)
 
+    def test_join_int_bool_with_na(self):
+        left = DataFrame({'a': np.arange(5), 'b': np.arange(5) % 2 == 0,
+                          'c': randn(5)})
+        right = DataFrame({'d': np.arange(3), 'e': [True, False, True],
+                           'f': randn(3)}, index=[1, 3, 7])
+
+        for how in ['left', 'outer']:
+            joined = left.join(right, how=how)
+            expected = left.join(right.astype(object), how=how)
+            self.assertEqual(joined['d'].dtype, np.float64)
+            self.assertEqual(joined['e'].dtype, np.object_)
+            self.assert_(np.array_equal(joined.columns, list('abcdef')))
+            assert_frame_equal(joined.astype(object), expected.astype(object))
+
+            # the single consolidated block is in column order
+            single = left[['c']].join(right[['d', 'f']], how=how)
+            tm.assert_almost_equal(single.values[:, 1], single['d'].values)
+
+        # the int / bool data is kept with a mask of the missing values
+        joined = left.join(right, how='left')
+        expected = left.join(right.astype(object), how='left')
+        for item in ['d', 'e']:
+            _, block = joined._data._find_block(item)
+            self.assert_(isinstance(block, MaskedBlock))
+        filled = joined.fillna(0)
+        self.assertEqual(filled['d'].dtype, np.int64)
+        self.assertEqual(filled['e'].dtype, np.bool_)
+        self.assert_(np.array_equal(filled['d'], [0, 0, 0, 1, 0]))
+
+        for result in [concat([joined, joined]),
+                       concat([joined, joined], axis=1, keys=['x', 'y']),
+                       joined.reindex([4, 3, 6]), joined[1:],
+                       pickle.loads(pickle.dumps(joined))]:
+            self.assert_(any(isinstance(b, MaskedBlock)
+                             for b in result._data.blocks))
+        assert_frame_equal(concat([joined, joined]).astype(object),
+                           concat([expected, expected]).astype(object))
+        assert_frame_equal(pickle.loads(pickle.dumps(joined)), joined)
+
+        joined = left.join(right, how='inner')
+        self.assertEqual(joined['a'].dtype, np.int64)
+        self.assertEqual(joined['e'].dtype, np.bool_)
+
     def test_join_many_non_unique_index(self):
         df1 = DataFrame({"a": [1,1], "b": [1,1], "c": [10,20]})
         df2 = DataFrame({"a": [1,1], "b": [1,2], "d": [100,200]})
@@ -671,6 +716,31 @@ class TestMerge(unittest.TestCase):
         result = merge(right, left, on='key', how='right')
         assert_frame_equal(result, left)
 
+    def test_merge_categorical_keys(self):
+        lkeys = np.array(['b', 'a', 'c', np.nan, 'a'], dtype=object)
+        rkeys = np.array(['a', 'd', 'b', np.nan], dtype=object)
+        left = DataFrame({'key': lkeys, 'lvalue': np.arange(5)})
+        right = DataFrame({'key': rkeys, 'rvalue': np.arange(4.)})
+        cleft = left.copy()
+        cleft['key'] = Categorical.from_array(lkeys)
+        cright = right.copy()
+        cright['key'] = Categorical.from_array(rkeys)
+
+        for how in ['inner', 'left', 'right', 'outer']:
+            for sort in [True, False]:
+                expected = merge(left, right, on='key', how=how, sort=sort)
+                result = merge(cleft, cright, on='key', how=how, sort=sort)
+                assert_frame_equal(result, expected)
+
+                # only one side categorical
+                result = merge(cleft, right, on='key', how=how, sort=sort)
+                assert_frame_equal(result, expected)
+
+        # the categorical column keeps its codes
+        result = merge(cleft, right, on='key')
+        self.assert_(result._data.get_categorical('lvalue') is None)
+        self.assert_(result._data.get_categorical('key') is not None)
+
 
 def _check_merge(x, y):
     for how in ['inner', 'left', 'outer']:
@@ -1098,6 +1168,32 @@ class TestConcatenate(unittest.TestCase):
         expected = concat([frames[k] for k in keys], keys=keys)
         tm.assert_frame_equal(result, expected)
 
+    def test_concat_categorical(self):
+        keys = np.array(['a', 'b', np.nan], dtype=object)
+        df1 = DataFrame({'key': Categorical.from_array(keys),
+                         'value': [1., 2., 3.]}, columns=['key', 'value'])
+        df2 = DataFrame({'key': Categorical.from_array(['c', 'b']),
+                         'value': [4., 5.]}, columns=['key', 'value'])
+        dense1 = df1.astype(object).convert_objects()
+        dense2 = df2.astype(object).convert_objects()
+
+        # the codes are concatenated
+        result = concat([df1, df2])
+        cat = result._data.get_categorical('key')
+        self.assert_(cat is not None)
+        self.assert_(np.array_equal(cat.levels, ['a', 'b', 'c']))
+        assert_frame_equal(result, concat([dense1, dense2]))
+
+        result = concat([df1, df2], axis=1, keys=['one', 'two'])
+        self.assert_(result._data.get_categorical(('one', 'key')) is not None)
+        self.assert_(result._data.get_categorical(('two', 'key')) is not None)
+        assert_frame_equal(result, concat([dense1, dense2], axis=1,
+                                          keys=['one', 'two']))
+
+        # the item is dense in one of the frames
+        result = concat([df1, dense2])
+        assert_frame_equal(result, concat([dense1, dense2]))
+
     def test_concat_ignore_index(self):
         frame1 = DataFrame({"test1": ["a", "b", "c"],
                             "test2": [1,2,3],
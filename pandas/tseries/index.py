@@ -493,8 +493,13 @@ class DatetimeIndex(Int64Index):
     def __reduce__(self):
         """Necessary for making this object picklable"""
         object_state = list(np.ndarray.__reduce__(self))
+
+        # pickle the int64 view, the raw data is the same
+        nd_state = list(object_state[2])
+        nd_state[2] = np.dtype(np.int64)
+
         subclass_state = self.name, self.offset, self.tz
-        object_state[2] = (object_state[2], subclass_state)
+        object_state[2] = (tuple(nd_state), subclass_state)
         return tuple(object_state)
 
     def __setstate__(self, state):
@@ -504,6 +509,11 @@ class DatetimeIndex(Int64Index):
             self.name = own_state[0]
             self.offset = own_state[1]
             self.tz = own_state[2]
+
+            if nd_state[2] == np.int64:
+                nd_state = list(nd_state)
+                nd_state[2] = _NS_DTYPE
+                nd_state = tuple(nd_state)
             np.ndarray.__setstate__(self, nd_state)
         else:  # pragma: no cover
             np.ndarray.__setstate__(self, state)
@@ -565,6 +575,10 @@ class DatetimeIndex(Int64Index):
             except ValueError:
                 return self.asobject.isin(values)
 
+        if self._can_merge(values) and values.is_unique:
+            indexer = self._left_indexer_unique(self.values, values.values)
+            return indexer != -1
+
         value_set = set(values.asi8)
         return lib.ismember(self.asi8, value_set)
 
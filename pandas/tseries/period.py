@@ -7,6 +7,7 @@ import numpy as np
 from pandas.tseries.frequencies import (get_freq_code as _gfc, to_offset,
                                         _month_numbers, FreqGroup)
 from pandas.tseries.index import DatetimeIndex, Int64Index, Index
+from pandas.core.index import _asof_locs
 from pandas.tseries.tools import parse_time_string
 import pandas.tseries.frequencies as _freq_mod
 
@@ -642,15 +643,7 @@ class PeriodIndex(Int64Index):
         if isinstance(where_idx, DatetimeIndex):
             where_idx = PeriodIndex(where_idx.values, freq=self.freq)
 
-        locs = self.values[mask].searchsorted(where_idx.values, side='right')
-
-        locs = np.where(locs > 0, locs - 1, 0)
-        result = np.arange(len(self))[mask].take(locs)
-
-        first = mask.argmax()
-        result[(locs == 0) & (where_idx.values < self.values[first])] = -1
-
-        return result
+        return _asof_locs(self.values, where_idx.values, mask)
 
     @property
     def asobject(self):
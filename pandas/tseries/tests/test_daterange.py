@@ -138,6 +138,8 @@ class TestDateRange(unittest.TestCase):
         unpickled = pickle.loads(pickled)
 
         self.assert_(unpickled.offset is not None)
+        self.assert_(unpickled.dtype == self.rng.dtype)
+        self.assert_(unpickled.equals(self.rng))
 
     def test_union(self):
         # overlapping
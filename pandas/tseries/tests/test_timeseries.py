@@ -1341,6 +1341,12 @@ class TestDatetimeIndex(unittest.TestCase):
         assert_almost_equal(index.isin([index[2], 5]),
                             [False, False, True, False])
 
+        # merged without building the hash table
+        index = date_range('1/1/2000', periods=10)
+        result = index.isin(index[::3])
+        self.assert_(np.array_equal(result, np.arange(10) % 3 == 0))
+        self.assertEqual(index._engine.sizeof(), 0)
+
     def test_union(self):
         i1 = Int64Index(np.arange(0, 20, 2))
         i2 = Int64Index(np.arange(10, 30, 2))
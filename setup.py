@@ -352,7 +352,8 @@ else:
 
 tseries_depends = ['reindex', 'groupby', 'skiplist', 'moments',
                    'reduce', 'stats', 'datetime',
-                   'hashtable', 'inference', 'properties', 'join', 'engines']
+                   'hashtable', 'inference', 'properties', 'join', 'engines',
+                   'json']
 
 plib_depends = ['plib']
 
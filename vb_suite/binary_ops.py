@@ -24,3 +24,85 @@ stmt = "ts1 + ts2"
 series_align_int64_index_binop = Benchmark(stmt, setup,
                                            start_date=datetime(2010, 6, 1),
                                            logy=True)
+
+#----------------------------------------------------------------------
+# mixed-dtype frames, computed block by block
+
+setup = common_setup + """
+n = 1000
+cols = ['c%d' % i for i in range(1000)]
+data = {}
+for i, col in enumerate(cols):
+    if i % 2:
+        data[col] = np.random.randn(n)
+    else:
+        data[col] = np.random.randint(0, 100, size=n)
+df = DataFrame(data, columns=cols)
+df2 = DataFrame(data, columns=cols[::-1])
+"""
+
+frame_add_mixed_dtypes = \
+    Benchmark("df + df", setup, name='frame_add_mixed_dtypes',
+              start_date=datetime(2012, 11, 1))
+
+frame_add_mixed_dtypes_unordered = \
+    Benchmark("df + df2", setup, name='frame_add_mixed_dtypes_unordered',
+              start_date=datetime(2012, 11, 1))
+
+frame_mult_scalar_mixed_dtypes = \
+    Benchmark("df * 2", setup, name='frame_mult_scalar_mixed_dtypes',
+              start_date=datetime(2012, 11, 1))
+
+#----------------------------------------------------------------------
+# in-place arithmetic
+
+setup = common_setup + """
+df = DataFrame(np.random.randn(100000, 50))
+w = np.random.randn(50)
+"""
+
+frame_mult_add_inplace = \
+    Benchmark("df *= 1.0001; df += w", setup, name='frame_mult_add_inplace',
+              start_date=datetime(2012, 11, 1))
+
+frame_mult_add = \
+    Benchmark("df * 1.0001 + w", setup, name='frame_mult_add',
+              start_date=datetime(2012, 11, 1))
+
+#----------------------------------------------------------------------
+# large elementwise operations, numexpr against numpy
+
+setup = common_setup + """
+import pandas.core.expressions as expr
+df = DataFrame(np.random.randn(20000, 100))
+df2 = DataFrame(np.random.randn(20000, 100))
+"""
+
+frame_add = \
+    Benchmark("df + df2", setup, name='frame_add',
+              start_date=datetime(2012, 11, 1))
+
+frame_add_no_ne = \
+    Benchmark("df + df2", setup + "expr.set_use_numexpr(False)",
+              cleanup="expr.set_use_numexpr(True)", name='frame_add_no_ne',
+              start_date=datetime(2012, 11, 1))
+
+frame_comparison = \
+    Benchmark("df > df2", setup, name='frame_comparison',
+              start_date=datetime(2012, 11, 1))
+
+frame_comparison_no_ne = \
+    Benchmark("df > df2", setup + "expr.set_use_numexpr(False)",
+              cleanup="expr.set_use_numexpr(True)",
+              name='frame_comparison_no_ne',
+              start_date=datetime(2012, 11, 1))
+
+frame_mult_scalar = \
+    Benchmark("df * 2", setup, name='frame_mult_scalar',
+              start_date=datetime(2012, 11, 1))
+
+frame_mult_scalar_no_ne = \
+    Benchmark("df * 2", setup + "expr.set_use_numexpr(False)",
+              cleanup="expr.set_use_numexpr(True)",
+              name='frame_mult_scalar_no_ne',
+              start_date=datetime(2012, 11, 1))
@@ -65,3 +65,32 @@ bool_arr[:1000] = True
 
 frame_boolean_row_select = Benchmark('df[bool_arr]', setup,
                                      start_date=datetime(2011, 1, 1))
+
+#----------------------------------------------------------------------
+# string interning
+
+setup = common_setup + """
+strings = np.array([rands(10) for _ in xrange(1000)], dtype=object)
+keys = np.random.permutation(np.tile(strings, 100))
+df = DataFrame({'a': [''.join(list(s)) for s in keys],
+                'b': [''.join(list(s)) for s in keys]})
+"""
+
+frame_intern_strings = Benchmark('df.intern_strings()', setup,
+                                 start_date=datetime(2012, 11, 1))
+
+#----------------------------------------------------------------------
+# eval / query
+
+setup = common_setup + """
+df = DataFrame(randn(1000000, 3), columns=['a', 'b', 'c'])
+"""
+
+frame_query = Benchmark("df.query('(a > 1) & (b < c * 2)')", setup,
+                        start_date=datetime(2012, 11, 1))
+
+frame_boolean_mask_expr = Benchmark("df[(df.a > 1) & (df.b < df.c * 2)]",
+                                    setup, start_date=datetime(2012, 11, 1))
+
+frame_eval = Benchmark("df.eval('a * 2 + b * c - 1')", setup,
+                       start_date=datetime(2012, 11, 1))
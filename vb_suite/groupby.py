@@ -220,3 +220,69 @@ groupby_simple_compress_timing = \
     Benchmark('df.groupby(labels).mean()', setup,
               start_date=datetime(2011, 8, 1))
 
+#----------------------------------------------------------------------
+# float32 aggregation
+
+setup = common_setup + """
+data = np.random.randn(1000000, 2).astype(np.float32)
+labels = np.random.randint(0, 1000, size=1000000)
+df = DataFrame(data)
+"""
+
+groupby_frame_float32_mean = \
+    Benchmark('df.groupby(labels).mean()', setup,
+              start_date=datetime(2012, 11, 1))
+
+
+#----------------------------------------------------------------------
+# categorical-coded key column
+
+setup = common_setup + """
+keys = np.array(['foo', 'bar', 'baz', 'qux'] * 250000, dtype=object)
+df_dense = DataFrame({'key': keys, 'value': np.random.randn(1000000)})
+df = DataFrame({'key': Categorical.from_array(keys),
+                'value': np.random.randn(1000000)})
+"""
+
+groupby_categorical_column_sum = \
+    Benchmark("df.groupby('key').sum()", setup,
+              start_date=datetime(2012, 11, 1))
+
+groupby_object_column_sum = \
+    Benchmark("df_dense.groupby('key').sum()", setup,
+              start_date=datetime(2012, 11, 1))
+
+categorical_column_value_counts = \
+    Benchmark("df['key'].value_counts()", setup,
+              start_date=datetime(2012, 11, 1))
+
+categorical_column_eq_filter = \
+    Benchmark("df[df['key'] == 'foo']", setup,
+              start_date=datetime(2012, 11, 1))
+
+
+#----------------------------------------------------------------------
+# Cython kernels split across the threads of pandas.core.parallel
+
+setup = common_setup + """
+import pandas.core.parallel as parallel
+parallel.set_num_threads()
+
+labels = np.random.randint(0, 1000, size=1000000)
+df = DataFrame(np.random.randn(1000000, 20))
+indexer = np.random.permutation(1000000)
+"""
+
+cleanup = "parallel.set_num_threads(1)"
+
+groupby_frame_mean_threads = \
+    Benchmark('df.groupby(labels).mean()', setup, cleanup=cleanup,
+              start_date=datetime(2012, 11, 1))
+
+frame_take_rows_threads = \
+    Benchmark('df.take(indexer)', setup, cleanup=cleanup,
+              start_date=datetime(2012, 11, 1))
+
+frame_rank_threads = \
+    Benchmark('df.rank()', setup, cleanup=cleanup,
+              start_date=datetime(2012, 11, 1))
@@ -33,3 +33,41 @@ index_int64_union = Benchmark('left.union(right)', setup,
 
 index_int64_intersection = Benchmark('left.intersection(right)', setup,
                                      start_date=datetime(2011, 1, 1))
+
+#----------------------------------------------------------------------
+# indexers between sorted indexes
+
+setup = common_setup + """
+rng = date_range('1/1/2000', periods=1000000, freq='s')
+target = rng[::2].append(rng[-1:] + datetools.Second())
+"""
+
+index_datetime_get_indexer_monotonic = \
+    Benchmark('rng._engine.clear_mapping(); rng.get_indexer(target)', setup,
+              start_date=datetime(2012, 10, 1))
+
+index_datetime_isin_monotonic = \
+    Benchmark('rng.isin(target)', setup,
+              start_date=datetime(2012, 10, 1))
+
+#----------------------------------------------------------------------
+# MultiIndex lookups
+
+setup = common_setup + """
+index = MultiIndex(levels=[np.arange(100), np.arange(100), np.arange(100)],
+                   labels=[np.arange(100).repeat(10000),
+                           np.tile(np.arange(100).repeat(100), 100),
+                           np.tile(np.arange(100), 10000)])
+target = index[::-3]
+other = index[::2]
+key = index[500000]
+"""
+
+multiindex_get_loc = Benchmark('index.get_loc(key)', setup,
+                               start_date=datetime(2012, 10, 1))
+
+multiindex_get_indexer = Benchmark('index.get_indexer(target)', setup,
+                                   start_date=datetime(2012, 10, 1))
+
+multiindex_join = Benchmark("index.join(other, how='inner')", setup,
+                            start_date=datetime(2012, 10, 1))
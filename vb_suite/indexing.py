@@ -118,3 +118,41 @@ inds = range(0, 500, 10)
 
 indexing_panel_subset = Benchmark('p.ix[inds, inds, inds]', setup,
                                   start_date=datetime(2012, 1, 1))
+
+#----------------------------------------------------------------------
+# Column access in a frame with many blocks
+
+setup = common_setup + """
+df = DataFrame(index=range(100))
+for i in range(2000):
+    df[i] = np.random.randn(100) if i % 2 else np.arange(100)
+col = 1500
+"""
+
+frame_getitem_many_blocks = \
+    Benchmark("df._data.get(col)", setup,
+              name='frame_getitem_many_blocks',
+              start_date=datetime(2012, 11, 1))
+
+frame_setitem_many_blocks = \
+    Benchmark("df[col] = 1.", setup,
+              name='frame_setitem_many_blocks',
+              start_date=datetime(2012, 11, 1))
+
+#----------------------------------------------------------------------
+# adding many columns
+
+setup = common_setup + """
+df = DataFrame(np.random.randn(10000, 10))
+new = dict(('n%d' % i, np.random.randn(10000)) for i in range(500))
+"""
+
+frame_insert_500_columns = \
+    Benchmark("for k, v in new.iteritems(): df[k] = v", setup,
+              name='frame_insert_500_columns',
+              start_date=datetime(2012, 11, 1))
+
+frame_add_columns_500 = \
+    Benchmark("df.add_columns(new)", setup,
+              name='frame_add_columns_500',
+              start_date=datetime(2012, 11, 1))
@@ -109,6 +109,23 @@ append_frame_single_mixed = Benchmark(stmt, setup,
                                       name='append_frame_single_mixed',
                                       ncalls=500, repeat=1)
 
+#----------------------------------------------------------------------
+# incremental appends
+
+setup = common_setup + """
+batch = DataFrame({'a': np.arange(10), 'b': np.random.randn(10),
+                   'c': ['foo'] * 10})
+
+def build_frame(n=1000):
+    builder = DataFrameBuilder(ignore_index=True)
+    for _ in xrange(n):
+        builder.append(batch)
+    return builder.get_frame()
+"""
+
+frame_builder_append = Benchmark('build_frame()', setup,
+                                 start_date=datetime(2012, 11, 1))
+
 #----------------------------------------------------------------------
 # data alignment
 
@@ -29,6 +29,18 @@ statement = "df.reindex(rng2)"
 reindex_frame_daterange = Benchmark(statement, setup,
                                     name='dataframe_reindex_daterange')
 
+#----------------------------------------------------------------------
+# int / bool columns, introducing NAs
+
+setup = common_setup + """
+df = DataFrame(np.random.randint(0, 100, (100000, 10)),
+               index=np.arange(0, 200000, 2))
+df['bool'] = df[0] > 50
+new_index = np.arange(200000)
+"""
+reindex_frame_int_with_na = Benchmark("df.reindex(new_index)", setup,
+                                      start_date=datetime(2012, 11, 1))
+
 #----------------------------------------------------------------------
 # multiindex reindexing
 